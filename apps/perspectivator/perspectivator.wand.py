@@ -269,11 +269,11 @@ class Perspectivator(ttk.TTkWidget):
         if not (image:=self._highlightedImage):
             pass
         elif evt.evt == ttk.TTkK.WHEEL_Up:
-            image.size = min(image.size+1,50)
+            image.size = min(image.size+evt.delta,50)
             image._updateBox()
             self.update()
         elif evt.evt == ttk.TTkK.WHEEL_Down:
-            image.size = max(image.size-1,5)
+            image.size = max(image.size-evt.delta,5)
             image._updateBox()
             self.update()
         return True
@@ -69,6 +69,10 @@ def main():
                 ttk.TTkTerm.Sigmask.CTRL_Z ))
     TloggHelper._runPlugins()
 
+    # The searches are scanned in parallel by the worker processes,
+    # this module is safe to be imported by them
+    ttk.TTkFileBuffer.SEARCH_PROCESSES = True
+
     for file in args.filename:
         tlogg.openFile(file)
 
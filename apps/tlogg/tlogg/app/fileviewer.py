@@ -22,23 +22,95 @@
 
 __all__ = ['FileViewer','FileViewerSearch','FileViewerArea']
 
+import re
+
 import TermTk as ttk
 
 from tlogg import TloggHelper, tloggProxy
 
 from . import TloggCfg
 
+class _HighlightRules():
+    '''
+    The highlight rules (:py:attr:`TloggCfg.colors`) compiled once in a single alternation regex,
+    they are compiled again only if the configuration changes
+    '''
+    __slots__ = ('_rules', '_version', '_regex', '_groups', '_patterns', '_colors')
+    _instance = None
+    # Numbered back references are not valid once the rules are joined
+    _backRef = re.compile(r'\\[1-9]')
+
+    def __init__(self, rules, version):
+        self._rules = rules
+        self._version = version
+        self._patterns = []
+        self._colors = []
+        alternatives = []
+        for i,(pattern, ignoreCase, fg, bg) in enumerate(rules):
+            try:
+                self._patterns.append(re.compile(pattern, re.IGNORECASE if ignoreCase else 0))
+                alternatives.append(f"(?P<_r{i}>{'(?i:'+pattern+')' if ignoreCase else pattern})")
+            except re.error:
+                self._patterns.append(None)
+            self._colors.append((
+                ttk.TTkColor.fg(fg)+ttk.TTkColor.bg(bg),
+                ttk.TTkColor.fg(bg)+ttk.TTkColor.bg(fg)))
+        self._groups = {f"_r{i}":i for i in range(len(rules))}
+        try:
+            if any(self._backRef.search(pattern) for pattern,*_ in rules):
+                raise re.error('back reference')
+            self._regex = re.compile('|'.join(alternatives)) if alternatives else None
+        except re.error:
+            # Fallback to the rules searched one by one
+            self._regex = None
+
+    @staticmethod
+    def get():
+        rules = tuple((c['pattern'], c['ignorecase'], c['fg'], c['bg']) for c in TloggCfg.colors)
+        if (instance := _HighlightRules._instance) is None or instance._rules != rules:
+            _HighlightRules._instance = instance = _HighlightRules(rules, 0 if instance is None else instance._version+1)
+        return instance
+
+    def version(self):
+        return self._version
+
+    def match(self, text):
+        '''
+        Return the (line color, searched color) of the first rule matching the text or None
+        '''
+        if self._regex is None:
+            first = len(self._patterns)
+        elif m := self._regex.search(text):
+            # The leftmost match is not necessarily the first rule,
+            # only the previous rules need to be checked
+            first = self._groups[m.lastgroup]
+        else:
+            return None
+        for i in range(first):
+            if (pattern := self._patterns[i]) and pattern.search(text):
+                return self._colors[i]
+        return self._colors[first] if first < len(self._colors) else None
+
 class FileViewer(ttk.TTkAbstractScrollView):
     __slots__ = (
         '_fileBuffer', '_indexesMark', '_indexesSearched',
-        '_selected', '_indexing', '_searchRe',
+        '_selected', '_indexing', '_searchRe', '_follow',
+        '_searchRegex', '_searchVersion', '_indexesSearchedSet', '_renderCache',
         '_selection', '_pressed'
         # Signals
         'selected', 'marked')
+    # Number of rendered lines kept in the cache
+    RENDER_CACHE_SIZE = 0x400
+
     def __init__(self, *args, **kwargs):
         self._indexesMark = []
         self._indexesSearched = []
+        self._indexesSearchedSet = set()
+        self._renderCache = {}
+        self._searchRegex = None
+        self._searchVersion = 0
         self._indexing = None
+        self._follow = False
         self._selected = -1
         self._selection = None
         self._pressed = False
@@ -64,23 +136,45 @@ class FileViewer(ttk.TTkAbstractScrollView):
     @ttk.pyTTkSlot(float)
     def fileIndexing(self, percentage):
         self._indexing = percentage
+        self._renderCache.clear()
         self.viewChanged.emit()
 
     @ttk.pyTTkSlot()
     def fileIndexed(self):
         self._indexing = None
+        # The last line may be changed while following the file
+        self._renderCache.clear()
+        if self._follow:
+            # Keep the last line visible like "tail -f"
+            ox,_ = self.getViewOffsets()
+            self.viewMoveTo(ox, max(0,self.getLen()-self.height()))
         self.viewChanged.emit()
 
+    @ttk.pyTTkSlot(bool)
+    def setFollow(self, follow):
+        self._follow = follow
+        if follow:
+            self.fileIndexed()
+
     def markIndexes(self, indexes):
         self._indexesMark = indexes
         self.viewChanged.emit()
 
-    def searchedIndexes(self, indexes):
+    def _setIndexesSearched(self, indexes):
         self._indexesSearched = indexes
+        self._indexesSearchedSet = set(indexes)
+
+    def searchedIndexes(self, indexes):
+        self._setIndexesSearched(indexes)
         self.viewChanged.emit()
 
     def searchRe(self, searchRe):
         self._searchRe = searchRe
+        try:
+            self._searchRegex = re.compile(searchRe, re.IGNORECASE) if searchRe else None
+        except re.error:
+            self._searchRegex = None
+        self._searchVersion += 1
         self.update()
 
     def viewFullAreaSize(self) -> (int, int):
@@ -159,57 +253,75 @@ class FileViewer(ttk.TTkAbstractScrollView):
     def getLineNum(self, num) -> int:
         return num
 
+    _symbols = (
+        (ttk.TTkColor.fg("#0000ff"), ttk.TTkColor.bg("#444444"), '○'),
+        (ttk.TTkColor.fg("#ff0000"), ttk.TTkColor.bg("#444444"), '●'),
+        (ttk.TTkColor.fg("#00ffff"), ttk.TTkColor.bg("#444444"), '❥'))
+
+    def _renderLine(self, num, lineNum, ox, lineState, symbolState, lenLineNumber, rules):
+        line = ttk.TTkString(self.getLine(num).replace('\n','')).tab2spaces()
+        symbolcolor, numberColor, symbol = self._symbols[symbolState]
+
+        if lineState == 1:
+            selectedColor = ttk.TTkColor.bg("#008844")
+            searchedColor = ttk.TTkColor.fg("#FFFF00")+ttk.TTkColor.bg("#004400")
+            line = line.setColor(selectedColor)
+        elif lineState == 2:
+            selectedColor = ttk.TTkColor.bg("#008888")
+            searchedColor = ttk.TTkColor.fg("#FFFF00")+ttk.TTkColor.bg("#004400")
+            line = line.setColor(selectedColor)
+        elif colors := rules.match(line.toAscii()):
+            # The first filter with a matching pattern defines the color
+            selectedColor, searchedColor = colors
+            line = line.setColor(selectedColor)
+        else:
+            selectedColor = ttk.TTkColor.RST
+            searchedColor = ttk.TTkColor.fg("#000000")+ttk.TTkColor.bg("#AAAAAA")
+        if self._searchRegex:
+            for match in self._searchRegex.findall(line.toAscii()):
+                line = line.setColor(searchedColor, match=match)
+
+        # Add Line Number
+        lineNumber = ttk.TTkString() + numberColor + str(lineNum).rjust(lenLineNumber) + ttk.TTkColor.RST + ' '
+        # Compose print line
+        printLine = ttk.TTkString() + symbolcolor + symbol + ttk.TTkColor.RST + ' ' + lineNumber + line.substring(ox)
+        # stupid scramble
+        # printLine._text = ''.join([chr(121-(ord(l)-65)) if (65<=ord(l)<=121) else l for l in printLine._text])
+        return printLine, selectedColor
+
     def paintEvent(self, canvas):
         ox,oy = self.getViewOffsets()
         bufferLen = self.getLen()
+        rules = _HighlightRules.get()
+        cache = self._renderCache
+        selection = (min(self._selection), max(self._selection)) if self._selection else None
+        lenLineNumber = len(str(self.getLineNum(bufferLen-1))) if bufferLen else 0
+        width = self.width()
         for i in range(min(self.height(),bufferLen-oy)):
-            line = ttk.TTkString(self.getLine(i+oy).replace('\n','')).tab2spaces()
-            lineNum = self.getLineNum(i+oy)
-            if lineNum in self._indexesMark:
-                symbolcolor = ttk.TTkColor.fg("#00ffff")
-                numberColor = ttk.TTkColor.bg("#444444")
-                symbol='❥'
-            elif lineNum in self._indexesSearched:
-                symbolcolor = ttk.TTkColor.fg("#ff0000")
-                numberColor = ttk.TTkColor.bg("#444444")
-                symbol='●'
+            num = i+oy
+            lineNum = self.getLineNum(num)
+            if num == self._selected:
+                lineState = 1
+            elif selection and selection[0] <= num <= selection[1]:
+                lineState = 2
             else:
-                symbolcolor = ttk.TTkColor.fg("#0000ff")
-                numberColor = ttk.TTkColor.bg("#444444")
-                symbol='○'
-
-            if i+oy == self._selected:
-                selectedColor = ttk.TTkColor.bg("#008844")
-                searchedColor = ttk.TTkColor.fg("#FFFF00")+ttk.TTkColor.bg("#004400")
-                line = line.setColor(selectedColor)
-            elif self._selection and min(self._selection) <= i+oy <= max(self._selection):
-                selectedColor = ttk.TTkColor.bg("#008888")
-                searchedColor = ttk.TTkColor.fg("#FFFF00")+ttk.TTkColor.bg("#004400")
-                line = line.setColor(selectedColor)
+                lineState = 0
+            if lineNum in self._indexesMark:
+                symbolState = 2
+            elif lineNum in self._indexesSearchedSet:
+                symbolState = 1
             else:
-                selectedColor = ttk.TTkColor.RST
-                searchedColor = ttk.TTkColor.fg("#000000")+ttk.TTkColor.bg("#AAAAAA")
-                # Check in the filters a matching color
-                for color in TloggCfg.colors:
-                    #TTkLog.debug(f"{color['pattern']} - {line}")
-                    if m := line.findall(regexp=color['pattern'], ignoreCase=color['ignorecase']):
-                        selectedColor = ttk.TTkColor.fg(color['fg'])+ttk.TTkColor.bg(color['bg'])
-                        searchedColor = ttk.TTkColor.fg(color['bg'])+ttk.TTkColor.bg(color['fg'])
-                        line = line.setColor(selectedColor)
-                        break
-            if self._searchRe:
-                if m := line.findall(regexp=self._searchRe, ignoreCase=True):
-                    for match in m:
-                        line = line.setColor(searchedColor, match=match)
-
-            # Add Line Number
-            lenLineNumber = len(str(self.getLineNum(bufferLen-1)))
-            lineNumber = ttk.TTkString() + numberColor + str(lineNum).rjust(lenLineNumber) + ttk.TTkColor.RST + ' '
-            # Compose print line
-            printLine = ttk.TTkString() + symbolcolor + symbol + ttk.TTkColor.RST + ' ' + lineNumber + line.substring(ox)
-            # stupid scramble
-            # printLine._text = ''.join([chr(121-(ord(l)-65)) if (65<=ord(l)<=121) else l for l in printLine._text])
-            canvas.drawText(pos=(0,i), text=printLine, color=selectedColor, width=self.width(), )
+                symbolState = 0
+
+            # Only the lines not rendered before (or changed) are composed
+            key = (lineNum, ox, lineState, symbolState, lenLineNumber, rules.version(), self._searchVersion)
+            if (rendered := cache.pop(key, None)) is None:
+                rendered = self._renderLine(num, lineNum, ox, lineState, symbolState, lenLineNumber, rules)
+                if len(cache) >= self.RENDER_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+            cache[key] = rendered
+            printLine, selectedColor = rendered
+            canvas.drawText(pos=(0,i), text=printLine, color=selectedColor, width=width, )
 
         # Draw the loading banner
         if self._indexing is not None:
@@ -236,7 +348,7 @@ class FileViewerSearch(FileViewer):
         if self._selected > -1:
             lineSelected = self._indexes[self._selected]
 
-        self._indexesSearched = indexes
+        self._setIndexesSearched(indexes)
         self._indexes = [i for i in sorted(set(self._indexesSearched+self._indexesMark))]
         ox,_ = self.getViewOffsets()
 
@@ -30,9 +30,9 @@ from .fileviewer  import FileViewer, FileViewerArea, FileViewerSearch
 from .predefinedfilters import PredefinedFilters
 
 class LoggWidget(ttk.TTkSplitter):
-    __slots__ = ('_btn_filters', '_bls_label_1', '_bls_cb_icase', '_bls_search', '_bls_searchbox',
+    __slots__ = ('_btn_filters', '_bls_label_1', '_bls_cb_icase', '_bls_search', '_bls_searchbox', '_bls_cb_follow',
                  '_topViewport', '_bottomViewport',
-                 '_fileBuffer')
+                 '_fileBuffer', '_searchParams')
     def __init__(self, filename, *args, **kwargs):
         super().__init__(*args, **kwargs|{'orientation':ttk.TTkK.VERTICAL})
 
@@ -46,6 +46,7 @@ class LoggWidget(ttk.TTkSplitter):
         self._bls_label_1   = ttk.TTkLabel(text=" Txt:", maxWidth=5)
         self._bls_cb_icase  = ttk.TTkCheckbox(text="Aa", maxWidth=5, checked=True)
         self._bls_search    = ttk.TTkButton(text="Search", maxWidth=10)
+        self._bls_cb_follow = ttk.TTkCheckbox(text="Follow", maxWidth=9, checked=False)
         self._bls_searchbox = ttk.TTkComboBox(editable=True)
         self._bls_searchbox.addItems(TloggCfg.searches)
         self._bls_searchbox.setCurrentIndex(0)
@@ -55,6 +56,7 @@ class LoggWidget(ttk.TTkSplitter):
         bottomLayoutSearch.addWidget(self._bls_searchbox)
         bottomLayoutSearch.addWidget(self._bls_cb_icase)
         bottomLayoutSearch.addWidget(self._bls_search)
+        bottomLayoutSearch.addWidget(self._bls_cb_follow)
 
         bottomFrame.layout().addItem(bottomLayoutSearch)
 
@@ -62,8 +64,13 @@ class LoggWidget(ttk.TTkSplitter):
         self._fileBuffer = ttk.TTkFileBuffer(filename, 0x100, 0x1000)
         self._topViewport = FileViewer(filebuffer=self._fileBuffer)
         topViewer = FileViewerArea(parent=topFrame, fileView=self._topViewport)
-        self._fileBuffer.indexUpdated.connect(self._topViewport.fileIndexing)
-        self._fileBuffer.indexed.connect(self._topViewport.fileIndexed)
+        # The index signals are emitted from the indexing/follow threads,
+        # the viewer and the search are updated in the drawing routine
+        self._indexProgress = None
+        self._fileBuffer.indexUpdated.connect(self._indexUpdated)
+        self._fileBuffer.indexed.connect(self._indexed)
+        self._fileBuffer.searchUpdated.connect(self._searchUpdated)
+        self._searchParams = None
         # Define the Search Viewer
         self._bottomViewport = FileViewerSearch(filebuffer=self._fileBuffer)
         bottomViewer = FileViewerArea(parent=bottomFrame, fileView=self._bottomViewport)
@@ -78,19 +85,54 @@ class LoggWidget(ttk.TTkSplitter):
 
         self._bls_search.clicked.connect(self._search)
         self._bls_searchbox.editTextChanged.connect(self._search)
+        self._bls_cb_follow.toggled.connect(self._follow)
 
         def _openPredefinedFilters():
             ttk.TTkHelper.overlay(self._btn_filters, PredefinedFilters(self._bls_searchbox), -2, 1)
         self._btn_filters.clicked.connect(_openPredefinedFilters)
 
+    @ttk.pyTTkSlot(bool)
+    def _follow(self, follow):
+        self._fileBuffer.setFollow(follow)
+        self._topViewport.setFollow(follow)
+
+    @ttk.pyTTkSlot(list, float)
+    def _searchUpdated(self, indexes, progress):
+        self._bottomViewport.searchedIndexes(indexes)
+        self._topViewport.searchedIndexes(indexes)
+
+    @ttk.pyTTkSlot(float)
+    def _indexUpdated(self, progress):
+        self._indexProgress = progress
+        ttk.TTkHelper.deferCall(self._syncIndex)
+
+    @ttk.pyTTkSlot()
+    def _indexed(self):
+        self._indexProgress = None
+        ttk.TTkHelper.deferCall(self._syncIndex)
+
+    def _syncIndex(self):
+        if (progress := self._indexProgress) is not None:
+            self._topViewport.fileIndexing(progress)
+        else:
+            self._topViewport.fileIndexed()
+            self._refreshSearch()
+
+    @ttk.pyTTkSlot()
+    def _refreshSearch(self):
+        # Search the lines appended while following the file,
+        # the previous results are cached and only the new lines are scanned
+        if self._searchParams and self._fileBuffer.follow():
+            self._fileBuffer.searchReAsync(*self._searchParams)
+
     @ttk.pyTTkSlot()
     def _search(self):
         searchtext = str(self._bls_searchbox.currentText())
         ttk.TTkLog.debug(f"{searchtext=}")
-        indexes = self._fileBuffer.searchRe(searchtext, ignoreCase=self._bls_cb_icase.checkState() == ttk.TTkK.Checked)
-        self._bottomViewport.searchedIndexes(indexes)
+        searchParams = (searchtext, self._bls_cb_icase.checkState() == ttk.TTkK.Checked)
+        self._fileBuffer.searchReAsync(*searchParams)
+        self._searchParams = searchParams
         self._bottomViewport.searchRe(searchtext)
-        self._topViewport.searchedIndexes(indexes)
         self._topViewport.searchRe(searchtext)
         if TloggCfg.searches:
             x = set(TloggCfg.searches)
@@ -255,7 +255,7 @@ class TTkAbstractScrollView(TTkContainer, TTkAbstractScrollViewInterface):
         :return: True if the event was handled
         :rtype: bool
         '''
-        delta = TTkCfg.scrollDelta
+        delta = TTkCfg.scrollDelta * evt.delta
         offx, offy = self.getViewOffsets()
         if evt.evt == TTkK.WHEEL_Up:
             self.viewMoveTo(offx, offy - delta)
@@ -120,19 +120,30 @@ class TTkAbstractTableModel():
 
     Editable models need to implement :meth:`setData`.
 
+    **Async Data Source**
+
+    Slow models (i.e. remote databases, computed data) can avoid to block the rendering
+    implementing :meth:`isRowLoaded` and :meth:`fetchRows`.
+
+    The view paints a placeholder for the rows not loaded yet and requests them (and the rows ahead of the scroll direction)
+    calling :meth:`fetchRows` on a worker thread.
+    Once the rows are loaded the model must emit :meth:`dataChanged` to trigger the repaint.
+
     **Built-In Implementation**
 
     :py:class:`TTkTableModelList` basic subclass implementing a 2d list as data structure
 
     :py:class:`TTkTableModelCSV` subclass of :py:class:`TTkTableModelList` including the api to import csv data
 
+    :py:class:`TTkTableModelCSVStream` read only, file backed, model for huge csv files, the rows are parsed on demand
+
     :py:class:`TTkTableModelSQLite3` subclass of :py:class:`TTkTableModelList` including support for `sqlite3 <https://www.sqlite.org>`__ databases
 
     '''
 
     __slots__ = (
         # Signals
-        'dataChanged', 'modelChanged'
+        'dataChanged', 'modelChanged', 'rowsAppended'
     )
 
     dataChanged:pyTTkSignal
@@ -155,9 +166,23 @@ class TTkAbstractTableModel():
 
         When the model topology changes, this signal must be emitted explicitly.
     '''
+    rowsAppended:pyTTkSignal
+    '''
+        This signal is emitted when new rows are added at the end of the model (i.e. a file being indexed).
+
+        Unlike :py:attr:`modelChanged` the existing rows are not affected,
+        the views keep their current state (selection, current cell, ...) and only extend their rows.
+
+        :param row: the first row added
+        :type row: int
+
+        :param count: the number of rows added
+        :type count: int
+    '''
     def __init__(self):
         self.dataChanged = pyTTkSignal(tuple[int,int],tuple[int,int])
         self.modelChanged = pyTTkSignal()
+        self.rowsAppended = pyTTkSignal(int,int)
 
     def rowCount(self) -> int:
         '''
@@ -297,6 +322,37 @@ class TTkAbstractTableModel():
             return retData, TTkK.Alignment.RIGHT_ALIGN
         return retData, TTkK.Alignment.LEFT_ALIGN
 
+    def isRowLoaded(self, row:int) -> bool:
+        '''
+        Returns True if the data of the row is available (:meth:`data` does not block).
+
+        This method is called by the view during the rendering, it must be fast.
+
+        The base class implementation returns True, reimplement it (and :meth:`fetchRows`) for async models.
+
+        :param row: the row position
+        :type row: int
+
+        :return: bool
+        '''
+        return True
+
+    def fetchRows(self, row:int, count:int) -> None:
+        '''
+        Load the data of the rows in the range [row, row+count).
+
+        This method is called by the view on a worker thread for the rows not loaded (see :meth:`isRowLoaded`),
+        the :meth:`dataChanged` signal must be emitted once the rows are available.
+
+        The base class implementation does nothing.
+
+        :param row: the first row to be loaded
+        :type row: int
+        :param count: the number of rows
+        :type count: int
+        '''
+        pass
+
     def headerData(self, pos:int, orientation:TTkK.Direction) -> TTkString:
         '''
         Returns the data for the given role and section in the header with the specified orientation.
@@ -336,6 +392,19 @@ class TTkAbstractTableModel():
             TTkK.ItemFlag.ItemIsEnabled  |
             TTkK.ItemFlag.ItemIsSelectable )
 
+    def uniformFlags(self) -> bool:
+        '''
+        Returns True if the :meth:`flags` depend only on the column and not on the row.
+
+        The view can cache the flags per column, avoiding to evaluate them for every cell
+        (i.e. during the selection of large tables).
+
+        The base class implementation returns True if :meth:`flags` is not reimplemented.
+
+        :return: bool
+        '''
+        return type(self).flags is TTkAbstractTableModel.flags
+
     def sort(self, column:int, order:TTkK.SortOrder) -> None:
         '''
         Sorts the model by column in the given order.
@@ -32,6 +32,7 @@ from typing import Optional
 from ..drivers import TTkInputDriver
 
 from TermTk.TTkCore.log import TTkLog
+from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.signal import pyTTkSignal
 from TermTk.TTkCore.TTkTerm.term   import TTkTerm
@@ -55,6 +56,8 @@ class TTkInput:
     _midTap = 0
     _rightTap = 0
     _mouse_re = re.compile(r"\033\[<(\d+);(\d+);(\d+)([mM])")
+    # DECRPM - Report Mode: ESC [ ? Pd ; Ps $ y
+    _decrpm_re = re.compile(r"\033\[\?(\d+);(\d)\$y")
 
     class Mouse(int):
         ON = 0x01
@@ -84,29 +87,73 @@ class TTkInput:
         if TTkInput._readInput:
             TTkInput._readInput.cont()
 
+    @staticmethod
+    def _coalesce(mevt:TTkMouseEvent, mevtNew:TTkMouseEvent) -> Optional[TTkMouseEvent]:
+        '''
+        Merge two consecutive mouse events
+
+        * Move/Drag, the last event with the same button and modifiers wins
+        * Wheel, the ticks in the same direction are merged in a single event (:py:attr:`TTkMouseEvent.delta`)
+
+        :return: the merged event or None if the events cannot be merged
+        '''
+        if (mevt.key != mevtNew.key or
+            mevt.evt != mevtNew.evt or
+            mevt.mod != mevtNew.mod):
+            return None
+        if mevtNew.evt in (TTkK.Move, TTkK.Drag):
+            return mevtNew
+        if mevtNew.key == TTkK.Wheel:
+            return TTkMouseEvent(
+                        mevtNew.x, mevtNew.y, mevtNew.key, mevtNew.evt, mevtNew.mod,
+                        mevtNew.tap, mevtNew.raw, mevt.delta+mevtNew.delta)
+        return None
+
     @staticmethod
     def start() -> None:
         TTkInput._inputThread.start()
-        while inq := TTkInput._inputQueue.get():
+        # The Move/Drag/Wheel events are kept pending and merged with the following ones
+        # until the queue is empty and the mouse rate (TTkCfg.mouseRate) allows the dispatch
+        pending:Optional[TTkMouseEvent] = None
+        lastTime = 0.0
+        while True:
+            timeout = None
+            if pending:
+                interval = 1/TTkCfg.mouseRate if TTkCfg.mouseRate > 0 else 0
+                timeout = max(0, lastTime + interval - time())
+            try:
+                inq = TTkInput._inputQueue.get(timeout=timeout)
+            except queue.Empty:
+                TTkInput.inputEvent.emit(None, pending)
+                pending = None
+                lastTime = time()
+                continue
+            if not inq:
+                break
             kevt,mevt,paste = inq
 
-            # Try to filter out the queued moved mouse events
-            while (not kevt and
-                   not paste and
-                   mevt and mevt.evt == TTkK.Drag and
-                   not TTkInput._inputQueue.empty() ):
-                mevtOld = mevt
-                kevt, mevt, paste = TTkInput._inputQueue.get()
-                if (kevt  or
-                    paste or
-                    mevt and mevt.evt != TTkK.Drag):
-                    TTkInput.inputEvent.emit(kevt, mevtOld)
-                    break
+            if (not kevt and not paste and mevt and
+                ( mevt.evt in (TTkK.Move, TTkK.Drag) or mevt.key == TTkK.Wheel )):
+                if pending and (merged := TTkInput._coalesce(pending, mevt)):
+                    pending = merged
+                else:
+                    if pending:
+                        TTkInput.inputEvent.emit(None, pending)
+                        lastTime = time()
+                    pending = mevt
+                continue
 
+            # Any other event flush the pending one to preserve the ordering
+            if pending:
+                TTkInput.inputEvent.emit(None, pending)
+                pending = None
+                lastTime = time()
             if kevt or mevt:
                 TTkInput.inputEvent.emit(kevt, mevt)
             if paste:
                 TTkInput.pasteEvent.emit(paste)
+        if pending:
+            TTkInput.inputEvent.emit(None, pending)
         TTkLog.debug("Close TTkInput")
 
     @staticmethod
@@ -134,6 +181,13 @@ class TTkInput:
             TTkInput._pasteBuffer += stdinRead
         return None, None, None
 
+    @staticmethod
+    def _handleReportMode(mode:int, value:int) -> None:
+        # Ps = 0 not recognized, 1 set, 2 reset, 3 permanently set, 4 permanently reset
+        if mode == 2026:
+            TTkLog.debug(f"Synchronized Update (DEC mode 2026) status: {value}")
+            TTkTerm.setSyncUpdate(value in (1,2,3))
+
     @staticmethod
     def key_process(stdinRead:str) -> None:
         if TTkInput._bracketedPaste:
@@ -141,6 +195,10 @@ class TTkInput:
 
         mevt,kevt = None,None
 
+        if m := TTkInput._decrpm_re.match(stdinRead):
+            TTkInput._handleReportMode(int(m.group(1)), int(m.group(2)))
+            return None, None, None
+
         if not stdinRead.startswith("\033[<"):
             # Key Event
             kevt = TTkKeyEvent.parse(stdinRead)
@@ -59,6 +59,11 @@ class TTkMouseEvent:
 
         The number of tap (keypressed) reported in this event, (i.e. a **doubleclick** is reported as tap=2)
 
+    .. py:attribute:: delta
+        :type: int
+
+        The number of wheel ticks merged in this event (see :py:attr:`TTkCfg.mouseRate`), default 1
+
     .. py:attribute:: raw
         :type: str
 
@@ -85,7 +90,7 @@ class TTkMouseEvent:
     Left    = TTkK.WHEEL_Left
     Right   = TTkK.WHEEL_Right
 
-    __slots__ = ('x', 'y', 'key', 'evt', 'mod', 'tap', 'raw')
+    __slots__ = ('x', 'y', 'key', 'evt', 'mod', 'tap', 'raw', 'delta')
     x: int
     y: int
     key: int
@@ -93,7 +98,8 @@ class TTkMouseEvent:
     mod: int
     tap: int
     raw: str
-    def __init__(self, x: int, y: int, key: int, evt: int, mod: int, tap: int, raw: str):
+    delta: int
+    def __init__(self, x: int, y: int, key: int, evt: int, mod: int, tap: int, raw: str, delta: int = 1):
         self.x = x
         self.y = y
         self.key = key
@@ -101,6 +107,7 @@ class TTkMouseEvent:
         self.mod = mod
         self.raw = raw
         self.tap = tap
+        self.delta = delta
 
     def pos(self) -> tuple[int,int]:
         '''
@@ -114,7 +121,7 @@ class TTkMouseEvent:
     def clone(self, pos=None, evt=None):
         x,y = pos or (self.x, self.y)
         evt = evt or self.evt
-        return TTkMouseEvent(x, y, self.key, evt, self.mod, self.tap, self.raw)
+        return TTkMouseEvent(x, y, self.key, evt, self.mod, self.tap, self.raw, self.delta)
 
     def key2str(self):
         return {
@@ -24,7 +24,7 @@ __all__ = ['TTkTermBase']
 
 import os
 from enum import Flag
-from typing import Callable, TextIO
+from typing import Callable, TextIO, Optional, List
 
 class TTkTermBase():
     '''TTkTermBase'''
@@ -35,6 +35,11 @@ class TTkTermBase():
     SET_BRACKETED_PM   = "\033[?2004h" # Ps = 2 0 0 4  ⇒  Set bracketed paste mode, xterm.
     RESET_BRACKETED_PM = "\033[?2004l" # Ps = 2 0 0 4  ⇒  Reset bracketed paste mode, xterm.
 
+    # https://gist.github.com/christianparpart/d8a62cc1ab659194337d73e399004036
+    SET_SYNC_UPDATE    = "\033[?2026h"  # Ps = 2 0 2 6  ⇒  Begin Synchronized Update (BSU)
+    RESET_SYNC_UPDATE  = "\033[?2026l"  # Ps = 2 0 2 6  ⇒  End Synchronized Update (ESU)
+    REQ_SYNC_UPDATE    = "\033[?2026$p" # DECRQM, Request the Synchronized Update mode status
+
     class Mouse(str):
         ON         = "\033[?1002h\033[?1006h" # Enable reporting of mouse position on click and release
         OFF        = "\033[?1002l\033[?1006l" # Disable mouse reporting
@@ -94,9 +99,46 @@ class TTkTermBase():
     height: int = 0
     mouse: bool = True
     directMouse: bool = False
+    syncUpdate: bool = False
 
     _sigWinChCb = None
 
+    # Frame buffer, while a frame is open all the pushes are collected
+    # and sent to the terminal at once when the frame is committed
+    _frameBuffer: Optional[List[str]] = None
+    _frameSync: bool = False
+
+    @staticmethod
+    def beginFrame(syncUpdate:bool=False) -> None:
+        '''Start collecting the terminal output,
+
+        every :py:meth:`push` following this call is buffered
+        until :py:meth:`commitFrame` is called.
+
+        :param syncUpdate: wrap the frame in a Synchronized Update (BSU/ESU) envelope, defaults to False
+        :type syncUpdate: bool, optional
+        '''
+        if TTkTermBase._frameBuffer is None:
+            TTkTermBase._frameBuffer = []
+            TTkTermBase._frameSync = syncUpdate
+
+    @staticmethod
+    def commitFrame() -> None:
+        '''Send the collected output to the terminal in a single write and close the frame'''
+        frame = TTkTermBase._frameBuffer
+        TTkTermBase._frameBuffer = None
+        if not frame:
+            return
+        if TTkTermBase._frameSync:
+            TTkTermBase.pushFrame(TTkTermBase.SET_SYNC_UPDATE + ''.join(frame) + TTkTermBase.RESET_SYNC_UPDATE)
+        else:
+            TTkTermBase.pushFrame(''.join(frame))
+
+    @staticmethod
+    def setSyncUpdate(supported:bool) -> None:
+        '''Store the Synchronized Update capability reported by the terminal (DECRPM reply)'''
+        TTkTermBase.syncUpdate = supported
+
     @staticmethod
     def init(title: str = "TermTk", sigmask=0) -> None:
         TTkTermBase.title = title
@@ -105,6 +147,9 @@ class TTkTermBase():
         TTkTermBase.push(TTkTermBase.ALT_SCREEN)
         TTkTermBase.push(TTkTermBase.SET_BRACKETED_PM)
         TTkTermBase.push(TTkTermBase.CLEAR + TTkTermBase.Cursor.HIDE)
+        # Probe the Synchronized Update support,
+        # the reply (if any) is handled by TTkInput
+        TTkTermBase.push(TTkTermBase.REQ_SYNC_UPDATE)
         TTkTermBase.setEcho(False)
         TTkTermBase.CRNL(False)
         TTkTermBase.setSigmask(sigmask, False)
@@ -157,6 +202,7 @@ class TTkTermBase():
     setSigmask = lambda *args: None
     getSigmask = lambda *args: 0x00
     push       = lambda *args: None
+    pushFrame  = lambda txt: TTkTermBase.push(txt)
     flush      = lambda *args: None
     setEcho    = lambda *args: None
     CRNL       = lambda *args: None
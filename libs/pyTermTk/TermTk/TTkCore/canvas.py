@@ -121,6 +121,7 @@ class TTkCanvas():
         ret._width = self._width
         ret._height = self._height
         ret._data, ret._colors = self.copyBuffers()
+        return ret
 
     def copyBuffers(self):
         h = self._height
@@ -128,6 +129,17 @@ class TTkCanvas():
         retColors = [self._colors[i].copy() for i in range(h)]
         return retData, retColors
 
+    def copyRows(self, canvas, fr, to):
+        ''' copy the rows [fr,to) from a canvas with the same size
+
+        :param canvas: the source canvas
+        :param fr: the first row
+        :param to: the row after the last one
+        '''
+        for y in range(max(0,fr), min(to,self._height,canvas._height)):
+            self._data[y][:]   = canvas._data[y]
+            self._colors[y][:] = canvas._colors[y]
+
     def hide(self):
         self._visible = False
 
@@ -238,12 +250,14 @@ class TTkCanvas():
         self._data[y][x+a:x+b] = txt[a:b]
         if forceColor:
             colors=[color]*len(colors)
+        elif color != TTkColor.RST:
+            canvasColors = self._colors[y]
+            for i in range(a,b):
+                canvasColors[x+i] = (colors[i] | color).mod(x+i,y)
         else:
+            canvasColors = self._colors[y]
             for i in range(a,b):
-                if color != TTkColor.RST:
-                    self._colors[y][x+i] = (colors[i] | color).mod(x+i,y)
-                else:
-                    self._colors[y][x+i] = colors[i].mod(x+i,y)
+                canvasColors[x+i] = colors[i].mod(x+i,y)
         # Check the full wide chars on the edge of the two canvasses
         if ((0 <= (x+a) < self._width) and self._data[y][x+a] == ''):
             self._data[y][x+a]   = TTkCfg.theme.unicodeWideOverflowCh[0]
@@ -691,7 +705,7 @@ class TTkCanvas():
             for x in range(0, self._width):
                 ch = self._data[y][x]
                 color = self._colors[y][x]
-                if color != lastcolor:
+                if color is not lastcolor and color != lastcolor:
                     ansi += str(color-lastcolor)
                     lastcolor = color
                 ansi+=ch
@@ -709,7 +723,7 @@ class TTkCanvas():
             for x in range(0, self._width):
                 ch = self._data[y][x]
                 color = self._colors[y][x]
-                if color != lastcolor:
+                if color is not lastcolor and color != lastcolor:
                     ansi += color-lastcolor
                     lastcolor = color
                 ansi+=ch
@@ -723,16 +737,25 @@ class TTkCanvas():
         self._bufferedData   = [baseData.copy()   for _ in range(h)]
         self._bufferedColors = [baseColors.copy() for _ in range(h)]
 
-    def pushToTerminalBuffered(self, x, y, w, h):
+    def pushToTerminalBuffered(self, x, y, w, h, rows=None):
+        ''' push to the terminal the cells changed since the previous push
+
+        :param rows: (optional) the damaged [fr,to) row ranges, the other rows are not checked
+        :type rows: list[tuple[int,int]]
+        '''
         # TTkLog.debug("pushToTerminal")
         data, colors = self._data, self._colors
         oldData, oldColors = self._bufferedData, self._bufferedColors
         lastcolor = TTkColor.RST
         empty = True
         ansi = ""
-        for y,(lda, ldb, lca, lcb) in enumerate(zip(data, oldData, colors, oldColors)):
+        if rows is None:
+            rows = ((0,len(data)),)
+        for y in (y for fr,to in rows for y in range(max(0,fr),min(to,len(data),len(oldData)))):
+            lda, ldb, lca, lcb = data[y], oldData[y], colors[y], oldColors[y]
+            if lda == ldb and lca == lcb: continue
             for x,(da, db, ca, cb) in enumerate(zip(lda, ldb, lca, lcb)):
-                if da==db and ca==cb:
+                if da==db and (ca is cb or ca==cb):
                     if not empty:
                         TTkTerm.push(ansi)
                         empty=True
@@ -742,19 +765,20 @@ class TTkCanvas():
                 if empty:
                     ansi = TTkTerm.Cursor.moveTo(y+1,x+1)
                     empty = False
-                if color != lastcolor:
+                if color is not lastcolor and color != lastcolor:
                     ansi += color-lastcolor
                     lastcolor = color
                 ansi+=ch
             if not empty:
                 TTkTerm.push(ansi)
                 empty=True
+            # Update the buffer, the canvas is kept valid
+            # to allow the damaged rows only recomposition
+            ldb[:] = lda
+            lcb[:] = lca
         # Reset the color at the end
         TTkTerm.push(TTkColor.RST-lastcolor)
         # TTkTerm.flush()
-        # Switch the buffer
-        self._bufferedData, self._bufferedColors = data, colors
-        self._data,         self._colors         = oldData, oldColors
 
     def pushToTerminalBufferedNew(self, x, y, w, h):
         # TTkLog.debug("pushToTerminal")
@@ -767,7 +791,7 @@ class TTkCanvas():
             count = 0
             chBk = ''
             for x,(da,db,ca,cb) in enumerate(zip(lda,ldb,lca,lcb)):
-                if da==db and ca==cb:
+                if da==db and (ca is cb or ca==cb):
                     if not empty:
                         ansi += "" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b"
                         TTkTerm.push(ansi)
@@ -782,7 +806,7 @@ class TTkCanvas():
                     empty = False
                     count = 0
                     chBk = ''
-                if color != lastcolor:
+                if color is not lastcolor and color != lastcolor:
                     ansi += ("" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b") + str(color-lastcolor)
                     lastcolor = color
                     count = 0
@@ -799,10 +823,11 @@ class TTkCanvas():
                 ansi += "" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b"
                 TTkTerm.push(ansi)
                 empty=True
+            # Update the buffer, the canvas is kept valid
+            # to allow the damaged rows only recomposition
+            ldb[:] = lda
+            lcb[:] = lca
         # Reset the color at the end
         TTkTerm.push(TTkColor.RST)
         if getattr(lastcolor, "_link", False):
-            TTkTerm.push("\033]8;;\033\\")
-        # Switch the buffer
-        self._bufferedData, self._bufferedColors = data, colors
-        self._data,         self._colors         = oldData, oldColors
\ No newline at end of file
+            TTkTerm.push("\033]8;;\033\\")
\ No newline at end of file
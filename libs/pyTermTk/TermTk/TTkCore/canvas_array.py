@@ -0,0 +1,529 @@
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+__all__ = ['TTkCanvasArray']
+
+import weakref
+from array import array
+from typing import List, Dict, Tuple, Optional, Iterator
+
+from TermTk.TTkCore.TTkTerm.term import TTkTerm
+from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.cfg import TTkCfg
+from TermTk.TTkCore.color import TTkColor
+from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.canvas import TTkCanvas
+
+class _TTkGlyphs(dict):
+    '''Interned glyphs, map each glyph to its (int) id'''
+    __slots__ = ('table', 'wide', 'limit')
+    table:List[Optional[str]]
+    wide:bytearray
+    limit:int
+    _maxGlyphs = 0x10000
+    def __init__(self) -> None:
+        super().__init__()
+        self.table = []
+        self.wide  = bytearray()
+        self.limit = _TTkGlyphs._maxGlyphs
+
+    def __missing__(self, ch:Optional[str]) -> int:
+        gid = len(self.table)
+        self.table.append(ch)
+        self.wide.append(1 if ch and TTkString._isWideCharData(ch) else 0)
+        self[ch] = gid
+        return gid
+
+    def compact(self, live:List[int]) -> None:
+        '''Keep only the (sorted) live ids, each glyph is renumbered with its position in the list'''
+        table, wide = self.table, self.wide
+        self.table = [table[i] for i in live]
+        self.wide  = bytearray(wide[i] for i in live)
+        self.clear()
+        self.update((ch,gid) for gid,ch in enumerate(self.table))
+        self.limit = max(_TTkGlyphs._maxGlyphs, 2*len(live))
+
+class _TTkColors():
+    '''Interned colors, map each color to its (int) id
+    and cache the ansi transition between two colors'''
+    __slots__ = ('table', 'limit', '_ids', '_transitions')
+    table:List[Optional[TTkColor]]
+    limit:int
+    _ids:Dict[Tuple,int]
+    _transitions:Dict[Tuple[int,int],str]
+    _maxColors = 0x10000
+    _maxTransitions = 0x10000
+    def __init__(self) -> None:
+        self.table = []
+        self.limit = _TTkColors._maxColors
+        self._ids = {}
+        self._transitions = {}
+
+    @staticmethod
+    def _key(color:Optional[TTkColor]) -> Optional[Tuple]:
+        if color is None:
+            return None
+        # TTkColor is not hashable and its "==" ignore the clean/link status
+        return (type(color), color._fg, color._bg,
+                getattr(color, '_mod', 0), getattr(color, '_link', ''),
+                color._clean)
+
+    def id(self, color:Optional[TTkColor]) -> int:
+        key = _TTkColors._key(color)
+        if (cid := self._ids.get(key)) is None:
+            cid = self._ids[key] = len(self.table)
+            self.table.append(color)
+        return cid
+
+    def ids(self, colors:List[Optional[TTkColor]]) -> array:
+        ret = array('I',[0])*len(colors)
+        last, lastId = None, 0
+        for i,c in enumerate(colors):
+            if c is not last:
+                last, lastId = c, self.id(c)
+            ret[i] = lastId
+        return ret
+
+    def transition(self, fromId:int, toId:int) -> str:
+        key = (fromId, toId)
+        if (ret := self._transitions.get(key)) is None:
+            if len(self._transitions) > _TTkColors._maxTransitions:
+                self._transitions.clear()
+            ret = self._transitions[key] = self.table[toId] - self.table[fromId]
+        return ret
+
+    def compact(self, live:List[int]) -> None:
+        '''Keep only the (sorted) live ids, each color is renumbered with its position in the list'''
+        table = self.table
+        self.table = [table[i] for i in live]
+        self._ids = {_TTkColors._key(c):cid for cid,c in enumerate(self.table)}
+        self._transitions = {}
+        self.limit = max(_TTkColors._maxColors, 2*len(live))
+
+_glyphs = _TTkGlyphs()
+_colors = _TTkColors()
+# The canvases referencing the interned ids
+_canvases:weakref.WeakSet = weakref.WeakSet()
+
+# Reserved ids
+_NONE  = _glyphs[None]  # 0 - Transparent glyph
+_WIDE  = _glyphs['']    # 1 - Second half of a wide char
+_SPACE = _glyphs[' ']   # 2
+_colors.id(None)        # 0 - Transparent color
+_RST   = _colors.id(TTkColor.RST)
+
+def _remap(rows:List[array], reserved:int, size:int) -> List[int]:
+    '''Renumber in place the ids used in the rows, return the (sorted) old ids still in use'''
+    live = set(range(reserved))
+    for row in rows:
+        live.update(row)
+    live = sorted(live)
+    idMap = array('I',[0])*size
+    for newId, oldId in enumerate(live):
+        idMap[oldId] = newId
+    for row in rows:
+        row[:] = array('I', map(idMap.__getitem__, row))
+    return live
+
+def _canvasRows(glyphs:bool) -> Iterator[array]:
+    for canvas in list(_canvases):
+        yield from canvas._data if glyphs else canvas._colors
+        if canvas._doubleBuffer:
+            yield from canvas._bufferedData if glyphs else canvas._bufferedColors
+
+def _compact() -> None:
+    '''Drop the interned glyphs/colors no longer used by any canvas
+
+    The tables are compacted only when they grow over their limit,
+    the ids stored in the live canvases are renumbered in place
+    and the reserved ids are preserved.
+    It must be called when no drawing is in progress (i.e. before pushing the frame).
+    '''
+    if len(_glyphs.table) > _glyphs.limit:
+        # The same row may be listed twice only if shared, remap it once
+        rows = list({id(r):r for r in _canvasRows(True)}.values())
+        _glyphs.compact(_remap(rows, _SPACE+1, len(_glyphs.table)))
+    if len(_colors.table) > _colors.limit:
+        rows = list({id(r):r for r in _canvasRows(False)}.values())
+        _colors.compact(_remap(rows, _RST+1, len(_colors.table)))
+
+class TTkCanvasArray(TTkCanvas):
+    ''' Compact Canvas
+
+    Same API of :py:class:`TTkCanvas` but glyphs and colors are interned
+    and each row is stored as an array('I') of ids.
+
+    Cleaning, filling and composing the canvas are reduced to array slice copies,
+    and only the rows touched since the last push are diffed against the terminal buffer.
+
+    It can be enabled for all the widgets through :py:attr:`TTkCfg.compactCanvas`
+
+    .. note::
+        A :py:class:`TTkCanvas` (i.e. a pixmap) can be painted on a :py:class:`TTkCanvasArray`,
+        the opposite require :py:meth:`toCanvas`
+
+    :param width: the width of the Canvas
+    :type width: int
+    :param height: the height of the Canvas
+    :type height: int
+    '''
+    __slots__ = ('_dirty', '__weakref__')
+    _data:List[array]
+    _colors:List[array]
+    _dirty:bytearray
+
+    def __init__(self,
+                 width:int=0,
+                 height:int=0) -> None:
+        self._dirty = bytearray()
+        super().__init__(width=width, height=height)
+        _canvases.add(self)
+
+    @staticmethod
+    def fromCanvas(canvas:TTkCanvas) -> TTkCanvasArray:
+        '''Return a compact copy of a list based :py:class:`TTkCanvas`'''
+        w,h = canvas.size()
+        ret = TTkCanvasArray(width=w, height=h)
+        ret._transparent = canvas._transparent
+        ret._data   = [array('I', map(_glyphs.__getitem__, row)) for row in canvas._data[:h]]
+        ret._colors = [_colors.ids(row) for row in canvas._colors[:h]]
+        return ret
+
+    def toCanvas(self) -> TTkCanvas:
+        '''Return a list based :py:class:`TTkCanvas` copy of this canvas'''
+        gt, ct = _glyphs.table, _colors.table
+        ret = TTkCanvas(width=self._width, height=self._height)
+        ret._transparent = self._transparent
+        ret._data   = [[gt[i] for i in row] for row in self._data]
+        ret._colors = [[ct[i] for i in row] for row in self._colors]
+        return ret
+
+    def _baseRows(self, w:int) -> Tuple[array,array]:
+        if self._transparent:
+            return array('I',[_NONE])*w, array('I',[_NONE])*w
+        return array('I',[_SPACE])*w, array('I',[_RST])*w
+
+    def enableDoubleBuffer(self):
+        self._doubleBuffer = True
+        self._bufferedData, self._bufferedColors = self.copyBuffers()
+        self._dirty = bytearray(b'\x01'*self._height)
+
+    def updateSize(self):
+        if not self._visible: return
+        w,h = self._newWidth, self._newHeight
+        if w  == self._width and h == self._height:
+            return
+        baseData, baseColors = self._baseRows(w)
+        self._data   = [baseData[:]   for _ in range(h)]
+        self._colors = [baseColors[:] for _ in range(h)]
+        self._dirty  = bytearray(b'\x01'*h)
+        if self._doubleBuffer:
+            self._bufferedData   = [baseData[:]   for _ in range(h)]
+            self._bufferedColors = [baseColors[:] for _ in range(h)]
+        self._height = h
+        self._width  = w
+
+    def clean(self):
+        if not self._visible: return
+        baseData, baseColors = self._baseRows(self._width)
+        # Reuse the rows, no new allocations
+        for rd,rc in zip(self._data, self._colors):
+            rd[:] = baseData
+            rc[:] = baseColors
+        self._dirty = bytearray(b'\x01'*self._height)
+
+    def copy(self) -> TTkCanvasArray:
+        ret = TTkCanvasArray()
+        ret._width = ret._newWidth = self._width
+        ret._height = ret._newHeight = self._height
+        ret._transparent = self._transparent
+        ret._data, ret._colors = self.copyBuffers()
+        ret._dirty = bytearray(b'\x01'*self._height)
+        return ret
+
+    def copyBuffers(self):
+        h = self._height
+        retData   = [self._data[i][:]   for i in range(h)]
+        retColors = [self._colors[i][:] for i in range(h)]
+        return retData, retColors
+
+    def copyRows(self, canvas, fr, to):
+        if not isinstance(canvas, TTkCanvasArray):
+            canvas = TTkCanvasArray.fromCanvas(canvas)
+        for y in range(max(0,fr), min(to,self._height,canvas._height)):
+            self._data[y][:]   = canvas._data[y]
+            self._colors[y][:] = canvas._colors[y]
+            self._dirty[y] = 1
+
+    def _set(self, _y, _x, _ch, _col=TTkColor.RST):
+        if 0 <= _y < self._height and \
+           0 <= _x < self._width  :
+            self._data[_y][_x] = _glyphs[_ch]
+            self._colors[_y][_x] = _colors.id(_col.mod(_x,_y))
+            self._dirty[_y] = 1
+
+    def fill(self, pos=(0,0), size=None, char=' ', color=TTkColor.RST):
+        w,h = self.size()
+        if not size:
+            size=(w,h)
+        fxa,fya = pos
+        fw,fh = size
+        fxb,fyb = fxa+fw, fya+fh
+        # the fill area is outside the boundaries
+        if ( fxa >= w or fya >= h or
+             fxb <= 0 or fyb <= 0): return
+
+        fxa = max(0,fxa)
+        fya = max(0,fya)
+        fxb = min(w,fxb)
+        fyb = min(h,fyb)
+
+        fillCh = array('I',[_glyphs[char]])*(fxb-fxa)
+        for iy in range(fya,fyb):
+            self._data[iy][fxa:fxb] = fillCh
+            self._dirty[iy] = 1
+        if color.colorType() & TTkK.ColorType.ColorModifier:
+            for iy in range(fya,fyb):
+                for ix in range(fxa,fxb):
+                    self._colors[iy][ix] = _colors.id(color.mod(fxa+ix,fya+iy))
+        else:
+            fillColor = array('I',[_colors.id(color)])*(fxb-fxa)
+            for iy in range(fya,fyb):
+                self._colors[iy][fxa:fxb] = fillColor
+
+    def drawTTkString(self, pos, text:TTkString, width=None, color=TTkColor.RST, alignment=TTkK.NONE, forceColor=False):
+        if not self._visible: return
+
+        # Check the size and bounds
+        x,y = pos
+        if y<0 or y>=self._height : return
+
+        lentxt = text.termWidth()
+        if width is None or width<0:
+            width = lentxt
+
+        if x+width<0 or x>=self._width : return
+
+        text = text.align(width=width, alignment=alignment, color=color)
+        txt, colors = text.tab2spaces().getData()
+        a,b = max(0,-x), min(len(txt),self._width-x)
+        rowData, rowColors = self._data[y], self._colors[y]
+        rowData[x+a:x+b] = array('I', map(_glyphs.__getitem__, txt[a:b]))
+        self._dirty[y] = 1
+        if not forceColor:
+            if color != TTkColor.RST:
+                for i in range(a,b):
+                    rowColors[x+i] = _colors.id((colors[i] | color).mod(x+i,y))
+            else:
+                last, lastId = None, _RST
+                for i in range(a,b):
+                    if (c := colors[i]) is not last or c._colorMod:
+                        last, lastId = c, _colors.id(c.mod(x+i,y))
+                    rowColors[x+i] = lastId
+        # Check the full wide chars on the edge of the two canvasses
+        if ((0 <= (x+a) < self._width) and rowData[x+a] == _WIDE):
+            rowData[x+a]   = _glyphs[TTkCfg.theme.unicodeWideOverflowCh[0]]
+            rowColors[x+a] = _colors.id(TTkString.unicodeWideOverflowColor)
+        if ((0 <= (x+b-1) < self._width) and _glyphs.wide[rowData[x+b-1]]):
+            rowData[x+b-1]   = _glyphs[TTkCfg.theme.unicodeWideOverflowCh[1]]
+            rowColors[x+b-1] = _colors.id(TTkString.unicodeWideOverflowColor)
+
+    def paintCanvas(self, canvas, geom, _slice, bound):
+        x, y, w, h  = geom
+        bx,by,bw,bh = bound
+        cw,ch = self.size()
+        # out of bound
+        if not self._visible: return
+        if not canvas._visible: return
+        if canvas._width<=0 or canvas._height<=0: return
+        if bx+bw<0 or by+bh<0 or bx>=cw or by>=ch: return
+        if x+w<=bx or y+h<=by or bx+bw<=x or by+bh<=y: return
+
+        if not isinstance(canvas, TTkCanvasArray):
+            canvas = TTkCanvasArray.fromCanvas(canvas)
+
+        if (0,0,cw,ch)==geom==bound and (cw,ch)==canvas.size() and not canvas._transparent:
+            # fast Copy
+            # the canvas match exactly on top of the current one
+            for y in range(h):
+                self._data[y][:]   = canvas._data[y]
+                self._colors[y][:] = canvas._colors[y]
+            self._dirty = bytearray(b'\x01'*self._height)
+            return
+
+        x = min(x,cw-1)
+        y = min(y,ch-1)
+        w = min(w,cw-x)
+        h = min(h,ch-y)
+
+        xoffset = min(max(0,bx-x),canvas._width-1)
+        yoffset = min(max(0,by-y),canvas._height-1)
+        wslice = min(w if x+w < bx+bw else bx+bw-x,canvas._width)
+        hslice = min(h if y+h < by+bh else by+bh-y,canvas._height)
+
+        a, b = x+xoffset, x+wslice
+        slice_ab  = slice(a,b)
+        slice_off = slice(xoffset,wslice)
+        dirty = self._dirty
+        if canvas._transparent:
+            for iy in range(yoffset,hslice):
+                dstData, dstColors = self._data[y+iy], self._colors[y+iy]
+                srcData, srcColors = canvas._data[iy][slice_off], canvas._colors[iy][slice_off]
+                if _NONE in srcData:
+                    dstData[slice_ab] = array('I', [cca if cca else ccb for cca,ccb in zip(srcData,dstData[slice_ab])])
+                else:
+                    dstData[slice_ab] = srcData
+                if _NONE in srcColors:
+                    dstColors[slice_ab] = array('I', [cca if cca else ccb for cca,ccb in zip(srcColors,dstColors[slice_ab])])
+                else:
+                    dstColors[slice_ab] = srcColors
+                dirty[y+iy] = 1
+        else:
+            for iy in range(yoffset,hslice):
+                self._data[y+iy][slice_ab]   = canvas._data[iy][slice_off]
+                self._colors[y+iy][slice_ab] = canvas._colors[iy][slice_off]
+                dirty[y+iy] = 1
+
+        wide = _glyphs.wide
+        for iy in range(yoffset,hslice):
+            rowData, rowColors = self._data[y+iy], self._colors[y+iy]
+            # Check the full wide chars on the edge of the two canvasses
+            if ((0 <= a < cw) and rowData[a]==_WIDE):
+                rowData[a]   = _glyphs[TTkCfg.theme.unicodeWideOverflowCh[0]]
+                rowColors[a] = _colors.id(TTkString.unicodeWideOverflowColor)
+            if ((0 < b <= cw) and wide[rowData[b-1]]):
+                rowData[b-1]   = _glyphs[TTkCfg.theme.unicodeWideOverflowCh[1]]
+                rowColors[b-1] = _colors.id(TTkString.unicodeWideOverflowColor)
+            if ((0 < a <= cw) and wide[rowData[a-1]]):
+                rowData[a-1]   = _glyphs[TTkCfg.theme.unicodeWideOverflowCh[1]]
+                rowColors[a-1] = _colors.id(TTkString.unicodeWideOverflowColor)
+            if ((0 <= b < cw) and rowData[b]==_WIDE):
+                rowData[b]   = _glyphs[TTkCfg.theme.unicodeWideOverflowCh[0]]
+                rowColors[b] = _colors.id(TTkString.unicodeWideOverflowColor)
+
+    def toAnsi(self):
+        return self.toCanvas().toAnsi()
+
+    def pushToTerminal(self, x, y, w, h):
+        self.toCanvas().pushToTerminal(x, y, w, h)
+
+    def cleanBuffers(self):
+        if not self._visible: return
+        w = self._width
+        baseData, baseColors = array('I',[_SPACE])*w, array('I',[_RST])*w
+        self._bufferedData   = [baseData[:]   for _ in range(self._height)]
+        self._bufferedColors = [baseColors[:] for _ in range(self._height)]
+        self._dirty = bytearray(b'\x01'*self._height)
+
+    def pushToTerminalBuffered(self, x, y, w, h, rows=None):
+        _compact()
+        # The damaged rows are already tracked by the dirty flags
+        data, colors = self._data, self._colors
+        oldData, oldColors = self._bufferedData, self._bufferedColors
+        glyphs = _glyphs.table
+        transition = _colors.transition
+        lastcolor = _RST
+        for y,dirty in enumerate(self._dirty):
+            if not dirty: continue
+            lda, ldb, lca, lcb = data[y], oldData[y], colors[y], oldColors[y]
+            # Rows not changed are skipped with a single (C) comparison
+            if lda == ldb and lca == lcb: continue
+            empty = True
+            ansi = ""
+            for x,(da, db, ca, cb) in enumerate(zip(lda, ldb, lca, lcb)):
+                if da==db and ca==cb:
+                    if not empty:
+                        TTkTerm.push(ansi)
+                        empty=True
+                    continue
+                if empty:
+                    ansi = TTkTerm.Cursor.moveTo(y+1,x+1)
+                    empty = False
+                if ca != lastcolor:
+                    ansi += transition(lastcolor, ca)
+                    lastcolor = ca
+                ansi += glyphs[da]
+            if not empty:
+                TTkTerm.push(ansi)
+            # Align the terminal buffer to the current frame
+            ldb[:] = lda
+            lcb[:] = lca
+        # Reset the color at the end
+        TTkTerm.push(transition(lastcolor, _RST))
+        self._dirty = bytearray(len(self._dirty))
+
+    def pushToTerminalBufferedNew(self, x, y, w, h):
+        _compact()
+        data, colors = self._data, self._colors
+        oldData, oldColors = self._bufferedData, self._bufferedColors
+        glyphs = _glyphs.table
+        transition = _colors.transition
+        lastcolor = _RST
+        def _rep(chBk, count):
+            return "" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b"
+        for y,dirty in enumerate(self._dirty):
+            if not dirty: continue
+            lda, ldb, lca, lcb = data[y], oldData[y], colors[y], oldColors[y]
+            if lda == ldb and lca == lcb: continue
+            empty = True
+            ansi = ""
+            count = 0
+            chBk = ''
+            for x,(da,db,ca,cb) in enumerate(zip(lda,ldb,lca,lcb)):
+                if da==db and ca==cb:
+                    if not empty:
+                        ansi += _rep(chBk, count)
+                        TTkTerm.push(ansi)
+                        count = 0
+                        chBk = ''
+                        empty=True
+                    continue
+                ch = glyphs[da]
+                if empty:
+                    ansi = _rep(chBk, count) + TTkTerm.Cursor.moveTo(y+1,x+1)
+                    empty = False
+                    count = 0
+                    chBk = ''
+                if ca != lastcolor:
+                    ansi += _rep(chBk, count) + transition(lastcolor, ca)
+                    lastcolor = ca
+                    count = 0
+                    chBk = ''
+                # "Collect the consecutive characters"
+                if ch == chBk:
+                    count+=1
+                else:
+                    ansi += _rep(chBk, count)
+                    chBk = ch
+                    count=1
+            if not empty:
+                ansi += _rep(chBk, count)
+                TTkTerm.push(ansi)
+            ldb[:] = lda
+            lcb[:] = lca
+        # Reset the color at the end
+        TTkTerm.push(TTkColor.RST)
+        if getattr(_colors.table[lastcolor], "_link", False):
+            TTkTerm.push("\033]8;;\033\\")
+        self._dirty = bytearray(len(self._dirty))
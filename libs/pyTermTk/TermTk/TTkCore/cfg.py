@@ -39,6 +39,17 @@ class _TTkCfg:
     maxFps:int = 65
     doubleBuffer:bool = True
     doubleBufferNew:bool = False
+    # Synchronized Update (DEC mode 2026)
+    # None = autodetect, True = always on, False = disabled
+    syncUpdate:Optional[bool] = None
+    # Use the compact (array based) canvas for the widgets
+    compactCanvas:bool = False
+    # Recompose only the rows damaged by the updated widgets
+    damageCompose:bool = True
+    # Use a spatial index for the hit-testing on the crowded layouts
+    spatialIndex:bool = True
+    # Max number of coalesced mouse Move/Drag/Wheel events dispatched per second (0 = unlimited)
+    mouseRate:int = 120
 
     scrollDelta:int = 5
 
@@ -67,6 +67,110 @@ from TermTk.TTkCore.helper import TTkHelper
 # [47m          --        set background color to white
 # [49m          2.53      set background color to default (black)
 
+class _TTkColorPalette():
+    '''Flyweight registry of the colors and cache of the ansi transitions
+
+    The colors composed with the ``+`` operator or created by the helpers
+    (:py:meth:`TTkColor.fg`, :py:meth:`TTkColor.bg`, ...) are interned,
+    identical colors are the same object and can be compared by identity.
+
+    Each color used in a ``-`` operation gets a palette id,
+    the resulting ansi sequence is cached for the (to, from) id pair
+    so the renderer does not format the same escape code for each cell.
+    '''
+    __slots__ = ()
+
+    MAX_COLORS:int = 0x1000
+    MAX_TRANSITIONS:int = 0x4000
+
+    _colors:Dict[tuple,TTkColor] = {}
+    _ids:Dict[tuple,int] = {}
+    _lastId:int = 0
+    _transitions:Dict[Tuple[int,int],str] = {}
+
+    @staticmethod
+    def get(cls, fg, bg, clean:bool=False, mod:int=0, link:str='', colorMod=None) -> TTkColor:
+        '''Return the shared color instance matching the arguments
+
+        Colors with a color modifier are stateful and are never shared.
+        '''
+        if colorMod:
+            return _TTkColorPalette._new(cls, fg, bg, clean, mod, link, colorMod)
+        key = (cls, fg, bg, clean, mod, link)
+        colors = _TTkColorPalette._colors
+        try:
+            if (color := colors.get(key)) is not None:
+                return color
+        except TypeError: # Not hashable fg/bg (i.e. lists)
+            return _TTkColorPalette._new(cls, fg, bg, clean, mod, link, None)
+        if len(colors) >= _TTkColorPalette.MAX_COLORS:
+            colors.clear()
+        color = colors[key] = _TTkColorPalette._new(cls, fg, bg, clean, mod, link, None)
+        return color
+
+    @staticmethod
+    def _new(cls, fg, bg, clean, mod, link, colorMod) -> TTkColor:
+        if cls is TTkColor:
+            return TTkColor(fg=fg, bg=bg, clean=clean, colorMod=colorMod)
+        if cls is _TTkColor_mod:
+            return _TTkColor_mod(fg=fg, bg=bg, clean=clean, mod=mod, colorMod=colorMod)
+        return cls(fg=fg, bg=bg, clean=clean, mod=mod, link=link, colorMod=colorMod)
+
+    @staticmethod
+    def colorId(color:TTkColor) -> int:
+        '''Return (and assign) the palette id of the color'''
+        fg, bg = color._fg, color._bg
+        key = (type(color),
+               tuple(fg) if fg else fg,
+               tuple(bg) if bg else bg,
+               color._clean,
+               getattr(color, '_mod', 0),
+               getattr(color, '_link', ''))
+        ids = _TTkColorPalette._ids
+        if not (pid := ids.get(key, 0)):
+            if len(ids) >= _TTkColorPalette.MAX_COLORS:
+                # The ids are never reused, the colors still
+                # referencing the old ones are valid
+                ids.clear()
+                _TTkColorPalette._transitions.clear()
+            _TTkColorPalette._lastId += 1
+            pid = ids[key] = _TTkColorPalette._lastId
+        color._pid = pid
+        return pid
+
+    @staticmethod
+    def transition(sub):
+        '''Decorator caching the ansi sequence returned by ``toColor - fromColor``'''
+        def _transition(toColor, fromColor) -> str:
+            key = (toColor._pid   or _TTkColorPalette.colorId(toColor),
+                   fromColor._pid or _TTkColorPalette.colorId(fromColor))
+            if (ret := _TTkColorPalette._transitions.get(key)) is None:
+                ret = _TTkColorPalette._addTransition(key, sub(toColor, fromColor))
+            return ret
+        _transition.__doc__ = sub.__doc__
+        return _transition
+
+    @staticmethod
+    def rtransition(rsub):
+        '''Decorator caching the ansi sequence returned by the reflected ``fromColor.__rsub__(toColor)``'''
+        def _rtransition(fromColor, toColor) -> str:
+            key = (toColor._pid   or _TTkColorPalette.colorId(toColor),
+                   fromColor._pid or _TTkColorPalette.colorId(fromColor))
+            if (ret := _TTkColorPalette._transitions.get(key)) is None:
+                ret = _TTkColorPalette._addTransition(key, rsub(fromColor, toColor))
+            return ret
+        _rtransition.__doc__ = rsub.__doc__
+        return _rtransition
+
+    @staticmethod
+    def _addTransition(key:Tuple[int,int], ansi:str) -> str:
+        transitions = _TTkColorPalette._transitions
+        if len(transitions) >= _TTkColorPalette.MAX_TRANSITIONS:
+            # Drop the oldest entry
+            del transitions[next(iter(transitions))]
+        transitions[key] = ansi
+        return ansi
+
 class TTkColor:
     ''' TermTk Color helper
 
@@ -170,7 +274,7 @@ class TTkColor:
     BLINKING:TTkColor
     '''"Blinking" modifier'''
 
-    __slots__ = ('_fg','_bg', '_colorMod', '_buffer', '_clean')
+    __slots__ = ('_fg','_bg', '_colorMod', '_buffer', '_clean', '_pid')
     _fg: Optional[Tuple[int,int,int]]
     _bg: Optional[Tuple[int,int,int]]
     def __init__(self,
@@ -194,7 +298,7 @@ class TTkColor:
         self._clean = clean or (fg is None and bg is None)
         self._colorMod = colorMod
         self._buffer = ''
-
+        self._pid = 0
 
 
     @staticmethod
@@ -224,9 +328,9 @@ class TTkColor:
         '''
         fg,bg,mod,clean = TTkTermColor.ansi2rgb(ansi)
         if mod:
-            return _TTkColor_mod(fg=fg, bg=bg, mod=mod, clean=clean)
+            return _TTkColorPalette.get(_TTkColor_mod, fg, bg, clean, mod)
         else:
-            return TTkColor(fg=fg, bg=bg, clean=clean)
+            return _TTkColorPalette.get(TTkColor, fg, bg, clean)
 
     @staticmethod
     def fg(color:str, *, link:str='', modifier:Optional[TTkColorModifier]=None) -> TTkColor:
@@ -250,9 +354,9 @@ class TTkColor:
         :return: :py:class:`TTkColor`
         '''
         if link:
-            return _TTkColor_mod_link(fg=TTkColor.hexToRGB(color), colorMod=modifier, link=link)
+            return _TTkColorPalette.get(_TTkColor_mod_link, TTkColor.hexToRGB(color), None, link=link, colorMod=modifier)
         else:
-            return TTkColor(fg=TTkColor.hexToRGB(color), colorMod=modifier)
+            return _TTkColorPalette.get(TTkColor, TTkColor.hexToRGB(color), None, colorMod=modifier)
 
     @staticmethod
     def bg(color:str, *, link:str='', modifier:Optional[TTkColorModifier]=None) -> TTkColor:
@@ -276,9 +380,9 @@ class TTkColor:
         :return: :py:class:`TTkColor`
         '''
         if link:
-            return _TTkColor_mod_link(bg=TTkColor.hexToRGB(color), colorMod=modifier, link=link)
+            return _TTkColorPalette.get(_TTkColor_mod_link, None, TTkColor.hexToRGB(color), link=link, colorMod=modifier)
         else:
-            return TTkColor(bg=TTkColor.hexToRGB(color), colorMod=modifier)
+            return _TTkColorPalette.get(TTkColor, None, TTkColor.hexToRGB(color), colorMod=modifier)
 
     @staticmethod
     def fgbg(fg:str='', bg:str='', *, link:str='', modifier:Optional[TTkColorModifier]=None) -> TTkColor:
@@ -304,9 +408,9 @@ class TTkColor:
         :return: :py:class:`TTkColor`
         '''
         if link:
-            return _TTkColor_mod_link(fg=TTkColor.hexToRGB(fg), bg=TTkColor.hexToRGB(bg), colorMod=modifier, link=link)
+            return _TTkColorPalette.get(_TTkColor_mod_link, TTkColor.hexToRGB(fg), TTkColor.hexToRGB(bg), link=link, colorMod=modifier)
         else:
-            return TTkColor(fg=TTkColor.hexToRGB(fg), bg=TTkColor.hexToRGB(bg), colorMod=modifier)
+            return _TTkColorPalette.get(TTkColor, TTkColor.hexToRGB(fg), TTkColor.hexToRGB(bg), colorMod=modifier)
 
 
     def foreground(self) -> TTkColor:
@@ -316,7 +420,7 @@ class TTkColor:
         :rtype: :py:class:`TTkColor`
         '''
         if self._fg:
-            return TTkColor(fg=self._fg)
+            return _TTkColorPalette.get(TTkColor, self._fg, None)
         else:
             return TTkColor.RST
 
@@ -327,7 +431,7 @@ class TTkColor:
         :rtype: :py:class:`TTkColor`
         '''
         if self._bg:
-            return TTkColor(bg=self._bg)
+            return _TTkColorPalette.get(TTkColor, None, self._bg)
         else:
             return TTkColor.RST
 
@@ -521,6 +625,10 @@ class TTkColor:
         :return: color copy with foreground/background inverted
         :rtype: :py:class:`TTkColor`
         '''
+        if not self._colorMod:
+            return _TTkColorPalette.get(
+                        type(self), self._bg, self._fg, self._clean,
+                        getattr(self, '_mod', 0), getattr(self, '_link', ''))
         ret = self.copy()
         ret._fg = self._bg
         ret._bg = self._fg
@@ -543,6 +651,12 @@ class TTkColor:
     def __or__(self, other) -> TTkColor:
         if self is other:
             return self
+        if not self._colorMod:
+            if not self._clean:
+                return other + self
+            if type(self) is TTkColor and self._fg is None and self._bg is None:
+                # Unclean reset, ( other + TTkColor() ) is equivalent to other
+                return other
         c = self.copy()
         c._clean = False
         return other + c
@@ -556,11 +670,9 @@ class TTkColor:
         fg = other._fg or self._fg
         bg = other._bg or self._bg
         colorMod = other._colorMod or self._colorMod
-        return TTkColor(
-                    fg=fg, bg=bg,
-                    colorMod=colorMod,
-                    clean=clean)
+        return _TTkColorPalette.get(TTkColor, fg, bg, clean, colorMod=colorMod)
 
+    @_TTkColorPalette.transition
     def __sub__(self, other) -> str:
         '''Return a transition ANSI sequence from ``other`` to ``self``.
 
@@ -693,7 +805,7 @@ class _TTkColor_mod(TTkColor):
 
     def withoutModifiers(self) -> TTkColor:
         '''Return a base color stripped of style flags.'''
-        return TTkColor(fg=self._fg, bg=self._bg)
+        return _TTkColorPalette.get(TTkColor, self._fg, self._bg)
 
     def __str__(self) -> str:
         if not self._buffer:
@@ -708,14 +820,6 @@ class _TTkColor_mod(TTkColor):
                 ( self._mod == (other._mod if isinstance(other,_TTkColor_mod) else 0))
             )
 
-    # self | other
-    def __or__(self, other) -> TTkColor:
-        if self is other:
-            return self
-        c = self.copy()
-        c._clean = False
-        return other + c
-
     # self + other
     def __add__(self, other) -> TTkColor:
         # TTkLog.debug("__add__")
@@ -727,10 +831,7 @@ class _TTkColor_mod(TTkColor):
         bg  = other._bg or self._bg
         mod = self._mod | otherMod
         colorMod = other._colorMod or self._colorMod
-        return _TTkColor_mod(
-                    fg=fg, bg=bg, mod=mod,
-                    colorMod=colorMod,
-                    clean=clean)
+        return _TTkColorPalette.get(_TTkColor_mod, fg, bg, clean, mod, colorMod=colorMod)
 
     # self + other
     def __radd__(self, other) -> TTkColor:
@@ -742,11 +843,9 @@ class _TTkColor_mod(TTkColor):
         bg  = self._bg or other._bg
         mod = self._mod
         colorMod = self._colorMod or other._colorMod
-        return _TTkColor_mod(
-                    fg=fg, bg=bg, mod=mod,
-                    colorMod=colorMod,
-                    clean=clean)
+        return _TTkColorPalette.get(_TTkColor_mod, fg, bg, clean, mod, colorMod=colorMod)
 
+    @_TTkColorPalette.transition
     def __sub__(self, other) -> str:
         otherMod = other._mod if isinstance(other,_TTkColor_mod) else 0
         if ( None == self._bg   != other._bg or
@@ -757,6 +856,7 @@ class _TTkColor_mod(TTkColor):
                                 clean=True)
         return str(self)
 
+    @_TTkColorPalette.rtransition
     def __rsub__(self, other) -> str:
         return TTkTermColor.rgb2ansi(fg=other._fg, bg=other._bg, clean=True)
 
@@ -818,14 +918,6 @@ class _TTkColor_mod_link(_TTkColor_mod):
                 ( self._link == (other._link if isinstance(other,_TTkColor_mod_link) else 0))
             )
 
-    # self | other
-    def __or__(self, other) -> TTkColor:
-        if self is other:
-            return self
-        c = self.copy()
-        c._clean = False
-        return other + c
-
     # self + other
     def __add__(self, other) -> TTkColor:
         # TTkLog.debug("__add__")
@@ -839,10 +931,7 @@ class _TTkColor_mod_link(_TTkColor_mod):
         mod = self._mod | otherMod
         link:str = self._link or otherLink
         colorMod = other._colorMod or self._colorMod
-        return _TTkColor_mod_link(
-                    fg=fg, bg=bg, mod=mod,
-                    colorMod=colorMod, link=link,
-                    clean=clean)
+        return _TTkColorPalette.get(_TTkColor_mod_link, fg, bg, clean, mod, link, colorMod=colorMod)
 
     def __radd__(self, other) -> TTkColor:
         # TTkLog.debug("__add__")
@@ -855,11 +944,9 @@ class _TTkColor_mod_link(_TTkColor_mod):
         mod  = self._mod | otherMod
         link = self._link
         colorMod = self._colorMod or other._colorMod
-        return _TTkColor_mod_link(
-                    fg=fg, bg=bg, mod=mod,
-                    colorMod=colorMod, link=link,
-                    clean=clean)
+        return _TTkColorPalette.get(_TTkColor_mod_link, fg, bg, clean, mod, link, colorMod=colorMod)
 
+    @_TTkColorPalette.transition
     def __sub__(self, other) -> str:
         # TTkLog.debug("__sub__")
         # if other is None: return str(self)
@@ -874,6 +961,7 @@ class _TTkColor_mod_link(_TTkColor_mod):
                                 link=self._link, clean=True)
         return ''
 
+    @_TTkColorPalette.rtransition
     def __rsub__(self, other) -> str:
         if type(other) == TTkColor:
             return TTkTermColor.rgb2ansi_link(fg=other._fg, bg=other._bg, clean=True, cleanLink=True)
@@ -1124,4 +1212,6 @@ class TTkAlternateColor(TTkColorModifier):
         :rtype: :py:class:`TTkColor`
         '''
         if y%2: return self._alternateColor
-        else:   return base_color.copy(modifier=False)
+        else:   return _TTkColorPalette.get(
+                            type(base_color), base_color._fg, base_color._bg, base_color._clean,
+                            getattr(base_color, '_mod', 0), getattr(base_color, '_link', ''))
@@ -29,6 +29,9 @@ from ..TTkTerm.term_base import TTkTermBase
 class TTkTerm(TTkTermBase):
     @staticmethod
     def _push(*args):
+        if (frame := TTkTermBase._frameBuffer) is not None:
+            frame.append(str(*args))
+            return
         pyodideProxy.termPush(str(*args))
     TTkTermBase.push = _push
 
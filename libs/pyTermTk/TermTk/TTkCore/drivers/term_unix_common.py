@@ -24,6 +24,7 @@ __all__ = ['_TTkTerm']
 
 import sys, os, signal
 from threading import Thread, Lock
+from select import select
 
 from typing import Callable, TextIO
 
@@ -66,6 +67,9 @@ class _TTkTerm(TTkTermBase):
 
     @staticmethod
     def _push(*args):
+        if (frame := TTkTermBase._frameBuffer) is not None:
+            frame.append(str(*args))
+            return
         try:
             sys.stdout.write(str(*args))
             sys.stdout.flush()
@@ -75,6 +79,22 @@ class _TTkTerm(TTkTermBase):
             TTkLog.fatal(e)
     TTkTermBase.push = _push
 
+    @staticmethod
+    def _pushFrame(txt:str):
+        try:
+            # Anything still pending in the python buffer goes first
+            sys.stdout.flush()
+            fd = sys.stdout.fileno()
+            data = memoryview(txt.encode(sys.stdout.encoding or 'utf-8', errors='replace'))
+            while data:
+                try:
+                    data = data[os.write(fd, data):]
+                except BlockingIOError:
+                    select([], [fd], [])
+        except Exception as e:
+            TTkLog.fatal(e)
+    TTkTermBase.pushFrame = _pushFrame
+
     @staticmethod
     def _flush():
         sys.stdout.flush()
@@ -34,6 +34,9 @@ from .windows import *
 class TTkTerm(TTkTermBase):
     @staticmethod
     def _push(*args):
+        if (frame := TTkTermBase._frameBuffer) is not None:
+            frame.append(str(*args))
+            return
         try:
             sys.stdout.write(str(*args))
             sys.stdout.flush()
@@ -24,7 +24,16 @@ __all__ = ['TTkFileBuffer']
 
 import os
 import re
+import mmap
+import time
+import operator
+import weakref
 import threading
+import multiprocessing
+from array import array
+from bisect import bisect_left
+from itertools import islice, compress, count, repeat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.signal import pyTTkSignal
 
@@ -37,6 +46,107 @@ from TermTk.TTkCore.signal import pyTTkSignal
 #     File   |----|----|----|----|----|----|  view as list of windows
 #              w1   w2   w3   w4   w5   w6
 
+# Bytes scanned by each search strategy to choose the fastest
+_SEARCH_SAMPLE_SIZE = 0x10000
+# The assertions that may match in a line searched alone
+# but not in the middle of a block, the block search may miss those lines
+_searchBlockUnsafe = re.compile(r'\$|\\[ZAB]|\(\?<?[=!]')
+
+def _searchLines(rr, rrBlock, nl, data, start, end, line, ret):
+    '''
+    Search the regex in each line between "start" and "end" (new line included),
+    return the number of the line at "end"
+    '''
+    lines = data[start:end].split(nl)
+    last = lines.pop()
+    ret.extend(compress(count(line), map(rr.search, map(operator.add, lines, repeat(nl)))))
+    line += len(lines)
+    # The last line of the file may not be terminated
+    if last and rr.search(last):
+        ret.append(line)
+    return line
+
+def _searchBlock(rr, rrBlock, nl, data, start, end, line, ret):
+    '''
+    Search the regex in the whole block between "start" and "end",
+    each match is validated searching its line,
+    return the number of the line at "end"
+    '''
+    pos = start
+    while (m := rrBlock.search(data, pos, end)):
+        # A match at the end is valid only at the end of a not terminated line
+        if (match := m.start()) == end and (pos == end or data[end-1:end] == nl):
+            break
+        line += data.count(nl, pos, match)
+        lineStart = data.rfind(nl, pos, match)+1 or pos
+        lineEnd = data.find(nl, match, end)+1 or end
+        if rr.search(data[lineStart:lineEnd]):
+            ret.append(line)
+        pos = lineEnd
+        line += 1
+    return line + data.count(nl, pos, end)
+
+def _searchChunk(filename, start, end, line, regex, flags, asciiRegex):
+    '''
+    Return the lines matching the regex between the "start" and "end" bytes of the file,
+    "start" is the beginning of the "line",
+    "asciiRegex" is True if the regex can be compiled as a bytes pattern
+
+    This function runs in the search pool processes
+    '''
+    with open(filename, 'rb') as fd:
+        with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = mm[start:end]
+    # The bytes regex is used if it is equivalent to the str regex on this chunk
+    if asciiRegex and data.isascii():
+        pattern = regex.encode()
+        nl = b'\n'
+    else:
+        data = data.decode(errors='replace')
+        pattern = regex
+        nl = '\n'
+    # Each line is searched as in a file read line by line,
+    # the multiline regex is used to find the candidate lines in the block search
+    rr = re.compile(pattern, flags)
+    rrBlock = re.compile(pattern, flags|re.MULTILINE)
+    ret = array('Q')
+    size = len(data)
+    if _searchBlockUnsafe.search(regex):
+        _searchLines(rr, rrBlock, nl, data, 0, size, line, ret)
+        return ret
+    # The block search is faster for selective patterns,
+    # the line by line search is faster if the regex backtracks on many positions.
+    # Both are sampled and the fastest is used for the rest of the chunk
+    sampleStart = 0
+    timings = []
+    for search in (_searchBlock, _searchLines):
+        sampleEnd = data.find(nl, sampleStart+_SEARCH_SAMPLE_SIZE)+1 or size
+        t = time.perf_counter()
+        line = search(rr, rrBlock, nl, data, sampleStart, sampleEnd, line, ret)
+        timings.append((time.perf_counter()-t, search))
+        if (sampleStart := sampleEnd) >= size:
+            return ret
+    min(timings, key=lambda t:t[0])[1](rr, rrBlock, nl, data, sampleStart, size, line, ret)
+    return ret
+
+_searchPoolExecutors = {}
+def _searchPool(processes):
+    '''
+    Return the pool used to scan the search chunks,
+    a process pool if requested and supported (see :py:attr:`TTkFileBuffer.SEARCH_PROCESSES`), a thread pool otherwise
+    '''
+    processes = processes and 'forkserver' in multiprocessing.get_all_start_methods()
+    if (pool := _searchPoolExecutors.get(processes)) is None:
+        workers = max(1, (os.cpu_count() or 2)-1)
+        if processes:
+            # Forking this (multithreaded) process may deadlock the children,
+            # the workers are forked by a single threaded server
+            pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('forkserver'))
+        else:
+            pool = ThreadPoolExecutor(workers)
+        _searchPoolExecutors[processes] = pool
+    return pool
+
 class TTkFileBuffer():
     class _Page:
         __slots__ = ('_page', '_size', '_buffer')
@@ -54,30 +164,69 @@ class TTkFileBuffer():
 
     __slots__ = (
         '_indexes', '_indexesMutex',
-        '_filename', '_fd',
+        '_filename', '_fd', '_mmap',
         '_pages', '_buffer',
         '_window', '_numW',
         '_width',
+        '_indexThread', '_indexedSize', '_indexGen', '_follow',
+        '_searchCache', '_searchCancel',
+        '__weakref__',
         #Signals
-        'indexUpdated', 'indexed')
-    def __init__(self, filename, window, numWindows):
+        'indexUpdated', 'indexed', 'searchUpdated')
+
+    # Bytes scanned by the indexing thread in a single block
+    CHUNK_SIZE:int = 0x1000000 # ~16M
+    # Bytes scanned by a search process in a single block
+    SEARCH_CHUNK_SIZE:int = 0x400000 # ~4M
+    # Number of searches results cached
+    SEARCH_CACHE_SIZE:int = 16
+    # Scan the search chunks in a process pool, a thread pool is used by default.
+    # The workers import the main module of the application,
+    # it must be safe to import (i.e. guarded by 'if __name__ == "__main__":')
+    SEARCH_PROCESSES:bool = False
+
+    _indexes:array
+    def __init__(self, filename, window, numWindows, follow=False):
         # Signals
         self.indexUpdated = pyTTkSignal(float)
         self.indexed = pyTTkSignal()
+        self.searchUpdated = pyTTkSignal(list, float)
 
         self._window = window
         self._numW = numWindows
         self._filename = filename
-        self._indexes = [0]
+        # Byte offset of the beginning of each line
+        self._indexes = array('Q',[0])
         self._indexesMutex = threading.Lock()
         self._width=0
         self._buffer = [None]*self._numW
         self._pages = [None]
-        self._fd = open(self._filename, 'r', errors='replace', newline='\n')
-        threading.Thread(name='TTkFileBuffer', target=self.createIndex).start()
+        self._indexedSize = 0
+        # Incremented each time the index is rebuilt from the beginning
+        self._indexGen = 0
+        self._follow = None
+        self._searchCache = {}
+        self._searchCancel = None
+        self._fd = open(self._filename, 'rb')
+        self._mmap = self._map(self._fd)
+        self._indexThread = threading.Thread(name='TTkFileBuffer', target=self.createIndex)
+        self._indexThread.start()
+        self.setFollow(follow)
 
     def __del__(self):
-        self._fd.close()
+        if stop := getattr(self, '_follow', None):
+            stop.set()
+        if mm := getattr(self, '_mmap', None):
+            mm.close()
+        if fd := getattr(self, '_fd', None):
+            fd.close()
+
+    @staticmethod
+    def _map(fd):
+        # An empty file cannot be mapped
+        if not os.fstat(fd.fileno()).st_size:
+            return None
+        return mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
 
     def filename(self):
         return self._filename
@@ -88,39 +237,141 @@ class TTkFileBuffer():
     def getWidth(self, indexes=None):
        return self._width
 
+    def follow(self):
+        '''
+        Returns True if the file is followed
+
+        :return: bool
+        '''
+        return self._follow is not None
+
+    def setFollow(self, follow, interval=0.25):
+        '''
+        Follow the file (like "tail -f"),
+        the size of the file is polled and only the appended lines are indexed.
+
+        If the file is truncated or rotated (replaced by a new file with the same name)
+        the index is rebuilt from the beginning.
+
+        :py:meth:`indexUpdated` and :py:meth:`indexed` are emitted after the new lines are indexed.
+
+        :param follow: enable/disable the follow mode
+        :type follow: bool
+        :param interval: the polling interval in seconds
+        :type interval: float
+        '''
+        if bool(follow) == self.follow():
+            return
+        if not follow:
+            self._follow.set()
+            self._follow = None
+            return
+        self._follow = threading.Event()
+        # The thread holds only a weak reference to the buffer to not keep it alive
+        threading.Thread(
+            name='TTkFileBufferFollow', daemon=True,
+            target=TTkFileBuffer._followLoop,
+            args=(weakref.ref(self), self._follow, self._indexThread, interval)).start()
+
+    @staticmethod
+    def _followLoop(ref, stop, indexThread, interval):
+        indexThread.join()
+        while not stop.wait(interval):
+            if (fb := ref()) is None:
+                return
+            fb._updateIndex()
+            fb = None
+
+    def _updateIndex(self):
+        try:
+            stat = os.stat(self._filename)
+        except OSError:
+            # The file is rotated and the new one is not created yet
+            return
+        if stat.st_ino != os.fstat(self._fd.fileno()).st_ino or stat.st_size < self._indexedSize:
+            # The file is rotated or truncated, restart the index from the beginning
+            fd = open(self._filename, 'rb')
+            with self._indexesMutex:
+                self._fd.close()
+                self._fd = fd
+                self._mmap = None
+                self._indexes = array('Q',[0])
+                self._pages = [None]
+                self._buffer = [None]*self._numW
+                self._width = 0
+                self._indexedSize = 0
+                self._indexGen += 1
+                self._searchCache.clear()
+        elif stat.st_size == self._indexedSize:
+            return
+        if (mm := self._map(self._fd)) is None:
+            self.indexUpdated.emit(1.0)
+            self.indexed.emit()
+            return
+        with self._indexesMutex:
+            # The last line may be incomplete, its page is read again
+            self._mmap = mm
+            for page in range((len(self._indexes)-1)//self._window, len(self._pages)):
+                if (p := self._pages[page]) is not None:
+                    self._buffer[self._buffer.index(p)] = None
+                    self._pages[page] = None
+        self._index(mm, self._indexedSize)
+        self.indexUpdated.emit(1.0)
+        self.indexed.emit()
+
+    def _readLines(self, line, count):
+        '''
+        Return the decoded bytes of the "count" lines starting at "line"
+        '''
+        with self._indexesMutex:
+            if (mm := self._mmap) is None:
+                return ""
+            indexes = self._indexes
+            start = indexes[line]
+            end = indexes[line+count] if line+count < len(indexes) else None
+        if end is None:
+            # The end of the block is not indexed (yet)
+            end = start
+            for _ in range(count):
+                if not (end := mm.find(b'\n', end)+1):
+                    end = len(mm)
+                    break
+        return mm[start:end].decode(errors='replace')
+
     def getLineDirect(self, line):
         if line >= self.getLen():
             return ""
-        self._indexesMutex.acquire()
-        self._fd.seek(self._indexes[line])
-        self._indexesMutex.release()
-        return self._fd.readline()
+        return self._readLines(line, 1)
 
     def getLine(self, line):
         if line >= self.getLen():
             return ""
         page = line//self._window
         offset = line%self._window
-        if self._pages[page]is None:
+        if page >= len(pages := self._pages):
+            # The file has been truncated while reading
+            return ""
+        if (p := pages[page]) is None:
             # Dispose of the pages to the bottom
             dispose = self._buffer.pop(0)
             if dispose is not None:
-                self._pages[dispose.page] = None
-            self._pages[page] = self._Page(page, self._window)
-            self._buffer.append(self._pages[page])
-            self._indexesMutex.acquire()
-            self._fd.seek(self._indexes[line-offset])
-            self._indexesMutex.release()
-            buffer = self._pages[page].buffer
-            for i in range(self._window):
-                buffer[i] = self._fd.readline().replace('\r','')
-                #self._width = max(self._width,len(buffer[i]))
+                pages[dispose.page] = None
+            pages[page] = p = self._Page(page, self._window)
+            self._buffer.append(p)
+            lines = self._readLines(line-offset, self._window).replace('\r','').split('\n')
+            buffer = p.buffer
+            # All the lines but the last one are terminated by a new line
+            for i in range(min(len(lines)-1, self._window)):
+                buffer[i] = lines[i]+'\n'
+            if len(lines) <= self._window:
+                buffer[len(lines)-1] = lines[-1]
         else:
             # Push the page to the top of the buffer
-            i = self._buffer.index(self._pages[page])
-            p = self._buffer.pop(i)
-            self._buffer.append(p)
-        return self._pages[page].buffer[offset]
+            # (unless it has been just invalidated by the follow thread)
+            if p in (buffer := self._buffer):
+                buffer.remove(p)
+                buffer.append(p)
+        return p.buffer[offset]
 
     def getSlice(self, line, length):
         ret = []
@@ -128,60 +379,177 @@ class TTkFileBuffer():
             ret.append(self.getLine(i))
         return ret
 
+    def _index(self, mm, start):
+        '''
+        Index the lines of the mapped file starting from the "start" byte
+        '''
+        newLine = re.compile(b'\n')
+        fileSize = len(mm)
+        for offset in range(start, fileSize, self.CHUNK_SIZE):
+            indexes = array('Q', (m.end() for m in newLine.finditer(mm, offset, offset+self.CHUNK_SIZE)))
+            if indexes:
+                # The width is the longest distance between two consecutive line offsets
+                self._width = max(
+                    self._width,
+                    indexes[0]-self._indexes[-1],
+                    max(map(operator.sub, islice(indexes,1,None), indexes), default=0))
+            self._indexesMutex.acquire()
+            self._indexes.extend(indexes)
+            self._pages += [None]*(1+(self.getLen()//self._window)-(len(self._pages)))
+            self._indexedSize = min(offset+self.CHUNK_SIZE,fileSize)
+            self._indexesMutex.release()
+            self.indexUpdated.emit((self._indexedSize-start)/(fileSize-start))
+            # TTkLog.debug(f"{self._filename} {offset/fileSize} ...")
+
     def createIndex(self):
         # TTkLog.debug(f"Start Indexing {self._filename}")
-        indexes = []
-        offset = 0
-        fileSize = os.stat(self._filename).st_size
-        chunkSize = 0x1000000 # ~16M
-        with open(self._filename,'rb') as infile:
-            while (chunk:=infile.read(chunkSize)):
-                start = 0
-                while (index:=chunk.find(0x0A,start))!=-1:
-                    indexes.append(index+offset+1)
-                    start = index+1
-                self._indexesMutex.acquire()
-                self._indexes += indexes
-                self._pages += [None]*(1+(self.getLen()//self._window)-(len(self._pages)))
-                self._indexesMutex.release()
-                indexes = []
-                offset+=len(chunk)
-                self.indexUpdated.emit(offset/fileSize)
-                # TTkLog.debug(f"{self._filename} {offset/fileSize} ...")
-        self._width = max( (self._indexes[i+1]-self._indexes[i]) for i in range(len(self._indexes)-1) )
+        if (mm := self._mmap) is not None:
+            self._index(mm, 0)
         self.indexUpdated.emit(1.0)
         self.indexed.emit()
-        # TTkLog.debug(f"{self._filename} {offset/fileSize} END")
+        # TTkLog.debug(f"{self._filename} END")
+
+    def _searchChunks(self, fromLine):
+        '''
+        Split the indexed lines starting from "fromLine" in chunks of ~SEARCH_CHUNK_SIZE bytes
+        aligned to the lines index
+
+        :return: the list of (line, startByte, endByte), the number of terminated lines and the index generation
+        '''
+        with self._indexesMutex:
+            indexes = self._indexes
+            lines = len(indexes)
+            end = self._indexedSize
+            gen = self._indexGen
+        chunks = []
+        line = fromLine
+        while line < lines and indexes[line] < end:
+            nextLine = max(line+1, bisect_left(indexes, indexes[line]+self.SEARCH_CHUNK_SIZE, line, lines))
+            chunks.append((line, indexes[line], indexes[nextLine] if nextLine < lines else end))
+            line = nextLine
+        return chunks, lines-1, gen
+
+    def _search(self, regex, ignoreCase, cancel, callback):
+        '''
+        Search the regex in the file splitting the scan in chunks processed by the search pool,
+        the result of the previous scans are reused and only the lines appended are searched.
+        If the file is still being indexed, the lines indexed meanwhile are searched until the end of the index.
+
+        The callback is called with the sorted list of the lines found so far and the progress
+
+        :return: the list of the matching lines or None if canceled
+        '''
+        flags = re.IGNORECASE if ignoreCase else 0
+        # Raise re.error in the caller
+        re.compile(regex, flags)
+        # Some escapes are valid only in a str pattern (i.e. \N{...}, \u...)
+        try:
+            asciiRegex = regex.isascii() and bool(re.compile(regex.encode(), flags))
+        except re.error:
+            asciiRegex = False
+        key = (regex, flags)
+        with self._indexesMutex:
+            gen, validLines, found = self._searchCache.get(key, (self._indexGen, 0, array('Q')))
+        found = array('Q', found)
+        lastEmit = time.monotonic()
+        while True:
+            indexing = self._indexThread.is_alive()
+            chunks, terminatedLines, chunksGen = self._searchChunks(validLines)
+            if chunksGen != gen:
+                # The file has been rotated or truncated, the previous results are stale
+                gen, validLines, found = chunksGen, 0, array('Q')
+                continue
+            if chunks:
+                pool = _searchPool(self.SEARCH_PROCESSES) if len(chunks) > 1 else None
+                args = [(self._filename, start, end, line, regex, flags, asciiRegex) for line, start, end in chunks]
+                if pool is None:
+                    results = (_searchChunk(*arg) for arg in args)
+                else:
+                    futures = [pool.submit(_searchChunk, *arg) for arg in args]
+                    results = (future.result() for future in futures)
+                for i,result in enumerate(results):
+                    if cancel.is_set():
+                        if pool is not None:
+                            for future in futures:
+                                future.cancel()
+                        return None
+                    found.extend(result)
+                    if callback and time.monotonic() - lastEmit > 0.1:
+                        lastEmit = time.monotonic()
+                        callback(list(found), (i+1)/len(chunks))
+            with self._indexesMutex:
+                if gen != self._indexGen:
+                    # The file has been rotated or truncated while searching
+                    continue
+                if not indexing:
+                    # Cache only the terminated lines, the last one may still grow
+                    self._searchCache.pop(key, None)
+                    self._searchCache[key] = (gen, terminatedLines, array('Q', islice(found, bisect_left(found, terminatedLines))))
+                    while len(self._searchCache) > self.SEARCH_CACHE_SIZE:
+                        del self._searchCache[next(iter(self._searchCache))]
+                    break
+            # The last line may be only partially indexed, it is searched again with the lines indexed meanwhile
+            del found[bisect_left(found, terminatedLines):]
+            validLines = terminatedLines
+            self._indexThread.join(0.1)
+            if cancel.is_set():
+                return None
+        ret = list(found)
+        if callback and not cancel.is_set():
+            callback(ret, 1.0)
+        return ret
 
     def searchRe(self, regex, ignoreCase=False):
-        indexes = []
-        rr = re.compile(regex, re.IGNORECASE if ignoreCase else 0)
+        '''
+        Search the regex in the lines of the file
+
+        :param regex: the regular expression
+        :type regex: str
+        :param ignoreCase: case insensitive search
+        :type ignoreCase: bool
+
+        :return: the sorted list of the matching lines
+        '''
         TTkLog.debug(f"Search RE: {regex}")
-        # from datetime import datetime
-        # now = datetime.now()
-        # TTkLog.debug(f"Time1 {now}")
-        with open(self._filename, 'r', errors='replace', newline='\n') as infile:
-            # for i,line in enumerate(infile):
-            #     if rr.search(line):
-            #         indexes.append(i)
-
-            # id = 0
-            # for line in infile:
-            #     ma = rr.search(line)
-            #     if ma:
-            #         indexes.append(id)
-            #     id += 1
-
-            # for i,index in enumerate(self._indexes):
-            #     infile.seek(index)
-            #     rl = infile.readline()
-            #     if rr.search(rl):
-            #         indexes.append(i)
-
-            indexes = [i for i,line in enumerate(infile) if rr.search(line)]
-        # TTkLog.debug(f"Time2 {datetime.now()}")
-        # TTkLog.debug(f"Diff: {datetime.now() - now}")
-        return indexes
+        return self._search(regex, ignoreCase, threading.Event(), None)
+
+    def searchReAsync(self, regex, ignoreCase=False):
+        '''
+        Search the regex in the lines of the file in a background thread,
+        the previous search (if still running) is canceled.
+
+        The partial and the final results are reported by :py:meth:`searchUpdated`
+
+        :param regex: the regular expression
+        :type regex: str
+        :param ignoreCase: case insensitive search
+        :type ignoreCase: bool
+        '''
+        TTkLog.debug(f"Search RE Async: {regex}")
+        re.compile(regex, re.IGNORECASE if ignoreCase else 0)
+        self.cancelSearch()
+        self._searchCancel = cancel = threading.Event()
+        def _emit(indexes, progress):
+            if not cancel.is_set():
+                self.searchUpdated.emit(indexes, progress)
+        def _run():
+            try:
+                self._search(regex, ignoreCase, cancel, _emit)
+            except Exception as e:
+                # Report the failure and complete the search without results
+                TTkLog.error(f"Search RE Async failed: {regex!r} {type(e).__name__}: {e}")
+                _emit([], 1.0)
+        threading.Thread(
+            name='TTkFileBufferSearch', daemon=True,
+            target=_run).start()
+
+    def cancelSearch(self):
+        '''
+        Cancel the running :meth:`searchReAsync`
+        '''
+        if self._searchCancel is not None:
+            self._searchCancel.set()
+            self._searchCancel = None
 
     def search(self, txt):
         indexes = []
@@ -24,7 +24,8 @@ from __future__ import annotations
 
 __all__ = ['TTkHelper']
 
-from typing import TYPE_CHECKING, Set, Optional, Tuple, Callable
+import threading
+from typing import TYPE_CHECKING, Set, Dict, Optional, Tuple, Callable
 from dataclasses import dataclass
 
 from TermTk.TTkCore.TTkTerm.term import TTkTerm
@@ -54,6 +55,10 @@ class TTkHelper:
     _cursor: bool = False
     _cursorType: str = TTkTerm.Cursor.BLINKING_BLOCK
     _cursorWidget: Optional[TTkWidget] = None
+    _widgetDepthGen: int = 0
+    _widgetVisibleGen: int = 0
+    _deferredCalls: Dict[Callable[[],None],None] = {}
+    _deferredLock: threading.Lock = threading.Lock()
 
     @staticmethod
     def updateAll() -> None:
@@ -78,6 +83,29 @@ class TTkHelper:
     def addUpdateBuffer(widget: TTkWidget) -> None:
         TTkHelper._updateBuffer.add(widget)
 
+    @staticmethod
+    def deferCall(callback: Callable[[],None]) -> None:
+        '''
+        Run the callback in the drawing routine, before the widgets are painted
+
+        It allows to update the widgets from a worker thread (i.e. a model indexed in background),
+        the callback is executed holding the same lock used to process the input and to paint the widgets.
+        The same callback queued more than once before the next frame is executed once.
+
+        :param callback: the callback
+        :type callback: Callable[[],None]
+        '''
+        with TTkHelper._deferredLock:
+            TTkHelper._deferredCalls[callback] = None
+        TTkHelper.unlockPaint()
+
+    @staticmethod
+    def _runDeferredCalls() -> None:
+        with TTkHelper._deferredLock:
+            calls, TTkHelper._deferredCalls = TTkHelper._deferredCalls, {}
+        for callback in calls:
+            callback()
+
     @staticmethod
     def registerRootWidget(widget: TTk) -> None:
         TTkHelper._rootCanvas = widget.getCanvas()
@@ -173,6 +201,8 @@ class TTkHelper:
             _updateBuffer = list widgets that require a repaint [paintEvent]
             _updateWidget = list widgets that need to be pushed below
         '''
+        # The deferred calls may update some widgets
+        TTkHelper._runDeferredCalls()
         if TTkHelper._rootCanvas is None:
             return
 
@@ -182,6 +212,7 @@ class TTkHelper:
         TTkHelper._updateWidget.clear()
         TTkHelper._updateBuffer.clear()
         updateWidgets = set()
+        damageCompose = TTkCfg.damageCompose
 
         # TTkLog.debug(f"{len(TTkHelper._updateBuffer)} {len(TTkHelper._updateWidget)}")
         for widget in updateWidgetsBk:
@@ -189,8 +220,13 @@ class TTkHelper:
             updateBuffers.add(widget)
             updateWidgets.add(widget)
             parent = widget.parentWidget()
-            while parent is not None:
-                updateBuffers.add(parent)
+            # Stop at the first parent already collected,
+            # all its ancestors have been collected as well
+            while parent is not None and parent not in updateWidgets:
+                # With the damage compositing the parents are not repainted,
+                # only the damaged rows are recomposed
+                if not damageCompose:
+                    updateBuffers.add(parent)
                 updateWidgets.add(parent)
                 parent = parent.parentWidget()
 
@@ -207,25 +243,45 @@ class TTkHelper:
         # Compose all the canvas to the parents
         # From the deepest children to the bottom
         pushToTerminal = False
-        sortedUpdateWidget = sorted(updateWidgets, key=lambda w: -TTkHelper.widgetDepth(w))
+        rootRows = None
+        damage = {}
+        # Bucket the widgets by their (cached) depth
+        # to avoid sorting the whole list of widgets
+        depthBuckets = {}
+        for widget in updateWidgets:
+            depthBuckets.setdefault(TTkHelper.widgetDepth(widget),[]).append(widget)
+        sortedUpdateWidget = [w for d in sorted(depthBuckets, reverse=True) for w in depthBuckets[d]]
         for widget in sortedUpdateWidget:
             if not widget.isVisibleAndParent(): continue
             pushToTerminal = True
-            widget.paintChildCanvas()
+            if not damageCompose:
+                widget.paintChildCanvas()
+                continue
+            rows = widget._composeChildCanvas(widget in updateBuffers, damage.pop(widget,{}))
+            if (parent := widget.parentWidget()) is not None:
+                damage.setdefault(parent,{})[widget] = rows
+            elif widget.getCanvas() is TTkHelper._rootCanvas:
+                rootRows = rows
 
         if pushToTerminal:
-            if TTkHelper._cursor:
-                TTkTerm.Cursor.hide()
-            if TTkCfg.doubleBuffer:
-                TTkHelper._rootCanvas.pushToTerminalBuffered(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
-            elif TTkCfg.doubleBufferNew:
-                TTkHelper._rootCanvas.pushToTerminalBufferedNew(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
-            else:
-                TTkHelper._rootCanvas.pushToTerminal(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
-            if TTkHelper._cursor:
-                x,y = TTkHelper._cursorPos
-                TTkTerm.push(TTkTerm.Cursor.moveTo(y+1,x+1))
-                TTkTerm.Cursor.show(TTkHelper._cursorType)
+            # Collect the whole frame and send it to the terminal in a single write
+            syncUpdate = TTkTerm.syncUpdate if TTkCfg.syncUpdate is None else TTkCfg.syncUpdate
+            TTkTerm.beginFrame(syncUpdate=syncUpdate)
+            try:
+                if TTkHelper._cursor:
+                    TTkTerm.Cursor.hide()
+                if TTkCfg.doubleBuffer:
+                    TTkHelper._rootCanvas.pushToTerminalBuffered(0, 0, TTkGlbl.term_w, TTkGlbl.term_h, rows=rootRows)
+                elif TTkCfg.doubleBufferNew:
+                    TTkHelper._rootCanvas.pushToTerminalBufferedNew(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
+                else:
+                    TTkHelper._rootCanvas.pushToTerminal(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
+                if TTkHelper._cursor:
+                    x,y = TTkHelper._cursorPos
+                    TTkTerm.push(TTkTerm.Cursor.moveTo(y+1,x+1))
+                    TTkTerm.Cursor.show(TTkHelper._cursorType)
+            finally:
+                TTkTerm.commitFrame()
 
     @staticmethod
     def rePaintAll() -> None:
@@ -234,11 +290,28 @@ class TTkHelper:
             TTkHelper._rootCanvas.cleanBuffers()
             TTkHelper._rootWidget.update()
 
+    @staticmethod
+    def invalidateWidgetDepth() -> None:
+        '''Invalidate the cached depths, to be called every time the widget tree changes'''
+        TTkHelper._widgetDepthGen += 1
+
+    @staticmethod
+    def invalidateWidgetVisibility() -> None:
+        '''Invalidate the cached visibility, to be called every time a widget is shown/hidden/reparented'''
+        TTkHelper._widgetVisibleGen += 1
+
     @staticmethod
     def widgetDepth(widget: TTkWidget) -> int:
         if widget is None:
             return 0
-        return 1 + TTkHelper.widgetDepth(widget.parentWidget())
+        # The depth is cached in the widget and it is valid until
+        # the next reparenting (see invalidateWidgetDepth)
+        if widget._depthGen == TTkHelper._widgetDepthGen:
+            return widget._depth
+        depth = 1 + TTkHelper.widgetDepth(widget.parentWidget())
+        widget._depth = depth
+        widget._depthGen = TTkHelper._widgetDepthGen
+        return depth
 
     @staticmethod
     def isParent(widget: TTkWidget, parent: TTkWidget) -> bool:
@@ -259,7 +332,7 @@ class TTkHelper:
         if x<lx or x>=lx+lw or y<ly or y>=lh+ly: return None
         x-=lx
         y-=ly
-        for item in reversed(layout.zSortedItems):
+        for item in layout._itemsAt(x, y, lw, lh):
             if item.layoutItemType() == TTkK.WidgetItem and not item.isEmpty():
                 widget = item.widget()
                 if not widget._visible: continue
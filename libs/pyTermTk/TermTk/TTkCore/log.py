@@ -25,16 +25,25 @@ __all__ = ['TTkLog']
 # This code is inspired by
 # https://github.com/ceccopierangiolieugenio/pyCuT/blob/master/cupy/CuTCore/CuDebug.py
 
-import inspect
+import sys
+import queue
+import atexit
 import logging
-from typing import Callable
+import logging.handlers
+from typing import Callable, Optional
 
 class _TTkContext:
-    __slots__ = ['file', 'line', 'function']
-    def __init__(self, cf):
-        self.file = cf[1]
-        self.line = cf[2]
-        self.function = cf[3]
+    '''Caller context of a log message, the file/function are resolved only when requested'''
+    __slots__ = ['_code', 'line']
+    def __init__(self, frame):
+        self._code = frame.f_code
+        self.line = frame.f_lineno
+    @property
+    def file(self) -> str:
+        return self._code.co_filename
+    @property
+    def function(self) -> str:
+        return self._code.co_name
     def __str__(self):
         return f"{self.file}:{self.line} [{self.function}]"
 
@@ -47,8 +56,50 @@ class TTkLog:
     FatalMsg    = 0x0020
     SystemMsg   = CriticalMsg
 
+    # Severity order used by setLevel
+    _levels = (DebugMsg, InfoMsg, WarningMsg, ErrorMsg, CriticalMsg, FatalMsg)
+
     # TypeHandlers = list[Callable]
     _messageHandler: list[Callable] = []
+    _level: int = DebugMsg
+    # Mask of the message types processed,
+    # it is 0 if no handlers are installed so any log call is a noop
+    _enabled: int = 0
+    _queueListener: Optional[logging.handlers.QueueListener] = None
+    _queueHandler: Optional[logging.handlers.QueueHandler] = None
+
+    @staticmethod
+    def _updateEnabled() -> None:
+        if not TTkLog._messageHandler:
+            TTkLog._enabled = 0
+            return
+        levels = TTkLog._levels
+        TTkLog._enabled = sum(levels[levels.index(TTkLog._level):])
+
+    @staticmethod
+    def setLevel(level: int) -> None:
+        '''
+        Set the minimum level of the messages processed,
+        any message below this level is discarded before any other processing
+
+        Severity order: Debug < Info < Warning < Error < Critical < Fatal
+
+        :param level: the minimum level (i.e. :py:attr:`TTkLog.InfoMsg`)
+        :type level: int
+        '''
+        if level not in TTkLog._levels:
+            raise ValueError(f"Unknown log level {level}")
+        TTkLog._level = level
+        TTkLog._updateEnabled()
+
+    @staticmethod
+    def level() -> int:
+        '''
+        Return the minimum level of the messages processed
+
+        :rtype: int
+        '''
+        return TTkLog._level
 
     @staticmethod
     def _logging_message_handler(mode, context, message):
@@ -61,12 +112,48 @@ class TTkLog:
         log(f"{context.file}:{context.line} {message}")
 
     @staticmethod
-    def use_default_file_logging(file="session.log"):
-        logging.basicConfig(level=logging.DEBUG,
-                    filename=file,
-                    format='%(levelname)s:(%(threadName)-9s) %(message)s',)
+    def use_default_file_logging(file="session.log", background=False):
+        '''
+        Log to file
+
+        :param file: the log file
+        :type file: str
+        :param background: write the log file from a background thread, the log calls only enqueue the records
+        :type background: bool
+        '''
+        if background:
+            # Replace the listener installed by a previous call
+            TTkLog._stopQueueListener()
+            logQueue = queue.SimpleQueue()
+            queueHandler = logging.handlers.QueueHandler(logQueue)
+            logging.basicConfig(level=logging.DEBUG, handlers=[queueHandler])
+            # basicConfig is a noop if the root logger is already configured,
+            # in this case there is nothing feeding the listener
+            if queueHandler in logging.getLogger().handlers:
+                handler = logging.FileHandler(file)
+                handler.setFormatter(logging.Formatter('%(levelname)s:(%(threadName)-9s) %(message)s'))
+                TTkLog._queueHandler = queueHandler
+                TTkLog._queueListener = listener = logging.handlers.QueueListener(logQueue, handler)
+                listener.start()
+                # Flush the pending records at exit
+                atexit.register(listener.stop)
+        else:
+            logging.basicConfig(level=logging.DEBUG,
+                        filename=file,
+                        format='%(levelname)s:(%(threadName)-9s) %(message)s',)
         TTkLog.installMessageHandler(TTkLog._logging_message_handler)
 
+    @staticmethod
+    def _stopQueueListener() -> None:
+        if not (listener := TTkLog._queueListener):
+            return
+        logging.getLogger().removeHandler(TTkLog._queueHandler)
+        TTkLog._queueListener = TTkLog._queueHandler = None
+        atexit.unregister(listener.stop)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
     @staticmethod
     def use_default_stdout_logging():
         logging.basicConfig(level=logging.DEBUG,
@@ -76,38 +163,48 @@ class TTkLog:
 
     @staticmethod
     def _process_msg(mode: int, msg: str):
+        # 0 = _process_msg, 1 = TTkLog.<level>, 2 = caller
+        try:
+            ctx = _TTkContext(sys._getframe(2))
+        except ValueError:
+            return
+        txt = msg if type(msg) is str else str(msg)
+        lines = txt.split('\n') if '\n' in txt else (txt,)
         for cb in TTkLog._messageHandler:
-            curframe = inspect.currentframe()
-            calframe = inspect.getouterframes(curframe,1)
-            if len(calframe) > 2:
-                ctx = _TTkContext(calframe[2])
-                for txt in str(msg).split('\n'):
-                    cb(mode, ctx, txt)
+            for line in lines:
+                cb(mode, ctx, line)
 
     @staticmethod
     def debug(msg):
-        TTkLog._process_msg(TTkLog.DebugMsg, msg)
+        if TTkLog._enabled & TTkLog.DebugMsg:
+            TTkLog._process_msg(TTkLog.DebugMsg, msg)
 
     @staticmethod
     def info(msg):
-        TTkLog._process_msg(TTkLog.InfoMsg, msg)
+        if TTkLog._enabled & TTkLog.InfoMsg:
+            TTkLog._process_msg(TTkLog.InfoMsg, msg)
 
     @staticmethod
     def error(msg):
-        TTkLog._process_msg(TTkLog.ErrorMsg, msg)
+        if TTkLog._enabled & TTkLog.ErrorMsg:
+            TTkLog._process_msg(TTkLog.ErrorMsg, msg)
 
     @staticmethod
     def warn(msg):
-        TTkLog._process_msg(TTkLog.WarningMsg, msg)
+        if TTkLog._enabled & TTkLog.WarningMsg:
+            TTkLog._process_msg(TTkLog.WarningMsg, msg)
 
     @staticmethod
     def critical(msg):
-        TTkLog._process_msg(TTkLog.CriticalMsg, msg)
+        if TTkLog._enabled & TTkLog.CriticalMsg:
+            TTkLog._process_msg(TTkLog.CriticalMsg, msg)
 
     @staticmethod
     def fatal(msg):
-        TTkLog._process_msg(TTkLog.FatalMsg, msg)
+        if TTkLog._enabled & TTkLog.FatalMsg:
+            TTkLog._process_msg(TTkLog.FatalMsg, msg)
 
     @staticmethod
     def installMessageHandler(mh: Callable):
         TTkLog._messageHandler.append(mh)
+        TTkLog._updateEnabled()
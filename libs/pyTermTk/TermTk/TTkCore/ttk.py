@@ -163,6 +163,15 @@ class TTk(_TTkRootContainer):
             TTkCfg.doubleBuffer = False
             TTkCfg.doubleBufferNew = True
 
+        if 'TERMTK_FULL_COMPOSE' in os.environ:
+            TTkCfg.damageCompose = False
+
+        if 'TERMTK_MOUSE_RATE' in os.environ:
+            TTkCfg.mouseRate = int(os.environ['TERMTK_MOUSE_RATE'])
+
+        if 'TERMTK_SYNC_UPDATE' in os.environ:
+            TTkCfg.syncUpdate = os.environ['TERMTK_SYNC_UPDATE'].lower() not in ('0','false','no','off')
+
         if os.environ.get("TERMTK_GPM",False):
             self._showMouseCursor = True
 
@@ -279,6 +288,13 @@ class TTk(_TTkRootContainer):
 
     def paintChildCanvas(self) -> None:
         super().paintChildCanvas()
+        self._paintMouseCursor()
+
+    def _paintChildCanvasRows(self, rows) -> None:
+        super()._paintChildCanvasRows(rows)
+        self._paintMouseCursor()
+
+    def _paintMouseCursor(self) -> None:
         if self._mouseCursor:
             ch = self._mouseCursor._cursor
             pos = self._mouseCursor._pos
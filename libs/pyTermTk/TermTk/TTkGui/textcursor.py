@@ -26,7 +26,7 @@ __all__ = ['TTkTextCursor']
 
 from enum import IntEnum
 
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.color import TTkColor
@@ -284,20 +284,24 @@ class TTkTextCursor():
                 key=lambda x: x.selectionStart().toNum())
         # remove /merge overlapping cursors
         newProperties = self._properties[:1]
-        for np in self._properties:
-            op = newProperties[-1]
-            if op.selectionEnd().toNum() < np.selectionStart().toNum():
+        op = newProperties[0]
+        opEnd = op.selectionEnd().toNum()
+        for np in self._properties[1:]:
+            if opEnd < np.selectionStart().toNum():
                 newProperties.append(np)
+                op = np
+                opEnd = np.selectionEnd().toNum()
                 continue
             if currCurs == np:
                 currCurs = op
             # the two cursors are overlapping
             # I try to combine the 2 selections
-            if op.selectionEnd().toNum() < np.selectionEnd().toNum():
+            if opEnd < (npEnd := np.selectionEnd().toNum()):
                 if op.position.toNum()>op.anchor.toNum():
                     op.position=np.selectionEnd()
                 else:
                     op.anchor=np.selectionEnd()
+                opEnd = npEnd
         self._properties = newProperties
         self._cID = self._properties.index(currCurs)
         if notify or currPos != currCurs.position.toNum():
@@ -390,9 +394,6 @@ class TTkTextCursor():
         if self.hasSelection():
             _lineFirst, _lineRem, _lineAdd = self._removeSelectedText()
 
-        lineFirst = self._properties[0].position.line
-        lineRem, lineAdd = 0,0
-
         # Check if the number of lines is the same as the number of cursors
         # this is a corner case where each line belongs to a
         # different cursor
@@ -400,75 +401,20 @@ class TTkTextCursor():
         if len(textLines) != len(self._properties):
             textLines = [text]*len(self._properties)
 
-        # Calc the added and removed lines
+        edits = []
         for i, pr in enumerate(self._properties):
-            lenNewLines=len(textLines[i].split('\n'))
+            text = textLines[i]
+            # Use the same color under the cursor if no color is defined:
+            if isinstance(text, str):
+                text = TTkString(text, self._color if self._color else self.positionColor(i))
             l = pr.position.line
             p = pr.position.pos
-            if (  textLines[i] == '\n' and
-                  l == lineFirst != _lineFirst and
-                  p==len(self._document._dataLines[l]) ):
-                lineFirst = l+1
-                lineAdd = 1
-                lineRem = 0
-            elif (lineFirst + lineRem) > l:
-                lineAdd += lenNewLines-1
-            else:
-                lineAdd += lenNewLines + l-lineFirst-lineRem
-                lineRem = l - lineFirst + 1
+            edits.append((pr, l, p, l, p, text))
+        lineFirst, lineRem, lineAdd = self._applyEdits(edits, moveCursor)
         if _lineFirst != -1:
             lineFirst, lineRem, lineAdd = TTkTextDocument._mergeChangesSlices(
                                                 (_lineFirst, _lineRem, _lineAdd),
                                                 ( lineFirst,  lineRem,  lineAdd))
-        for i, pr in enumerate(self._properties):
-            text=textLines[i]
-            l = pr.position.line
-            p = pr.position.pos
-            color = self._color if self._color else self.positionColor(i)
-
-            # Use the same color under the cursor if no color is defined:
-            ttktext = text
-            if isinstance(ttktext, str):
-                ttktext = TTkString(text, color)
-
-            newLines = ( self._document._dataLines[l].substring(to=p) +
-                         ttktext +
-                         self._document._dataLines[l].substring(fr=p) ).split('\n')
-            self._document._dataLines[l] = newLines[0]
-            for nl in reversed(newLines[1:]):
-                self._document._dataLines.insert(l+1, nl)
-
-            # Move/Shift the cursors based on the pasted content
-            #
-            # 2 scenarios:
-            #  1) No Newline(s) added
-            #                p     p+1   p+2
-            #   from:  aaaaaaXaaaaaYaaaaaYaaaa
-            #
-            #   to:    aaaaaaX....aaaaaYaaaaaYaaaa
-            #                     diffPos = len(text)
-            #
-            #  2) Newlines are added
-            #                p     p+1   p+2
-            #   from:  aaaaaaXaaaaaYaaaaaYaaaa
-            #
-            #   to:    aaaaaaX...\n
-            #          ......\n
-            #          \n
-            #          .....aaaaaYaaaaaYaaaa
-            #               diffPos = len(text.split('\n')[-1]) - p
-            diffLine = len(newLines)-1
-            if diffLine:
-                diffPos = len(text.split('\n')[-1]) - p
-            else:
-                diffPos = len(text)
-            # Realign all the cursos (move the same if required)
-            for pp in self._properties[i+(0 if moveCursor else 1):]:
-                if pp.position.line == l:
-                    pp.position.pos  += diffPos
-                    pp.anchor.pos  += diffPos
-                pp.position.line += diffLine
-                pp.anchor.line += diffLine
         self._autoChanged = True
         self._document.setChanged(True)
         self._document._release()
@@ -539,6 +485,79 @@ class TTkTextCursor():
             ret += _getText(p)
         return TTkString('\n').join(ret)
 
+    def _applyEdits(self, edits:list[Tuple[_Prop,int,int,int,int,TTkString]], moveCursor:bool) -> Tuple[int,int,int]:
+        '''
+        Apply all the edits to the document in a single pass
+
+        Each edit (cursor, fromLine, fromPos, toLine, toPos, text) replaces
+        the text between the two positions and moves the cursor
+        at the beginning (or at the end if moveCursor is True) of the new text.
+
+        The edits chained on the same lines are merged and
+        replace those lines with a single slice assignment,
+        the cursors are realigned with the lines/chars added by the previous edits.
+
+        :return: the (line, linesRemoved, linesAdded) range of the document touched by the edits
+        :rtype: tuple[int,int,int]
+        '''
+        dataLines = self._document._dataLines
+        edits = sorted(edits, key=lambda e: (e[1],e[2]))
+        shift = 0
+        rangeFr, rangeTo, rangeShift = None, 0, 0
+        i, n = 0, len(edits)
+        while i < n:
+            # Collect the edits where each one starts on the line where the previous one ends
+            j = i+1
+            while j < n and edits[j][1] == edits[j-1][3]:
+                j += 1
+            fromLine = edits[i][1]
+            toLine   = edits[j-1][3]
+            line = fromLine + shift
+            pos  = edits[i][2]
+            newText = dataLines[line].substring(to=pos)
+            newLines = 0
+            changed = False
+            for k in range(i,j):
+                prop, fromL, fromP, toL, toP, text = edits[k]
+                changed = changed or fromL != toL or fromP != toP or len(text) > 0
+                if not moveCursor:
+                    prop.position.set(line, pos)
+                    prop.anchor.set(line, pos)
+                newText += text
+                strText = str(text)
+                if (nl := strText.count('\n')):
+                    newLines += nl
+                    line += nl
+                    pos = len(strText) - strText.rfind('\n') - 1
+                else:
+                    pos += len(text)
+                if moveCursor:
+                    prop.position.set(line, pos)
+                    prop.anchor.set(line, pos)
+                # The text between the end of this edit and the start of the next one
+                fr = edits[k+1][2] if k+1 < j else None
+                gap = dataLines[toL+shift].substring(fr=toP, to=fr)
+                newText += gap
+                pos += len(gap)
+            if changed:
+                # A newline typed at the end of the first line leaves it untouched
+                fr = fromLine
+                if ( edits[i][1] == edits[i][3] and edits[i][2] == edits[i][4] and
+                     edits[i][2] == len(dataLines[fromLine+shift]) and
+                     edits[i][5] == '\n' ):
+                    fr += 1
+                if rangeFr is None:
+                    rangeFr = fr
+                rangeTo = toLine
+                rangeShift = shift + newLines - (toLine - fromLine)
+            dataLines[fromLine+shift:toLine+shift+1] = newText.split('\n') if newLines else [newText]
+            shift += newLines - (toLine - fromLine)
+            i = j
+        if rangeFr is None:
+            return 0, 0, 0
+        lineRem = rangeTo - rangeFr + 1
+        return rangeFr, lineRem, lineRem + rangeShift
+
     def hasSelection(self) -> bool:
         for p in self._properties:
             if p.hasSelection():
@@ -546,42 +565,14 @@ class TTkTextCursor():
         return False
 
     def _removeSelectedText(self) -> Tuple[int,int,int]:
-        currPos = self.position().toNum()
-
-        lineFirst = self._properties[0].selectionStart().line
-        lineAdd = 0
-        lineRem = 0
-
+        edits = []
         for p in self._properties:
-            # Check how many lines are removed/added after this operation
             selSt = p.selectionStart()
             selEn = p.selectionEnd()
+            edits.append((p, selSt.line, selSt.pos, selEn.line, selEn.pos, TTkString()))
+        lineFirst, lineRem, lineAdd = self._applyEdits(edits, False)
 
-            if (lineFirst + lineRem) > selSt.line:
-                _lineAdd = 0
-            else:
-                _lineAdd = 0 if selSt.pos == selEn.pos == 0 else 1
-
-            lineAdd += selSt.line - lineFirst - lineRem + _lineAdd
-            lineRem = selEn.line - lineFirst + _lineAdd
-
-        def _alignPoint(point,st,en):
-            point.line += st.line - en.line
-            if point.line == st.line:
-                point.pos += st.pos - en.pos
-
-        for i, p in enumerate(self._properties):
-            selSt = p.selectionStart()
-            selEn = p.selectionEnd()
-            self._document._dataLines[selSt.line] = self._document._dataLines[selSt.line].substring(to=selSt.pos) + \
-                               self._document._dataLines[selEn.line].substring(fr=selEn.pos)
-            self._document._dataLines = self._document._dataLines[:selSt.line+1] + self._document._dataLines[selEn.line+1:]
-            for pp in self._properties[i+1:]:
-                _alignPoint(pp.position, selSt, selEn)
-                _alignPoint(pp.anchor,   selSt, selEn)
-            self.setPosition(selSt.line, selSt.pos, cID=i)
-
-        self._checkCursors(notify=self.position().toNum()!=currPos)
+        self._checkCursors(notify=True)
 
         return lineFirst, lineRem, lineAdd
 
@@ -623,41 +614,50 @@ class TTkTextCursor():
                         lines[i-fr] = color
         return lines
 
-    def _getBlinkingCursors(self, fr:int, to:int, lines, color:TTkColor) -> list[TTkString]:
-        ret = lines
-        # Add Blinking cursor
+    def _getBlinkingPositions(self, fr:int, to:int) -> Iterator[Tuple[int,int]]:
+        # The blinking cursors are displayed only if multiple cursors are used
         if len(self._properties)>1:
             for p in self._properties:
                 cp = p.position
-                if not 0<=(cp.line-fr)<len(ret): continue
-                ret[cp.line-fr] = ret[cp.line-fr].setColor(color=color+TTkColor.BLINKING, posFrom=cp.pos, posTo=cp.pos+1)
-                if cp.pos == len(ret[cp.line-fr]):
-                   ret[cp.line-fr] = ret[cp.line-fr]+TTkString('↵',color+TTkColor.BLINKING)
-                elif ret[cp.line-fr].charAt(cp.pos) == ' ':
-                    ret[cp.line-fr] = ret[cp.line-fr].setCharAt(pos=cp.pos, char='∙')
-                    # ret[p.line-fr].setColorAt(pos=p.pos, color=TTkCfg.theme.treeLineColor+TTkColor.BLINKING)
-                #elif ret[p.line-fr].charAt(p.pos) == '\t':
-                #    ret[p.line-fr].setCharAt(pos=p.pos, char='\t')
+                if fr <= cp.line <= to:
+                    yield cp.line, cp.pos
+
+    @staticmethod
+    def _setBlinkingCursor(line:TTkString, pos:int, color:TTkColor) -> TTkString:
+        line = line.setColor(color=color+TTkColor.BLINKING, posFrom=pos, posTo=pos+1)
+        if pos == len(line):
+            line = line+TTkString('↵',color+TTkColor.BLINKING)
+        elif line.charAt(pos) == ' ':
+            line = line.setCharAt(pos=pos, char='∙')
+            # line.setColorAt(pos=pos, color=TTkCfg.theme.treeLineColor+TTkColor.BLINKING)
+        #elif line.charAt(pos) == '\t':
+        #    line.setCharAt(pos=pos, char='\t')
+        return line
+
+    def _getBlinkingCursors(self, fr:int, to:int, lines, color:TTkColor) -> list[TTkString]:
+        ret = lines
+        # Add Blinking cursor
+        for line, pos in self._getBlinkingPositions(fr, to):
+            ret[line-fr] = TTkTextCursor._setBlinkingCursor(ret[line-fr], pos, color)
         return ret
 
-    def _getHighlightedLines(self, fr:int, to:int, lines, color:TTkColor) -> list[TTkString]:
-        # Create a list of cursors (filtering out the ones which
-        # position/selection is outside the screen boundaries)
-        sel = []
+    def _getSelectionSpans(self, fr:int, to:int) -> Iterator[Tuple[int,int,Optional[int]]]:
+        '''
+        Yield (line, posFrom, posTo) for each line between **fr** and **to**
+        covered by the cursors (or their selection),
+        posTo is None if the selection continues after the end of the line
+        '''
         for p in self._properties:
             selSt = p.selectionStart()
             selEn = p.selectionEnd()
-            if selEn.line >= fr and selSt.line<=to:
-                sel.append((selSt,selEn,p))
+            if selEn.line < fr or selSt.line > to: continue
+            for i in range(max(selSt.line,fr),min(selEn.line,to)+1):
+                yield i, 0 if i > selSt.line else selSt.pos, None if i < selEn.line else selEn.pos
 
-        # Retrieve the sublist of lines to be required (displayed)
+    def _getHighlightedLines(self, fr:int, to:int, lines, color:TTkColor) -> list[TTkString]:
         ret = lines
-        # Apply the selection color for each of them
-        for s in sel:
-            selSt, selEn, _ = s
-            for i in range(max(selSt.line,fr),min(selEn.line+1,to+1)):
-                l = ret[i-fr]
-                pf = 0      if i > selSt.line else selSt.pos
-                pt = len(l) if i < selEn.line else selEn.pos
-                ret[i-fr] = l.setColor(color=color, posFrom=pf, posTo=pt)
+        # Apply the selection color for each of the displayed lines
+        for i, pf, pt in self._getSelectionSpans(fr, to):
+            l = ret[i-fr]
+            ret[i-fr] = l.setColor(color=color, posFrom=pf, posTo=len(l) if pt is None else pt)
         return ret
@@ -22,13 +22,14 @@
 
 __all__ = ['TTkTextDocument']
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 from threading import RLock
 
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
 from TermTk.TTkCore.string import TTkString, TTkStringType
 from TermTk.TTkCore.color import TTkColor
+from TermTk.TTkGui.textdocument_lines import _TTkTextLines
 
 if TYPE_CHECKING:
     from TermTk.TTkGui.textcursor import TTkTextCursor
@@ -153,7 +154,7 @@ class TTkTextDocument():
         self.undoCommandAdded = pyTTkSignal()
         self.modificationChanged = pyTTkSignal(bool)
         self._backgroundColor = TTkColor.RST
-        self._dataLines = [TTkString(t) for t in text.split('\n')]
+        self._dataLines = _TTkTextLines(TTkString(t) for t in text.split('\n'))
         self._modified = False
         # Cumulative changes since the lasrt snapshot
         self._snapChanged = None
@@ -257,18 +258,18 @@ class TTkTextDocument():
                 ret = None
             return ret
 
-    def dataLines(self, lineRange:Optional[slice]=None) -> list[TTkString]:
+    def dataLines(self, lineRange:Optional[slice]=None) -> Sequence[TTkString]:
         '''Return data lines in a thread-safe way.
 
         :param lineRange: optional slice selecting a subset of lines.
         :type lineRange: Optional[slice]
-        :return: the internal lines list or a sliced list.
-        :rtype: List[:py:class:`TTkString`]
+        :return: the internal lines sequence or a sliced list.
+        :rtype: Sequence[:py:class:`TTkString`]
 
         .. note::
             This method does not copy the full document when ``lineRange`` is
-            ``None``. The returned object is mutable and reflects live document
-            updates.
+            ``None``. The returned object is the internal list like sequence,
+            it is mutable and reflects live document updates.
         '''
         with self._docMutex:
             if lineRange is not None:
@@ -285,7 +286,7 @@ class TTkTextDocument():
         if not isinstance(text, str) and not isinstance(text,TTkString):
             text=str(text)
         with self._docMutex:
-            self._dataLines = [TTkString(t) for t in text.split('\n')]
+            self._dataLines = _TTkTextLines(TTkString(t) for t in text.split('\n'))
             self._modified = False
             self._lastSnap = self._dataLines.copy()
             self._snap = TTkTextDocument._snapshot(self._lastCursor, None, None)
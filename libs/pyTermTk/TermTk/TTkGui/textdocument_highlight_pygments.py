@@ -22,14 +22,15 @@
 
 __all__ = ['TextDocumentHighlight']
 
-from pygments import highlight
+from itertools import islice
+from typing import Iterator, Optional, Sequence, Tuple
+
 from pygments.util import ClassNotFound
 from pygments.styles import get_all_styles
+from pygments.lexer import Lexer, RegexLexer
 from pygments.lexers import guess_lexer, guess_lexer_for_filename, get_lexer_by_name, special, get_all_lexers
-from pygments.formatters import TerminalFormatter, Terminal256Formatter, TerminalTrueColorFormatter
 from pygments.formatter import Formatter
-from pygments.token import Keyword, Name, Comment, String, Error, \
-    Number, Operator, Generic, Token, Whitespace
+from pygments.token import Error, Whitespace, _TokenType
 
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.color import TTkColor
@@ -39,21 +40,15 @@ from TermTk.TTkCore.timer import TTkTimer
 
 from TermTk.TTkGui.textdocument import TTkTextDocument
 
+_ROOT_STATE = ('root',)
+
 class _TTkFormatter(Formatter):
-    class Data():
-        __slots__=('lines', 'block', 'error', 'multiline')
-        def __init__(self, lines, block):
-            self.lines = lines
-            self.block = block
-            self.error = None
-            self.multiline = False
-
-    __slots__ = ('_dl', '_blockNum', '_highlightStyles', '_defaultColor')
+    __slots__ = ('_highlightStyles', '_colors', '_defaultColor')
     def __init__(self, *args, **kwargs):
         self._defaultColor = TTkColor.RST
+        self._colors = {}
         super().__init__(*args, **kwargs)
         self._highlightStyles = {}
-        self._blockNum = 1
         for token, style in self.style:
             # Token = Token.Comment.PreprocFile
             # style = {
@@ -78,57 +73,143 @@ class _TTkFormatter(Formatter):
                 color += TTkColor.UNDERLINE
             self._highlightStyles[token] = color
 
-    def setDl(self,dl):
-        self._dl = dl
-
     def setDefaultColor(self, color:TTkColor) -> None:
         self._defaultColor = color
-
-    def format(self, tokensource, _):
-        multiline = False
-        multilineId = 0
-        for ttype, value in tokensource:
-            if ttype == Error and self._dl.error is None:
-                self._dl.error = len(self._dl.lines)-1
-            # self._dl.multiline = ttype == Comment.Multiline
-            multiline = ttype == Comment.Multiline
-
-            while ttype not in self._highlightStyles:
-                ttype = ttype.parent
-            # TTkLog.debug (f"{ttype=}")
-            # TTkLog.debug (f"{value=}")
-            color = self._highlightStyles[ttype]
+        self._colors = {}
+
+    def color(self, ttype:_TokenType) -> TTkColor:
+        if (color := self._colors.get(ttype)) is None:
+            styleType = ttype
+            while styleType not in self._highlightStyles:
+                styleType = styleType.parent
+            color = self._highlightStyles[styleType]
             if not color.hasForeground():
                color += self._defaultColor
+            self._colors[ttype] = color
+        return color
+
+def _hasLexerState(lexer:Lexer) -> bool:
+    # Only the plain RegexLexer loop can be resumed from a saved state stack,
+    # the lexers overriding it (or based on a context) are lexed from the top
+    return type(lexer).get_tokens_unprocessed is RegexLexer.get_tokens_unprocessed
+
+def _regexLexerTokens(lexer:RegexLexer, text:str, stack:Tuple[str,...]) -> Iterator[Tuple[int,Optional[_TokenType],object]]:
+    '''
+    Same loop of :py:meth:`RegexLexer.get_tokens_unprocessed`,
+    in addition it yields (pos, None, stack) each time a line starts
+    at a token boundary, with the lexer state required to resume from there.
+    '''
+    pos = 0
+    tokendefs = lexer._tokens
+    statestack = list(stack)
+    statetokens = tokendefs[statestack[-1]]
+    while 1:
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                if action is not None:
+                    if type(action) is _TokenType:
+                        yield pos, action, m.group()
+                    else:
+                        yield from action(lexer, m)
+                pos = m.end()
+                if new_state is not None:
+                    # state transition
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == '#pop':
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == '#push':
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == '#push':
+                        statestack.append(statestack[-1])
+                    else:
+                        assert False, f"wrong state def: {new_state!r}"
+                    statetokens = tokendefs[statestack[-1]]
+                if pos and text[pos-1] == '\n':
+                    yield pos, None, tuple(statestack)
+                break
+        else:
+            try:
+                if text[pos] == '\n':
+                    # at EOL, reset state to "root"
+                    statestack = ['root']
+                    statetokens = tokendefs['root']
+                    yield pos, Whitespace, '\n'
+                    pos += 1
+                    yield pos, None, _ROOT_STATE
+                    continue
+                yield pos, Error, text[pos]
+                pos += 1
+            except IndexError:
+                break
 
-            values = value.split('\n')
-
-            self._dl.lines[-1] += TTkString(values[0],color)
-            self._dl.lines += [TTkString(t,color) for t in values[1:]]
-            self._dl.block[-1] = self._blockNum
-            self._dl.block += [self._blockNum]*(len(values)-1)
-
-            # self._dl.lines += [TTkString(t) for t in value.split('\n')]
-
-            # multiline = len(values)>1 if self._dl.lines[-1]._text == values[-1] else self._dl.multiline
-            # if self._dl.lines[-1]._text == '' or not multiline:
-            #     self._blockNum += 1
-            #     multilineId = len(self._dl.lines)
-
-            if multiline:
-                multilineId += len(values)
-            else:
-                multilineId = 0
-                self._blockNum += 1
-
-        if multiline:
-            self._dl.multiline = multilineId
+def _highlightLines(
+        lexer:Lexer, formatter:_TTkFormatter,
+        lines:Sequence[TTkString], line:int, stack:Tuple[str,...]) -> Iterator[Tuple[int,TTkString,Optional[Tuple[str,...]]]]:
+    '''
+    Lex the document starting from the beginning of **line** with the **stack** lexer state
+    and yield for each line (line, highlighted line, lexer state at the beginning of the next line),
+    the state is None if the next line starts in the middle of a token.
+
+    Like the pygments formatters the tokens are consumed in sequence (some lexers
+    yield the indexes relative to the embedded code), the colors of each line are collected
+    token by token and the highlighted :py:class:`TTkString` is built once the line is completed.
+    '''
+    numLines = len(lines)
+    text = '\n'.join(l._text for l in islice(lines, line, None)) + '\n'
+    if _hasLexerState(lexer):
+        tokens = _regexLexerTokens(lexer, text, stack)
+    else:
+        tokens = lexer.get_tokens_unprocessed(text)
+    lineText = lines[line]._text
+    lineStart, lineEnd = 0, len(lineText)
+    colors = []
+    cur = 0
+    pending = None
+    for index, ttype, value in tokens:
+        if ttype is None:
+            if pending is not None and index == lineStart:
+                yield pending[0], pending[1], value
+                pending = None
+            continue
+        color = formatter.color(ttype)
+        end = cur+len(value)
+        while cur < end:
+            if cur < lineEnd:
+                n = min(end, lineEnd) - cur
+                colors += [color]*n
+                cur += n
+                continue
+            # Newline reached, the line is completed
+            if pending is not None:
+                yield pending[0], pending[1], None
+            pending = (line, TTkString._importString1(lineText, colors))
+            cur += 1
+            line += 1
+            if line >= numLines:
+                break
+            lineText = lines[line]._text
+            lineStart, lineEnd = cur, cur+len(lineText)
+            colors = []
+    if pending is not None:
+        yield pending[0], pending[1], None
 
 class TextDocumentHighlight(TTkTextDocument):
-    _linesRefreshed:int = 30
+    _linesRefreshed:int = 0x200
+    _resumeLines:int = 0x100
+    _guessSample:int = 0x4000
     __slots__ = (
         '_timerRefresh',
-        '_blocks', '_changedContent', '_refreshContent',
+        '_states', '_refreshFrom', '_refreshTo', '_revision', '_pass',
         '_lexer', '_formatter',
         '_defaultForegroundColor',
         #Signals
@@ -136,20 +217,20 @@ class TextDocumentHighlight(TTkTextDocument):
     def __init__(self, **kwargs):
         self.highlightUpdate = pyTTkSignal()
         self._lexer = None
-        self._blocks = []
+        self._pass = None
+        self._revision = 0
         self._defaultForegroundColor = TTkColor.RST
         # self._formatter = _TTkFormatter(style='dracula')
         self._formatter = _TTkFormatter(style='gruvbox-dark')
         super().__init__(**kwargs)
         self._timerRefresh = TTkTimer(name='Text Highlight Refresh')
         self._timerRefresh.timeout.connect(self._refreshEvent)
-        self._changedContent = (0,0,len(self._dataLines))
-        self._refreshContent = (0,TextDocumentHighlight._linesRefreshed)
+        self._resetStates()
         # self.contentsChange.connect(lambda a,b,c: TTkLog.debug(f"{a=} {b=} {c=}"))
         self.contentsChange.connect(self._saveChangedContent)
 
         try:
-            self._lexer = guess_lexer(self.toPlainText())
+            self._lexer = guess_lexer(self._sampleText())
             TTkLog.debug(f"Using Lexer: {self._lexer.name}")
         except ClassNotFound:
             self._lexer = special.TextLexer()
@@ -164,9 +245,34 @@ class TextDocumentHighlight(TTkTextDocument):
     def getLexers() -> list[str]:
         return sorted(list(set(b for a in get_all_lexers() for b in a[1])))
 
+    def _sampleText(self) -> str:
+        # Guessing the lexer scans the text with all the available lexers,
+        # the beginning of the document is enough for that
+        size = 0
+        sample = []
+        for line in self._dataLines:
+            sample.append(line._text)
+            size += len(line._text)+1
+            if size >= TextDocumentHighlight._guessSample:
+                break
+        return '\n'.join(sample)[:TextDocumentHighlight._guessSample]
+
+    def _resetStates(self) -> None:
+        # Highlight the whole document discarding the lexer states
+        with self._docMutex:
+            self._states = [_ROOT_STATE] + [None]*(len(self._dataLines)-1)
+            self._restartHighlight()
+
+    def _restartHighlight(self) -> None:
+        # Highlight the whole document again
+        with self._docMutex:
+            self._revision += 1
+            self._refreshFrom = 0
+            self._refreshTo = len(self._dataLines)
+
     @pyTTkSlot(str)
     def setStyle(self, alias:str) -> None:
-        self._formatter = formatter = _TTkFormatter(style=alias)
+        formatter = _TTkFormatter(style=alias)
         if (color:=formatter.style.background_color) and color != "#000000":
             self._backgroundColor = TTkColor.bg(color)
         else:
@@ -180,124 +286,119 @@ class TextDocumentHighlight(TTkTextDocument):
                 self._defaultForegroundColor = TTkColor.WHITE
             else:
                 self._defaultForegroundColor = TTkColor.BLACK
+        formatter.setDefaultColor(self._defaultForegroundColor)
 
         TTkLog.debug(f"{color=} {alias=} {formatter.style}")
-        self._changedContent = (0,0,len(self._dataLines))
-        self._refreshContent = (0,TextDocumentHighlight._linesRefreshed)
+        with self._docMutex:
+            self._formatter = formatter
+            self._restartHighlight()
         self._timerRefresh.start(0.3)
 
     @pyTTkSlot(str)
     def setLexer(self, alias:str) -> None:
         try:
-            self._lexer = get_lexer_by_name(alias)
-            self._changedContent = (0,0,len(self._dataLines))
-            self._refreshContent = (0,TextDocumentHighlight._linesRefreshed)
-            self._timerRefresh.start(0.3)
-            TTkLog.debug(f"Using Lexer: {self._lexer.name}")
+            lexer = get_lexer_by_name(alias)
+            TTkLog.debug(f"Using Lexer: {lexer.name}")
         except ClassNotFound:
-            self._lexer = special.TextLexer()
+            lexer = special.TextLexer()
+        self._setLexer(lexer)
 
     @pyTTkSlot(str)
     def guessLexerFromFilename(self, fileName:str) -> None:
         with open(fileName, 'r') as f:
-            content = f.read()
+            content = f.read(TextDocumentHighlight._guessSample)
             try:
-                self._lexer = guess_lexer_for_filename(fileName, content)
-                TTkLog.debug(f"Using Lexer: {self._lexer.name}")
+                lexer = guess_lexer_for_filename(fileName, content)
+                TTkLog.debug(f"Using Lexer: {lexer.name}")
             except ClassNotFound:
-                self._lexer = special.TextLexer()
+                lexer = special.TextLexer()
+        self._setLexer(lexer)
+
+    def _setLexer(self, lexer:Lexer) -> None:
+        with self._docMutex:
+            self._lexer = lexer
+            self._resetStates()
+        self._timerRefresh.start(0.3)
 
     @pyTTkSlot(int,int,int)
     def _saveChangedContent(self,a,b,c):
-        if self._changedContent:
-            self._changedContent = TTkTextDocument._mergeChangesSlices(self._changedContent,(a,b,c))
-        else:
-            self._changedContent = (a,b,c)
-        if not self._refreshContent:
-            self._refreshContent = (self._changedContent[0], TextDocumentHighlight._linesRefreshed)
+        with self._docMutex:
+            # The state at the beginning of the first line may depend on the change
+            # (i.e. a token ending with a lookahead in this line), the refresh resumes
+            # from a known state before the change; the states of the following lines
+            # are kept to check when the lexer converges back to the previous highlighting
+            states = self._states
+            states[a:a+b] = [None]*c
+            states[0] = _ROOT_STATE
+            self._revision += 1
+            if self._refreshFrom is None:
+                self._refreshFrom, self._refreshTo = a, a+c
+            else:
+                refreshTo = self._refreshTo
+                if refreshTo >= a+b:
+                    refreshTo += c-b
+                self._refreshFrom = min(self._refreshFrom, a)
+                self._refreshTo = max(refreshTo, a+c)
         self._timerRefresh.start(0.1)
 
+    def _converged(self, revision:int, line:int, state:Tuple[str,...]) -> bool:
+        with self._docMutex:
+            return (
+                revision == self._revision and
+                self._refreshTo <= line < len(self._states) and
+                self._states[line] == state )
+
     @pyTTkSlot()
     def _refreshEvent(self):
-        if not self._refreshContent: return
-        self._acquire()
-
-        ra,rb = self._refreshContent
-
-        if self._changedContent:
-            ca,cb,cc = self._changedContent
-            self._changedContent = None
-            self._blocks[ca:ca+cb] = [0]*cc
-            ra = min(ra,ca)
-
-        # find the beginning of the current block
-        # TTkLog.debug(self._blocks)
-        if ra and self._blocks:
-            blockId = self._blocks[ra]
-            for i,v in enumerate(reversed(self._blocks[:ra])):
-                # TTkLog.debug(f"{i=}:{v=} {blockId=}")
-                if v == blockId or not blockId:
-                    blockId = v
-                    ra -= 1
-                    rb += 1
-                else:
-                    break
-
-        # TTkLog.debug(f"{ra=} {rb=}")
-
-        eof = False
-        if (ra+rb) >= len(self._dataLines):
-            rb  = len(self._dataLines)-ra
-            eof=True
-
-        tsl = self._dataLines[ra:ra+rb]
-        # Find the offset from the first not empty line
-        # because pygments autostrip the heading empty lines
-        offset = 0
-        for i,l in enumerate(tsl):
-            if l != '':
-                offset = i
+        with self._docMutex:
+            if self._refreshFrom is None: return
+            if self._pass is None or self._pass[0] != self._revision:
+                # A token may span from the previous lines to the changed ones
+                # (i.e. a comment closed or a lookahead satisfied by the change),
+                # the lexing resumes from a known state some lines before the change
+                line = max(0, min(self._refreshFrom, len(self._dataLines)-1) - TextDocumentHighlight._resumeLines)
+                while self._states[line] is None:
+                    line -= 1
+                lines = self._dataLines.copy()
+                self._pass = (self._revision, lines,
+                    _highlightLines(self._lexer, self._formatter, lines, line, self._states[line]))
+            revision, lines, highlight = self._pass
+
+        # The lexing is done outside the document lock
+        done = True
+        newLines = []
+        for line, text, state in highlight:
+            newLines.append((line, text, state))
+            if state is not None and line+1 >= self._refreshTo and self._converged(revision, line+1, state):
+                break
+            if len(newLines) >= TextDocumentHighlight._linesRefreshed:
+                done = False
                 break
 
-        # TTkLog.debug(f"Refresh {self._lexer.name} {ra=} {rb=}")
-        tsl1  = [TTkString()]*(offset+1)
-        block = [0]*(offset+1)
-
-        kfd = _TTkFormatter.Data(tsl1, block)
-        self._formatter.setDl(kfd)
-        self._formatter.setDefaultColor(self._defaultForegroundColor)
-
-        rawl = [l._text for l in tsl[offset:]]
-        rawt = '\n'.join(rawl)
-        highlight(rawt, self._lexer, self._formatter)
-
-        # for ll in tsl:
-        #     TTkLog.debug(f"1: -{ll}-")
-        # for ll in tsl1:
-        #     TTkLog.debug(f"2: -{ll}-")
-
-        tsl1 = tsl1[:rb]
-        block = block[:rb]
-        self._dataLines[ra:ra+rb] = tsl1 + tsl[len(tsl1):]
-        self._blocks[ra:ra+rb] = block + [-1]*(rb-len(block))
-        # TTkLog.debug(self._blocks)
-
-        if kfd.error is not None:
-            self._refreshContent = (ra+kfd.error,rb<<1)
-            # TTkLog.debug(f"Error: {self._refreshContent=}")
-        elif kfd.multiline is not None:
-            self._refreshContent = (ra+kfd.multiline,rb<<1)
-        elif (ra+rb) < len(self._dataLines):
-            self._refreshContent = (ra+rb,TextDocumentHighlight._linesRefreshed)
-        else:
-            self._refreshContent = None
-        # TTkLog.debug(f"{self._refreshContent=}")
+        with self._docMutex:
+            fr, to = (newLines[0][0], newLines[-1][0]+1) if newLines else (0,0)
+            if ( revision != self._revision or
+                 len(self._dataLines) != len(self._states) or
+                 not all(a is b for a,b in zip(self._dataLines[fr:to], lines[fr:to])) ):
+                # The document changed in the meantime, the highlighting restarts
+                self._pass = None
+                self._timerRefresh.start(0.03)
+                return
+            self._dataLines[fr:to] = [text for _,text,_ in newLines]
+            states = [state for _,_,state in newLines]
+            if states and to >= len(self._states):
+                states.pop()
+            self._states[fr+1:fr+1+len(states)] = states
+            if done:
+                self._pass = None
+                self._refreshFrom = None
+            else:
+                self._refreshFrom = to
 
-        if not eof:
+        if not done:
             self._timerRefresh.start(0.03)
         else:
             TTkLog.debug(f"Refresh {self._lexer.name} DONE!!!")
 
-        self._release()
         self.highlightUpdate.emit()
         self.formatChanged.emit()
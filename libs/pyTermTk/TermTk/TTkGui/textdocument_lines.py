@@ -0,0 +1,218 @@
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = []
+
+from bisect import bisect_right
+from collections.abc import MutableSequence
+from itertools import chain
+from typing import Iterable, Iterator, Union
+
+from TermTk.TTkCore.string import TTkString
+
+class _TTkTextLines(MutableSequence):
+    '''
+    The lines of a :py:class:`TTkTextDocument`
+
+    It behaves like a list of :py:class:`TTkString` but the lines are stored in blocks
+    of at most 2 * :py:attr:`BLOCK_SIZE` lines shared between the copies (copy on write),
+    a copy duplicates only the list of the blocks and
+    a slice assignment replaces only the blocks involved.
+
+    ::
+
+                    _starts:  0         512       1024      1536
+                    _blocks: [ ┌─────┐ , ┌─────┐ , ┌─────┐ , ┌─────┐ ]
+        lines                   │ 0   │   │ 512 │   │1024 │   │1536 │
+        (TTkString)             │ ... │   │ ... │   │ ... │   │ ... │
+                                └─────┘   └─────┘   └─────┘   └─────┘
+    '''
+    BLOCK_SIZE:int = 0x200
+
+    __slots__ = ('_blocks', '_owned', '_starts', '_len')
+    _blocks:list[list[TTkString]]
+    _owned:list[bool]
+    _starts:list[int]
+    _len:int
+
+    def __init__(self, lines:Iterable[TTkString]=()) -> None:
+        self._blocks = []
+        # The blocks not shared with other copies
+        self._owned  = []
+        # The index of the first line of each block
+        self._starts = []
+        self._len    = 0
+        self._splice(0, 0, list(lines))
+
+    def copy(self) -> '_TTkTextLines':
+        ret = _TTkTextLines()
+        ret._blocks = self._blocks.copy()
+        ret._starts = self._starts.copy()
+        ret._len    = self._len
+        ret._owned  = [False]*len(self._blocks)
+        self._owned = [False]*len(self._blocks)
+        return ret
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[TTkString]:
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[TTkString]:
+        return chain.from_iterable(reversed(b) for b in reversed(self._blocks))
+
+    def __repr__(self) -> str:
+        return f"_TTkTextLines({list(self)!r})"
+
+    def _block(self, index:int) -> int:
+        return bisect_right(self._starts, index)-1
+
+    def _index(self, index:int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError('line index out of range')
+        return index
+
+    def _range(self, start:int, stop:int) -> list[TTkString]:
+        if start >= stop:
+            return []
+        blocks, starts = self._blocks, self._starts
+        bi = self._block(start)
+        bj = self._block(stop-1)
+        if bi == bj:
+            return blocks[bi][start-starts[bi]:stop-starts[bi]]
+        ret = blocks[bi][start-starts[bi]:]
+        for b in blocks[bi+1:bj]:
+            ret += b
+        ret += blocks[bj][:stop-starts[bj]]
+        return ret
+
+    def __getitem__(self, key:Union[int,slice]) -> Union[TTkString,list[TTkString]]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._len)
+            if step == 1:
+                return self._range(start, stop)
+            if not (r := range(start, stop, step)):
+                return []
+            lo = min(r[0],r[-1])
+            return self._range(lo, max(r[0],r[-1])+1)[r[0]-lo::step]
+        if key < 0:
+            key += self._len
+        if not 0 <= key < self._len:
+            raise IndexError('line index out of range')
+        starts = self._starts
+        b = bisect_right(starts, key)-1
+        return self._blocks[b][key-starts[b]]
+
+    def __setitem__(self, key:Union[int,slice], value:Union[TTkString,Iterable[TTkString]]) -> None:
+        if not isinstance(key, slice):
+            index = self._index(key)
+            b = self._block(index)
+            if not self._owned[b]:
+                self._blocks[b] = self._blocks[b].copy()
+                self._owned[b]  = True
+            self._blocks[b][index-self._starts[b]] = value
+            return
+        start, stop, step = key.indices(self._len)
+        if step != 1:
+            lines = list(self)
+            lines[key] = value
+            self._splice(0, len(self._blocks), lines)
+            return
+        stop  = max(start, stop)
+        value = list(value)
+        blocks, starts = self._blocks, self._starts
+        if not blocks:
+            self._splice(0, 0, value)
+            return
+        bi = self._block(start) if start < self._len else len(blocks)-1
+        bj = self._block(stop-1) if stop > start else bi
+        offFr = start-starts[bi]
+        offTo = stop-starts[bj]
+        size = len(blocks[bi]) - (stop-start) + len(value)
+        if bi == bj and 0 < size <= 2*self.BLOCK_SIZE and (size >= self.BLOCK_SIZE//2 or len(blocks) == 1):
+            # Fast path, only one block is changed
+            if self._owned[bi]:
+                blocks[bi][offFr:offTo] = value
+            else:
+                blocks[bi] = blocks[bi][:offFr] + value + blocks[bi][offTo:]
+                self._owned[bi] = True
+            if delta := len(value) - (stop-start):
+                for b in range(bi+1,len(starts)):
+                    starts[b] += delta
+                self._len += delta
+            return
+        self._splice(bi, bj+1, blocks[bi][:offFr] + value + blocks[bj][offTo:])
+
+    def __delitem__(self, key:Union[int,slice]) -> None:
+        if not isinstance(key, slice):
+            index = self._index(key)
+            key = slice(index, index+1)
+        self[key] = []
+
+    def _splice(self, bi:int, bj:int, lines:list[TTkString]) -> None:
+        '''
+        Replace the blocks [bi:bj] with the lines,
+        a small result is merged with the next (or previous) block
+        '''
+        blocks, bs = self._blocks, self.BLOCK_SIZE
+        if len(lines) < bs//2:
+            if bj < len(blocks):
+                lines = lines + blocks[bj]
+                bj += 1
+            elif bi > 0:
+                bi -= 1
+                lines = blocks[bi] + lines
+        if len(lines) <= 2*bs:
+            chunks = [lines] if lines else []
+        else:
+            chunks = [lines[i:i+bs] for i in range(0, len(lines), bs)]
+            if len(chunks[-1]) < bs//2:
+                last = chunks.pop()
+                chunks[-1] += last
+        blocks[bi:bj] = chunks
+        self._owned[bi:bj] = [True]*len(chunks)
+        starts = self._starts
+        del starts[bi:]
+        start = starts[-1]+len(blocks[bi-1]) if bi else 0
+        for b in blocks[bi:]:
+            starts.append(start)
+            start += len(b)
+        self._len = start
+
+    def insert(self, index:int, line:TTkString) -> None:
+        if index < 0:
+            index = max(0, index+self._len)
+        index = min(index, self._len)
+        self[index:index] = [line]
+
+    def append(self, line:TTkString) -> None:
+        self[self._len:self._len] = [line]
+
+    def extend(self, lines:Iterable[TTkString]) -> None:
+        self[self._len:self._len] = lines
+
+    def __iadd__(self, lines:Iterable[TTkString]) -> '_TTkTextLines':
+        self.extend(lines)
+        return self
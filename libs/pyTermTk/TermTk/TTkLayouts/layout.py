@@ -28,15 +28,62 @@ from __future__ import annotations
 
 __all__ = ['TTkLayoutItem', 'TTkLayout', 'TTkWidgetItem']
 
-from typing import TYPE_CHECKING, Generator, List
+from typing import TYPE_CHECKING, Generator, List, Dict, Tuple, Optional, Iterable
 
 from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.cfg import TTkCfg
 
 from .layoutitem import TTkLayoutItem, TTkWidgetItem
 
 if TYPE_CHECKING:
     from TermTk.TTkWidgets.widget import TTkWidget
 
+class _TTkSpatialIndex():
+    '''
+    Grid buckets of the items of a layout, used to speed up the hit-testing (mouse events, :py:meth:`TTkHelper.widgetAt`)
+
+    The widget items are placed in each cell (:py:attr:`CELL_W` x :py:attr:`CELL_H`)
+    they overlap, clipped to the layout area.
+    The nested layouts are always returned as candidates.
+    '''
+    __slots__ = ('_items', '_size', '_cells', '_always')
+    CELL_W:int = 16
+    CELL_H:int = 8
+
+    _items:List[TTkLayoutItem]
+    _size:Tuple[int,int]
+    _cells:Dict[Tuple[int,int],List[Tuple[int,TTkLayoutItem]]]
+    _always:List[Tuple[int,TTkLayoutItem]]
+
+    def __init__(self, items:List[TTkLayoutItem], w:int, h:int) -> None:
+        self._items = items
+        self._size = (w,h)
+        self._cells = cells = {}
+        self._always = always = []
+        cw, ch = _TTkSpatialIndex.CELL_W, _TTkSpatialIndex.CELL_H
+        # From the top most item, the same order used by the hit-testing
+        for i,item in enumerate(reversed(items)):
+            if isinstance(item, TTkWidgetItem):
+                if item.isEmpty(): continue
+                wx,wy,ww,wh = item.widget().geometry()
+                x1, y1 = max(0,wx),   max(0,wy)
+                x2, y2 = min(w,wx+ww), min(h,wy+wh)
+                if x1>=x2 or y1>=y2: continue
+                for cy in range(y1//ch, (y2-1)//ch+1):
+                    for cx in range(x1//cw, (x2-1)//cw+1):
+                        cells.setdefault((cx,cy),[]).append((i,item))
+            else:
+                always.append((i,item))
+
+    def isValid(self, items:List[TTkLayoutItem], w:int, h:int) -> bool:
+        return self._items is items and self._size == (w,h)
+
+    def itemsAt(self, x:int, y:int) -> List[TTkLayoutItem]:
+        cell = self._cells.get((x//_TTkSpatialIndex.CELL_W, y//_TTkSpatialIndex.CELL_H),[])
+        if self._always:
+            cell = sorted(cell+self._always, key=lambda c:c[0])
+        return [item for _,item in cell]
+
 class TTkLayout(TTkLayoutItem):
     '''
     | The :py:class:`TTkLayout` class is the base class of geometry managers. <br/>
@@ -56,13 +103,17 @@ class TTkLayout(TTkLayoutItem):
         ║                            ║
         ╚════════════════════════════╝
     '''
-    __slots__ = ('_items', '_zSortedItems')
+    __slots__ = ('_items', '_zSortedItems', '_spatialIndex')
     _items:List[TTkLayoutItem]
     _zSortedItems:List[TTkLayoutItem]
+    _spatialIndex:Optional[_TTkSpatialIndex]
+    # Minimum number of items required to use the spatial index for the hit-testing
+    SPATIAL_INDEX_MIN_ITEMS:int = 32
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._items = []
         self._zSortedItems = []
+        self._spatialIndex = None
 
     def children(self):
         '''Return the list of direct child layout items.'''
@@ -149,6 +200,33 @@ class TTkLayout(TTkLayoutItem):
         '''Return child items sorted by z-order.'''
         return self._zSortedItems
 
+    def _invalidateSpatialIndex(self) -> None:
+        self._spatialIndex = None
+
+    def _itemsAt(self, x:int, y:int, w:int, h:int) -> Iterable[TTkLayoutItem]:
+        '''
+        Return the child items, from the top most, that may include the point (x,y)
+
+        The caller is still required to check the geometry of the items returned.
+        The spatial index is used if the layout has enough items
+        and it is rebuilt lazily after any z-order or geometry change.
+
+        :param x: the horizontal position (relative to the layout area)
+        :type x: int
+        :param y: the vertical position (relative to the layout area)
+        :type y: int
+        :param w: the width of the layout area
+        :type w: int
+        :param h: the height of the layout area
+        :type h: int
+        '''
+        items = self._zSortedItems
+        if not TTkCfg.spatialIndex or len(items) < TTkLayout.SPATIAL_INDEX_MIN_ITEMS:
+            return reversed(items)
+        if (index := self._spatialIndex) is None or not index.isValid(items, w, h):
+            index = self._spatialIndex = _TTkSpatialIndex(items, w, h)
+        return index.itemsAt(x, y)
+
     def replaceItem(self, item, index):
         '''Replace the item at ``index`` with ``item``.
 
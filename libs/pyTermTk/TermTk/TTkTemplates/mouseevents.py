@@ -113,6 +113,9 @@ class TMouseEvents():
         '''
         This event handler, can be reimplemented in a subclass to receive mouse wheel events for the widget.
 
+        The consecutive wheel ticks are merged in a single event, their number is reported in :py:attr:`TTkMouseEvent.delta`
+        (see :py:meth:`TTkWidget.setWheelCoalescing`)
+
         .. note:: Reimplement this function to handle this event
 
         :param evt: The mouse event
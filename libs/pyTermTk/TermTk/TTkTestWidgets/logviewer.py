@@ -23,9 +23,12 @@
 __all__ = ['TTkLogViewer']
 
 import os
+from collections import deque
+from itertools import islice
 from typing import Optional
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.log import TTkLog
+from TermTk.TTkCore.helper import TTkHelper
 from TermTk.TTkCore.color import TTkColor
 from TermTk.TTkCore.string import TTkString
 from TermTk.TTkCore.signal import pyTTkSlot
@@ -34,13 +37,33 @@ from TermTk.TTkAbstract.abstractscrollarea import TTkAbstractScrollArea
 from TermTk.TTkAbstract.abstractscrollview import TTkAbstractScrollView
 
 class _TTkLogViewer(TTkAbstractScrollView):
-    __slots__ = ('_messages', '_cwd', '_follow')
+    __slots__ = (
+        '_messages', '_cwd', '_follow',
+        '_count', '_widths', '_inbox',
+        '_pending', '_syncCount', '_syncLen')
     def __init__(self, *,
                  follow:bool=False,
+                 maxLines:int=0x4000,
                  **kwargs) -> None:
         self._cwd = os.getcwd()
-        self._messages = [TTkString()]
         self._follow = follow
+        # Ring buffer of the last "maxLines" messages
+        self._messages:deque[TTkString] = deque(maxlen=max(1,maxLines))
+        # Total number of messages received,
+        # the first message in the buffer is the (_count - len(_messages))th
+        self._count = 0
+        # Decreasing (count, width) of the messages,
+        # the first item is the widest message still in the buffer
+        self._widths:deque[tuple[int,int]] = deque()
+        # The messages logged (from any thread) not yet added to the buffer,
+        # they are added in the drawing routine by _syncView
+        self._inbox:deque[TTkString] = deque()
+        # The view is synced with the new messages
+        # once per frame, in the drawing routine before the widgets are painted
+        self._pending = False
+        self._syncCount = 0
+        self._syncLen = 0
+        self._append(TTkString())
         super().__init__(**kwargs)
         TTkLog.installMessageHandler(self.loggingCallback)
         self.viewChanged.connect(self._viewChangedHandler)
@@ -49,8 +72,49 @@ class _TTkLogViewer(TTkAbstractScrollView):
     def _viewChangedHandler(self):
         self.update()
 
+    def maxLines(self) -> int:
+        '''
+        This property holds the maximum number of messages retained,
+        the oldest messages are discarded when this limit is reached.
+
+        :return: int
+        '''
+        return self._messages.maxlen
+
+    def setMaxLines(self, maxLines:int) -> None:
+        '''
+        Set the maximum number of messages retained.
+
+        :param maxLines: the number of messages
+        :type maxLines: int
+        '''
+        maxLines = max(1,maxLines)
+        if maxLines == self._messages.maxlen: return
+        self._messages = deque(self._messages, maxlen=maxLines)
+        first = self._count - len(self._messages)
+        self._widths = deque()
+        for c,m in enumerate(self._messages, first):
+            self._pushWidth(c, m.termWidth())
+        self._scheduleSync()
+
+    def _pushWidth(self, count:int, width:int) -> None:
+        widths = self._widths
+        while widths and widths[-1][1] <= width:
+            widths.pop()
+        widths.append((count,width))
+
+    def _append(self, message:TTkString) -> None:
+        self._pushWidth(self._count, message.termWidth())
+        self._count += 1
+        self._messages.append(message)
+        # Drop the widths of the messages pushed out of the ring buffer
+        first = self._count - len(self._messages)
+        widths = self._widths
+        while widths[0][0] < first:
+            widths.popleft()
+
     def viewFullAreaSize(self) -> tuple[int,int]:
-        w = max( m.termWidth() for m in self._messages)
+        w = self._widths[0][1]
         h = len(self._messages)
         return w , h
 
@@ -62,19 +126,44 @@ class _TTkLogViewer(TTkAbstractScrollView):
         elif mode == TTkLog.FatalMsg:    logType = TTkString("FATAL"   ,TTkColor.fg("#ff0000"))
         elif mode == TTkLog.WarningMsg:  logType = TTkString("WARNING ",TTkColor.fg("#ff0000"))
         elif mode == TTkLog.CriticalMsg: logType = TTkString("CRITICAL",TTkColor.fg("#ff0000"))
-        self._messages.append(logType+TTkString(f": {context.file}:{context.line} {message}".replace(self._cwd,"_")))
+        self._inbox.append(logType+TTkString(f": {context.file}:{context.line} {message}".replace(self._cwd,"_")))
+        self._scheduleSync()
+
+    def _scheduleSync(self) -> None:
+        if self._pending: return
+        self._pending = True
+        TTkHelper.deferCall(self._syncView)
+
+    def _syncView(self) -> None:
+        '''
+        Add the messages received since the last sync and move the view to follow them
+        '''
+        self._pending = False
+        inbox = self._inbox
+        while inbox:
+            self._append(inbox.popleft())
         offx, offy = self.getViewOffsets()
         _,h = self.size()
-        if self._follow or offy == len(self._messages)-h-1:
-            offy = len(self._messages)-h
-        self.viewMoveTo(offx, offy)
+        count = self._count
+        size  = len(self._messages)
+        # The lines discarded from the top of the buffer
+        dropped = (count - size) - (self._syncCount - self._syncLen)
+        follow = self._follow or offy >= self._syncLen-h
+        self._syncCount = count
+        self._syncLen   = size
+        # The scrollbars may change the size of the view
         self.viewChanged.emit()
-        self.update()
+        if follow:
+            _,h = self.size()
+            offy = size-h
+        else:
+            offy -= dropped
+        self.viewMoveTo(offx, max(0,offy))
 
     def paintEvent(self, canvas):
         ox,oy = self.getViewOffsets()
         _,h = self.size()
-        for y, message in enumerate(self._messages[oy:oy+h]):
+        for y, message in enumerate(islice(self._messages,oy,oy+h)):
             canvas.drawTTkString(pos=(-ox,y),text=message)
 
 class TTkLogViewer(TTkAbstractScrollArea):
@@ -85,8 +174,11 @@ class TTkLogViewer(TTkAbstractScrollArea):
                  visible:bool=True,
                  # TTkLogViewer init
                  follow:bool=False,
+                 maxLines:int=0x4000,
                  **kwargs) -> None:
-        self._logView = _TTkLogViewer(follow=follow)
+        self._logView = _TTkLogViewer(follow=follow, maxLines=maxLines)
         super().__init__(parent=parent, visible=visible, **kwargs)
         self.setFocusPolicy(TTkK.ClickFocus)
         self.setViewport(self._logView)
+        self.maxLines    = self._logView.maxLines
+        self.setMaxLines = self._logView.setMaxLines
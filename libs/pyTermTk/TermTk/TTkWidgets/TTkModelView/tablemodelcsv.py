@@ -20,16 +20,100 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-__all__=['TTkTableModelCSV']
+__all__=['TTkTableModelCSV','TTkTableModelCSVStream']
 
+import io
+import os
+import re
 import csv
+import threading
+from array import array
 
-from typing import Tuple,List,Optional,cast
+from typing import Tuple,List,Dict,Optional,cast
 
 from TermTk.TTkCore.constant import TTkK
-from TermTk.TTkCore.string import TTkStringType
+from TermTk.TTkCore.string import TTkString, TTkStringType
+from TermTk.TTkCore.signal import pyTTkSignal
+from TermTk.TTkAbstract.abstracttablemodel import TTkAbstractTableModel
 from TermTk.TTkWidgets.TTkModelView.tablemodellist import TTkTableModelList
 
+def _checkIndexColumn(data:list[list]) -> bool:
+    if not data:
+        return False
+    if all(l[0].isdigit() for l in data):
+        num = int(data[0][0])
+        return all(num+i==int(l[0]) for i,l in enumerate(data))
+    return False
+
+# The remaining of a quoted field, the group is the closing quote (empty if the field continues)
+_quotedValue = re.compile(rb'(?:[^"]|"")*("?)')
+# A record, the group is the record separator (missing if the record continues in the next chunk),
+# a quote opens a quoted field only at the beginning of the field and it is closed by an odd sequence of quotes
+_record = re.compile(rb'(?:[^\n"]+|(?<=[^,\n])"|"[^"]*(?:""[^"]*)*"(?!"))*(?:(\n)|(?:"[^"]*(?:""[^"]*)*)?\Z)')
+# A record separator or a quoted field, the second group is the closing quote (empty if the field continues)
+_token = re.compile(rb'(\n)|(?<![^,\n])"(?:[^"]|"")*("?)')
+
+class _CSVIndexer():
+    '''
+    Find the records boundaries in the consecutive chunks of a csv file.
+
+    The quotes are tracked as done by :py:func:`csv.reader` (default dialect),
+    a quote opens a quoted field only at the beginning of the field
+    and a double quote inside a quoted field is an escaped quote,
+    any other quote is part of the value (i.e. 12" pipe).
+    '''
+    __slots__ = ('_quoted', '_quoteEnd', '_fieldStart')
+    _quoted:bool
+    _quoteEnd:bool
+    _fieldStart:bool
+
+    def __init__(self) -> None:
+        # Inside a quoted field
+        self._quoted = False
+        # The previous chunk ends with a quote inside a quoted field (closing or escaped)
+        self._quoteEnd = False
+        # The previous chunk ends at the beginning of a field
+        self._fieldStart = True
+
+    def feed(self, chunk:bytes, offset:int) -> array:
+        '''
+        Return the offsets of the records beginning in this chunk
+
+        :param chunk: the chunk following the previous one
+        :type chunk: bytes
+        :param offset: the position of the chunk in the file
+        :type offset: int
+        '''
+        size = len(chunk)
+        pos = 0
+        if self._quoteEnd:
+            self._quoteEnd = False
+            if chunk[:1] == b'"':
+                # Escaped quote
+                pos = 1
+            else:
+                self._quoted = False
+        if self._quoted:
+            match = _quotedValue.match(chunk, pos)
+            pos = match.end()
+            if not match.group(1) or pos == size:
+                self._quoteEnd = bool(match.group(1))
+                return array('Q')
+            self._quoted = False
+        elif not self._fieldStart and chunk[:1] == b'"':
+            # A quote in the middle of a field is part of the value
+            pos = 1
+        ret = array('Q', [offset+m.end() for m in _record.finditer(chunk, pos) if m.lastindex])
+        # Only the last record, not terminated in this chunk, can leave a quoted field open
+        last = None
+        for last in _token.finditer(chunk, ret[-1]-offset if ret else pos):
+            pass
+        if last is not None and last.lastindex == 2 and last.end() == size:
+            self._quoted = True
+            self._quoteEnd = bool(last.group(2))
+        self._fieldStart = not self._quoted and chunk[-1:] in (b',', b'\n')
+        return ret
+
 class TTkTableModelCSV(TTkTableModelList):
     '''
     :py:class:`TTkTableModelCSV` extends :py:class:`TTkTableModelList` with csv loading helpers.
@@ -93,9 +177,187 @@ class TTkTableModelCSV(TTkTableModelList):
         return data, head, idx
 
     def _checkIndexColumn(self, data:list[list]) -> bool:
-        if not data:
-            return False
-        if all(l[0].isdigit() for l in data):
-            num = int(data[0][0])
-            return all(num+i==int(l[0]) for i,l in enumerate(data))
-        return False
+        return _checkIndexColumn(data)
+
+class TTkTableModelCSVStream(TTkAbstractTableModel):
+    '''
+    :py:class:`TTkTableModelCSVStream` is a read only, file backed, csv table model
+    designed for huge files.
+
+    Unlike :py:class:`TTkTableModelCSV` the file is not loaded in memory,
+    the byte offset of each row is indexed in a background thread
+    and only the rows displayed are parsed and kept in a LRU page cache.
+
+    The :meth:`rowCount` grows while the file is indexed,
+    the :py:attr:`TTkAbstractTableModel.rowsAppended` signal is emitted for each indexed chunk
+    (from the indexing thread).
+
+    ::
+
+        import TermTk as ttk
+
+        tm = ttk.TTkTableModelCSVStream(filename='path/huge.file.csv')
+        tm.indexed.connect(lambda : ttk.TTkLog.info(f"Rows: {tm.rowCount()}"))
+
+    '''
+
+    __slots__ = (
+        '_filename', '_fd', '_fileMutex', '_isIndexed',
+        '_offsets', '_header', '_indexColumn', '_columns',
+        '_pages',
+        # Signals
+        'indexUpdated', 'indexed')
+
+    # Number of rows parsed in a single read
+    PAGE_SIZE:int = 256
+    # Max number of pages kept in the cache
+    MAX_PAGES:int = 64
+    # Bytes read by the indexing thread in a single chunk
+    CHUNK_SIZE:int = 0x1000000 # ~16M
+
+    indexUpdated:pyTTkSignal
+    '''
+        This signal is emitted during the indexing of the file
+
+        :param progress: the indexed fraction of the file [0.0 - 1.0]
+        :type progress: float
+    '''
+    indexed:pyTTkSignal
+    '''
+        This signal is emitted when the file is completely indexed
+    '''
+
+    _offsets:array
+    _header:List[TTkStringType]
+    _pages:Dict[int,List[List[str]]]
+
+    def __init__(self, *, filename:str) -> None:
+        '''
+        :param filename: the csv filename
+        :type filename: str
+        '''
+        # Signals
+        self.indexUpdated = pyTTkSignal(float)
+        self.indexed = pyTTkSignal()
+
+        self._filename = filename
+        self._fileMutex = threading.Lock()
+        self._isIndexed = False
+        self._pages = {}
+        # Byte offsets of the beginning of each record and the end of the last one
+        self._offsets = array('Q',[0])
+        self._header = []
+        self._indexColumn = False
+        self._columns = 0
+        self._fd = open(filename, 'rb')
+        self._checkHeader()
+        super().__init__()
+        threading.Thread(name='TTkTableModelCSVStream', target=self._createIndex, daemon=True).start()
+
+    def __del__(self):
+        if fd := getattr(self, '_fd', None):
+            fd.close()
+
+    def filename(self) -> str:
+        return self._filename
+
+    def isIndexed(self) -> bool:
+        '''
+        Returns True if the file is completely indexed
+
+        :return: bool
+        '''
+        return self._isIndexed
+
+    def _checkHeader(self) -> None:
+        # Use the beginning of the file to detect the header
+        # and the index column as done in TTkTableModelCSV
+        with open(self._filename, 'r', errors='replace', newline='') as fd:
+            sniffer = csv.Sniffer()
+            try:
+                has_header = sniffer.has_header(fd.read(2048))
+            except:
+                has_header = False
+            fd.seek(0)
+            sample = []
+            for row in csv.reader(fd):
+                sample.append(row)
+                if len(sample) > self.PAGE_SIZE: break
+        if has_header and sample:
+            self._header = sample.pop(0)
+        data = [row for row in sample if row]
+        self._indexColumn = _checkIndexColumn(data)
+        if self._indexColumn and self._header:
+            self._header.pop(0)
+        self._columns = max((len(row) for row in sample), default=len(self._header)+self._indexColumn) - self._indexColumn
+
+    def _createIndex(self) -> None:
+        offset = 0
+        # A new line inside a quoted field is not a record separator
+        indexer = _CSVIndexer()
+        fileSize = os.stat(self._filename).st_size
+        with open(self._filename,'rb') as infile:
+            while (chunk:=infile.read(self.CHUNK_SIZE)):
+                offsets = indexer.feed(chunk, offset)
+                offset+=len(chunk)
+                if offset == fileSize and (offsets[-1] if offsets else self._offsets[-1]) != offset:
+                    # The last record does not end with a new line
+                    offsets.append(offset)
+                rows = self.rowCount()
+                with self._fileMutex:
+                    self._offsets.extend(offsets)
+                self.indexUpdated.emit(offset/fileSize)
+                if (count:=self.rowCount()-rows) > 0:
+                    self.rowsAppended.emit(rows, count)
+        self._isIndexed = True
+        self.indexUpdated.emit(1.0)
+        self.indexed.emit()
+
+    def _getPage(self, page:int) -> List[List[str]]:
+        '''
+        Return the parsed rows of the page,
+        the pages are kept in a LRU cache
+        '''
+        pages = self._pages
+        if (rows := pages.pop(page, None)) is None:
+            fr = page*self.PAGE_SIZE + (1 if self._header else 0)
+            with self._fileMutex:
+                offsets = self._offsets
+                to = min(fr+self.PAGE_SIZE, len(offsets)-1)
+                if to <= fr:
+                    return []
+                self._fd.seek(offsets[fr])
+                buffer = self._fd.read(offsets[to]-offsets[fr])
+            rows = list(csv.reader(io.StringIO(buffer.decode(errors='replace'), newline='')))
+            # The last page may grow while indexing, it is not cached if incomplete
+            if to-fr < self.PAGE_SIZE:
+                return rows
+            if len(pages) >= self.MAX_PAGES:
+                # Evict the least recently used page
+                del pages[next(iter(pages))]
+        pages[page] = rows
+        return rows
+
+    def _row(self, row:int) -> List[str]:
+        rows = self._getPage(row//self.PAGE_SIZE)
+        return rows[row%self.PAGE_SIZE] if row%self.PAGE_SIZE < len(rows) else []
+
+    def rowCount(self) -> int:
+        return max(0, len(self._offsets)-1-(1 if self._header else 0))
+
+    def columnCount(self) -> int:
+        return self._columns
+
+    def data(self, row:int, col:int) -> str:
+        rowData = self._row(row)
+        col += self._indexColumn
+        return rowData[col] if col < len(rowData) else ''
+
+    def headerData(self, num:int, orientation:int) -> TTkString:
+        if orientation == TTkK.HORIZONTAL:
+            if num < len(self._header):
+                return TTkString(self._header[num])
+        if orientation == TTkK.VERTICAL:
+            if self._indexColumn and (rowData:=self._row(num)):
+                return TTkString(rowData[0])
+        return super().headerData(num, orientation)
@@ -123,6 +123,9 @@ class TTkTableModelList(TTkAbstractTableModel):
             TTkK.ItemFlag.ItemIsEditable |
             TTkK.ItemFlag.ItemIsSelectable )
 
+    def uniformFlags(self) -> bool:
+        return type(self).flags is TTkTableModelList.flags
+
     def sort(self, column:int, order:TTkK.SortOrder) -> None:
         if column == -1:
             self._data = self._dataOriginal
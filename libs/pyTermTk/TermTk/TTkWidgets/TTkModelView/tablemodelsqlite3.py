@@ -27,7 +27,7 @@ __all__=['TTkTableModelSQLite3']
 import sqlite3
 import threading
 
-from typing import Any,Dict,List
+from typing import Any,Dict,List,Tuple
 
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.string import TTkString
@@ -91,9 +91,16 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
         '_key', '_columns', '_columnTypes', '_count',
         '_sort', '_sortColumn',
         '_sqliteMutex',
-        '_idMap')
+        '_idMap', '_rowKeys', '_pages')
+
+    # Number of rows fetched in a single query
+    PAGE_SIZE:int = 256
+    # Max number of pages kept in the cache
+    MAX_PAGES:int = 64
 
     _idMap:Dict[str,int]
+    _rowKeys:List[str]
+    _pages:Dict[int,List[Tuple[Any,...]]]
 
     def __init__(self, *,
                  fileName:str,
@@ -112,6 +119,8 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
         self._columns = []
         self._columnTypes = []  # Add this to store column types
         self._idMap = {}
+        self._rowKeys = []
+        self._pages = {}
         self._sort = ''
         self._sortColumn = -1
 
@@ -134,9 +143,31 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
         super().__init__()
 
     def _refreshIdMap(self):
-        self._idMap = {
-            _id : _rn
-            for _rn,_id in self._cur.execute(f"SELECT ROW_NUMBER() OVER ({self._sort}) RN, {self._key} from {self._table}")}
+        # The keys in the current order (row -> key) are used to fetch the pages,
+        # and the _idMap (key -> row number) to resolve the model indexes
+        self._rowKeys = [_id for _id, in self._cur.execute(f"SELECT {self._key} FROM {self._table} {self._sort}")]
+        self._idMap = {_id:_rn for _rn,_id in enumerate(self._rowKeys,1)}
+        self._pages = {}
+
+    def _getPage(self, page:int) -> List[Tuple[Any,...]]:
+        '''
+        Return the rows (all the columns) of the page,
+        the pages are fetched in a single query using the keys of the rows
+        and they are kept in a LRU cache
+        '''
+        pages = self._pages
+        if (rows := pages.pop(page, None)) is None:
+            keys = self._rowKeys[page*self.PAGE_SIZE:(page+1)*self.PAGE_SIZE]
+            res = self._cur.execute(
+                f"SELECT {self._key}, {', '.join(self._columns)} FROM {self._table} "
+                f"WHERE {self._key} IN ({','.join(['?']*len(keys))})", keys)
+            rowsByKey = {_r[0]:_r[1:] for _r in res}
+            rows = [rowsByKey.get(_k,()) for _k in keys]
+            if len(pages) >= self.MAX_PAGES:
+                # Evict the least recently used page
+                del pages[next(iter(pages))]
+        pages[page] = rows
+        return rows
 
     def rowCount(self) -> int:
         return self._count
@@ -149,28 +180,19 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
 
     def index(self, row:int, col:int) -> TTkModelIndex:
         with self._sqliteMutex:
-            res = self._cur.execute(
-                f"SELECT {self._key} FROM {self._table} "
-                f"{self._sort} "
-                f"LIMIT 1 OFFSET {row}")
-            key:str = '' if not (_fetch:=res.fetchone()) else _fetch[0]
+            key:str = self._rowKeys[row] if 0 <= row < len(self._rowKeys) else ''
             return _TTkModelIndexSQLite3(col=col,rowId=key,sqModel=self)
 
     def data(self, row:int, col:int) -> Any:
+        if not 0 <= row < len(self._rowKeys):
+            return None
         with self._sqliteMutex:
-            res = self._cur.execute(
-                f"SELECT {self._columns[col]} FROM {self._table} "
-                f"{self._sort} "
-                f"LIMIT 1 OFFSET {row}")
-            return None if not (_fetch:=res.fetchone()) else _fetch[0]
+            rowData = self._getPage(row//self.PAGE_SIZE)[row%self.PAGE_SIZE]
+            return rowData[col] if col < len(rowData) else None
 
     def setData(self, row:int, col:int, data:object) -> bool:
         with self._sqliteMutex:
-            res = self._cur.execute(
-                f"SELECT {self._key} FROM {self._table} "
-                f"{self._sort} "
-                f"LIMIT 1 OFFSET {row}")
-            key=res.fetchone()[0]
+            key=self._rowKeys[row]
             res = self._cur.execute(
                 f"UPDATE {self._table} "
                 f"SET {self._columns[col]} = '{data}' "
@@ -178,6 +200,9 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
             self._conn.commit()
             if col == self._sortColumn:
                 self._refreshIdMap()
+            else:
+                # The value stored may be converted by sqlite, refetch the page
+                self._pages.pop(row//self.PAGE_SIZE, None)
         return True
 
     def headerData(self, num:int, orientation:TTkK.Direction) -> TTkString:
@@ -192,6 +217,9 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
             TTkK.ItemFlag.ItemIsEditable |
             TTkK.ItemFlag.ItemIsSelectable )
 
+    def uniformFlags(self) -> bool:
+        return type(self).flags is TTkTableModelSQLite3.flags
+
     def sort(self, column:int, order:TTkK.SortOrder) -> None:
         self._sortColumn = column
         if column == -1:
@@ -24,9 +24,12 @@ from __future__ import annotations
 
 __all__ = ['TTkTableWidget','TTkHeaderView']
 
-from typing import Optional, List, Tuple, Callable, Iterator, Any, Protocol
+from typing import Optional, List, Tuple, Dict, Callable, Iterable, Iterator, Any, Protocol
 from dataclasses import dataclass
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, Future
 
+from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.helper import TTkHelper
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.string import TTkString
@@ -91,6 +94,153 @@ class TTkHeaderView():
         '''
         return self._visible
 
+class _TTkTablePrefetch():
+    '''
+    Request the rows not loaded by an async model (see :py:meth:`TTkAbstractTableModel.isRowLoaded`)
+    in blocks of :py:attr:`BLOCK` rows on a shared worker pool.
+
+    The blocks requested and not started yet are cancelled
+    if they are no more required (i.e. fast scrolling)
+    '''
+    __slots__ = ('_model', '_pending', 'enabled')
+    BLOCK:int = 64
+    _executor:Optional[ThreadPoolExecutor] = None
+
+    _model:TTkAbstractTableModel
+    _pending:Dict[int,Future]
+    enabled:bool
+
+    def __init__(self, model:TTkAbstractTableModel) -> None:
+        self._model = model
+        self._pending = {}
+        # Only the models implementing the async protocol require the prefetch
+        self.enabled = type(model).isRowLoaded is not TTkAbstractTableModel.isRowLoaded
+
+    def request(self, rowa:int, rowb:int) -> None:
+        '''Request the rows in the range [rowa, rowb)'''
+        if not self.enabled: return
+        model = self._model
+        rowb = min(rowb, model.rowCount())
+        if rowa >= rowb: return
+        B = _TTkTablePrefetch.BLOCK
+        blocks = range(rowa//B, (rowb-1)//B+1)
+        for block, future in list(self._pending.items()):
+            # The cancelled blocks are removed by the done callback
+            if block not in blocks:
+                future.cancel()
+        for block in blocks:
+            if block in self._pending: continue
+            fr = block*B
+            to = min(fr+B, rowb) if block == blocks[-1] else fr+B
+            if all(model.isRowLoaded(_r) for _r in range(fr, to)): continue
+            if _TTkTablePrefetch._executor is None:
+                _TTkTablePrefetch._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='TTkTablePrefetch')
+            future = _TTkTablePrefetch._executor.submit(self._fetch, block)
+            self._pending[block] = future
+            # Added after the registration, it is called immediately if the fetch is already completed
+            future.add_done_callback(lambda _f, _b=block: self._done(_b, _f))
+
+    def cancel(self) -> None:
+        '''
+        Cancel the pending blocks and disable any further request (i.e. the model is replaced),
+        a block already being fetched is not interrupted
+        '''
+        self.enabled = False
+        for future in list(self._pending.values()):
+            future.cancel()
+        self._pending = {}
+
+    def _done(self, block:int, future:Future) -> None:
+        if self._pending.get(block) is future:
+            del self._pending[block]
+
+    def _fetch(self, block:int) -> None:
+        # Cancelled after the block was started by the pool
+        if not self.enabled: return
+        model = self._model
+        B = _TTkTablePrefetch.BLOCK
+        try:
+            row = block*B
+            model.fetchRows(row, max(0,min(B, model.rowCount()-row)))
+        except Exception as e:
+            TTkLog.error(f"Table prefetch error: {e}")
+
+class _TTkTableColumnWidths():
+    '''
+    Cache of the cells width used to resize the columns to their contents.
+
+    Only a sample of the rows is measured for huge models
+    (the head, the tail, the visible window and a sample spread across the table),
+    the cache is incrementally updated with the cells reported by the :py:meth:`TTkAbstractTableModel.dataChanged` signal
+    '''
+    __slots__ = ('_model', '_widths', '_changed')
+    SAMPLE:int = 100
+
+    _model:TTkAbstractTableModel
+    _widths:Dict[int,Dict[int,int]]
+    _changed:List[Tuple[Tuple[int,int],Tuple[int,int]]]
+
+    def __init__(self, model:TTkAbstractTableModel) -> None:
+        self._model = model
+        self._widths = {}
+        self._changed = []
+
+    def clear(self) -> None:
+        self._widths = {}
+        self._changed = []
+
+    def dataChanged(self, pos:Tuple[int,int], size:Tuple[int,int]) -> None:
+        # The changes are applied when the width is requested,
+        # this signal may be emitted by a worker thread (i.e. async models)
+        self._changed.append((pos,size))
+
+    def _cellWidth(self, row:int, col:int) -> int:
+        txt = self._model.ttkStringData(row, col)
+        return max(t.termWidth() for t in txt.split('\n'))
+
+    def _applyChanges(self) -> None:
+        changed = self._changed
+        rows = self._model.rowCount()
+        n = len(changed)
+        for (row,col),(h,w) in changed[:n]:
+            for c in [_c for _c in self._widths if col <= _c < col+w]:
+                if h > 4*_TTkTableColumnWidths.SAMPLE:
+                    # Too many changes, the column will be measured again
+                    del self._widths[c]
+                    continue
+                cells = self._widths[c]
+                for r in range(row, min(row+h,rows)):
+                    cells[r] = self._cellWidth(r,c)
+        del changed[:n]
+
+    @staticmethod
+    def _sampleRows(rows:int, row:int, full:bool) -> Iterable[int]:
+        S = _TTkTableColumnWidths.SAMPLE
+        if full or rows <= 4*S:
+            return range(rows)
+        return (*range(S), *range(rows-S,rows),
+                *range(max(0,row-S), min(row+S,rows)),
+                *range(0, rows, rows//S))
+
+    def columnWidth(self, col:int, row:int, full:bool=False) -> int:
+        '''
+        Return the max width of the cells in the column
+
+        :param col: the column
+        :type col: int
+        :param row: the row in the middle of the visible window
+        :type row: int
+        :param full: measure all the rows, defaults to False
+        :type full: bool, optional
+        '''
+        self._applyChanges()
+        if (cells:=self._widths.get(col)) is None:
+            cells = self._widths[col] = {}
+        for r in self._sampleRows(self._model.rowCount(), row, full):
+            if r not in cells:
+                cells[r] = self._cellWidth(r,col)
+        return max(cells.values(), default=0)
+
 _ClipboardTableData = List[List[Tuple[int,int,Any]]]
 
 class _ClipboardTable(TTkString):
@@ -128,25 +278,175 @@ class _ClipboardTable(TTkString):
 class _FlagsCallable(Protocol):
     def __call__(self, row: int, col: int) -> TTkK.ItemFlag: ...
 
+class _SectionPositions():
+    '''
+    The end positions of the rows/columns (the separators) stored as a Fenwick tree
+    of the sections sizes, the first section starts after the position -1
+
+    ::
+
+        sizes     = [3, 2, 4]
+        positions = [2, 4, 8]
+
+    Reading or shifting a position and searching the section at a given position are **O(log n)**
+    '''
+    __slots__ = ('_tree', '_len', '_step')
+
+    _tree:List[int]
+    _len:int
+    _step:int
+
+    def __init__(self, positions:Iterable[int]=()) -> None:
+        tree = [0]
+        prev = -1
+        for pos in positions:
+            tree.append(pos-prev)
+            prev = pos
+        self._len = n = len(tree)-1
+        for i in range(1,n+1):
+            if (j:=i+(i&-i)) <= n:
+                tree[j] += tree[i]
+        self._tree = tree
+        self._step = 1<<(n.bit_length()-1) if n else 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        # Rebuild the sizes from the tree and accumulate them
+        sizes = self._tree.copy()
+        n = self._len
+        for i in range(n,0,-1):
+            if (j:=i+(i&-i)) <= n:
+                sizes[j] -= sizes[i]
+        pos = -1
+        for size in sizes[1:]:
+            pos += size
+            yield pos
+
+    def __getitem__(self, index:int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("section index out of range")
+        tree = self._tree
+        pos = -1
+        i = index+1
+        while i > 0:
+            pos += tree[i]
+            i -= i&-i
+        return pos
+
+    def __setitem__(self, index:int, pos:int) -> None:
+        '''Move only the position at the index, the following ones are not changed'''
+        if index < 0:
+            index += self._len
+        diff = pos-self[index]
+        self.shift(index, diff)
+        if index+1 < self._len:
+            self.shift(index+1, -diff)
+
+    def append(self, pos:int) -> None:
+        '''Add a section ending at pos, after the last one'''
+        n = self._len+1
+        # The new node covers the sizes of the sections in the range (low,n]
+        low = n-(n&-n)
+        self._tree.append(pos-(self[low-1] if low else -1))
+        self._len = n
+        self._step = 1<<(n.bit_length()-1)
+
+    def shift(self, index:int, diff:int) -> None:
+        '''Move all the positions starting from the index'''
+        tree = self._tree
+        n = self._len
+        i = index+1
+        while i <= n:
+            tree[i] += diff
+            i += i&-i
+
+    def lowerBound(self, pos:int) -> int:
+        '''Return the index of the first position greater or equal to pos, len() if none'''
+        tree = self._tree
+        n = self._len
+        # Find the sections whose end position is lower than pos (sizes sum lower than pos+1)
+        remaining = pos+1
+        index = 0
+        step = self._step
+        while step:
+            if (nxt:=index+step) <= n and tree[nxt] < remaining:
+                index = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+        return index
+
+_SelectionIntervals = Tuple[Tuple[int,int],...]
+
+def _intervalsSet(intervals:_SelectionIntervals, fr:int, to:int, select:bool) -> _SelectionIntervals:
+    '''Add (select=True) or remove the range [fr,to) from the sorted list of disjoint intervals'''
+    ret:List[Tuple[int,int]] = []
+    for _a,_b in intervals:
+        if _b <= fr or _a >= to:
+            ret.append((_a,_b))
+            continue
+        if _a < fr: ret.append((_a,fr))
+        if _b > to: ret.append((to,_b))
+    if select:
+        ret.append((fr,to))
+    ret.sort()
+    # Merge the adjacent intervals
+    merged:List[Tuple[int,int]] = []
+    for _a,_b in ret:
+        if merged and merged[-1][1] >= _a:
+            merged[-1] = (merged[-1][0], max(merged[-1][1],_b))
+        else:
+            merged.append((_a,_b))
+    return tuple(merged)
+
 class _SelectionProxy():
+    '''
+    The selection is stored as horizontal bands of rows sharing the same selected column intervals,
+    the band **i** include the rows in the range [_bandRows[i], _bandRows[i+1])
+
+    ::
+
+        _bandRows = [0, 3, 5]
+        _bandCols = [(), ((1,3),(5,6)), ()]
+
+           0 1 2 3 4 5 6
+        0  . . . . . . .
+        1  . . . . . . .
+        2  . . . . . . .
+        3  . X X . . X .
+        4  . X X . . X .
+        5  . . . . . . .
+
+    Selecting the whole table, a row or a column, requires few bands regardless of the table size,
+    the non selectable cells (see :py:class:`TTkK.ItemFlag.ItemIsSelectable`) are masked when queried,
+    using a per column cache if the model declares uniform flags (see :py:meth:`TTkAbstractTableModel.uniformFlags`)
+    '''
     __slots__ = (
-        '_selected_2d_list',
+        '_bandRows', '_bandCols',
         '_cols','_rows',
-        '_flags')
+        '_flags', '_colSelectable')
 
     _cols:int
     _rows:int
     _flags:_FlagsCallable
-    _selected_2d_list:List[List[bool]]
+    _colSelectable:Optional[List[bool]]
+    _bandRows:List[int]
+    _bandCols:List[_SelectionIntervals]
 
     def __init__(self):
         self._cols = 0
         self._rows = 0
         self._flags = lambda x,y : TTkK.ItemFlag.NoItemFlags
-        self._selected_2d_list = []
+        self._colSelectable = None
+        self._bandRows = [0]
+        self._bandCols = [()]
 
-    def updateModel(self, cols:int, rows:int, flags:_FlagsCallable) -> None:
+    def updateModel(self, cols:int, rows:int, flags:_FlagsCallable, uniformFlags:bool=False) -> None:
         self._flags = flags
+        self._colSelectable = [] if uniformFlags else None
         self.resize(cols=cols, rows=rows)
 
     def resize(self, cols:int, rows:int) -> None:
@@ -156,100 +456,155 @@ class _SelectionProxy():
             raise ValueError(f"unexpected negative value {rows=}")
         self._rows = rows
         self._cols = cols
+        if self._colSelectable is not None:
+            cmp = TTkK.ItemFlag.ItemIsSelectable
+            flagFunc = self._flags
+            self._colSelectable = [rows>0 and cmp==(cmp&flagFunc(row=0,col=col)) for col in range(cols)]
         self.clear()
 
+    def appendRows(self, rows:int) -> None:
+        '''Grow the rows count to rows, the new rows are not selected'''
+        if rows <= self._rows:
+            return
+        if self._bandCols[-1]:
+            if self._bandRows[-1] == self._rows:
+                self._bandCols[-1] = ()
+            else:
+                self._bandRows.append(self._rows)
+                self._bandCols.append(())
+        if self._colSelectable is not None and not self._rows:
+            cmp = TTkK.ItemFlag.ItemIsSelectable
+            flagFunc = self._flags
+            self._colSelectable = [cmp==(cmp&flagFunc(row=0,col=col)) for col in range(self._cols)]
+        self._rows = rows
+
+    def _isSelectable(self, row:int, col:int) -> bool:
+        if (colSelectable:=self._colSelectable) is not None:
+            return colSelectable[col]
+        cmp = TTkK.ItemFlag.ItemIsSelectable
+        return cmp==(cmp&self._flags(row=row,col=col))
+
+    def _split(self, row:int) -> int:
+        '''Ensure a band starts at the row and return its index'''
+        bandRows = self._bandRows
+        if row >= self._rows:
+            return len(bandRows)
+        index = bisect_right(bandRows, row)-1
+        if bandRows[index] == row:
+            return index
+        bandRows.insert(index+1, row)
+        self._bandCols.insert(index+1, self._bandCols[index])
+        return index+1
+
+    def _apply(self, pos:Tuple[int,int], size:Tuple[int,int], select:bool) -> None:
+        x,y = pos
+        w,h = size
+        cola, colb = max(0,x), min(self._cols,x+w)
+        rowa, rowb = max(0,y), min(self._rows,y+h)
+        if cola >= colb or rowa >= rowb:
+            return
+        ia = self._split(rowa)
+        ib = self._split(rowb)
+        bandRows = self._bandRows
+        bandCols = self._bandCols
+        for i in range(ia,ib):
+            bandCols[i] = _intervalsSet(bandCols[i], cola, colb, select)
+        # Merge the consecutive bands with the same selection
+        for i in range(min(ib,len(bandRows)-1), max(0,ia-1), -1):
+            if bandCols[i] == bandCols[i-1]:
+                del bandRows[i]
+                del bandCols[i]
+
+    def _bandRange(self, index:int) -> range:
+        bandRows = self._bandRows
+        return range(bandRows[index], bandRows[index+1] if index+1 < len(bandRows) else self._rows)
+
     def clear(self) -> None:
-        rows = self._rows
-        cols = self._cols
-        if not cols or not rows:
-            self._selected_2d_list = []
-        self._selected_2d_list = [[False]*cols for _ in range(rows)]
+        self._bandRows = [0]
+        self._bandCols = [()]
 
     def clearSelection(self) -> None:
         self.clear()
 
     def selectAll(self) -> None:
-        rows = self._rows
-        cols = self._cols
-        cmp = TTkK.ItemFlag.ItemIsSelectable
-        flagFunc = self._flags
-        self._selected_2d_list = [[cmp==(cmp&flagFunc(row=row,col=col)) for col in range(cols)] for row in range(rows)]
+        self._bandRows = [0]
+        self._bandCols = [((0,self._cols),) if self._cols else ()]
 
     def selectRow(self, row:int) -> None:
         if row < 0 or row >= self._rows:
             return
-        cmp = TTkK.ItemFlag.ItemIsSelectable
-        flagFunc = self._flags
-        self._selected_2d_list[row] = [cmp==(cmp&flagFunc(row=row,col=col)) for col in range(self._cols)]
+        self._apply(pos=(0,row), size=(self._cols,1), select=True)
 
     def selectColumn(self, col:int) -> None:
         if col < 0 or col >= self._cols:
             return
-        cmp = TTkK.ItemFlag.ItemIsSelectable
-        flagFunc = self._flags
-        for row,line in enumerate(self._selected_2d_list):
-            line[col] = cmp==(cmp&flagFunc(row=row,col=col))
+        self._apply(pos=(col,0), size=(1,self._rows), select=True)
 
     def unselectRow(self, row:int) -> None:
         if row < 0 or row >= self._rows:
             return
-        self._selected_2d_list[row] = [False]*self._cols
+        self._apply(pos=(0,row), size=(self._cols,1), select=False)
 
     def unselectColumn(self, col:int) -> None:
         if col < 0 or col >= self._cols:
             return
-        for line in self._selected_2d_list:
-            line[col] = False
+        self._apply(pos=(col,0), size=(1,self._rows), select=False)
 
     def setSelection(self, pos:tuple[int,int], size:tuple[int,int], flags:TTkK.TTkItemSelectionModel) -> None:
-        x,y = pos
-        w,h = size
-
-        cols = self._cols
-        flagFunc = self._flags
-        cmp = TTkK.ItemFlag.ItemIsSelectable
-
         if flags & (TTkK.TTkItemSelectionModel.Clear|TTkK.TTkItemSelectionModel.Deselect):
-            selection = [[False]*w for _ in range(h)]
+            self._apply(pos=pos, size=size, select=False)
         elif flags & TTkK.TTkItemSelectionModel.Select:
-            selection = [[cmp==(cmp&flagFunc(col=_x,row=_y)) for _x in range(x,x+w)] for _y in range(y,y+h)]
-
-        for line,subst in zip(self._selected_2d_list[y:y+h],selection):
-            w=min(w,cols-x)
-            line[x:x+w]=subst[:w]
+            self._apply(pos=pos, size=size, select=True)
 
     def isRowSelected(self, row:int) -> bool:
         if row < 0 or row >= self._rows:
             return False
-        flagFunc = self._flags
-        cmp = TTkK.ItemFlag.ItemIsSelectable
-        return all(_sel for i,_sel in enumerate(self._selected_2d_list[row]) if flagFunc(row,i)&cmp)
+        intervals = self._bandCols[bisect_right(self._bandRows, row)-1]
+        # All the selectable cells outside the selected intervals
+        prev = 0
+        for _a,_b in intervals + ((self._cols,self._cols),):
+            if any(self._isSelectable(row,col) for col in range(prev,_a)):
+                return False
+            prev = _b
+        return True
 
     def isColSelected(self, col:int) -> bool:
         if col < 0 or col >= self._cols:
             return False
-        flagFunc = self._flags
-        cmp = TTkK.ItemFlag.ItemIsSelectable
-        return all(_sel[col] for i,_sel in enumerate(self._selected_2d_list) if flagFunc(i,col)&cmp)
+        if self._colSelectable is not None and not self._colSelectable[col]:
+            return True
+        for i,intervals in enumerate(self._bandCols):
+            if any(_a <= col < _b for _a,_b in intervals):
+                continue
+            if any(self._isSelectable(row,col) for row in self._bandRange(i)):
+                return False
+        return True
 
     def isCellSelected(self, col:int, row:int) -> bool:
         if col < 0 or col >= self._cols:
             return False
         if row < 0 or row >= self._rows:
             return False
-        return self._selected_2d_list[row][col]
+        for _a,_b in self._bandCols[bisect_right(self._bandRows, row)-1]:
+            if _a <= col < _b:
+                return self._isSelectable(row,col)
+            if col < _a:
+                break
+        return False
 
     def iterateSelected(self) -> Iterator[Tuple[int,int]]:
-        for row,line in enumerate(self._selected_2d_list):
-            for col,value in enumerate(line):
-                if value:
-                    yield (row,col)
+        for line in self.iterateSelectedByRows():
+            yield from line
 
     def iterateSelectedByRows(self) -> Iterator[List[Tuple[int,int]]]:
-        for row,line in enumerate(self._selected_2d_list):
-            selections_in_line = [(row,col) for col,value in enumerate(line) if value]
-            if selections_in_line:
-                yield selections_in_line
+        isSelectable = self._isSelectable
+        for i,intervals in enumerate(self._bandCols):
+            if not intervals:
+                continue
+            for row in self._bandRange(i):
+                selections_in_line = [(row,col) for _a,_b in intervals for col in range(_a,_b) if isSelectable(row,col)]
+                if selections_in_line:
+                    yield selections_in_line
 
 @dataclass
 class _SnapItem():
@@ -427,6 +782,8 @@ class TTkTableWidget(TTkAbstractScrollView):
                   '_fastCheck', '_guessDataEdit',
                   '_snapshot', '_snapshotId',
                   '_edit_proxy', '_edit_proxy_widget',
+                  '_prefetch', '_prefetchRow',
+                  '_columnWidths',
                   # Signals
                   # '_cellActivated',
                   '_cellChanged',
@@ -444,6 +801,11 @@ class TTkTableWidget(TTkAbstractScrollView):
     _hSeparatorSelected:Optional[int]
     _vSeparatorSelected:Optional[int]
     _dragPos:Optional[_DragPosType]
+    _colsPos:_SectionPositions
+    _rowsPos:_SectionPositions
+    _prefetch:_TTkTablePrefetch
+    _prefetchRow:int
+    _columnWidths:_TTkTableColumnWidths
 
     def __init__(self, *,
                  tableModel:Optional[TTkAbstractTableModel]=None,
@@ -517,8 +879,13 @@ class TTkTableWidget(TTkAbstractScrollView):
         self._sortColumn = -1
         self._sortOrder = TTkK.AscendingOrder
         self._tableModel = tableModel if tableModel else TTkTableModelList(data=[['']*10 for _ in range(10)])
+        self._prefetch = _TTkTablePrefetch(self._tableModel)
+        self._prefetchRow = 0
+        self._columnWidths = _TTkTableColumnWidths(self._tableModel)
         self._tableModel.dataChanged.connect(self.update)
+        self._tableModel.dataChanged.connect(self._columnWidths.dataChanged)
         self._tableModel.modelChanged.connect(self._refreshLayout)
+        self._tableModel.rowsAppended.connect(self._rowsAppended)
         super().__init__(**kwargs)
         self._refreshLayout()
         self.setMinimumHeight(1)
@@ -542,6 +909,8 @@ class TTkTableWidget(TTkAbstractScrollView):
             col=_i.dataIndex.col()
             self.setSelection(pos=(col,row),size=(1,1),flags=TTkK.TTkItemSelectionModel.Select)
             _i.dataIndex.setData(_i.newData if newData else _i.oldData)
+            # The model index setData does not emit dataChanged
+            self._columnWidths.dataChanged((row,col),(1,1))
         cpsi:TTkModelIndex = self._snapshot[snapId].pos
         self._setCurrentCell(cpsi.row(),cpsi.col())
         self._moveCurrentCell(diff=(0,0))
@@ -669,6 +1038,8 @@ class TTkTableWidget(TTkAbstractScrollView):
                                 oldData=oldData,
                                 newData=newData))
             self._tableModel.setData(row=row,col=col,data=newData)
+            # Not all the models emit dataChanged (i.e. TTkTableModelSQLite3)
+            self._columnWidths.dataChanged((row,col),(1,1))
         if snaps:
             row,col = self._currentPos if self._currentPos else (0,0)
             self._saveSnapshot(snaps,self._tableModel.index(row=row,col=col))
@@ -720,6 +1091,8 @@ class TTkTableWidget(TTkAbstractScrollView):
         self._sortColumn = column
         self._sortOrder = order
         self._tableModel.sort(column,order)
+        # The rows are reordered, the sampled widths are no more valid
+        self._columnWidths.clear()
         self.update()
 
     @pyTTkSlot()
@@ -742,24 +1115,54 @@ class TTkTableWidget(TTkAbstractScrollView):
         self._sortOrder = TTkK.AscendingOrder
         self._snapshot = []
         self._snapshotId = 0
+        self._columnWidths.clear()
         rows = self._tableModel.rowCount()
         cols = self._tableModel.columnCount()
-        self._select_proxy.updateModel(rows=rows, cols=cols, flags=self._tableModel.flags)
-        self._vHeaderSize = vhs = 0 if not rows else 1+max(len(self._tableModel.headerData(_p, TTkK.VERTICAL)) for _p in range(rows) )
+        self._select_proxy.updateModel(rows=rows, cols=cols, flags=self._tableModel.flags, uniformFlags=self._tableModel.uniformFlags())
+        # The vertical header width is evaluated on a sample of the rows for huge models
+        self._vHeaderSize = vhs = 0 if not rows else 1+max(len(self._tableModel.headerData(_p, TTkK.VERTICAL)) for _p in _TTkTableColumnWidths._sampleRows(rows, 0, False) )
         self._hHeaderSize = hhs = 0 if not rows else 1
         self.setPadding(hhs,0,vhs,0)
         if self._showVSeparators:
-            self._colsPos  = [(1+x)*11 for x in range(cols)]
+            self._colsPos  = _SectionPositions((1+x)*11 for x in range(cols))
         else:
-            self._colsPos  = [(1+x)*10 for x in range(cols)]
+            self._colsPos  = _SectionPositions((1+x)*10 for x in range(cols))
         if self._showHSeparators:
-            self._rowsPos     = [1+x*2  for x in range(rows)]
+            self._rowsPos     = _SectionPositions(1+x*2  for x in range(rows))
         else:
-            self._rowsPos     = [1+x    for x in range(rows)]
+            self._rowsPos     = _SectionPositions(1+x    for x in range(rows))
         #TODO: remove
         self.clearSelection()
         self.viewChanged.emit()
 
+    @pyTTkSlot(int,int)
+    def _rowsAppended(self, row:int, count:int) -> None:
+        # This signal may be emitted by a worker thread (i.e. the csv indexing),
+        # the rows are added in the drawing routine
+        TTkHelper.deferCall(self._appendRows)
+
+    def _appendRows(self) -> None:
+        rows = self._tableModel.rowCount()
+        if self._tableModel.columnCount() != len(self._colsPos):
+            self._refreshLayout()
+            return
+        if (count:=rows-len(self._rowsPos)) <= 0:
+            return
+        # The current cell, the selection, the sorting and the undo history are preserved
+        self._select_proxy.appendRows(rows)
+        size = 2 if self._showHSeparators else 1
+        pos = self._rowsPos[-1] if self._rowsPos else 1-size
+        for _ in range(count):
+            pos += size
+            self._rowsPos.append(pos)
+        vhs = max(self._vHeaderSize, 1+len(self._tableModel.headerData(rows-1, TTkK.VERTICAL)))
+        if (vhs,1) != (self._vHeaderSize,self._hHeaderSize):
+            self._vHeaderSize = vhs
+            self._hHeaderSize = 1
+            self._headerVisibilityChanged()
+        self.viewChanged.emit()
+        self.update()
+
     # Overridden function
     def viewFullAreaSize(self) -> tuple[int, int]:
         showVH = self._verticalHeader.isVisible()
@@ -940,9 +1343,9 @@ class TTkTableWidget(TTkAbstractScrollView):
         if self._showHSeparators == visibility: return
         self._showHSeparators = visibility
         if visibility:
-            self._rowsPos = [v+i for i,v in enumerate(self._rowsPos,1)]
+            self._rowsPos = _SectionPositions(v+i for i,v in enumerate(self._rowsPos,1))
         else:
-            self._rowsPos = [v-i for i,v in enumerate(self._rowsPos,1)]
+            self._rowsPos = _SectionPositions(v-i for i,v in enumerate(self._rowsPos,1))
         self.viewChanged.emit()
 
     def setVSeparatorVisibility(self, visibility:bool):
@@ -965,9 +1368,9 @@ class TTkTableWidget(TTkAbstractScrollView):
         if self._showVSeparators == visibility: return
         self._showVSeparators = visibility
         if visibility:
-            self._colsPos = [v+i for i,v in enumerate(self._colsPos,1)]
+            self._colsPos = _SectionPositions(v+i for i,v in enumerate(self._colsPos,1))
         else:
-            self._colsPos = [v-i for i,v in enumerate(self._colsPos,1)]
+            self._colsPos = _SectionPositions(v-i for i,v in enumerate(self._colsPos,1))
         self.viewChanged.emit()
 
     def model(self) -> TTkAbstractTableModel:
@@ -986,10 +1389,18 @@ class TTkTableWidget(TTkAbstractScrollView):
         :type model: :py:class:`TTkAbstractTableModel`
         '''
         self._tableModel.modelChanged.disconnect(self._refreshLayout)
+        self._tableModel.rowsAppended.disconnect(self._rowsAppended)
         self._tableModel.dataChanged.disconnect(self.update)
+        self._tableModel.dataChanged.disconnect(self._columnWidths.dataChanged)
         self._tableModel = model
+        self._prefetch.cancel()
+        self._prefetch = _TTkTablePrefetch(model)
+        self._prefetchRow = 0
+        self._columnWidths = _TTkTableColumnWidths(model)
         self._tableModel.dataChanged.connect(self.update)
+        self._tableModel.dataChanged.connect(self._columnWidths.dataChanged)
         self._tableModel.modelChanged.connect(self._refreshLayout)
+        self._tableModel.rowsAppended.connect(self._rowsAppended)
         self._refreshLayout()
 
     def focusOutEvent(self) -> None:
@@ -1021,23 +1432,14 @@ class TTkTableWidget(TTkAbstractScrollView):
             newPos = prevPos + width
         oldPos = self._colsPos[i]
         diff    = newPos-oldPos
-        for ii in range(i,len(self._colsPos)):
-            self._colsPos[ii] += diff
+        self._colsPos.shift(i,diff)
         self.viewChanged.emit()
         self.update()
 
     def _columnContentsSize(self, column:int) -> int:
-        def _wid(_c):
-            txt = self._tableModel.ttkStringData(_c, column)
-            return max(t.termWidth() for t in txt.split('\n'))
-        rows = self._tableModel.rowCount()
-        if self._fastCheck:
-            w,h = self.size()
-            row,_ = self._findCell(w//2, h//2, False)
-            rowa,rowb = max(0,row-100), min(row+100,rows)
-        else:
-            rowa,rowb = 0,rows
-        return max(_wid(i) for i in range(rowa,rowb))+self._dataPadding
+        w,h = self.size()
+        row,_ = self._findCell(w//2, h//2, False)
+        return self._columnWidths.columnWidth(column, row, full=not self._fastCheck)+self._dataPadding
 
     @pyTTkSlot(int)
     def resizeColumnToContents(self, column:int) -> None:
@@ -1057,9 +1459,11 @@ class TTkTableWidget(TTkAbstractScrollView):
         _d = 1 if self._showVSeparators else 0
         cols = self._tableModel.columnCount()
         pos = -1
+        colsPos = []
         for _c in range(cols):
             pos += _d+self._columnContentsSize(_c)
-            self._colsPos[_c] = pos
+            colsPos.append(pos)
+        self._colsPos = _SectionPositions(colsPos)
         self.viewChanged.emit()
         self.update()
 
@@ -1081,8 +1485,7 @@ class TTkTableWidget(TTkAbstractScrollView):
             newPos = prevPos + height
         oldPos = self._rowsPos[i]
         diff    = newPos-oldPos
-        for ii in range(i,len(self._rowsPos)):
-            self._rowsPos[ii] += diff
+        self._rowsPos.shift(i,diff)
         self.viewChanged.emit()
         self.update()
 
@@ -1117,9 +1520,11 @@ class TTkTableWidget(TTkAbstractScrollView):
         rows = self._tableModel.rowCount()
         _d = 1 if self._showHSeparators else 0
         pos = -1
+        rowsPos = []
         for _r in range(rows):
             pos += _d + self._rowContentsSize(_r)
-            self._rowsPos[_r] = pos
+            rowsPos.append(pos)
+        self._rowsPos = _SectionPositions(rowsPos)
         self.viewChanged.emit()
         self.update()
 
@@ -1139,17 +1544,13 @@ class TTkTableWidget(TTkAbstractScrollView):
             row = -1
         else:
             y += oy-hhs
-            for row,py in enumerate(rp):
-                if py>=y:
-                    break
+            row = max(0,min(rp.lowerBound(y), len(rp)-1))
 
         if headers and x<vhs:
             col = -1
         else:
             x += ox-vhs
-            for col,px in enumerate(cp):
-                if px>=x:
-                    break
+            col = max(0,min(cp.lowerBound(x), len(cp)-1))
 
         return row,col
 
@@ -1302,15 +1703,13 @@ class TTkTableWidget(TTkAbstractScrollView):
             elif evt.key == TTkK.Key_PageDown:
                 _,h = self.size()
                 rp=self._rowsPos[row]
-                for dy,rh in enumerate(self._rowsPos[row:]):
-                    if rh-rp >= h: break
-                self._moveCurrentCell(col=col, row=row+dy, borderStop=True)
+                # The first row at least one page below
+                self._moveCurrentCell(col=col, row=self._rowsPos.lowerBound(rp+h), borderStop=True)
             elif evt.key == TTkK.Key_PageUp:
                 _,h = self.size()
                 rp=self._rowsPos[row]
-                for dy,rh in enumerate(self._rowsPos[row::-1]):
-                    if rp-rh >= h: break
-                self._moveCurrentCell(col=col, row=row-dy, borderStop=True)
+                # The last row at least one page above
+                self._moveCurrentCell(col=col, row=min(row,self._rowsPos.lowerBound(rp-h+1)-1), borderStop=True)
             elif evt.key == TTkK.Key_Home: self._moveCurrentCell(col=0,    row=row, borderStop=True)
             elif evt.key == TTkK.Key_End:  self._moveCurrentCell(col=cols, row=row, borderStop=True)
             elif evt.mod==TTkK.NoModifier:
@@ -1355,20 +1754,19 @@ class TTkTableWidget(TTkAbstractScrollView):
         # This is important to handle the header selection in the next part
         if showVS and y < hhs:
             _x = x+ox-vhs
-            for i, c in enumerate(self._colsPos):
-                if _x == c:
-                    # I-th separator selected
-                    self.resizeColumnToContents(i)
-                    return True
+            i = cp.lowerBound(_x)
+            if i < len(cp) and _x == cp[i]:
+                # I-th separator selected
+                self.resizeColumnToContents(i)
+                return True
             # return True
         elif showHS and x < vhs:
             _y = y+oy-hhs
-            for i, r in enumerate(self._rowsPos):
-                if _y == r:
-                    # I-th separator selected
-                    # I-th separator selected
-                    self.resizeRowToContents(i)
-                    return True
+            i = rp.lowerBound(_y)
+            if i < len(rp) and _y == rp[i]:
+                # I-th separator selected
+                self.resizeRowToContents(i)
+                return True
 
         row,col = self._findCell(x,y, headers=False)
         self.cellDoubleClicked.emit(row,col)
@@ -1388,20 +1786,20 @@ class TTkTableWidget(TTkAbstractScrollView):
         self._hoverPos = (row,col) = self._findCell(x,y, headers=True)
         if showVS and row==-1:
             _x = x+ox-vhs
-            for i, c in enumerate(self._colsPos):
-                if _x == c:
-                    # Over the I-th separator
-                    self._hoverPos = None
-                    self.update()
-                    return True
+            i = self._colsPos.lowerBound(_x)
+            if i < len(self._colsPos) and _x == self._colsPos[i]:
+                # Over the I-th separator
+                self._hoverPos = None
+                self.update()
+                return True
         if showHS and col==-1:
             _y = y+oy-hhs
-            for i, r in enumerate(self._rowsPos):
-                if _y == r:
-                    # Over the I-th separator
-                    self._hoverPos = None
-                    self.update()
-                    return True
+            i = self._rowsPos.lowerBound(_y)
+            if i < len(self._rowsPos) and _y == self._rowsPos[i]:
+                # Over the I-th separator
+                self._hoverPos = None
+                self.update()
+                return True
         if row>=0 and col>>0:
             self.cellEntered.emit(row,col)
         self.update()
@@ -1425,27 +1823,28 @@ class TTkTableWidget(TTkAbstractScrollView):
         # This is important to handle the header selection in the next part
         if y < hhs:
             _x = x+ox-vhs
-            for _i, _c in enumerate(self._colsPos):
-                if showVS and _x == _c:
-                    # I-th separator selected
-                    self._hSeparatorSelected = _i
-                    self.update()
-                    return True
-                elif self._sortingEnabled and _x == _c-(1 if showVS else 0) : # Pressed the sort otder icon
-                    if self._sortColumn == _i:
-                        order = TTkK.SortOrder.DescendingOrder if self._sortOrder==TTkK.SortOrder.AscendingOrder else TTkK.SortOrder.AscendingOrder
-                    else:
-                        order = TTkK.SortOrder.AscendingOrder
-                    self.sortByColumn(_i,order)
-                    return True
+            _i = self._colsPos.lowerBound(_x)
+            _c = self._colsPos[_i] if _i < len(self._colsPos) else None
+            if showVS and _x == _c:
+                # I-th separator selected
+                self._hSeparatorSelected = _i
+                self.update()
+                return True
+            elif self._sortingEnabled and _c is not None and _x == _c-(1 if showVS else 0) : # Pressed the sort otder icon
+                if self._sortColumn == _i:
+                    order = TTkK.SortOrder.DescendingOrder if self._sortOrder==TTkK.SortOrder.AscendingOrder else TTkK.SortOrder.AscendingOrder
+                else:
+                    order = TTkK.SortOrder.AscendingOrder
+                self.sortByColumn(_i,order)
+                return True
         elif showHS and x < vhs:
             _y = y+oy-hhs
-            for _i, r in enumerate(self._rowsPos):
-                if _y == r:
-                    # I-th separator selected
-                    self._vSeparatorSelected = _i
-                    self.update()
-                    return True
+            _i = self._rowsPos.lowerBound(_y)
+            if _i < len(self._rowsPos) and _y == self._rowsPos[_i]:
+                # I-th separator selected
+                self._vSeparatorSelected = _i
+                self.update()
+                return True
 
         row,col = self._findCell(x,y, headers=True)
         if not row==col==-1:
@@ -1513,11 +1912,11 @@ class TTkTableWidget(TTkAbstractScrollView):
             pos = max((ss+1)*4, x)
             diff = pos - self._colsPos[ss]
             # Align the previous Separators if pushed
-            for i in range(ss):
-                self._colsPos[i] = min(self._colsPos[i], pos-(ss-i)*4)
+            for i in range(ss-1,-1,-1):
+                if self._colsPos[i] <= (_p:=pos-(ss-i)*4): break
+                self._colsPos[i] = _p
             # Align all the other Separators relative to the selection
-            for i in range(ss, len(self._colsPos)):
-                self._colsPos[i] += diff
+            self._colsPos.shift(ss, diff)
             self._alignWidgets()
             self.viewChanged.emit()
             self.update()
@@ -1528,11 +1927,11 @@ class TTkTableWidget(TTkAbstractScrollView):
             pos = max((ss+1)*2-1, y)
             diff = pos - self._rowsPos[ss]
             # Align the previous Separators if pushed
-            for i in range(ss):
-                self._rowsPos[i] = min(self._rowsPos[i], pos-(ss-i)*2)
+            for i in range(ss-1,-1,-1):
+                if self._rowsPos[i] <= (_p:=pos-(ss-i)*2): break
+                self._rowsPos[i] = _p
             # Align all the other Separators relative to the selection
-            for i in range(ss, len(self._rowsPos)):
-                self._rowsPos[i] += diff
+            self._rowsPos.shift(ss, diff)
             self._alignWidgets()
             self.viewChanged.emit()
             self.update()
@@ -1639,38 +2038,39 @@ class TTkTableWidget(TTkAbstractScrollView):
         showHS = self._showHSeparators
         showVS = self._showVSeparators
 
-        sliceCol=list(zip([-1]+cp,cp))
-        sliceRow=list(zip([-1]+rp,rp))
+        def sliceCol(_col:int) -> Tuple[int,int]:
+            return (cp[_col-1] if _col else -1), cp[_col]
+        def sliceRow(_row:int) -> Tuple[int,int]:
+            return (rp[_row-1] if _row else -1), rp[_row]
 
         # NOTE: Add Color Cache
         # NOTE: Add Select/Hover Cache
         # Draw cell and right/bottom corner
 
         # Find First/Last displayed Rows
-        rowa, rowb = 0,rows-1
-        for row in range(rows):
-            ya,yb = sliceRow[row]
-            ya,yb = ya+hhs-oy, yb+hhs-oy
-            if ya>h  :
-                rowb = row
-                break
-            if yb<hhs:
-                rowa = row
-                continue
+        # rowa: the last row above the view (ending before oy)
+        # rowb: the first row below the view (starting after h-hhs+oy)
+        rowa = max(0, rp.lowerBound(oy)-1)
+        rowb = min(rows-1, rp.lowerBound(h-hhs+oy+1)+1)
         # Use this in range
         rrows = (rowa,rowb+1)
 
+        # Async models, request the rows not loaded yet
+        # and the ones ahead of the scroll direction
+        if self._prefetch.enabled:
+            rowsLoaded = [self._tableModel.isRowLoaded(row) for row in range(*rrows)]
+            screen = rowb+1-rowa
+            if rowa < self._prefetchRow:
+                self._prefetch.request(max(0,rowa-screen), rowb+1)
+            else:
+                self._prefetch.request(rowa, rowb+1+screen)
+            self._prefetchRow = rowa
+        else:
+            rowsLoaded = [True]*(rowb+1-rowa)
+
         # Find First/Last displayed Cols
-        cola, colb = 0, cols-1
-        for col in range(cols):
-            xa,xb = sliceCol[col]
-            xa,xb = xa+vhs-ox, xb+vhs-ox
-            if xa>w  :
-                colb = col
-                break
-            if xb<vhs:
-                cola = col
-                continue
+        cola = max(0, cp.lowerBound(ox)-1)
+        colb = min(cols-1, cp.lowerBound(w-vhs+ox+1)+1)
         # Use this in range
         rcols = (cola,colb+1)
 
@@ -1678,7 +2078,7 @@ class TTkTableWidget(TTkAbstractScrollView):
         _cellsCache   = []
         _colorCache2d:List[List[TTkColor]] = [[color]*(colb+1-cola) for _ in range(rowb+1-rowa)]
         for row in range(*rrows):
-            ya,yb = sliceRow[row]
+            ya,yb = sliceRow(row)
             if showHS:
                 ya,yb = ya+hhs-oy+1, yb+hhs-oy
             else:
@@ -1687,7 +2087,7 @@ class TTkTableWidget(TTkAbstractScrollView):
             if yb<hhs: continue
             rowColor = color.mod(0,row)
             for col in range(*rcols):
-                xa,xb = sliceCol[col]
+                xa,xb = sliceCol(col)
                 if showVS:
                     xa,xb = xa+vhs-ox+1, xb+vhs-ox
                 else:
@@ -1703,7 +2103,11 @@ class TTkTableWidget(TTkAbstractScrollView):
                 _cellsCache.append([row,col,xa,xb,ya,yb,cellColor])
 
         def _drawCellContent(_col,_row,_xa,_xb,_ya,_yb,_color):
-                _txt, _align = self._tableModel.displayData(_row, _col)
+                if rowsLoaded[_row-rowa]:
+                    _txt, _align = self._tableModel.displayData(_row, _col)
+                else:
+                    # Placeholder for the rows not loaded yet
+                    _txt, _align = TTkString('…', lineColor), TTkK.Alignment.CENTER_ALIGN
                 if _color != TTkColor.RST:
                     _txt = _txt.completeColor(_color)
                 for _i,_line in enumerate(_txt.split('\n')):
@@ -1908,11 +2312,11 @@ class TTkTableWidget(TTkAbstractScrollView):
             if row == -1:
                 ya,yb = -1,rp[-1]
             else:
-                ya,yb = sliceRow[row]
+                ya,yb = sliceRow(row)
             if col == -1:
                 xa,xb = -1,cp[-1]
             else:
-                xa,xb = sliceCol[col]
+                xa,xb = sliceCol(col)
 
             if showVS:
                 xa,xb = xa+vhs-ox, xb+vhs-ox
@@ -1940,21 +2344,21 @@ class TTkTableWidget(TTkAbstractScrollView):
             rowb,colb = self._dragPos.to
             if rowa == -1:
                 cola,colb = min(cola,colb),max(cola,colb)
-                xa = sliceCol[cola][0]-ox+vhs
-                xb = sliceCol[colb][1]-ox+vhs + (0 if showHS else 1)
+                xa = sliceCol(cola)[0]-ox+vhs
+                xb = sliceCol(colb)[1]-ox+vhs + (0 if showHS else 1)
                 ya,yb = -1-oy+hhs,rp[-1]-oy+hhs
             elif cola == -1:
                 rowa,rowb = min(rowa,rowb),max(rowa,rowb)
-                ya = sliceRow[rowa][0]-oy+hhs
-                yb = sliceRow[rowb][1]-oy+hhs + (0 if showVS else 1)
+                ya = sliceRow(rowa)[0]-oy+hhs
+                yb = sliceRow(rowb)[1]-oy+hhs + (0 if showVS else 1)
                 xa,xb = -1-ox+vhs,cp[-1]-ox+vhs
             else:
                 cola,colb = min(cola,colb),max(cola,colb)
                 rowa,rowb = min(rowa,rowb),max(rowa,rowb)
-                xa = sliceCol[cola][0]-ox+vhs
-                xb = sliceCol[colb][1]-ox+vhs + (0 if showHS else 1)
-                ya = sliceRow[rowa][0]-oy+hhs
-                yb = sliceRow[rowb][1]-oy+hhs + (0 if showVS else 1)
+                xa = sliceCol(cola)[0]-ox+vhs
+                xb = sliceCol(colb)[1]-ox+vhs + (0 if showHS else 1)
+                ya = sliceRow(rowa)[0]-oy+hhs
+                yb = sliceRow(rowb)[1]-oy+hhs + (0 if showVS else 1)
 
             hoverColorInv = hoverColor.background().invertFgBg()
             canvas.drawTTkString(pos=(xa,ya), text=TTkString('▗'+('▄'*(xb-xa-1))+'▖',hoverColorInv))
@@ -1964,10 +2368,10 @@ class TTkTableWidget(TTkAbstractScrollView):
 
         if self._currentPos:
             row,col = self._currentPos
-            xa = sliceCol[col][0]-ox+vhs
-            xb = sliceCol[col][1]-ox+vhs + (0 if showVS else 1)
-            ya = sliceRow[row][0]-oy+hhs
-            yb = sliceRow[row][1]-oy+hhs + (0 if showHS else 1)
+            xa = sliceCol(col)[0]-ox+vhs
+            xb = sliceCol(col)[1]-ox+vhs + (0 if showVS else 1)
+            ya = sliceRow(row)[0]-oy+hhs
+            yb = sliceRow(row)[1]-oy+hhs + (0 if showHS else 1)
             currentColorInv = currentColor.background().invertFgBg()
             if showVS and showHS:
                 canvas.drawTTkString(pos=(xa,ya),   text=TTkString('▗'+('▄'*(xb-xa-1))+'▖',currentColorInv))
@@ -1988,7 +2392,7 @@ class TTkTableWidget(TTkAbstractScrollView):
                 if isinstance(txt,TTkString): pass
                 elif type(txt) == str: txt = TTkString(txt)
                 else:                  txt = TTkString(f"{txt}")
-                xa,xb = sliceCol[col]
+                xa,xb = sliceCol(col)
                 if showVS:
                     xa,xb = xa+vhs-ox+1, xb+vhs-ox
                 else:
@@ -2004,7 +2408,7 @@ class TTkTableWidget(TTkAbstractScrollView):
         if showVH:
             hlineHead = TTkString('╾'+'╌'*(vhs-2), color=headerColor) + vHSeparator
             for row in range(*rrows):
-                ya,yb = sliceRow[row]
+                ya,yb = sliceRow(row)
                 if showHS:
                     ya,yb = ya+hhs-oy+1, yb+hhs-oy
                 else:
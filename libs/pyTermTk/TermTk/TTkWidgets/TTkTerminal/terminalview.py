@@ -989,7 +989,8 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
                 TTkK.WHEEL_Right:(k, 3,'M')}.get(
                     evt.evt,(0,0,'M'))
             # _termLog.mouse(f'Mouse: <ESC>[<{k+km};{x};{y}{pr}')
-            self.termData.emit(f'\033[<{k+km};{x};{y}{pr}'.encode())
+            # The merged wheel ticks are forwarded one by one
+            self.termData.emit(f'\033[<{k+km};{x};{y}{pr}'.encode()*evt.delta)
         else:
             head = {
                 TTkK.Press:     b'\033[M ',
@@ -1006,7 +1007,7 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
             bah.append((x+32)%0xff)
             bah.append((y+32)%0xff)
             # _termLog.mouse(f'Mouse: '+bah.decode().replace('\033','<ESC>'))
-            self.termData.emit(bah)
+            self.termData.emit(bah*evt.delta)
         return True
 
     def mousePressEvent(self, evt:TTkMouseEvent) -> bool:
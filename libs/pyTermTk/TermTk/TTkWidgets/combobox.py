@@ -507,10 +507,12 @@ class TTkComboBox(TTkContainer):
         return True
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
+        # The merged wheel ticks (evt.delta) are clamped to the list boundaries
         if evt.evt == TTkK.WHEEL_Up:
-            self.setCurrentIndex(self._id-1)
+            index = max(min(0,self._id-1), self._id-evt.delta)
         else:
-            self.setCurrentIndex(self._id+1)
+            index = min(max(len(self._list)-1,self._id+1), self._id+evt.delta)
+        self.setCurrentIndex(index)
         return True
 
     def mousePressEvent(self, evt:TTkMouseEvent) -> bool:
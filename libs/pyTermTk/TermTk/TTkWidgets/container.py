@@ -24,9 +24,10 @@ from __future__ import annotations
 
 __all__ = ['TTkContainer', 'TTkPadding']
 
-from typing import NamedTuple, Optional, List
+from typing import NamedTuple, Optional, List, Dict, Tuple
 
 from TermTk.TTkCore.constant  import TTkK
+from TermTk.TTkCore.canvas    import TTkCanvas
 from TermTk.TTkCore.log       import TTkLog
 from TermTk.TTkCore.helper    import TTkHelper
 from TermTk.TTkCore.signal    import pyTTkSignal, pyTTkSlot
@@ -105,8 +106,13 @@ class TTkContainer(TTkWidget):
     __slots__ = (
         '_padt', '_padb', '_padl', '_padr',
         '_forwardStyle',
+        '_backCanvas', '_placements',
         '_layout')
 
+    _backCanvas:Optional[TTkCanvas]
+    _placements:List[Tuple[TTkWidget,Tuple[int,int,int,int],Tuple[int,int,int,int],bool]]
+    _damageCompose:bool = True
+
     def __init__(self, *,
                  layout:Optional[TTkLayout]=None,
                  padding:Optional[TTkPadding] = None,
@@ -136,6 +142,8 @@ class TTkContainer(TTkWidget):
         :type forwardStyle: bool
         '''
         self._forwardStyle = forwardStyle
+        self._backCanvas = None
+        self._placements = []
         if padding:
             self._padt = padding[0]
             self._padb = padding[1]
@@ -336,6 +344,125 @@ class TTkContainer(TTkWidget):
         ''' .. caution:: Don't touch this! '''
         TTkContainer._paintChildCanvas(self._canvas, self.rootLayout(), self.rootLayout().geometry(), self.rootLayout().offset())
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # A custom paintChildCanvas (i.e. drawing on top of the children)
+        # is not aware of the damaged rows compositing
+        # unless _paintChildCanvasRows is overridden as well
+        if 'paintChildCanvas' in cls.__dict__:
+            cls._damageCompose = '_paintChildCanvasRows' in cls.__dict__
+
+    @staticmethod
+    def _childPlacements(item, geometry, offset, placements) -> None:
+        ''' Collect the (widget, geometry, bound, visible) used by :py:meth:`_paintChildCanvas` for each child '''
+        lx,ly,lw,lh = geometry
+        ox, oy = offset
+        if item.layoutItemType() == TTkK.WidgetItem and not item.isEmpty():
+            child = item.widget()
+            cx,cy,cw,ch = child.geometry()
+            placements.append((child, (cx+ox, cy+oy, cw, ch), geometry, child.getCanvas()._visible))
+        else:
+            for child in item.zSortedItems:
+                igx, igy, igw, igh = item.geometry()
+                iox, ioy = item.offset()
+                ix = igx+ox
+                iy = igy+oy
+                iw = igw
+                ih = igh
+                if ix+iw < lx and ix > lx+lw and iy+ih < ly and iy > ly+lh: continue
+                bx = max(ix,lx)
+                by = max(iy,ly)
+                bw = min(ix+iw,lx+lw)-bx
+                bh = min(iy+ih,ly+lh)-by
+                TTkContainer._childPlacements(child, (bx,by,bw,bh), (ix+iox,iy+ioy), placements)
+
+    def _paintChildCanvasRows(self, rows:List[Tuple[int,int]]) -> None:
+        ''' Restore the own content and recompose the children only in the damaged rows
+
+        :param rows: the damaged [fr,to) row ranges
+        :type rows: list[tuple[int,int]]
+        '''
+        canvas = self._canvas
+        for fr,to in rows:
+            canvas.copyRows(self._backCanvas, fr, to)
+            for child,(gx,gy,gw,gh),(bx,by,bw,bh),_ in self._placements:
+                cfr, cto = max(by,fr), min(by+bh,to)
+                if cfr >= cto: continue
+                canvas.paintCanvas(
+                        child.getCanvas(),
+                        (gx, gy, gw, gh),  # geometry
+                        ( 0,  0, gw, gh),  # slice
+                        (bx,cfr, bw, cto-cfr)) # bound
+
+    def _composeChildCanvas(self, repainted:bool, damage:Dict[TTkWidget,Optional[List[Tuple[int,int]]]]) -> Optional[List[Tuple[int,int]]]:
+        ''' Compose the child canvases, only the rows damaged by the children are recomposed
+        if this widget has not been repainted and its layout did not change.
+
+        :param repainted: the paintEvent has been executed in this frame
+        :type repainted: bool
+        :param damage: the damaged rows of the updated children (None = all)
+        :type damage: dict[:py:class:`TTkWidget`, list[tuple[int,int]] | None]
+
+        :return: the damaged rows of this widget (None = all)
+        :rtype: list[tuple[int,int]] | None
+        '''
+        canvas = self._canvas
+        back = self._backCanvas
+        placements:List[Tuple[TTkWidget,Tuple[int,int,int,int],Tuple[int,int,int,int],bool]] = []
+        rl = self.rootLayout()
+        TTkContainer._childPlacements(rl, rl.geometry(), rl.offset(), placements)
+        oldPlacements, self._placements = self._placements, placements
+
+        if not repainted and (back is None or back.size() != canvas.size()):
+            # The own content is not available, repaint it
+            canvas.updateSize()
+            canvas.clean()
+            self.paintEvent(canvas)
+            repainted = True
+
+        if repainted:
+            if back is not None and back.size() == canvas.size():
+                back.copyRows(canvas, 0, canvas._height)
+            else:
+                self._backCanvas = canvas.copy()
+            self.paintChildCanvas()
+            return None
+
+        h = canvas._height
+        if not self._damageCompose:
+            canvas.copyRows(back, 0, h)
+            self.paintChildCanvas()
+            return None
+        if [p[0] for p in oldPlacements] != [p[0] for p in placements]:
+            # The children or their z-order changed
+            self._paintChildCanvasRows([(0,h)])
+            return None
+
+        bands:List[Tuple[int,int]] = []
+        def _addBand(geom, bound, rows):
+            gy,gh = geom[1],geom[3]
+            lo,hi = max(bound[1],0), min(bound[1]+bound[3],h,gy+gh)
+            for fr,to in rows if rows is not None else ((0,gh),):
+                if (fr:=max(gy+fr,lo)) < (to:=min(gy+to,hi)):
+                    bands.append((fr,to))
+        for (child,geom,bound,visible),(_,oldGeom,oldBound,oldVisible) in zip(placements,oldPlacements):
+            if (geom,bound,visible) != (oldGeom,oldBound,oldVisible):
+                _addBand(oldGeom, oldBound, None)
+                _addBand(geom, bound, None)
+            elif child in damage:
+                _addBand(geom, bound, damage[child])
+
+        # Merge the overlapping bands
+        rows:List[Tuple[int,int]] = []
+        for fr,to in sorted(bands):
+            if rows and fr <= rows[-1][1]:
+                rows[-1] = (rows[-1][0], max(to,rows[-1][1]))
+            else:
+                rows.append((fr,to))
+        if rows:
+            self._paintChildCanvasRows(rows)
+        return rows
+
     def getPadding(self) -> TTkPadding:
         ''' Retrieve the :py:class:`TTkContainer`'s paddings sizes as shown in :ref:`Layout Topology <Container-Layout-Topology>`
 
@@ -371,8 +498,7 @@ class TTkContainer(TTkWidget):
             return False
         x-=lx
         y-=ly
-        for item in reversed(layout.zSortedItems):
-        # for item in layout.zSortedItems:
+        for item in layout._itemsAt(x, y, lw, lh):
             if item.layoutItemType() == TTkK.WidgetItem and not item.isEmpty():
                 widget = item.widget()
                 if not widget._visible: continue
@@ -455,6 +581,7 @@ class TTkContainer(TTkWidget):
     def show(self) -> None:
         if self._visible: return
         self._visible = True
+        TTkHelper.invalidateWidgetVisibility()
         self._canvas.show()
         self.update(updateLayout=True, updateParent=True)
         for w in self.rootLayout().iterWidgets(onlyVisible=True):
@@ -464,6 +591,7 @@ class TTkContainer(TTkWidget):
     def hide(self) -> None:
         if not self._visible: return
         self._visible = False
+        TTkHelper.invalidateWidgetVisibility()
         self._canvas.hide()
         self.update(repaint=False, updateParent=True)
 
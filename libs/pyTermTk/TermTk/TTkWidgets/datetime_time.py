@@ -307,9 +307,9 @@ class TTkTime(TTkWidget):
             delta = 5
         if delta:
             if evt.evt in (TTkK.WHEEL_Up, TTkK.WHEEL_Left):
-                self._addDelta(delta=delta)
+                self._addDelta(delta=delta*evt.delta)
             elif evt.evt in (TTkK.WHEEL_Down, TTkK.WHEEL_Right):
-                self._addDelta(delta=-delta)
+                self._addDelta(delta=-delta*evt.delta)
         return True
 
     def paintEvent(self, canvas):
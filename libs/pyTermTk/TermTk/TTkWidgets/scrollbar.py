@@ -132,9 +132,9 @@ class TTkScrollBar(TTkWidget):
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
         if evt.evt == TTkK.WHEEL_Up:
-            value = self._value-self._pageStep
+            value = self._value-self._pageStep*evt.delta
         else:
-            value = self._value+self._pageStep
+            value = self._value+self._pageStep*evt.delta
         self.setValue(max(self._minimum,min(self._maximum,value)))
         self.sliderMoved.emit(self._value)
         return True
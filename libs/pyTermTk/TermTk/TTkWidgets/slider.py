@@ -51,12 +51,13 @@ class TTkSlider(TTkScrollBar):
             }
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
+        step = self._pageStep*evt.delta
         if self._orientation == TTkK.VERTICAL:
-            if evt.evt == TTkK.WHEEL_Up: value = self._value+self._pageStep
-            else:                        value = self._value-self._pageStep
+            if evt.evt == TTkK.WHEEL_Up: value = self._value+step
+            else:                        value = self._value-step
         else:
-            if evt.evt == TTkK.WHEEL_Up: value = self._value-self._pageStep
-            else:                        value = self._value+self._pageStep
+            if evt.evt == TTkK.WHEEL_Up: value = self._value-step
+            else:                        value = self._value+step
         self.setValue(max(self._minimum,min(self._maximum,value)))
         self.sliderMoved.emit(self._value)
         return True
@@ -129,13 +129,13 @@ class TTkSpinBox(TTkContainer):
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
         if evt.evt == TTkK.WHEEL_Up:
-            self.setValue(self._value+1)
+            self.setValue(self._value+evt.delta)
         elif evt.evt == TTkK.WHEEL_Down:
-            self.setValue(self._value-1)
+            self.setValue(self._value-evt.delta)
         elif evt.evt == TTkK.WHEEL_Right:
-            self.setValue(self._value+1)
+            self.setValue(self._value+evt.delta)
         elif evt.evt == TTkK.WHEEL_Left:
-            self.setValue(self._value-1)
+            self.setValue(self._value-evt.delta)
         return True
 
     def keyEvent(self, evt:TTkKeyEvent) -> bool:
@@ -884,10 +884,11 @@ class TTkTabBar(TTkContainer):
         self.update()
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
-        if evt.evt in (TTkK.WHEEL_Up,TTkK.WHEEL_Left):
-            self._tabStatus._moveToTheLeft()
-        elif evt.evt in (TTkK.WHEEL_Down,TTkK.WHEEL_Right):
-            self._tabStatus._andMoveToTheRight()
+        for _ in range(evt.delta):
+            if evt.evt in (TTkK.WHEEL_Up,TTkK.WHEEL_Left):
+                self._tabStatus._moveToTheLeft()
+            elif evt.evt in (TTkK.WHEEL_Down,TTkK.WHEEL_Right):
+                self._tabStatus._andMoveToTheRight()
         return True
 
     def keyEvent(self, evt:TTkKeyEvent) -> bool:
@@ -216,7 +216,7 @@ class TTkTextEditView(TTkAbstractScrollView):
             '_replace',
             '_readOnly', '_multiCursor',
             '_clipboard',
-            '_lineMap',
+            '_lineMap', '_rowCache',
             # '_preview', '_previewWidth',
             '_multiLine',
             # Signals
@@ -368,6 +368,7 @@ class TTkTextEditView(TTkAbstractScrollView):
 
     def _setDocument(self, document:Optional[TTkTextDocument]) -> None:
         self._lineMap = _TextEditLineMap()
+        self._rowCache = {}
         if not document:
             document = TTkTextDocument()
         self._textDocument = document
@@ -1004,6 +1005,15 @@ class TTkTextEditView(TTkAbstractScrollView):
 
         return super().keyEvent(evt)
 
+    @staticmethod
+    def _decorateLine(line:TTkString, decorations:list) -> TTkString:
+        for blink, pf, pt, color in decorations:
+            if blink:
+                line = TTkTextCursor._setBlinkingCursor(line, pf, color)
+            else:
+                line = line.setColor(color=color, posFrom=pf, posTo=len(line) if pt is None else pt)
+        return line
+
     def paintEvent(self, canvas: TTkCanvas) -> None:
         ox, oy = self.getViewOffsets()
         w,h = self.size()
@@ -1021,7 +1031,12 @@ class TTkTextEditView(TTkAbstractScrollView):
         # backgroundColors must be sized to match the line range, not the wrapped row count
         # because wrapping can cause multiple wrapped rows to reference the same source line
         backgroundColors = [self._textDocument._backgroundColor]*(to-fr+1)
-        outLines = self._textCursor._getHighlightedLines(fr, to, outLines, selectColor)
+        # The selections and cursors (decorations) to be applied to each line
+        decorations = [[] for _ in range(to-fr+1)]
+        # Empty spans (a cursor without selection) do not change the line
+        for i, pf, pt in self._textCursor._getSelectionSpans(fr, to):
+            if pt is None or pf < pt:
+                decorations[i-fr].append((False, pf, pt, selectColor))
 
         for extraSelection in self._extraSelections:
             esCursor = extraSelection._cursor
@@ -1029,17 +1044,36 @@ class TTkTextEditView(TTkAbstractScrollView):
             esFormat = extraSelection._format
             if esFormat == TTkK.SelectionFormat.FullWidthSelection:
                 backgroundColors = esCursor._getCoveredLines(fr, to, backgroundColors, esColor)
-            outLines = esCursor._getHighlightedLines(fr, to, outLines, esColor)
+            for i, pf, pt in esCursor._getSelectionSpans(fr, to):
+                if pt is None or pf < pt:
+                    decorations[i-fr].append((False, pf, pt, esColor))
 
-        outLines = self._textCursor._getBlinkingCursors(fr, to, outLines, selectColor)
+        for i, pos in self._textCursor._getBlinkingPositions(fr, to):
+            decorations[i-fr].append((True, pos, pos, selectColor))
 
+        # Each row is rendered again only if its line, decorations or wrap are changed
+        tabSpaces = self._textWrap._wrapState.tabSpaces
+        rowCache, self._rowCache = self._rowCache, {}
+        decoratedLines = {}
         for y, row in enumerate(subLines):
-            t  = outLines[row.line-subLines[0].line]
-            bg = backgroundColors[row.line-subLines[0].line]
-            text:TTkString = t.substring(row.start,row.stop).tab2spaces(self._textWrap._wrapState.tabSpaces)
+            i    = row.line-fr
+            line = outLines[i]
+            bg   = backgroundColors[i]
+            deco = decorations[i]
+            key  = (row.line, row.start)
+            cached = rowCache.get(key)
+            if ( cached is None or cached[0] is not line or
+                 cached[1:5] != (row.stop, tabSpaces, bg, deco) ):
+                if (t := decoratedLines.get(i)) is None:
+                    t = decoratedLines[i] = TTkTextEditView._decorateLine(line, deco)
+                text:TTkString = t.substring(row.start,row.stop).tab2spaces(tabSpaces)
+                if bg != TTkColor.RST:
+                    text = text.completeColor(bg)
+                cached = (line, row.stop, tabSpaces, bg, deco, text)
+            self._rowCache[key] = cached
+            text = cached[5]
             if bg != TTkColor.RST:
                 canvas.fill(color=bg,pos=(0,y), size=(w,1))
-                text = text.completeColor(bg)
             canvas.drawTTkString(pos=(-ox,y), text=text)
 
         if self._lineWrapMode == TTkK.FixedWidth:
@@ -33,6 +33,7 @@ from TermTk.TTkCore.helper    import TTkHelper
 from TermTk.TTkCore.color     import TTkColor
 from TermTk.TTkCore.string    import TTkString
 from TermTk.TTkCore.canvas    import TTkCanvas
+from TermTk.TTkCore.canvas_array import TTkCanvasArray
 from TermTk.TTkCore.signal    import pyTTkSignal, pyTTkSlot
 from TermTk.TTkTemplates.dragevents import TDragEvents
 from TermTk.TTkTemplates.mouseevents import TMouseEvents
@@ -116,8 +117,11 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         '_enabled',
         '_style', '_currentStyle',
         '_toolTip',
+        '_wheelCoalescing',
         '_dropEventProxy',
         '_widgetCursor', '_widgetCursorEnabled', '_widgetCursorType',
+        '_depth', '_depthGen',
+        '_visibleAndParent', '_visibleGen',
         #Signals
         'focusChanged', 'sizeChanged', 'currentStyleChanged', 'closed')
 
@@ -139,10 +143,15 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
     _style:Dict[str, Any]
     _currentStyle:Dict[str, Any]
     _toolTip:TTkString
+    _wheelCoalescing:bool
     _dropEventProxy:Callable[..., Any]
     _widgetCursor:Tuple[int,int]
     _widgetCursorEnabled:bool
     _widgetCursorType:int
+    _depth:int
+    _depthGen:int
+    _visibleAndParent:bool
+    _visibleGen:int
 
     def __init__(
             self,
@@ -227,6 +236,12 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
 
         self._name = name if name else self.__class__.__name__
         self._parent = parent
+        # Cached depth in the widget tree, see TTkHelper.widgetDepth
+        self._depth = 0
+        self._depthGen = -1
+        # Cached visibility of the widget and its parents, see isVisibleAndParent
+        self._visibleAndParent = False
+        self._visibleGen = -1
 
 
         self._x, self._y = pos if pos else (x,y)
@@ -241,6 +256,7 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         self._enabled = enabled
 
         self._toolTip = TTkString(toolTip)
+        self._wheelCoalescing = True
 
         self._widgetItem = TTkWidgetItem(widget=self)
 
@@ -252,7 +268,7 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         if addStyle:
             self.mergeStyle(addStyle)
 
-        self._canvas = TTkCanvas(
+        self._canvas = (TTkCanvasArray if TTkCfg.compactCanvas else TTkCanvas)(
                             width  = self._width  ,
                             height = self._height )
 
@@ -368,6 +384,23 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         '''
         pass
 
+    def _composeChildCanvas(self, repainted:bool, damage:Dict[TTkWidget,Optional[List[Tuple[int,int]]]]) -> Optional[List[Tuple[int,int]]]:
+        '''
+        Compose the child widgets on the canvas during the paint process
+
+        .. note:: This is an internal method, the damaged rows compositing is implemented in :py:class:`TTkContainer`
+
+        :param repainted: the paintEvent has been executed in this frame
+        :type repainted: bool
+        :param damage: the damaged rows of the updated children (None = all)
+        :type damage: dict
+
+        :return: the damaged rows of this widget (None = all)
+        :rtype: list[tuple[int,int]] | None
+        '''
+        self.paintChildCanvas()
+        return None
+
     def moveEvent(self, x: int, y: int) -> None:
         '''
         Convenience function,
@@ -430,6 +463,8 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         if x==self._x and y==self._y: return
         self._x = x
         self._y = y
+        if (_l := self._widgetItem._parent) is not None:
+            _l._invalidateSpatialIndex()
         self.update(repaint=False, updateLayout=False)
         self.moveEvent(x,y)
 
@@ -445,6 +480,8 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         if width!=self._width or height!=self._height:
             self._width  = width
             self._height = height
+            if (_l := self._widgetItem._parent) is not None:
+                _l._invalidateSpatialIndex()
             self._canvas.resize(self._width, self._height)
             self.update(repaint=True, updateLayout=True)
         self.resizeEvent(width,height)
@@ -607,8 +644,16 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
                 return True
 
         if evt.key == TTkK.Wheel:
-            if self.wheelEvent(evt):
-                return True
+            if self._wheelCoalescing or evt.delta <= 1:
+                if self.wheelEvent(evt):
+                    return True
+            else:
+                # Deliver the merged ticks one by one
+                tick = TTkMouseEvent(evt.x, evt.y, evt.key, evt.evt, evt.mod, evt.tap, evt.raw)
+                if self.wheelEvent(tick):
+                    for _ in range(evt.delta-1):
+                        self.wheelEvent(tick)
+                    return True
 
         return False
 
@@ -619,6 +664,9 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         :param parent: the parent widget
         :type parent: :py:class:`TTkContainer`
         '''
+        if self._parent is not parent:
+            TTkHelper.invalidateWidgetDepth()
+            TTkHelper.invalidateWidgetVisibility()
         self._parent = parent
     def parentWidget(self) -> Optional[TTkContainer]:
         '''
@@ -876,6 +924,7 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         '''show the widget'''
         if self._visible: return
         self._visible = True
+        TTkHelper.invalidateWidgetVisibility()
         self._canvas.show()
         self.update(updateLayout=True, updateParent=True)
 
@@ -884,6 +933,7 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         '''hide the widget'''
         if not self._visible: return
         self._visible = False
+        TTkHelper.invalidateWidgetVisibility()
         self._canvas.hide()
         self.update(repaint=False, updateParent=True)
 
@@ -912,6 +962,9 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
                 _rl.removeWidget(self)
             _p.update()
         TTkHelper.removeOverlayAndChild(self)
+        if self._parent is not None:
+            TTkHelper.invalidateWidgetDepth()
+            TTkHelper.invalidateWidgetVisibility()
         self._parent = None
         self.hide()
         self.closed.emit(self)
@@ -934,9 +987,14 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         :return: True if the widget and all its parents are visible, False otherwise
         :rtype: bool
         '''
-        return ( self._visible and
-            ( self._parent is not None ) and
-            self._parent.isVisibleAndParent() )
+        # The result is cached and it is valid until the next
+        # show/hide/reparenting (see TTkHelper.invalidateWidgetVisibility)
+        if self._visibleGen != TTkHelper._widgetVisibleGen:
+            self._visibleAndParent = ( self._visible and
+                ( self._parent is not None ) and
+                self._parent.isVisibleAndParent() )
+            self._visibleGen = TTkHelper._widgetVisibleGen
+        return self._visibleAndParent
 
     def isVisible(self) -> bool:
         '''
@@ -1151,6 +1209,28 @@ class TTkWidget(TMouseEvents, TKeyEvents, TDragEvents):
         '''
         self._toolTip = TTkString(toolTip)
 
+    def wheelCoalescing(self) -> bool:
+        '''
+        Retrieve the wheel coalescing status
+
+        :return: True if the merged wheel ticks are delivered in a single :py:meth:`wheelEvent`
+        :rtype: bool
+        '''
+        return self._wheelCoalescing
+
+    def setWheelCoalescing(self, enabled:bool) -> None:
+        '''
+        Enable/Disable the wheel coalescing for this widget
+
+        If enabled (default) the consecutive wheel ticks are delivered in a single :py:meth:`wheelEvent`
+        reporting their number in :py:attr:`TTkMouseEvent.delta`,
+        if disabled :py:meth:`wheelEvent` is called once for each tick (with delta = 1).
+
+        :param enabled: the wheel coalescing status
+        :type enabled: bool
+        '''
+        self._wheelCoalescing = enabled
+
     def getWidgetByName(self, name: str) -> Optional[TTkWidget]:
         '''
         Get a widget by its name (recursively searches this widget and its children)
@@ -77,6 +77,16 @@ class Mock_TTkTerm():
         sys.stdout.write(str(*args))
         sys.stdout.flush()
 
+    syncUpdate = False
+
+    @staticmethod
+    def setSyncUpdate(supported):
+        Mock_TTkTerm.syncUpdate = supported
+    @staticmethod
+    def beginFrame(syncUpdate=False): pass
+    @staticmethod
+    def commitFrame(): pass
+
     @staticmethod
     def registerResizeCb(_): pass
     @staticmethod
@@ -24,6 +24,7 @@
 import os
 import sys
 import csv
+import time
 import tempfile
 import io
 from unittest.mock import Mock
@@ -400,5 +401,172 @@ def test_integration_with_table_widget():
         os.unlink(tmp_path)
 
 
+def _streamModel(content, modelClass=ttk.TTkTableModelCSVStream):
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as tmp:
+        tmp.write(content)
+        tmp_path = tmp.name
+    model = modelClass(filename=tmp_path)
+    for _ in range(500):
+        if model.isIndexed(): break
+        time.sleep(0.01)
+    assert model.isIndexed()
+    return model, tmp_path
+
+class TestTTkTableModelCSVStream:
+    """Test cases for TTkTableModelCSVStream class"""
+
+    def test_headers(self):
+        model, tmp_path = _streamModel("Name,Age,Role\nAlice,25,Engineer\nBob,30,Designer\nCharlie,35,Manager")
+        try:
+            assert model.rowCount() == 3
+            assert model.columnCount() == 3
+            assert model.data(0, 0) == 'Alice'
+            assert model.data(2, 2) == 'Manager'
+            assert model.headerData(1, ttk.TTkK.HORIZONTAL) == 'Age'
+            assert model.headerData(1, ttk.TTkK.VERTICAL) == '1'
+        finally:
+            os.unlink(tmp_path)
+
+    def test_headers_and_index(self):
+        model, tmp_path = _streamModel("ID,Name,Age\n1,Alice,25\n2,Bob,30\n3,Charlie,35\n")
+        try:
+            assert model.rowCount() == 3
+            assert model.columnCount() == 2
+            assert model.data(1, 0) == 'Bob'
+            assert model.headerData(0, ttk.TTkK.HORIZONTAL) == 'Name'
+            assert model.headerData(2, ttk.TTkK.VERTICAL) == '3'
+        finally:
+            os.unlink(tmp_path)
+
+    def test_quoted_new_lines(self):
+        model, tmp_path = _streamModel('Key,Text,Value\na,"multi\nline ""quoted""\nvalue",10\nd,e,20\ng,"h,i",30')
+        try:
+            assert model.rowCount() == 3
+            assert model.headerData(1, ttk.TTkK.HORIZONTAL) == 'Text'
+            assert model.data(0, 1) == 'multi\nline "quoted"\nvalue'
+            assert model.data(1, 0) == 'd'
+            assert model.data(2, 1) == 'h,i'
+        finally:
+            os.unlink(tmp_path)
+
+    def test_same_data_as_csv_model(self):
+        content = "\n".join(f"{chr(65+r%26)}{r},{r*3},\"v {r}\"" for r in range(2000))
+        model, tmp_path = _streamModel(content)
+        try:
+            ref = ttk.TTkTableModelCSV(filename=tmp_path)
+            assert model.rowCount() == ref.rowCount() == 2000
+            assert model.columnCount() == ref.columnCount()
+            # Read the pages out of order to exercise the cache
+            for row in (1999, 0, 700, 256, 255, 1024, 3):
+                for col in range(3):
+                    assert model.data(row, col) == ref.data(row, col)
+            assert len(model._pages) <= model.MAX_PAGES
+        finally:
+            os.unlink(tmp_path)
+
+    def test_page_cache_eviction(self):
+        class _SmallPages(ttk.TTkTableModelCSVStream):
+            PAGE_SIZE = 4
+            MAX_PAGES = 3
+        content = "\n".join(f"x{r},{r}" for r in range(100))
+        model, tmp_path = _streamModel(content, modelClass=_SmallPages)
+        try:
+            for row in range(0, 100, 4):
+                assert model.data(row, 1) == str(row)
+            assert list(model._pages) == [22, 23, 24]
+            # A cache hit moves the page to the most recently used position
+            assert model.data(89, 1) == '89'
+            assert model.data(0, 1) == '0'
+            assert list(model._pages) == [24, 22, 0]
+        finally:
+            os.unlink(tmp_path)
+
+    def test_progressive_index(self):
+        class _SmallChunks(ttk.TTkTableModelCSVStream):
+            CHUNK_SIZE = 1000
+        content = "\n".join(f"x{r},{r}" for r in range(10000))
+        model, tmp_path = _streamModel(content, modelClass=_SmallChunks)
+        try:
+            assert model.rowCount() == 10000
+            assert model.data(9999, 1) == '9999'
+            assert model.data(5000, 0) == 'x5000'
+        finally:
+            os.unlink(tmp_path)
+
+    def test_quotes_inside_a_field(self):
+        # Only a quote at the beginning of the field opens a quoted field
+        content = 'Item,Size\nhose,"1/2"" x 30"\npipe,12" pipe\nvalve,3" "brass"\nend,"a\nb"\n'
+        for chunkSize in (1, 2, 3, 5, 1000):
+            class _Chunks(ttk.TTkTableModelCSVStream):
+                CHUNK_SIZE = chunkSize
+            model, tmp_path = _streamModel(content, modelClass=_Chunks)
+            try:
+                ref = ttk.TTkTableModelCSV(filename=tmp_path)
+                # The header is not detected, the first line is a row
+                assert model.rowCount() == ref.rowCount() == 5
+                assert model.data(1, 1) == '1/2" x 30'
+                assert model.data(2, 1) == '12" pipe'
+                assert model.data(3, 1) == '3" "brass"'
+                assert model.data(4, 1) == 'a\nb'
+                for row in range(5):
+                    for col in range(2):
+                        assert model.data(row, col) == ref.data(row, col)
+            finally:
+                os.unlink(tmp_path)
+
+    def test_rows_appended(self):
+        class _SmallChunks(ttk.TTkTableModelCSVStream):
+            CHUNK_SIZE = 1000
+        appended = []
+        changed = []
+        class _Signals(_SmallChunks):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.rowsAppended.connect(lambda row,count: appended.append((row,count)))
+                self.modelChanged.connect(lambda: changed.append(True))
+        content = "\n".join(f"x{r},{r}" for r in range(10000))
+        model, tmp_path = _streamModel(content, modelClass=_Signals)
+        try:
+            assert not changed
+            # The indexing may have started before the connection
+            assert len(appended) > 1
+            assert all(_r+_c == _nr for (_r,_c),(_nr,_) in zip(appended, appended[1:]))
+            assert appended[-1][0]+appended[-1][1] == 10000
+        finally:
+            os.unlink(tmp_path)
+
+    def test_table_widget_rows_appended(self):
+        model, tmp_path = _streamModel("\n".join(f"x{r},{r}" for r in range(10)))
+        try:
+            table = ttk.TTkTableWidget(tableModel=model)
+            table.resize(40,10)
+            table.setSelection((0,2),(2,3),ttk.TTkK.TTkItemSelectionModel.Select)
+            table._currentPos = (3,1)
+            # Simulate the growth of the file being indexed
+            model._offsets.extend(model._offsets[-1]+i for i in range(1,6))
+            model.rowsAppended.emit(10,5)
+            assert len(table._rowsPos) == 10
+            ttk.TTkHelper._runDeferredCalls()
+            assert len(table._rowsPos) == 15
+            assert list(table._rowsPos) == [1+x*2 for x in range(15)]
+            assert table._currentPos == (3,1)
+            assert table._select_proxy.isCellSelected(1,4)
+            assert not table._select_proxy.isCellSelected(1,5)
+            assert not table._select_proxy.isCellSelected(0,14)
+            assert table.viewFullAreaSize()[1] == 1+table._rowsPos[-1]+1
+        finally:
+            os.unlink(tmp_path)
+
+    def test_table_widget(self):
+        content = "\n".join(f"x{r},{r}" for r in range(1000))
+        model, tmp_path = _streamModel(content)
+        try:
+            table = ttk.TTkTable(tableModel=model)
+            table.resize(40,10)
+            assert table.model() == model
+        finally:
+            os.unlink(tmp_path)
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
@@ -1154,4 +1154,43 @@ class TestTTkTableModelSQLite3:
 
         # Final cleanup
         model.removeRows(0, model.rowCount())
-        assert model.rowCount() == 0
\ No newline at end of file
+        assert model.rowCount() == 0
+    def test_page_cache(self, monkeypatch):
+        """Test the rows page cache (single query per page, LRU eviction, invalidation)"""
+        monkeypatch.setattr(ttk.TTkTableModelSQLite3, 'PAGE_SIZE', 3)
+        monkeypatch.setattr(ttk.TTkTableModelSQLite3, 'MAX_PAGES', 2)
+
+        conn = sqlite3.connect(self.temp_db_path)
+        conn.executemany('INSERT INTO users (name, age, role) VALUES (?, ?, ?)',
+                         [(f'User{i:02}', 50+(i*7)%30, f'Role{i%3}') for i in range(20)])
+        conn.commit()
+
+        model = ttk.TTkTableModelSQLite3(fileName=self.temp_db_path, table='users')
+        queries = []
+        model._conn.set_trace_callback(queries.append)
+
+        def _expected(sort=''):
+            return [list(r) for r in conn.execute(f"SELECT name, age, role FROM users {sort}")]
+        def _data():
+            return [[model.data(r,c) for c in range(3)] for r in range(model.rowCount())]
+
+        # All the columns of a page are fetched in a single query
+        assert [model.data(r,c) for r in range(3) for c in range(3)] == sum(_expected()[:3],[])
+        assert len(queries) == 1
+
+        assert _data() == _expected()
+        assert len(model._pages) <= 2
+        assert model.data(model.rowCount(), 0) is None
+
+        model.sort(1, ttk.TTkK.SortOrder.DescendingOrder)
+        assert _data() == _expected("ORDER BY age DESC")
+
+        model.setData(4, 0, 'Changed')
+        model.setData(5, 2, 'Changed Role')
+        assert _data() == _expected("ORDER BY age DESC")
+
+        model.setData(4, 1, 99)
+        assert model.data(0, 1) == 99
+        assert _data() == _expected("ORDER BY age DESC")
+
+        conn.close()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import os
+import sys
+import time
+import threading
+
+sys.path.append(os.path.join(sys.path[0],'../../../libs/pyTermTk'))
+import TermTk as ttk
+from TermTk.TTkWidgets.TTkModelView.tablewidget import _TTkTablePrefetch
+
+class _AsyncModel(ttk.TTkTableModelList):
+    def __init__(self, **kwargs) -> None:
+        self.loaded = set()
+        self.fetched = []
+        self.lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def isRowLoaded(self, row:int) -> bool:
+        return row in self.loaded
+
+    def fetchRows(self, row:int, count:int) -> None:
+        with self.lock:
+            self.fetched.append((row,count))
+            self.loaded.update(range(row,row+count))
+        self.dataChanged.emit((row,0),(count,self.columnCount()))
+
+def _waitPrefetch(table:ttk.TTkTableWidget) -> None:
+    for _ in range(200):
+        if not table._prefetch._pending: return
+        time.sleep(0.01)
+    assert False, "Prefetch not completed"
+
+def _paint(table:ttk.TTkTableWidget) -> str:
+    canvas = table.getCanvas()
+    canvas.updateSize()
+    canvas.clean()
+    table.paintEvent(canvas)
+    return '\n'.join(''.join(line) for line in canvas._data)
+
+def _mkTable(model) -> ttk.TTkTableWidget:
+    table = ttk.TTkTableWidget(tableModel=model)
+    table.resize(80,20)
+    table.getCanvas().resize(80,20)
+    return table
+
+def test_prefetch_disabled_on_sync_models():
+    model = ttk.TTkTableModelList(data=[[f"{r}-{c}" for c in range(3)] for r in range(100)])
+    table = _mkTable(model)
+    assert not table._prefetch.enabled
+    txt = _paint(table)
+    assert '0-0' in txt
+    assert '…' not in txt
+
+def test_prefetch_placeholder_and_fetch():
+    model = _AsyncModel(data=[[f"{r}-{c}" for c in range(3)] for r in range(1000)])
+    table = _mkTable(model)
+    assert table._prefetch.enabled
+
+    txt = _paint(table)
+    # Nothing loaded yet, the placeholders are displayed
+    assert '0-0' not in txt
+    assert '…' in txt
+
+    _waitPrefetch(table)
+    # The visible rows and the ones ahead are requested in blocks
+    assert 0 in model.loaded
+    assert all(row % _TTkTablePrefetch.BLOCK == 0 for row,_ in model.fetched)
+    # the rows far from the viewport are not requested
+    assert 999 not in model.loaded
+
+    txt = _paint(table)
+    assert '0-0' in txt
+    assert '…' not in txt
+
+def test_prefetch_scroll():
+    model = _AsyncModel(data=[[f"{r}-{c}" for c in range(3)] for r in range(1000)])
+    table = _mkTable(model)
+    # Each row is displayed with its separator line
+    table.viewMoveTo(0, 1000)
+    _paint(table)
+    _waitPrefetch(table)
+    assert 500 in model.loaded
+    assert 0 not in model.loaded
+    txt = _paint(table)
+    assert '500-0' in txt
+    assert '…' not in txt
+
+def test_prefetch_cancel():
+    model = _AsyncModel(data=[[f"{r}-{c}" for c in range(3)] for r in range(100000)])
+    prefetch = _TTkTablePrefetch(model)
+    ev = threading.Event()
+    _fetchRows = model.fetchRows
+    def _slowFetch(row, count):
+        ev.wait(2)
+        _fetchRows(row, count)
+    model.fetchRows = _slowFetch
+    # Saturate the workers and queue some blocks
+    prefetch.request(0, 64*10)
+    # Jump away, the queued blocks are no longer required
+    prefetch.request(50000, 50064)
+    ev.set()
+    for _ in range(200):
+        if not prefetch._pending: break
+        time.sleep(0.01)
+    fetched = {row for row,_ in model.fetched}
+    assert 50000 - 50000 % 64 in fetched
+    assert len(fetched) < 11
+
+def test_prefetch_set_model_cancel():
+    model = _AsyncModel(data=[[f"{r}-{c}" for c in range(3)] for r in range(100000)])
+    ev = threading.Event()
+    _fetchRows = model.fetchRows
+    def _slowFetch(row, count):
+        ev.wait(2)
+        _fetchRows(row, count)
+    model.fetchRows = _slowFetch
+    table = _mkTable(model)
+    prefetch = table._prefetch
+    # Saturate the workers and queue some blocks
+    prefetch.request(0, 64*10)
+    pending = list(prefetch._pending.values())
+
+    newModel = _AsyncModel(data=[[f"{r}-{c}" for c in range(3)] for r in range(100)])
+    table.setModel(newModel)
+    assert table._prefetch is not prefetch
+    assert not prefetch.enabled
+    assert not prefetch._pending
+    ev.set()
+    for _ in range(200):
+        if all(f.done() for f in pending): break
+        time.sleep(0.01)
+    # Only the blocks already started are fetched from the detached model
+    assert len(model.fetched) <= 2
+    # No further request is accepted by the old prefetcher
+    prefetch.request(0, 64)
+    assert not prefetch._pending
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import os
+import sys
+
+sys.path.append(os.path.join(sys.path[0],'../../../libs/pyTermTk'))
+import TermTk as ttk
+from TermTk.TTkWidgets.TTkModelView.tablewidget import _TTkTableColumnWidths
+
+class _CountingModel(ttk.TTkTableModelList):
+    def __init__(self, **kwargs) -> None:
+        self.calls = 0
+        super().__init__(**kwargs)
+
+    def ttkStringData(self, row:int, col:int) -> ttk.TTkString:
+        self.calls += 1
+        return super().ttkStringData(row, col)
+
+def _colWidths(table:ttk.TTkTableWidget):
+    cp = list(table._colsPos)
+    return [b-a-1 for a,b in zip([-1]+cp,cp)]
+
+def test_resize_columns_to_contents():
+    data = [['a', 'bbbb', 'cc\ncccccc'],
+            ['aaa', 'b', 'c']]
+    table = ttk.TTkTableWidget(tableModel=ttk.TTkTableModelList(data=data), dataPadding=1)
+    table.resize(80,20)
+    table.resizeColumnsToContents()
+    assert _colWidths(table) == [4,5,7]
+
+def test_incremental_set_data():
+    model = _CountingModel(data=[[f"{r}:{c}" for c in range(3)] for r in range(50)])
+    table = ttk.TTkTableWidget(tableModel=model, dataPadding=0)
+    table.resize(80,20)
+    table.resizeColumnsToContents()
+    assert model.calls == 50*3
+    assert _colWidths(table) == [4,4,4]
+
+    # Cached
+    table.resizeColumnsToContents()
+    assert model.calls == 50*3
+
+    # Only the changed cell is measured again
+    model.setData(10,1,"1234567890")
+    model.calls = 0
+    table.resizeColumnsToContents()
+    assert model.calls == 1
+    assert _colWidths(table) == [4,10,4]
+
+    # the column shrinks if the widest cell is reduced
+    model.setData(10,1,"x")
+    table.resizeColumnsToContents()
+    assert _colWidths(table) == [4,4,4]
+
+def test_model_changed_clears_the_cache():
+    model = _CountingModel(data=[[f"{r}:{c}" for c in range(3)] for r in range(50)])
+    table = ttk.TTkTableWidget(tableModel=model, dataPadding=0)
+    table.resize(80,20)
+    table.resizeColumnsToContents()
+    model.insertRows(0,1)
+    model.calls = 0
+    table.resizeColumnsToContents()
+    assert model.calls == 51*3
+
+def test_sampled_huge_model():
+    class _Model(ttk.TTkAbstractTableModel):
+        def __init__(self):
+            self.calls = 0
+            super().__init__()
+        def rowCount(self):        return 100000
+        def columnCount(self):     return 2
+        def data(self, row, col):
+            self.calls += 1
+            return 'x'*20 if row == 99999 else str(row)
+
+    model = _Model()
+    table = ttk.TTkTableWidget(tableModel=model, dataPadding=0)
+    table.resize(80,20)
+    table.resizeColumnsToContents()
+    # The sample include the tail of the table
+    assert _colWidths(table) == [20,20]
+    assert model.calls <= 2 * 5 * _TTkTableColumnWidths.SAMPLE
+
+def test_sampled_and_full():
+    widths = _TTkTableColumnWidths(ttk.TTkTableModelList(data=[[str(r)] for r in range(10000)]))
+    assert widths.columnWidth(0, 0) == 4
+    assert len(widths._widths[0]) < 500
+    # The full check measures all the rows
+    assert widths.columnWidth(0, 0, full=True) == 4
+    assert len(widths._widths[0]) == 10000
+
+class _SilentModel(ttk.TTkTableModelList):
+    '''A model not emitting dataChanged'''
+    def setData(self, row:int, col:int, data:object) -> bool:
+        self._data[row][col] = data
+        return True
+
+def test_undo_redo_set_data():
+    for model in (ttk.TTkTableModelList(data=[['a','b'],['c','d']]),
+                  _SilentModel(data=[['a','b'],['c','d']])):
+        table = ttk.TTkTableWidget(tableModel=model)
+        table.resize(80,20)
+        assert table._columnWidths.columnWidth(0,0) == 1
+        table._tableModel_setData([(0,0,'xxxxxxxxxx')])
+        assert table._columnWidths.columnWidth(0,0) == 10
+        table.undo()
+        assert model.data(0,0) == 'a'
+        assert table._columnWidths.columnWidth(0,0) == 1
+        table.redo()
+        assert table._columnWidths.columnWidth(0,0) == 10
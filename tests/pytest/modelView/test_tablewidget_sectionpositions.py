@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import os
+import sys
+import random
+import pytest
+
+sys.path.append(os.path.join(sys.path[0],'../../../libs/pyTermTk'))
+import TermTk as ttk
+from TermTk.TTkWidgets.TTkModelView.tablewidget import _SectionPositions
+
+def _lowerBound(ref, pos):
+    return next((i for i,v in enumerate(ref) if v>=pos), len(ref))
+
+def test_empty():
+    sp = _SectionPositions()
+    assert len(sp) == 0
+    assert list(sp) == []
+    assert sp.lowerBound(0) == 0
+    with pytest.raises(IndexError):
+        sp[0]
+
+def test_positions():
+    sp = _SectionPositions([2,4,8])
+    assert len(sp) == 3
+    assert list(sp) == [2,4,8]
+    assert [sp[i] for i in range(3)] == [2,4,8]
+    assert sp[-1] == 8
+    assert [sp.lowerBound(p) for p in range(-1,10)] == [0,0,0,0,1,1,2,2,2,2,3]
+
+def test_shift_and_set():
+    sp = _SectionPositions([2,4,8,10])
+    sp.shift(1,3)
+    assert list(sp) == [2,7,11,13]
+    # Only the position at the index is moved
+    sp[1] = 5
+    assert list(sp) == [2,5,11,13]
+    sp[-1] = 20
+    assert list(sp) == [2,5,11,20]
+
+def test_append():
+    sp = _SectionPositions()
+    ref = []
+    for pos in range(1,200,3):
+        sp.append(pos)
+        ref.append(pos)
+        assert list(sp) == ref
+        assert [sp.lowerBound(p) for p in range(-1,pos+2)] == [_lowerBound(ref,p) for p in range(-1,pos+2)]
+    sp.shift(10,5)
+    assert list(sp) == ref[:10]+[v+5 for v in ref[10:]]
+
+def test_random_reference():
+    rnd = random.Random(4321)
+    for n in (1,2,3,5,8,13,64,100):
+        ref = []
+        pos = -1
+        for _ in range(n):
+            pos += rnd.randrange(0,5)
+            ref.append(pos)
+        sp = _SectionPositions(ref)
+        for _ in range(100):
+            i = rnd.randrange(n)
+            if rnd.randrange(2):
+                diff = rnd.randrange(0,4)
+                sp.shift(i,diff)
+                ref[i:] = [v+diff for v in ref[i:]]
+            else:
+                lo = ref[i-1] if i else -1
+                hi = ref[i+1] if i+1 < n else lo+10
+                ref[i] = sp[i] = rnd.randrange(lo,hi+1)
+            assert list(sp) == ref
+            assert [sp[_i] for _i in range(n)] == ref
+            for p in range(-2, ref[-1]+3):
+                assert sp.lowerBound(p) == _lowerBound(ref,p)
+
+def test_table_large_model():
+    class _Model(ttk.TTkAbstractTableModel):
+        def rowCount(self):        return 200000
+        def columnCount(self):     return 5
+        def data(self, row, col):  return f"{row}-{col}"
+
+    table = ttk.TTkTableWidget(tableModel=_Model())
+    table.resize(80,20)
+    table.setRowHeight(10,5)
+    # The other rows are shifted
+    assert table._rowsPos[10] == 21+4
+    assert table._rowsPos[-1] == 1+199999*2+4
+
+    table.viewMoveTo(0, table._rowsPos[100000])
+    canvas = table.getCanvas()
+    canvas.resize(80,20)
+    canvas.updateSize()
+    canvas.clean()
+    table.paintEvent(canvas)
+    txt = '\n'.join(''.join(line) for line in canvas._data)
+    assert '100001-0' in txt
+    assert table._findCell(10,2,False)[0] == 100001
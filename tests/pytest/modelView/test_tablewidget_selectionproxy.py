@@ -30,6 +30,9 @@ sys.path.append(os.path.join(sys.path[0],'../../../libs/pyTermTk'))
 import TermTk as ttk
 from TermTk.TTkWidgets.TTkModelView.tablewidget import _SelectionProxy
 
+def _matrix(proxy:_SelectionProxy):
+    return [[proxy.isCellSelected(col, row) for col in range(proxy._cols)] for row in range(proxy._rows)]
+
 class TestSelectionProxy:
     """Test cases for _SelectionProxy class"""
 
@@ -56,7 +59,7 @@ class TestSelectionProxy:
 
         assert proxy._cols == 0
         assert proxy._rows == 0
-        assert proxy._selected_2d_list == []
+        assert _matrix(proxy) == []
 
     def test_resize_valid_dimensions(self):
         """Test resizing with valid dimensions"""
@@ -64,9 +67,9 @@ class TestSelectionProxy:
 
         assert self.proxy._cols == 3
         assert self.proxy._rows == 4
-        assert len(self.proxy._selected_2d_list) == 4
-        assert all(len(row) == 3 for row in self.proxy._selected_2d_list)
-        assert all(all(not cell for cell in row) for row in self.proxy._selected_2d_list)
+        assert len(_matrix(self.proxy)) == 4
+        assert all(len(row) == 3 for row in _matrix(self.proxy))
+        assert all(all(not cell for cell in row) for row in _matrix(self.proxy))
 
     def test_resize_zero_dimensions(self):
         """Test resizing with zero dimensions"""
@@ -74,7 +77,7 @@ class TestSelectionProxy:
 
         assert self.proxy._cols == 0
         assert self.proxy._rows == 0
-        assert self.proxy._selected_2d_list == []
+        assert _matrix(self.proxy) == []
 
     def test_resize_negative_dimensions(self):
         """Test resizing with negative dimensions raises ValueError"""
@@ -96,21 +99,21 @@ class TestSelectionProxy:
         """Test clearing selection with existing data"""
         self.proxy.resize(3, 4)
         # Manually set some selections
-        self.proxy._selected_2d_list[1][2] = True
-        self.proxy._selected_2d_list[3][0] = True
+        self.proxy.setSelection(pos=(2, 1), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
+        self.proxy.setSelection(pos=(0, 3), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
 
         self.proxy.clear()
 
-        assert all(all(not cell for cell in row) for row in self.proxy._selected_2d_list)
+        assert all(all(not cell for cell in row) for row in _matrix(self.proxy))
 
     def test_clear_selection_alias(self):
         """Test that clearSelection is alias for clear"""
         self.proxy.resize(3, 4)
-        self.proxy._selected_2d_list[1][1] = True
+        self.proxy.setSelection(pos=(1, 1), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
 
         self.proxy.clearSelection()
 
-        assert all(all(not cell for cell in row) for row in self.proxy._selected_2d_list)
+        assert all(all(not cell for cell in row) for row in _matrix(self.proxy))
 
     def test_select_all_with_all_selectable(self):
         """Test selectAll with all cells selectable"""
@@ -118,7 +121,7 @@ class TestSelectionProxy:
 
         self.proxy.selectAll()
 
-        assert all(all(cell for cell in row) for row in self.proxy._selected_2d_list)
+        assert all(all(cell for cell in row) for row in _matrix(self.proxy))
 
     def test_select_all_with_some_non_selectable(self):
         """Test selectAll with some cells non-selectable"""
@@ -127,10 +130,10 @@ class TestSelectionProxy:
         self.proxy.selectAll()
 
         # Cell (1,1) should not be selected due to flags
-        assert not self.proxy._selected_2d_list[1][1]
+        assert not _matrix(self.proxy)[1][1]
         # Other cells should be selected
-        assert self.proxy._selected_2d_list[0][0]
-        assert self.proxy._selected_2d_list[2][2]
+        assert _matrix(self.proxy)[0][0]
+        assert _matrix(self.proxy)[2][2]
 
     def test_select_row_valid(self):
         """Test selecting a valid row"""
@@ -139,10 +142,10 @@ class TestSelectionProxy:
         self.proxy.selectRow(1)
 
         # Row 1 should be fully selected
-        assert all(self.proxy._selected_2d_list[1])
+        assert all(_matrix(self.proxy)[1])
         # Other rows should not be selected
-        assert not any(self.proxy._selected_2d_list[0])
-        assert not any(self.proxy._selected_2d_list[2])
+        assert not any(_matrix(self.proxy)[0])
+        assert not any(_matrix(self.proxy)[2])
 
     def test_select_row_with_non_selectable_cells(self):
         """Test selecting row with non-selectable cells"""
@@ -151,10 +154,10 @@ class TestSelectionProxy:
         self.proxy.selectRow(1)
 
         # Cell (1,1) should not be selected due to flags
-        assert not self.proxy._selected_2d_list[1][1]
+        assert not _matrix(self.proxy)[1][1]
         # Other cells in row 1 should be selected
-        assert self.proxy._selected_2d_list[1][0]
-        assert self.proxy._selected_2d_list[1][2]
+        assert _matrix(self.proxy)[1][0]
+        assert _matrix(self.proxy)[1][2]
 
     def test_select_row_invalid_indices(self):
         """Test selecting invalid row indices"""
@@ -164,7 +167,7 @@ class TestSelectionProxy:
         self.proxy.selectRow(-1)
         self.proxy.selectRow(5)
 
-        assert not any(any(row) for row in self.proxy._selected_2d_list)
+        assert not any(any(row) for row in _matrix(self.proxy))
 
     def test_select_column_valid(self):
         """Test selecting a valid column"""
@@ -173,12 +176,12 @@ class TestSelectionProxy:
         self.proxy.selectColumn(2)
 
         # Column 2 should be selected in all rows
-        assert all(self.proxy._selected_2d_list[row][2] for row in range(3))
+        assert all(_matrix(self.proxy)[row][2] for row in range(3))
         # Other columns should not be selected
         for row in range(3):
-            assert not self.proxy._selected_2d_list[row][0]
-            assert not self.proxy._selected_2d_list[row][1]
-            assert not self.proxy._selected_2d_list[row][3]
+            assert not _matrix(self.proxy)[row][0]
+            assert not _matrix(self.proxy)[row][1]
+            assert not _matrix(self.proxy)[row][3]
 
     def test_select_column_with_non_selectable_cells(self):
         """Test selecting column with non-selectable cells"""
@@ -187,10 +190,10 @@ class TestSelectionProxy:
         self.proxy.selectColumn(1)
 
         # Cell (1,1) should not be selected due to flags
-        assert not self.proxy._selected_2d_list[1][1]
+        assert not _matrix(self.proxy)[1][1]
         # Other cells in column 1 should be selected
-        assert self.proxy._selected_2d_list[0][1]
-        assert self.proxy._selected_2d_list[2][1]
+        assert _matrix(self.proxy)[0][1]
+        assert _matrix(self.proxy)[2][1]
 
     def test_select_column_invalid_indices(self):
         """Test selecting invalid column indices"""
@@ -200,7 +203,7 @@ class TestSelectionProxy:
         self.proxy.selectColumn(-1)
         self.proxy.selectColumn(5)
 
-        assert not any(any(row) for row in self.proxy._selected_2d_list)
+        assert not any(any(row) for row in _matrix(self.proxy))
 
     def test_unselect_row_valid(self):
         """Test unselecting a valid row"""
@@ -210,22 +213,22 @@ class TestSelectionProxy:
         self.proxy.unselectRow(1)
 
         # Row 1 should be unselected
-        assert not any(self.proxy._selected_2d_list[1])
+        assert not any(_matrix(self.proxy)[1])
         # Other rows should remain selected
-        assert all(self.proxy._selected_2d_list[0])
-        assert all(self.proxy._selected_2d_list[2])
+        assert all(_matrix(self.proxy)[0])
+        assert all(_matrix(self.proxy)[2])
 
     def test_unselect_row_invalid_indices(self):
         """Test unselecting invalid row indices"""
         self.proxy.updateModel(cols=3, rows=3, flags=self.mock_flags_all)
         self.proxy.selectAll()
-        original_state = [row[:] for row in self.proxy._selected_2d_list]
+        original_state = [row[:] for row in _matrix(self.proxy)]
 
         # Should not crash or change anything
         self.proxy.unselectRow(-1)
         self.proxy.unselectRow(5)
 
-        assert self.proxy._selected_2d_list == original_state
+        assert _matrix(self.proxy) == original_state
 
     def test_unselect_column_valid(self):
         """Test unselecting a valid column"""
@@ -235,24 +238,24 @@ class TestSelectionProxy:
         self.proxy.unselectColumn(2)
 
         # Column 2 should be unselected in all rows
-        assert not any(self.proxy._selected_2d_list[row][2] for row in range(3))
+        assert not any(_matrix(self.proxy)[row][2] for row in range(3))
         # Other columns should remain selected
         for row in range(3):
-            assert self.proxy._selected_2d_list[row][0]
-            assert self.proxy._selected_2d_list[row][1]
-            assert self.proxy._selected_2d_list[row][3]
+            assert _matrix(self.proxy)[row][0]
+            assert _matrix(self.proxy)[row][1]
+            assert _matrix(self.proxy)[row][3]
 
     def test_unselect_column_invalid_indices(self):
         """Test unselecting invalid column indices"""
         self.proxy.updateModel(cols=3, rows=3, flags=self.mock_flags_all)
         self.proxy.selectAll()
-        original_state = [row[:] for row in self.proxy._selected_2d_list]
+        original_state = [row[:] for row in _matrix(self.proxy)]
 
         # Should not crash or change anything
         self.proxy.unselectColumn(-1)
         self.proxy.unselectColumn(5)
 
-        assert self.proxy._selected_2d_list == original_state
+        assert _matrix(self.proxy) == original_state
 
     def test_set_selection_select(self):
         """Test setSelection with Select flag"""
@@ -261,13 +264,13 @@ class TestSelectionProxy:
         self.proxy.setSelection(pos=(1, 1), size=(2, 2), flags=ttk.TTkK.TTkItemSelectionModel.Select)
 
         # Selected area should be (1,1) to (2,2)
-        assert self.proxy._selected_2d_list[1][1]
-        assert self.proxy._selected_2d_list[1][2]
-        assert self.proxy._selected_2d_list[2][1]
-        assert self.proxy._selected_2d_list[2][2]
+        assert _matrix(self.proxy)[1][1]
+        assert _matrix(self.proxy)[1][2]
+        assert _matrix(self.proxy)[2][1]
+        assert _matrix(self.proxy)[2][2]
         # Outside area should not be selected
-        assert not self.proxy._selected_2d_list[0][0]
-        assert not self.proxy._selected_2d_list[3][3]
+        assert not _matrix(self.proxy)[0][0]
+        assert not _matrix(self.proxy)[3][3]
 
     def test_set_selection_clear(self):
         """Test setSelection with Clear flag"""
@@ -277,11 +280,11 @@ class TestSelectionProxy:
         self.proxy.setSelection(pos=(1, 1), size=(2, 1), flags=ttk.TTkK.TTkItemSelectionModel.Clear)
 
         # Specified area should be cleared
-        assert not self.proxy._selected_2d_list[1][1]
-        assert not self.proxy._selected_2d_list[1][2]
+        assert not _matrix(self.proxy)[1][1]
+        assert not _matrix(self.proxy)[1][2]
         # Other areas should remain selected
-        assert self.proxy._selected_2d_list[0][0]
-        assert self.proxy._selected_2d_list[2][3]
+        assert _matrix(self.proxy)[0][0]
+        assert _matrix(self.proxy)[2][3]
 
     def test_set_selection_deselect(self):
         """Test setSelection with Deselect flag"""
@@ -291,13 +294,13 @@ class TestSelectionProxy:
         self.proxy.setSelection(pos=(0, 0), size=(2, 2), flags=ttk.TTkK.TTkItemSelectionModel.Deselect)
 
         # Specified area should be deselected
-        assert not self.proxy._selected_2d_list[0][0]
-        assert not self.proxy._selected_2d_list[0][1]
-        assert not self.proxy._selected_2d_list[1][0]
-        assert not self.proxy._selected_2d_list[1][1]
+        assert not _matrix(self.proxy)[0][0]
+        assert not _matrix(self.proxy)[0][1]
+        assert not _matrix(self.proxy)[1][0]
+        assert not _matrix(self.proxy)[1][1]
         # Other areas should remain selected
-        assert self.proxy._selected_2d_list[2][2]
-        assert self.proxy._selected_2d_list[2][3]
+        assert _matrix(self.proxy)[2][2]
+        assert _matrix(self.proxy)[2][3]
 
     def test_set_selection_boundary_conditions(self):
         """Test setSelection with boundary conditions"""
@@ -307,7 +310,7 @@ class TestSelectionProxy:
         self.proxy.setSelection(pos=(2, 2), size=(3, 3), flags=ttk.TTkK.TTkItemSelectionModel.Select)
 
         # Only valid cells should be selected
-        assert self.proxy._selected_2d_list[2][2]
+        assert _matrix(self.proxy)[2][2]
         # Should not crash or cause index errors
 
     def test_is_row_selected_all_selectable(self):
@@ -362,7 +365,7 @@ class TestSelectionProxy:
     def test_is_cell_selected_valid(self):
         """Test isCellSelected with valid coordinates"""
         self.proxy.updateModel(cols=4, rows=3, flags=self.mock_flags_all)
-        self.proxy._selected_2d_list[1][2] = True
+        self.proxy.setSelection(pos=(2, 1), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
 
         assert self.proxy.isCellSelected(2, 1)
         assert not self.proxy.isCellSelected(1, 1)
@@ -388,9 +391,9 @@ class TestSelectionProxy:
     def test_iterate_selected_with_selections(self):
         """Test iterateSelected with some selections"""
         self.proxy.updateModel(cols=4, rows=3, flags=self.mock_flags_all)
-        self.proxy._selected_2d_list[0][1] = True
-        self.proxy._selected_2d_list[1][2] = True
-        self.proxy._selected_2d_list[2][3] = True
+        self.proxy.setSelection(pos=(1, 0), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
+        self.proxy.setSelection(pos=(2, 1), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
+        self.proxy.setSelection(pos=(3, 2), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
 
         selections = list(self.proxy.iterateSelected())
 
@@ -409,14 +412,14 @@ class TestSelectionProxy:
         """Test iterateSelectedByRows with selections across multiple rows"""
         self.proxy.updateModel(cols=4, rows=4, flags=self.mock_flags_all)
         # Row 0: select columns 1, 2
-        self.proxy._selected_2d_list[0][1] = True
-        self.proxy._selected_2d_list[0][2] = True
+        self.proxy.setSelection(pos=(1, 0), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
+        self.proxy.setSelection(pos=(2, 0), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
         # Row 1: no selections
         # Row 2: select column 0
-        self.proxy._selected_2d_list[2][0] = True
+        self.proxy.setSelection(pos=(0, 2), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
         # Row 3: select columns 1, 3
-        self.proxy._selected_2d_list[3][1] = True
-        self.proxy._selected_2d_list[3][3] = True
+        self.proxy.setSelection(pos=(1, 3), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
+        self.proxy.setSelection(pos=(3, 3), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
 
         selections = list(self.proxy.iterateSelectedByRows())
 
@@ -430,9 +433,9 @@ class TestSelectionProxy:
     def test_iterate_selected_by_rows_single_row_multiple_cols(self):
         """Test iterateSelectedByRows with single row, multiple columns"""
         self.proxy.updateModel(cols=5, rows=3, flags=self.mock_flags_all)
-        self.proxy._selected_2d_list[1][0] = True
-        self.proxy._selected_2d_list[1][2] = True
-        self.proxy._selected_2d_list[1][4] = True
+        self.proxy.setSelection(pos=(0, 1), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
+        self.proxy.setSelection(pos=(2, 1), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
+        self.proxy.setSelection(pos=(4, 1), size=(1, 1), flags=ttk.TTkK.TTkItemSelectionModel.Select)
 
         selections = list(self.proxy.iterateSelectedByRows())
 
@@ -523,7 +526,7 @@ class TestSelectionProxy:
         self.proxy.selectAll()
 
         # Nothing should be selected
-        assert not any(any(row) for row in self.proxy._selected_2d_list)
+        assert not any(any(row) for row in _matrix(self.proxy))
 
         # Test with selective flags
         def selective_flags(row, col):
@@ -538,9 +541,9 @@ class TestSelectionProxy:
         for row in range(4):
             for col in range(4):
                 if row % 2 == 0 and col % 2 == 0:
-                    assert self.proxy._selected_2d_list[row][col]
+                    assert _matrix(self.proxy)[row][col]
                 else:
-                    assert not self.proxy._selected_2d_list[row][col]
+                    assert not _matrix(self.proxy)[row][col]
 
     def test_selection_state_consistency(self):
         """Test that selection state remains consistent across operations"""
@@ -548,16 +551,94 @@ class TestSelectionProxy:
 
         # Perform various operations and check consistency
         self.proxy.selectRow(0)
-        initial_selected = sum(sum(row) for row in self.proxy._selected_2d_list)
+        initial_selected = sum(sum(row) for row in _matrix(self.proxy))
 
         self.proxy.selectColumn(1)
         # Should have added new selections
-        current_selected = sum(sum(row) for row in self.proxy._selected_2d_list)
+        current_selected = sum(sum(row) for row in _matrix(self.proxy))
         assert current_selected >= initial_selected
 
         self.proxy.clearSelection()
-        assert sum(sum(row) for row in self.proxy._selected_2d_list) == 0
+        assert sum(sum(row) for row in _matrix(self.proxy)) == 0
 
         # Verify dimensions remain correct
-        assert len(self.proxy._selected_2d_list) == 3
-        assert all(len(row) == 4 for row in self.proxy._selected_2d_list)
\ No newline at end of file
+        assert len(_matrix(self.proxy)) == 3
+        assert all(len(row) == 4 for row in _matrix(self.proxy))
+    def test_random_operations_reference(self):
+        """Test the selection against a reference 2d list implementation"""
+        import random
+        rnd = random.Random(1234)
+        cols, rows = 7, 9
+        Select = ttk.TTkK.TTkItemSelectionModel.Select
+        Clear = ttk.TTkK.TTkItemSelectionModel.Clear
+
+        for uniform, flags in ((False, self.mock_flags_some), (True, self.mock_flags_all)):
+            self.proxy.updateModel(cols=cols, rows=rows, flags=flags, uniformFlags=uniform)
+            ref = [[False]*cols for _ in range(rows)]
+            sel = lambda r,c: bool(flags(r,c) & ttk.TTkK.ItemFlag.ItemIsSelectable)
+            for _ in range(300):
+                op = rnd.randrange(6)
+                if op == 0:
+                    x,y = rnd.randrange(-1,cols),rnd.randrange(-1,rows)
+                    w,h = rnd.randrange(1,4),rnd.randrange(1,4)
+                    flag = rnd.choice((Select,Clear))
+                    self.proxy.setSelection(pos=(x,y), size=(w,h), flags=flag)
+                    for r in range(max(0,y),min(rows,y+h)):
+                        for c in range(max(0,x),min(cols,x+w)):
+                            ref[r][c] = flag==Select and sel(r,c)
+                elif op == 1:
+                    r = rnd.randrange(rows)
+                    self.proxy.selectRow(r)
+                    ref[r] = [sel(r,c) for c in range(cols)]
+                elif op == 2:
+                    c = rnd.randrange(cols)
+                    self.proxy.selectColumn(c)
+                    for r in range(rows): ref[r][c] = sel(r,c)
+                elif op == 3:
+                    r = rnd.randrange(rows)
+                    self.proxy.unselectRow(r)
+                    ref[r] = [False]*cols
+                elif op == 4:
+                    c = rnd.randrange(cols)
+                    self.proxy.unselectColumn(c)
+                    for r in range(rows): ref[r][c] = False
+                elif rnd.randrange(10) == 0:
+                    self.proxy.selectAll()
+                    ref = [[sel(r,c) for c in range(cols)] for r in range(rows)]
+
+                assert _matrix(self.proxy) == ref
+                assert list(self.proxy.iterateSelected()) == [(r,c) for r in range(rows) for c in range(cols) if ref[r][c]]
+                for r in range(rows):
+                    assert self.proxy.isRowSelected(r) == all(ref[r][c] for c in range(cols) if sel(r,c))
+                for c in range(cols):
+                    assert self.proxy.isColSelected(c) == all(ref[r][c] for r in range(rows) if sel(r,c))
+            # The consecutive rows with the same selection share the same band
+            assert all(a!=b for a,b in zip(self.proxy._bandCols,self.proxy._bandCols[1:]))
+
+    def test_large_table(self):
+        """Test that the selection does not scale with the table size"""
+        calls = []
+        def flags(row, col):
+            calls.append((row,col))
+            return ttk.TTkK.ItemFlag.ItemIsSelectable
+
+        self.proxy.updateModel(cols=20, rows=1000000, flags=flags, uniformFlags=True)
+        # The flags are evaluated once per column
+        assert len(calls) == 20
+
+        self.proxy.selectAll()
+        assert self.proxy.isRowSelected(500000)
+        assert self.proxy.isColSelected(10)
+        self.proxy.unselectColumn(10)
+        assert not self.proxy.isColSelected(10)
+        assert not self.proxy.isRowSelected(500000)
+        assert len(self.proxy._bandRows) == 1
+
+        self.proxy.clear()
+        self.proxy.selectRow(999999)
+        self.proxy.selectColumn(3)
+        assert len(self.proxy._bandRows) == 2
+        assert self.proxy.isCellSelected(3, 0)
+        assert self.proxy.isCellSelected(5, 999999)
+        assert not self.proxy.isCellSelected(5, 999998)
+        assert len(calls) == 20
@@ -689,4 +689,43 @@ def test_ttkalternatecolor_returns_base_copy_on_even_rows():
     even = base.mod(0, 0)
 
     assert even.fgToRGB() == (1, 2, 3)
-    assert even is not alt
\ No newline at end of file
+    assert even is not alt
+
+def test_ttkcolor_composed_colors_are_interned():
+    a = TTkColor.fg('#112233') + TTkColor.bg('#445566') + TTkColor.BOLD
+    b = TTkColor.fg('#112233') + TTkColor.bg('#445566') + TTkColor.BOLD
+
+    assert a is b
+    assert TTkColor.fg('#010203') is TTkColor.fg('#010203')
+    assert TTkColor.fgbg('#112233', '#445566').invertFgBg() is TTkColor.fgbg('#445566', '#112233')
+    assert (TTkColor.RST | a) is a
+    # Colors with a color modifier are stateful and never shared
+    grad = TTkColorGradient(increment=10)
+    assert TTkColor.fg('#010203', modifier=grad) is not TTkColor.fg('#010203', modifier=grad)
+
+
+def test_ttkcolor_copy_is_not_interned():
+    color = TTkColor.fg('#112233')
+    copy = color.copy()
+    copy._fg = (1, 1, 1)
+
+    assert copy is not color
+    assert color.fgToRGB() == (17, 34, 51)
+    assert TTkColor.fg('#112233').fgToRGB() == (17, 34, 51)
+
+
+def test_ttkcolor_cached_transitions_match_the_ansi_sequences():
+    from TermTk.TTkCore.TTkTerm.colors import TTkTermColor
+    fg = TTkColor.fg('#112233')
+    fgbg = TTkColor.fgbg('#112233', '#445566')
+    bold = fg + TTkColor.BOLD
+    link = TTkColor.fg('#112233', link='https://example.com')
+    for _ in range(2):
+        assert fg - TTkColor.RST == str(fg)
+        assert fg - fgbg == TTkTermColor.rgb2ansi(fg=(17, 34, 51), clean=True)
+        assert bold - fg == TTkTermColor.rgb2ansi(fg=(17, 34, 51), mod=TTkTermColor.BOLD, clean=True)
+        assert fg - bold == TTkTermColor.rgb2ansi(fg=(17, 34, 51), clean=True)
+        assert link - fg == TTkTermColor.rgb2ansi_link(fg=(17, 34, 51), link='https://example.com', clean=True)
+        assert fg - link == TTkTermColor.rgb2ansi_link(fg=(17, 34, 51), clean=True, cleanLink=True)
+    # Colors created outside the palette share the cached transition
+    assert TTkColor(fg=(17, 34, 51)) - fgbg == fg - fgbg
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(sys.path[0], '../../libs/pyTermTk'))
+
+from TermTk.TTkCore.TTkTerm.term import TTkTerm
+from TermTk.TTkCore.color import TTkColor
+from TermTk.TTkCore.color import TTkColorGradient
+from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.canvas import TTkCanvas
+from TermTk.TTkCore.canvas_array import TTkCanvasArray
+
+
+def _draw(canvas):
+    canvas.updateSize()
+    canvas.fill(pos=(2,1), size=(10,3), char='#', color=TTkColor.bg('#112233'))
+    canvas.drawText(pos=(1,0), text='Hello', color=TTkColor.RED)
+    canvas.drawText(pos=(3,5), text=TTkString('世界 wide', TTkColor.BOLD))
+    canvas.drawText(pos=(-2,6), text=TTkString('clipped', TTkColor.fg('#00FF00', modifier=TTkColorGradient(increment=10))))
+    canvas.drawBox(pos=(0,7), size=(12,3))
+    return canvas
+
+
+def _pixmap(cls, transparent):
+    pm = cls(width=6, height=3)
+    pm.updateSize()
+    pm.setTransparent(transparent)
+    pm.drawText(pos=(1,1), text='PM', color=TTkColor.BLUE)
+    return pm
+
+
+def _data(canvas):
+    if isinstance(canvas, TTkCanvasArray):
+        canvas = canvas.toCanvas()
+    return canvas._data, canvas._colors
+
+
+def test_canvas_array_draw_matches_list_canvas():
+    dl, cl = _data(_draw(TTkCanvas(width=20, height=12)))
+    da, ca = _data(_draw(TTkCanvasArray(width=20, height=12)))
+    assert da == dl
+    assert ca == cl
+
+
+@pytest.mark.parametrize('transparent', [False, True])
+@pytest.mark.parametrize('pmCls', [TTkCanvas, TTkCanvasArray])
+def test_canvas_array_paint_canvas_matches_list_canvas(pmCls, transparent):
+    cl = _draw(TTkCanvas(width=20, height=12))
+    ca = _draw(TTkCanvasArray(width=20, height=12))
+    for x,y in ((0,0),(4,5),(17,10),(-3,-1)):
+        geom = (x,y,6,3)
+        cl.paintCanvas(_pixmap(TTkCanvas, transparent), geom, (0,0,6,3), (0,0,20,12))
+        ca.paintCanvas(_pixmap(pmCls,     transparent), geom, (0,0,6,3), (0,0,20,12))
+    assert _data(ca) == _data(cl)
+
+
+def test_canvas_array_clean_reuse_rows():
+    ca = _draw(TTkCanvasArray(width=20, height=12))
+    rows = list(ca._data)
+    ca.clean()
+    assert all(a is b for a,b in zip(rows, ca._data))
+    assert _data(ca) == _data(TTkCanvas(width=20, height=12))
+
+
+def test_canvas_array_push_matches_list_canvas(monkeypatch):
+    outputs = []
+    for cls in (TTkCanvas, TTkCanvasArray):
+        out = []
+        monkeypatch.setattr(TTkTerm, 'push', lambda *args: out.append(str(*args)), raising=False)
+        canvas = cls(width=20, height=12)
+        canvas.updateSize()
+        canvas.enableDoubleBuffer()
+        _draw(canvas)
+        canvas.pushToTerminalBuffered(0,0,20,12)
+        # Second frame, nothing changed but a single cell
+        canvas.clean()
+        _draw(canvas)
+        canvas.drawText(pos=(10,10), text='X')
+        canvas.pushToTerminalBuffered(0,0,20,12)
+        outputs.append(out)
+    assert outputs[0] == outputs[1]
+
+
+def test_canvas_array_compact_interned_tables(monkeypatch):
+    from TermTk.TTkCore import canvas_array
+    monkeypatch.setattr(canvas_array._glyphs, 'limit', 0x100)
+    monkeypatch.setattr(canvas_array._colors, 'limit', 0x100)
+    monkeypatch.setattr(canvas_array._TTkGlyphs, '_maxGlyphs', 0x100)
+    monkeypatch.setattr(canvas_array._TTkColors, '_maxColors', 0x100)
+    outputs = []
+    for cls in (TTkCanvas, TTkCanvasArray):
+        out = []
+        monkeypatch.setattr(TTkTerm, 'push', lambda *args: out.append(str(*args)), raising=False)
+        canvas = cls(width=20, height=12)
+        canvas.updateSize()
+        canvas.enableDoubleBuffer()
+        pixmap = _draw(cls(width=20, height=12))
+        for i in range(0x200):
+            # Unique glyphs and colors drawn and overwritten at each frame
+            canvas.clean()
+            canvas.paintCanvas(pixmap, (0,0,20,12), (0,0,20,12), (0,0,20,12))
+            canvas.drawText(pos=(i%15,11), text=chr(0x4e00+i)+chr(0x100+i), color=TTkColor.fg(f'#{i:06x}'))
+            canvas.pushToTerminalBuffered(0,0,20,12)
+        outputs.append((out, _data(canvas), _data(pixmap)))
+    assert outputs[0] == outputs[1]
+    assert len(canvas_array._glyphs.table) <= 0x200
+    assert len(canvas_array._colors.table) <= 0x200
+    # The reserved ids are preserved
+    assert canvas_array._glyphs.table[:3] == [None, '', ' ']
+    assert canvas_array._colors.table[canvas_array._RST] == TTkColor.RST
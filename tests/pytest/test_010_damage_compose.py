@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import os
+import sys
+import random
+
+import pytest
+
+sys.path.append(os.path.join(sys.path[0], '../../libs/pyTermTk'))
+import TermTk as ttk
+
+from TermTk.TTkCore.helper import TTkHelper
+
+
+def _allWidgets(widget):
+    yield widget
+    if isinstance(widget, ttk.TTkContainer):
+        for child in widget.rootLayout().iterWidgets(onlyVisible=False, recurse=True):
+            yield from _allWidgets(child)
+
+
+def _snapshot(root):
+    canvas = root.getCanvas()
+    if isinstance(canvas, ttk.TTkCanvasArray):
+        canvas = canvas.toCanvas()
+    return ([list(r) for r in canvas._data],
+            [[str(c) for c in r] for r in canvas._colors])
+
+
+@pytest.mark.parametrize('compactCanvas', [False, True])
+def test_damage_compose_matches_full_repaint(compactCanvas, monkeypatch):
+    '''
+        Update/move/raise/resize/scroll random widgets in a
+        splitter/window hierarchy and compare the damaged rows compositing
+        with a full repaint of all the widgets
+    '''
+    monkeypatch.setattr(ttk.TTkCfg, 'compactCanvas', compactCanvas)
+    monkeypatch.setattr(ttk.TTkCfg, 'damageCompose', True)
+    TTkHelper._updateWidget.clear()
+    TTkHelper._updateBuffer.clear()
+    random.seed(1234)
+
+    root = ttk.TTk(layout=ttk.TTkGridLayout())
+    splitter = ttk.TTkSplitter(parent=root)
+    left = ttk.TTkFrame(parent=splitter, title='Left', border=True, layout=ttk.TTkVBoxLayout())
+    right = ttk.TTkContainer(parent=splitter)
+    labels = [ttk.TTkLabel(parent=left, text=f"Label {i} 世界") for i in range(4)]
+    scrollArea = ttk.TTkScrollArea(parent=left)
+    scrollArea.viewport().setLayout(ttk.TTkVBoxLayout())
+    buttons = [ttk.TTkButton(parent=scrollArea.viewport(), text=f"Button {i}", border=True, minHeight=3) for i in range(8)]
+    windows = []
+    for i in range(3):
+        win = ttk.TTkWindow(parent=right, pos=(i*5,i*3), size=(30,12), title=f"Win {i}", layout=ttk.TTkVBoxLayout())
+        labels.append(ttk.TTkLabel(parent=win, text=f"Clock {i}"))
+        ttk.TTkTextEdit(parent=win).setText("Hello 世界 "*20)
+        windows.append(win)
+    root.show()
+    root.setGeometry(0,0,100,30)
+    TTkHelper.paintAll()
+
+    rootCanvas = root.getCanvas()
+    for step in range(120):
+        op = step % 6
+        if   op == 0: random.choice(labels).setText(f"t{step} "+random.choice(['x','世界','abc'*3]))
+        elif op == 1: random.choice(windows).move(random.randint(-5,70), random.randint(-3,25))
+        elif op == 2:
+            win = random.choice(windows)
+            win.raiseWidget()
+            win.update()
+        elif op == 3: random.choice(windows).resize(random.randint(10,40), random.randint(5,15))
+        elif op == 4: scrollArea.viewport().viewMoveTo(0, random.randint(0,15))
+        elif op == 5: random.choice(buttons).setText(f"b{step}")
+        TTkHelper.paintAll()
+        # The terminal buffer must be aligned with the composed canvas
+        assert rootCanvas._data   == rootCanvas._bufferedData
+        assert rootCanvas._colors == rootCanvas._bufferedColors
+        if step % 5: continue
+        damaged = _snapshot(root)
+        for widget in _allWidgets(root):
+            widget.update()
+        TTkHelper.paintAll()
+        assert damaged == _snapshot(root)
+    TTkHelper._updateWidget.clear()
+    TTkHelper._updateBuffer.clear()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import os
+import sys
+import random
+
+sys.path.append(os.path.join(sys.path[0], '../../libs/pyTermTk'))
+import TermTk as ttk
+
+from TermTk.TTkCore.helper import TTkHelper
+
+
+def _visibleAndParent(widget):
+    if isinstance(widget, ttk.TTk):
+        return widget.isVisible()
+    while widget is not None:
+        if not widget.isVisible():
+            return False
+        if isinstance(widget, ttk.TTk):
+            return True
+        widget = widget.parentWidget()
+    return False
+
+
+def test_widget_visibility_cache():
+    '''
+        Show/hide/reparent/close random widgets and check that the
+        cached visibility always matches the parent chain
+    '''
+    TTkHelper._updateWidget.clear()
+    TTkHelper._updateBuffer.clear()
+    random.seed(2468)
+    root = ttk.TTk(layout=ttk.TTkVBoxLayout())
+    containers = [root]
+    widgets = []
+    for i in range(40):
+        parent = random.choice(containers)
+        if random.random() < 0.5:
+            w = ttk.TTkFrame(parent=parent, layout=ttk.TTkVBoxLayout())
+            containers.append(w)
+        else:
+            w = ttk.TTkLabel(parent=parent, text=f"Label {i}")
+        widgets.append(w)
+    root.show()
+
+    for w in widgets+[root]:
+        assert w.isVisibleAndParent() == _visibleAndParent(w)
+
+    for _ in range(300):
+        w = random.choice(widgets)
+        op = random.random()
+        if op < 0.3:
+            w.hide()
+        elif op < 0.6:
+            w.show()
+        elif op < 0.65:
+            w.close()
+        else:
+            parent = random.choice(containers)
+            if parent is w or (isinstance(w, ttk.TTkContainer) and TTkHelper.isParent(parent, w)):
+                continue
+            if (_p := w.parentWidget()) is not None:
+                _p.layout().removeWidget(w)
+            parent.layout().addWidget(w)
+        for c in widgets+[root]:
+            assert c.isVisibleAndParent() == _visibleAndParent(c)
+
+    TTkHelper._updateWidget.clear()
+    TTkHelper._updateBuffer.clear()
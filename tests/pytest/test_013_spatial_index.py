@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import os
+import sys
+import random
+
+import pytest
+
+sys.path.append(os.path.join(sys.path[0], '../../libs/pyTermTk'))
+import TermTk as ttk
+
+from TermTk.TTkCore.helper import TTkHelper
+
+
+def _widgetsAt(w, h, monkeypatch, spatialIndex):
+    monkeypatch.setattr(ttk.TTkCfg, 'spatialIndex', spatialIndex)
+    return [[TTkHelper.widgetAt(x,y) for x in range(w)] for y in range(h)]
+
+
+def test_spatial_index_widget_at(monkeypatch):
+    '''
+        Move/resize/raise/hide/add/remove random windows
+        and compare the hit-testing with and without the spatial index
+    '''
+    TTkHelper._updateWidget.clear()
+    TTkHelper._updateBuffer.clear()
+    random.seed(1357)
+    W,H = 100,40
+
+    root = ttk.TTk(layout=ttk.TTkGridLayout())
+    frame = ttk.TTkFrame(parent=root, border=True, layout=ttk.TTkLayout())
+    windows = []
+    def _newWindow(i):
+        win = ttk.TTkWindow(
+                pos=(random.randint(-5,W),random.randint(-5,H)),
+                size=(random.randint(1,30),random.randint(1,12)),
+                title=f"Win {i}", layout=ttk.TTkGridLayout())
+        ttk.TTkButton(parent=win, text=f"Button {i}")
+        frame.layout().addWidget(win)
+        windows.append(win)
+    for i in range(60):
+        _newWindow(i)
+    root.show()
+    root.setGeometry(0,0,W,H)
+
+    assert len(frame.layout().zSortedItems) >= ttk.TTkLayout.SPATIAL_INDEX_MIN_ITEMS
+    assert _widgetsAt(W, H, monkeypatch, True) == _widgetsAt(W, H, monkeypatch, False)
+
+    for i in range(30):
+        win = random.choice(windows)
+        op = random.random()
+        if op < 0.3:
+            win.move(random.randint(-5,W),random.randint(-5,H))
+        elif op < 0.5:
+            win.resize(random.randint(1,30),random.randint(1,12))
+        elif op < 0.7:
+            win.raiseWidget()
+        elif op < 0.8:
+            win.setVisible(not win.isVisible())
+        elif op < 0.9:
+            windows.remove(win)
+            win.close()
+        else:
+            _newWindow(100+i)
+        assert _widgetsAt(W, H, monkeypatch, True) == _widgetsAt(W, H, monkeypatch, False)
+
+    TTkHelper._updateWidget.clear()
+    TTkHelper._updateBuffer.clear()
+
+
+def test_spatial_index_mouse_event(monkeypatch):
+    '''
+        The mouse events are routed through the spatial index
+        to the same widget as the linear scan
+    '''
+    TTkHelper._updateWidget.clear()
+    TTkHelper._updateBuffer.clear()
+    random.seed(2468)
+    W,H = 80,30
+
+    root = ttk.TTk(layout=ttk.TTkLayout())
+    clicked = []
+    for i in range(50):
+        btn = ttk.TTkButton(parent=root, text=f"{i}",
+                pos=(random.randint(0,W),random.randint(0,H)),
+                size=(random.randint(1,10),random.randint(1,4)))
+        btn.clicked.connect(lambda i=i: clicked.append(i))
+    root.show()
+    root.setGeometry(0,0,W,H)
+
+    for spatialIndex in (True, False):
+        monkeypatch.setattr(ttk.TTkCfg, 'spatialIndex', spatialIndex)
+        for y in range(H):
+            for x in range(W):
+                for key in (ttk.TTkK.Press, ttk.TTkK.Release):
+                    root.mouseEvent(ttk.TTkMouseEvent(x, y, ttk.TTkK.LeftButton, key, ttk.TTkK.NoModifier, 1, ''))
+        clicked.append(None)
+
+    linear = clicked[clicked.index(None)+1:-1]
+    indexed = clicked[:clicked.index(None)]
+    assert indexed
+    assert indexed == linear
+
+    TTkHelper._updateWidget.clear()
+    TTkHelper._updateBuffer.clear()
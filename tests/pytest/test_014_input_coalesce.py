@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import os
+import sys
+import queue
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(sys.path[0], '../../libs/pyTermTk'))
+import TermTk as ttk
+
+# The TTkInput used by the TTk app is mocked in conftest.py
+from TermTk.TTkCore.TTkTerm.input_thread import TTkInput
+
+K = ttk.TTkK
+
+def _mouse(x, y, key, evt, mod=K.NoModifier):
+    return None, ttk.TTkMouseEvent(x, y, key, evt, mod, 0, ''), None
+
+def _key(key):
+    return ttk.TTkKeyEvent(K.Character, key, key, K.NoModifier), None, None
+
+def _run(events, monkeypatch, mouseRate=0):
+    monkeypatch.setattr(ttk.TTkCfg, 'mouseRate', mouseRate)
+    monkeypatch.setattr(TTkInput, '_inputThread', threading.Thread(target=lambda:None))
+    monkeypatch.setattr(TTkInput, '_inputQueue', queue.Queue())
+    for evt in events:
+        TTkInput._inputQueue.put(evt)
+    TTkInput._inputQueue.put(None)
+    ret = []
+    def _collect(kevt, mevt):
+        ret.append((kevt.key if kevt else None, (mevt.x, mevt.y, mevt.key, mevt.evt, mevt.delta) if mevt else None))
+    TTkInput.inputEvent.connect(_collect)
+    try:
+        TTkInput.start()
+    finally:
+        TTkInput.inputEvent.disconnect(_collect)
+    return ret
+
+def test_coalesce_move_drag(monkeypatch):
+    events = (
+        [_mouse(i, i, K.NoButton, K.Move) for i in range(10)] +
+        [_mouse(5, 5, K.LeftButton, K.Press)] +
+        [_mouse(i, 2*i, K.LeftButton, K.Drag) for i in range(10)] +
+        [_mouse(9, 9, K.LeftButton, K.Release)] +
+        [_mouse(i, i, K.NoButton, K.Move) for i in range(5)] +
+        [_mouse(i, i, K.NoButton, K.Move, K.ShiftModifier) for i in range(5)] +
+        [_key('a')] )
+    assert _run(events, monkeypatch) == [
+        (None, (9, 9,  K.NoButton,   K.Move,    1)),
+        (None, (5, 5,  K.LeftButton, K.Press,   1)),
+        (None, (9, 18, K.LeftButton, K.Drag,    1)),
+        (None, (9, 9,  K.LeftButton, K.Release, 1)),
+        (None, (4, 4,  K.NoButton,   K.Move,    1)),
+        (None, (4, 4,  K.NoButton,   K.Move,    1)),
+        ('a',  None)]
+
+def test_coalesce_wheel(monkeypatch):
+    events = (
+        [_mouse(3, 4, K.Wheel, K.WHEEL_Up)   for _ in range(7)] +
+        [_mouse(3, 4, K.Wheel, K.WHEEL_Down) for _ in range(3)] +
+        [_key('b')] +
+        [_mouse(3, 4, K.Wheel, K.WHEEL_Down) for _ in range(2)] )
+    assert _run(events, monkeypatch) == [
+        (None, (3, 4, K.Wheel, K.WHEEL_Up,   7)),
+        (None, (3, 4, K.Wheel, K.WHEEL_Down, 3)),
+        ('b',  None),
+        (None, (3, 4, K.Wheel, K.WHEEL_Down, 2))]
+
+def test_coalesce_rate(monkeypatch):
+    '''
+        With a low mouse rate, the events generated while waiting
+        are merged in the pending one
+    '''
+    monkeypatch.setattr(ttk.TTkCfg, 'mouseRate', 10)
+    monkeypatch.setattr(TTkInput, '_inputThread', threading.Thread(target=lambda:None))
+    monkeypatch.setattr(TTkInput, '_inputQueue', queue.Queue())
+    ret = []
+    def _collect(kevt, mevt):
+        ret.append(mevt.delta)
+    def _producer():
+        for _ in range(20):
+            TTkInput._inputQueue.put(_mouse(0, 0, K.Wheel, K.WHEEL_Up))
+            threading.Event().wait(0.01)
+        TTkInput._inputQueue.put(None)
+    TTkInput.inputEvent.connect(_collect)
+    try:
+        producer = threading.Thread(target=_producer)
+        producer.start()
+        TTkInput.start()
+        producer.join()
+    finally:
+        TTkInput.inputEvent.disconnect(_collect)
+    assert sum(ret) == 20
+    assert len(ret) < 10
+
+@pytest.mark.parametrize('coalescing,handled,expected,ret', [
+    (True,  True,  [3],       True),
+    (False, True,  [1, 1, 1], True),
+    (False, False, [1],       False)])
+def test_widget_wheel_coalescing(coalescing, handled, expected, ret):
+    deltas = []
+    class _Widget(ttk.TTkWidget):
+        def wheelEvent(self, evt):
+            deltas.append(evt.delta)
+            return handled
+    widget = _Widget(size=(10, 5))
+    assert widget.wheelCoalescing() is True
+    widget.setWheelCoalescing(coalescing)
+    assert widget.wheelCoalescing() is coalescing
+    evt = ttk.TTkMouseEvent(1, 1, K.Wheel, K.WHEEL_Up, K.NoModifier, 0, '', 3)
+    assert widget.mouseEvent(evt) is ret
+    assert deltas == expected
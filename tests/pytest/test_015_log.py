@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import os
+import sys
+import subprocess
+
+import pytest
+
+sys.path.append(os.path.join(sys.path[0], '../../libs/pyTermTk'))
+import TermTk as ttk
+
+from TermTk.TTkCore.log import TTkLog
+
+
+@pytest.fixture
+def messages(monkeypatch):
+    '''Install a message handler only for the test'''
+    ret = []
+    monkeypatch.setattr(TTkLog, '_messageHandler', [])
+    monkeypatch.setattr(TTkLog, '_level', TTkLog.DebugMsg)
+    TTkLog.installMessageHandler(lambda mode, context, message: ret.append((mode, context, message)))
+    yield ret
+    monkeypatch.undo()
+    TTkLog._updateEnabled()
+
+
+def test_log_no_handlers(monkeypatch):
+    monkeypatch.setattr(TTkLog, '_messageHandler', [])
+    TTkLog._updateEnabled()
+    assert TTkLog._enabled == 0
+    class _Msg():
+        def __str__(self):
+            raise Exception("The message should not be processed")
+    TTkLog.debug(_Msg())
+    TTkLog.fatal(_Msg())
+    monkeypatch.undo()
+    TTkLog._updateEnabled()
+
+
+def test_log_context(messages):
+    TTkLog.info("Line 1\nLine 2") ; line = sys._getframe().f_lineno
+    TTkLog.error(1234)
+    assert [(m[0], m[2]) for m in messages] == [
+        (TTkLog.InfoMsg,  "Line 1"),
+        (TTkLog.InfoMsg,  "Line 2"),
+        (TTkLog.ErrorMsg, "1234")]
+    ctx = messages[0][1]
+    assert ctx.file == __file__
+    assert ctx.line == line
+    assert ctx.function == 'test_log_context'
+    assert str(ctx) == f"{__file__}:{line} [test_log_context]"
+
+
+def test_log_level(messages):
+    TTkLog.setLevel(TTkLog.WarningMsg)
+    assert TTkLog.level() == TTkLog.WarningMsg
+    TTkLog.debug("debug")
+    TTkLog.info("info")
+    TTkLog.warn("warn")
+    TTkLog.error("error")
+    TTkLog.critical("critical")
+    TTkLog.fatal("fatal")
+    assert [m[2] for m in messages] == ["warn", "error", "critical", "fatal"]
+    with pytest.raises(ValueError):
+        TTkLog.setLevel(0x1234)
+
+
+def test_log_background_file(tmp_path):
+    logFile = tmp_path / 'session.log'
+    subprocess.run([sys.executable, '-c', (
+            "import TermTk as ttk\n"
+            f"ttk.TTkLog.use_default_file_logging({str(logFile)!r}, background=True)\n"
+            "for i in range(100): ttk.TTkLog.debug(f'Message {i}')\n")],
+        env={**os.environ, 'PYTHONPATH':os.path.join(os.path.dirname(__file__),'../../libs/pyTermTk')},
+        check=True)
+    lines = logFile.read_text().splitlines()
+    assert len(lines) == 100
+    assert lines[-1].startswith('DEBUG:(MainThread')
+    assert lines[-1].endswith(':3 Message 99')
+
+
+def test_log_background_file_repeated(tmp_path):
+    logFiles = [tmp_path / f'session{i}.log' for i in range(3)]
+    subprocess.run([sys.executable, '-c', (
+            "import threading, logging\n"
+            "import TermTk as ttk\n"
+            f"for f in {[str(f) for f in logFiles[:2]]!r}:\n"
+            "    ttk.TTkLog._messageHandler.clear()\n"
+            "    ttk.TTkLog.use_default_file_logging(f, background=True)\n"
+            "    ttk.TTkLog.debug(f'Message {f}')\n"
+            # Only the last listener is running
+            "assert len(logging.getLogger().handlers) == 1\n"
+            "assert sum(t.name.startswith('Thread') for t in threading.enumerate()) == 1\n"
+            # The root logger is configured by someone else, no listener is started
+            "ttk.TTkLog._stopQueueListener()\n"
+            "logging.getLogger().addHandler(logging.NullHandler())\n"
+            f"ttk.TTkLog.use_default_file_logging({str(logFiles[2])!r}, background=True)\n"
+            "assert ttk.TTkLog._queueListener is None\n"
+            "assert threading.active_count() == 1\n")],
+        env={**os.environ, 'PYTHONPATH':os.path.join(os.path.dirname(__file__),'../../libs/pyTermTk')},
+        check=True)
+    assert [f.read_text().count('Message') for f in logFiles[:2]] == [1, 1]
+    assert not logFiles[2].exists()
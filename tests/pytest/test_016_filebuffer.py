@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import io
+import os
+import re
+import sys
+import time
+import random
+import threading
+from array import array
+
+import pytest
+
+sys.path.append(os.path.join(sys.path[0], '../../libs/pyTermTk'))
+import TermTk as ttk
+from TermTk.TTkCore import filebuffer
+
+
+def _fileBuffer(path, content:bytes, window=16, numWindows=4, fbClass=ttk.TTkFileBuffer):
+    with open(path, 'wb') as f:
+        f.write(content)
+    fb = fbClass(str(path), window, numWindows)
+    # Wait for the indexing thread
+    for thread in threading.enumerate():
+        if thread.name == 'TTkFileBuffer':
+            thread.join()
+    return fb
+
+def _refLines(content:bytes):
+    # The lines as returned by the text mode readline
+    lines = content.decode(errors='replace').split('\n')
+    return [l+'\n' for l in lines[:-1]] + [lines[-1]]
+
+class _SmallChunks(ttk.TTkFileBuffer):
+    CHUNK_SIZE = 37
+
+@pytest.mark.parametrize('content', [
+    b"one\ntwo\nthree",
+    b"a\r\nbb\r\nccc\r\n",
+    b"\n\n\n",
+    b"single line no newline",
+    "àèì\n€€€ ok\n😀\n".encode(),
+    b"ab\xff\xfe\ncd\x80\n",
+])
+@pytest.mark.parametrize('fbClass', [ttk.TTkFileBuffer, _SmallChunks])
+def test_lines(tmp_path, content, fbClass):
+    fb = _fileBuffer(tmp_path/'test.log', content, fbClass=fbClass)
+    ref = _refLines(content)
+    assert fb.getLen() == len(ref)
+    for i,line in enumerate(ref):
+        assert fb.getLineDirect(i) == line
+        assert fb.getLine(i) == line.replace('\r','')
+    assert fb.getLine(len(ref)) == ''
+    assert fb.getLineDirect(len(ref)+10) == ''
+    # The width is the longest terminated line in bytes, new line included
+    assert fb.getWidth() == max((len(l)+1 for l in content.split(b'\n')[:-1]), default=0)
+
+def test_empty_file(tmp_path):
+    fb = _fileBuffer(tmp_path/'empty.log', b"")
+    assert fb.getLen() == 1
+    assert fb.getWidth() == 0
+    assert fb.getLine(0) == ''
+    assert fb.getLineDirect(0) == ''
+
+def test_pages(tmp_path):
+    random.seed(1)
+    content = b''.join(b"x"*random.randint(0,80)+b"\n" for _ in range(2000)) + b"tail"
+    fb = _fileBuffer(tmp_path/'pages.log', content, window=16, numWindows=4, fbClass=_SmallChunks)
+    ref = _refLines(content)
+    assert fb.getLen() == 2001
+    # Random access through the pages cache
+    for i in [random.randint(0,2000) for _ in range(500)] + list(range(2001)):
+        assert fb.getLine(i) == ref[i]
+    assert sum(p is not None for p in fb._pages) <= 4
+    assert fb.getSlice(1990, 20) == ref[1990:] + ['']*9
+
+def test_not_indexed_page(tmp_path):
+    content = b''.join(f"line {i}\n".encode() for i in range(100))
+    fb = _fileBuffer(tmp_path/'partial.log', content)
+    # Simulate a partial index, the page is read up to its last line
+    with fb._indexesMutex:
+        del fb._indexes[10:]
+    assert fb.getLen() == 10
+    assert fb.getLine(3) == 'line 3\n'
+    assert fb.getLine(9) == 'line 9\n'
+    assert fb._pages[0].buffer == [f"line {i}\n" for i in range(16)]
+
+def _waitFor(check, timeout=5):
+    for _ in range(int(timeout/0.01)):
+        if check():
+            return True
+        time.sleep(0.01)
+    return False
+
+def _readAll(fb):
+    return [fb.getLine(i) for i in range(fb.getLen())]
+
+def test_follow_append(tmp_path):
+    path = tmp_path/'follow.log'
+    fb = _fileBuffer(path, b"one\ntwo\nthr")
+    indexed = []
+    fb.indexed.connect(lambda : indexed.append(fb.getLen()))
+    # Cache the page with the incomplete last line
+    assert _readAll(fb) == ['one\n', 'two\n', 'thr']
+    fb.setFollow(True, interval=0.01)
+    assert fb.follow()
+    with open(path, 'ab') as f:
+        f.write(b"ee\nfour\n")
+    assert _waitFor(lambda : fb.getLen() == 5)
+    assert _readAll(fb) == ['one\n', 'two\n', 'three\n', 'four\n', '']
+    assert fb.getWidth() == 6
+    assert _waitFor(lambda : indexed)
+    with open(path, 'ab') as f:
+        f.writelines(f"line {i}\n".encode() for i in range(1000))
+    assert _waitFor(lambda : fb.getLen() == 1005)
+    assert fb.getLine(1003) == 'line 999\n'
+    assert fb.getLine(500) == 'line 496\n'
+    fb.setFollow(False)
+    assert not fb.follow()
+    with open(path, 'ab') as f:
+        f.write(b"ignored\n")
+    time.sleep(0.1)
+    assert fb.getLen() == 1005
+
+def test_follow_empty(tmp_path):
+    path = tmp_path/'empty.log'
+    fb = _fileBuffer(path, b"")
+    fb.setFollow(True, interval=0.01)
+    with open(path, 'ab') as f:
+        f.write(b"first\n")
+    assert _waitFor(lambda : fb.getLen() == 2)
+    assert _readAll(fb) == ['first\n', '']
+    fb.setFollow(False)
+
+def test_follow_truncate(tmp_path):
+    path = tmp_path/'truncate.log'
+    fb = _fileBuffer(path, b''.join(f"line {i}\n".encode() for i in range(100)))
+    assert fb.getLine(99) == 'line 99\n'
+    fb.setFollow(True, interval=0.01)
+    with open(path, 'wb') as f:
+        f.write(b"new\n")
+    assert _waitFor(lambda : fb.getLen() == 2)
+    assert _readAll(fb) == ['new\n', '']
+    assert fb.getWidth() == 4
+    fb.setFollow(False)
+
+def test_follow_rotate(tmp_path):
+    path = tmp_path/'rotate.log'
+    fb = _fileBuffer(path, b"old 1\nold 2\n")
+    assert fb.getLine(1) == 'old 2\n'
+    fb.setFollow(True, interval=0.01)
+    os.rename(path, tmp_path/'rotate.log.1')
+    time.sleep(0.05)
+    with open(tmp_path/'rotate.tmp', 'wb') as f:
+        f.write(b"rotated 1\nrotated 2\nrotated 3\n")
+    os.rename(tmp_path/'rotate.tmp', path)
+    assert _waitFor(lambda : fb.getLen() == 4)
+    assert _readAll(fb) == ['rotated 1\n', 'rotated 2\n', 'rotated 3\n', '']
+    fb.setFollow(False)
+
+def _refSearch(content:bytes, regex, ignoreCase=False):
+    # The line by line search on the text file
+    rr = re.compile(regex, re.IGNORECASE if ignoreCase else 0)
+    return [i for i,line in enumerate(io.StringIO(content.decode(errors='replace'), newline='\n')) if rr.search(line)]
+
+class _SmallSearchChunks(ttk.TTkFileBuffer):
+    SEARCH_CHUNK_SIZE = 500
+
+_rand = random.Random(16)
+_searchContent = b''.join(
+    b"%05d %s %s%s\n" % (i, _rand.choice([b'INFO',b'WARN',b'error']), b'x'*_rand.randint(0,40), _rand.choice([b'',b'\r',b'  ']))
+    for i in range(2000)) + "àèì € ok\n\nno new line".encode()
+
+@pytest.mark.parametrize('regex', [
+    '', '^$', '$', 'error', 'x{30}', r'\r$', r'^\d+5 ', r'x\n', r'\s+$', 'à', r'\w €', 'line$', 'warn|info',
+    r'(?<=\n)', r'\Ax', r'\B', r'(?s)x.+',
+    # Valid only as str patterns
+    r'\u0078{30}', r'\N{LATIN SMALL LETTER E}rror', r'\U000000e0'])
+@pytest.mark.parametrize('ignoreCase', [False, True])
+@pytest.mark.parametrize('fbClass', [ttk.TTkFileBuffer, _SmallSearchChunks])
+def test_search(tmp_path, monkeypatch, regex, ignoreCase, fbClass):
+    # Sample both the search strategies in the small chunks
+    monkeypatch.setattr(filebuffer, '_SEARCH_SAMPLE_SIZE', 100)
+    fb = _fileBuffer(tmp_path/'search.log', _searchContent, fbClass=fbClass)
+    ref = _refSearch(_searchContent, regex, ignoreCase)
+    assert fb.searchRe(regex, ignoreCase) == ref
+    # Cached
+    assert fb.searchRe(regex, ignoreCase) == ref
+
+def test_search_invalid(tmp_path):
+    fb = _fileBuffer(tmp_path/'search.log', b"abc\n")
+    with pytest.raises(re.error):
+        fb.searchRe('(')
+    with pytest.raises(re.error):
+        fb.searchReAsync('(')
+
+class _ProcessSearch(_SmallSearchChunks):
+    SEARCH_PROCESSES = True
+
+@pytest.mark.parametrize('fbClass', [_SmallSearchChunks, _ProcessSearch])
+def test_search_async(tmp_path, fbClass):
+    fb = _fileBuffer(tmp_path/'search.log', _searchContent, fbClass=fbClass)
+    results = []
+    fb.searchUpdated.connect(lambda indexes, progress : results.append((indexes, progress)))
+    fb.searchReAsync('error')
+    assert _waitFor(lambda : results and results[-1][1] == 1.0)
+    assert results[-1][0] == _refSearch(_searchContent, 'error')
+    # The partial results are the beginning of the final one
+    for indexes, _ in results:
+        assert indexes == results[-1][0][:len(indexes)]
+
+class _FailingSearch(ttk.TTkFileBuffer):
+    def _search(self, regex, ignoreCase, cancel, callback):
+        raise MemoryError()
+
+def test_search_async_failure(tmp_path):
+    fb = _fileBuffer(tmp_path/'search.log', b"abc\n", fbClass=_FailingSearch)
+    results = []
+    fb.searchUpdated.connect(lambda indexes, progress : results.append((indexes, progress)))
+    fb.searchReAsync('abc')
+    # The search is completed without results
+    assert _waitFor(lambda : results)
+    assert results == [([], 1.0)]
+
+def test_search_cancel(tmp_path):
+    fb = _fileBuffer(tmp_path/'search.log', _searchContent, fbClass=_SmallSearchChunks)
+    cancel = threading.Event()
+    cancel.set()
+    assert fb._search('error', False, cancel, None) is None
+    # A canceled search is not cached
+    assert not fb._searchCache
+    results = []
+    fb.searchUpdated.connect(lambda indexes, progress : results.append((indexes, progress)))
+    fb.searchReAsync('INFO')
+    fb.searchReAsync('WARN')
+    assert _waitFor(lambda : results and results[-1][1] == 1.0)
+    time.sleep(0.1)
+    assert results[-1][0] == _refSearch(_searchContent, 'WARN')
+    assert all(progress < 1.0 for _, progress in results[:-1])
+
+def test_search_cache_follow(tmp_path):
+    path = tmp_path/'search.log'
+    fb = _fileBuffer(path, b"error 1\nok\nerror 2", fbClass=_SmallSearchChunks)
+    assert fb.searchRe('error') == [0, 2]
+    # The last line is not terminated and it is not cached
+    assert fb._searchCache[('error', 0)] == (0, 2, array('Q', [0]))
+    fb.setFollow(True, interval=0.01)
+    with open(path, 'ab') as f:
+        f.write(b"\nok\nerror 3\n")
+    assert _waitFor(lambda : fb.getLen() == 6)
+    assert fb.searchRe('error') == [0, 2, 4]
+    assert fb._searchCache[('error', 0)] == (0, 5, array('Q', [0, 2, 4]))
+    # Truncating the file invalidates the cache
+    with open(path, 'wb') as f:
+        f.write(b"error\n")
+    assert _waitFor(lambda : fb.getLen() == 2)
+    assert not fb._searchCache
+    assert fb.searchRe('error') == [0]
+    fb.setFollow(False)
+
+class _SlowIndex(_SmallSearchChunks):
+    CHUNK_SIZE = 1000
+    def _index(self, mm, start):
+        self.indexUpdated.connect(lambda _: time.sleep(0.01))
+        super()._index(mm, start)
+
+def test_search_while_indexing(tmp_path):
+    path = tmp_path/'search.log'
+    with open(path, 'wb') as f:
+        f.write(_searchContent)
+    fb = _SlowIndex(str(path), 16, 4)
+    assert fb._indexThread.is_alive()
+    # The lines indexed while searching are searched as well
+    assert fb.searchRe('error') == _refSearch(_searchContent, 'error')
+    assert not fb._indexThread.is_alive()
+    assert fb._searchCache[('error', 0)][1] == fb.getLen()-1
+
+class _RotatedWhileSearching(_SmallSearchChunks):
+    def _searchChunks(self, fromLine):
+        ret = super()._searchChunks(fromLine)
+        if not self._indexGen:
+            with open(self._filename, 'wb') as f:
+                f.write(b"ok\nerror\n")
+            self._updateIndex()
+        return ret
+
+def test_search_rotated_while_searching(tmp_path):
+    fb = _fileBuffer(tmp_path/'search.log', _searchContent, fbClass=_RotatedWhileSearching)
+    # The results of the previous file are dropped
+    assert fb.searchRe('error') == [1]
+    assert fb._searchCache == {('error', 0): (1, 2, array('Q', [1]))}
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(sys.path[0], '../../libs/pyTermTk'))
+import TermTk as ttk
+
+from TermTk.TTkCore.TTkTerm.input_thread import TTkInput, TTkTerm
+from TermTk.TTkCore.TTkTerm.term_base import TTkTermBase
+
+@pytest.fixture
+def frames(monkeypatch):
+    ret = []
+    monkeypatch.setattr(TTkTermBase, 'pushFrame', lambda txt: ret.append(txt))
+    monkeypatch.setattr(TTkTermBase, '_frameBuffer', None)
+    monkeypatch.setattr(TTkTermBase, 'push', lambda *args: TTkTermBase._frameBuffer.append(''.join(args)))
+    return ret
+
+@pytest.fixture(autouse=True)
+def syncUpdate(monkeypatch):
+    # the DECRPM reply is stored in the (mocked) terminal class
+    for cls in TTkTerm.__mro__:
+        if 'syncUpdate' in cls.__dict__:
+            monkeypatch.setattr(cls, 'syncUpdate', cls.syncUpdate)
+
+def _frame(syncUpdate):
+    TTkTermBase.beginFrame(syncUpdate=syncUpdate)
+    TTkTermBase.push('Frame')
+    TTkTermBase.commitFrame()
+
+@pytest.mark.parametrize('reply,supported', [
+    ('\033[?2026;1$y', True),
+    ('\033[?2026;2$y', True),
+    ('\033[?2026;3$y', True),
+    ('\033[?2026;0$y', False),
+    ('\033[?2026;4$y', False)])
+def test_decrpm_sync_update(reply, supported):
+    TTkTerm.setSyncUpdate(not supported)
+    assert TTkInput.key_process(reply) == (None, None, None)
+    assert TTkTerm.syncUpdate is supported
+
+def test_decrpm_other_modes_ignored():
+    TTkTerm.setSyncUpdate(True)
+    assert TTkInput.key_process('\033[?2004;0$y') == (None, None, None)
+    assert TTkTerm.syncUpdate is True
+
+def test_decrpm_is_not_a_key():
+    kevt, mevt, paste = TTkInput.key_process('\033[A')
+    assert kevt is not None
+    assert mevt is paste is None
+
+def test_frame_wrapped(frames):
+    _frame(syncUpdate=True)
+    assert frames == [TTkTermBase.SET_SYNC_UPDATE + 'Frame' + TTkTermBase.RESET_SYNC_UPDATE]
+
+def test_frame_not_wrapped(frames):
+    _frame(syncUpdate=False)
+    assert frames == ['Frame']
+
+def test_empty_frame_not_pushed(frames):
+    TTkTermBase.beginFrame(syncUpdate=True)
+    TTkTermBase.commitFrame()
+    assert frames == []
+
+@pytest.mark.parametrize('reply,cfg,wrapped', [
+    ('\033[?2026;1$y', None,  True),
+    ('\033[?2026;2$y', None,  True),
+    ('\033[?2026;0$y', None,  False),
+    ('\033[?2026;0$y', True,  True),
+    ('\033[?2026;1$y', False, False)])
+def test_decrpm_frame(reply, cfg, wrapped, frames, monkeypatch):
+    # Same selection used by TTkHelper.paintAll
+    monkeypatch.setattr(ttk.TTkCfg, 'syncUpdate', cfg)
+    TTkInput.key_process(reply)
+    _frame(syncUpdate=TTkTerm.syncUpdate if ttk.TTkCfg.syncUpdate is None else ttk.TTkCfg.syncUpdate)
+    if wrapped:
+        assert frames == [TTkTermBase.SET_SYNC_UPDATE + 'Frame' + TTkTermBase.RESET_SYNC_UPDATE]
+    else:
+        assert frames == ['Frame']
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import sys, os
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(sys.path[0],'../../../libs/pyTermTk'))
+import TermTk as ttk
+
+from TermTk.TTkCore.log import TTkLog
+
+
+@pytest.fixture
+def logViewer(monkeypatch):
+    '''A TTkLogViewer receiving only the messages logged by the test'''
+    monkeypatch.setattr(TTkLog, '_messageHandler', [])
+    monkeypatch.setattr(TTkLog, '_level', TTkLog.DebugMsg)
+    monkeypatch.setattr(ttk.TTkHelper, '_deferredCalls', {})
+    def _new(**kwargs):
+        lv = ttk.TTkLogViewer(**kwargs)
+        lv.resize(40,5)
+        return lv
+    yield _new
+    monkeypatch.undo()
+    TTkLog._updateEnabled()
+
+
+def _lines(lv):
+    # The messages are added to the buffer in the drawing routine
+    ttk.TTkHelper._runDeferredCalls()
+    return [str(m) for m in lv._logView._messages]
+
+
+def test_logviewer_ring_buffer(logViewer):
+    lv = logViewer(maxLines=4)
+    assert lv.maxLines() == 4
+    for i in range(10):
+        TTkLog.info(f"msg {i}")
+    lines = _lines(lv)
+    assert len(lines) == 4
+    assert [l.split(' ')[-1] for l in lines] == ['6','7','8','9']
+
+    lv.setMaxLines(2)
+    assert lv.maxLines() == 2
+    assert [l.split(' ')[-1] for l in _lines(lv)] == ['8','9']
+    lv.setMaxLines(5)
+    TTkLog.info("msg 10")
+    assert [l.split(' ')[-1] for l in _lines(lv)] == ['8','9','10']
+
+
+def test_logviewer_width(logViewer):
+    lv = logViewer(maxLines=3)
+    view = lv._logView
+    def _check():
+        ttk.TTkHelper._runDeferredCalls()
+        w,h = view.viewFullAreaSize()
+        assert h == len(view._messages)
+        assert w == max(m.termWidth() for m in view._messages)
+    for size in (50,10,30,20,5,5,1,40,3,2,1,60,1,1,1):
+        TTkLog.info('x'*size)
+        _check()
+    lv.setMaxLines(2)
+    _check()
+    lv.setMaxLines(4)
+    TTkLog.info('y'*100)
+    _check()
+
+
+def test_logviewer_follow(logViewer):
+    lv = logViewer(maxLines=20)
+    view = lv._logView
+    for i in range(10):
+        TTkLog.info(f"msg {i}")
+    view._syncView()
+    _,h = view.size()
+    # The view was at the bottom, it keeps following the new messages
+    assert view.getViewOffsets()[1] == len(view._messages)-h
+
+    # Scrolled up, the same lines stay in view while the oldest are discarded
+    view.viewMoveTo(0,3)
+    view._syncView()
+    top = _lines(lv)[3]
+    for i in range(15):
+        TTkLog.info(f"more {i}")
+    view._syncView()
+    _,oy = view.getViewOffsets()
+    assert oy == 0
+    for i in range(3):
+        TTkLog.info(f"again {i}")
+    view._syncView()
+    view.viewMoveTo(0,10)
+    view._syncView()
+    top = _lines(lv)[10]
+    for i in range(4):
+        TTkLog.info(f"last {i}")
+    view._syncView()
+    _,oy = view.getViewOffsets()
+    assert _lines(lv)[oy] == top
+
+
+def test_logviewer_follow_always(logViewer):
+    lv = logViewer(follow=True, maxLines=50)
+    view = lv._logView
+    for i in range(10):
+        TTkLog.info(f"msg {i}")
+    view._syncView()
+    _,h = view.size()
+    view.viewMoveTo(0,0)
+    TTkLog.info("new")
+    view._syncView()
+    assert view.getViewOffsets()[1] == len(view._messages)-h
+
+
+def test_logviewer_sync_before_paint(logViewer):
+    lv = logViewer(maxLines=50)
+    view = lv._logView
+    for i in range(20):
+        TTkLog.info(f"msg {i}")
+    # The new messages are only scheduled, the view is moved in the drawing routine
+    assert view._pending
+    assert view.getViewOffsets()[1] == 0
+    w,h = view.size()
+    canvas = ttk.TTkCanvas(width=w, height=h)
+    view.paintEvent(canvas)
+    assert view._pending
+    assert view.getViewOffsets()[1] == 0
+    ttk.TTkHelper._runDeferredCalls()
+    assert not view._pending
+    _,h = view.size()
+    assert view.getViewOffsets()[1] == len(view._messages)-h
+
+
+def test_logviewer_sync_hidden(logViewer):
+    lv = logViewer(maxLines=50)
+    lv.hide()
+    view = lv._logView
+    for i in range(20):
+        TTkLog.info(f"msg {i}")
+    ttk.TTkHelper._runDeferredCalls()
+    assert not view._pending
+    _,h = view.size()
+    assert view.getViewOffsets()[1] == len(view._messages)-h
+
+
+def test_logviewer_threads(logViewer):
+    lv = logViewer(maxLines=20)
+    view = lv._logView
+    stop = threading.Event()
+    def _log():
+        while not stop.is_set():
+            TTkLog.info("from the worker")
+    worker = threading.Thread(target=_log)
+    worker.start()
+    try:
+        w,h = view.size()
+        canvas = ttk.TTkCanvas(width=w, height=h)
+        for _ in range(500):
+            # Only the drawing routine changes the buffer
+            ttk.TTkHelper._runDeferredCalls()
+            view.viewFullAreaSize()
+            view.paintEvent(canvas)
+    finally:
+        stop.set()
+        worker.join()
+    assert _lines(lv)[-1].endswith("from the worker")
@@ -177,3 +177,56 @@ def test_blinking_cursor_on_space_renders_visible_dot_marker() -> None:
     )
 
     assert str(out_lines[0]) == 'a∙b'
+
+
+def test_multi_cursor_insert_text_emits_a_single_change() -> None:
+    doc, cur = _mk_cursor('\n'.join(f'{i},value' for i in range(100)))
+    calls: list[tuple[int, int, int]] = []
+    doc.contentsChange.connect(lambda a, b, c: calls.append((a, b, c)))
+
+    cur.setPosition(line=0, pos=1)
+    for line in range(1, 100):
+        cur.addCursor(line=line, pos=len(str(line)))
+    cur.insertText('X', moveCursor=True)
+
+    assert doc.toPlainText() == '\n'.join(f'{i}X,value' for i in range(100))
+    assert calls == [(0, 100, 100)]
+    assert [(p.position.line, p.position.pos) for p in cur.cursors()] == [
+        (line, len(str(line))+1) for line in range(100)]
+    assert all(p.anchor.toNum() == p.position.toNum() for p in cur.cursors())
+
+
+def test_multi_cursor_insert_newline_in_the_same_line() -> None:
+    doc, cur = _mk_cursor('abcdef\nghi')
+    calls: list[tuple[int, int, int]] = []
+    doc.contentsChange.connect(lambda a, b, c: calls.append((a, b, c)))
+
+    cur.setPosition(line=0, pos=1)
+    cur.addCursor(line=0, pos=3)
+    cur.addCursor(line=0, pos=5)
+    cur.addCursor(line=1, pos=1)
+    cur.insertText('\n', moveCursor=True)
+
+    assert doc.toPlainText() == 'a\nbc\nde\nf\ng\nhi'
+    assert len(calls) == 1
+    assert [(p.position.line, p.position.pos) for p in cur.cursors()] == [
+        (1, 0), (2, 0), (3, 0), (5, 0)]
+
+
+def test_multi_cursor_remove_selected_text_notifies_once() -> None:
+    doc, cur = _mk_cursor('one two three\nfour five\nsix')
+    calls: list[tuple[int, int, int]] = []
+    positions: list[ttk.TTkTextCursor] = []
+    doc.contentsChange.connect(lambda a, b, c: calls.append((a, b, c)))
+
+    cur.setPosition(line=0, pos=4)
+    cur.setPosition(line=0, pos=8, moveMode=ttk.TTkTextCursor.KeepAnchor)
+    cur.addCursor(line=0, pos=13)
+    cur.setPosition(line=1, pos=5, moveMode=ttk.TTkTextCursor.KeepAnchor, cID=1)
+    doc.cursorPositionChanged.connect(positions.append)
+    cur.removeSelectedText()
+
+    assert doc.toPlainText() == 'one threefive\nsix'
+    assert calls == [(0, 2, 1)]
+    assert len(positions) == 1
+    assert [(p.position.line, p.position.pos) for p in cur.cursors()] == [(0, 4), (0, 9)]
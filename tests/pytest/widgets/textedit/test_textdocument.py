@@ -3,10 +3,12 @@
 
 import os
 import sys
+import random
 
 sys.path.append(os.path.join(sys.path[0], '../../libs/pyTermTk'))
 
 import TermTk as ttk
+from TermTk.TTkGui.textdocument_lines import _TTkTextLines
 
 
 def _mk_doc(text: str = ' ') -> ttk.TTkTextDocument:
@@ -177,3 +179,78 @@ def test_clear_and_text_converters() -> None:
     doc.clear()
 
     assert doc.toPlainText() == ' '
+
+
+class _SmallBlocks(_TTkTextLines):
+    BLOCK_SIZE = 4
+
+
+def test_data_lines_behave_like_a_list() -> None:
+    rnd = random.Random(22)
+    for _ in range(50):
+        ref = [f"{i}" for i in range(rnd.randint(0, 40))]
+        lines = _SmallBlocks(ref)
+        for op in range(100):
+            n = len(ref)
+            value = [f"{op}.{i}" for i in range(rnd.choice([0, 1, 3, 20]))]
+            a, b = rnd.randint(-3, n+3), rnd.randint(-3, n+3)
+            if op % 4 == 0 and n:
+                i = rnd.randint(-n, n-1)
+                ref[i] = lines[i] = f"{op}"
+            elif op % 4 == 1:
+                ref[a:b] = value
+                lines[a:b] = value
+            elif op % 4 == 2:
+                ref.insert(a, f"{op}")
+                lines.insert(a, f"{op}")
+            else:
+                del ref[a:b]
+                del lines[a:b]
+            assert len(lines) == len(ref)
+            assert list(lines) == ref
+            assert list(reversed(lines)) == ref[::-1]
+            assert lines[a:b] == ref[a:b]
+            assert lines[b:a:-2] == ref[b:a:-2]
+            assert all(0 < len(blk) <= 2*_SmallBlocks.BLOCK_SIZE for blk in lines._blocks)
+
+
+def test_data_lines_copy_is_independent() -> None:
+    lines = _SmallBlocks(f"{i}" for i in range(100))
+    snap = lines.copy()
+    # The copy shares the blocks until they are changed
+    assert all(a is b for a, b in zip(lines._blocks, snap._blocks))
+
+    lines[10] = 'x'
+    lines[50:60] = ['y']
+    snap[0:0] = ['z']
+
+    assert list(snap) == ['z'] + [f"{i}" for i in range(100)]
+    assert lines[9:12] == ['9', 'x', '11']
+    assert len(lines) == 91
+    assert lines[50] == 'y'
+
+
+def test_insert_many_lines_and_undo() -> None:
+    doc = _mk_doc('\n'.join(f"line {i}" for i in range(1000)))
+    cur = ttk.TTkTextCursor(document=doc)
+    doc.saveSnapshot(cur.copy())
+    contents_change_calls: list[tuple[int, int, int]] = []
+    doc.contentsChange.connect(lambda a, b, c: contents_change_calls.append((a, b, c)))
+
+    pasted = '\n'.join(f"new {i}" for i in range(5000))
+    cur.setPosition(line=500, pos=2)
+    cur.insertText(pasted)
+    doc.saveSnapshot(cur.copy())
+
+    assert doc.lineCount() == 1000 + 4999
+    assert str(doc.dataLine(500)) == 'linew 0'
+    assert str(doc.dataLine(501)) == 'new 1'
+    assert str(doc.dataLine(500+4999)) == 'new 4999ne 500'
+    assert str(doc.dataLine(500+5000)) == 'line 501'
+    assert contents_change_calls == [(500, 1, 5000)]
+
+    doc.restoreSnapshotPrev()
+    assert doc.toPlainText() == '\n'.join(f"line {i}" for i in range(1000))
+    doc.restoreSnapshotNext()
+    assert doc.lineCount() == 1000 + 4999
+    assert str(doc.dataLine(501)) == 'new 1'
@@ -394,3 +394,143 @@ def test_textdocument_highlight_to_raw_text(highlight_document):
     doc.setText('raw')
     raw = doc.toRawText()
     assert isinstance(raw, ttk.TTkString)
+
+
+# ---------------------------------------------------------------------------
+# Incremental highlighting
+# ---------------------------------------------------------------------------
+
+def _mk_python_document(text: str) -> 'HighlightedDocument':
+    """Create a python highlighted document refreshed manually."""
+    doc = HighlightedDocument(text=text)
+    doc._timerRefresh.quit()
+    doc.setLexer('python')
+    _refresh(doc)
+    return doc
+
+
+def _refresh(doc) -> int:
+    """Run the highlight refresh until the document is completely highlighted."""
+    ticks = 0
+    while doc._refreshFrom is not None:
+        doc._refreshEvent()
+        ticks += 1
+    return ticks
+
+
+def _pygments_colors(doc) -> list:
+    """Colors of each line highlighting the whole document with pygments."""
+    colors = []
+    for _, ttype, value in doc._lexer.get_tokens_unprocessed(doc.toPlainText() + '\n'):
+        colors += [doc._formatter.color(ttype)] * len(value)
+    ret, pos = [], 0
+    for line in doc.toPlainText().split('\n'):
+        ret.append(colors[pos:pos + len(line)])
+        pos += len(line) + 1
+    return ret
+
+
+_PY_CODE = '\n'.join([
+    'import os',
+    '',
+    'def foo(a, b=1):',
+    '    """Docstring',
+    '    on multiple lines',
+    '    """',
+    '    # comment',
+    '    return a + b',
+    ] * 50)
+
+
+@pytest.mark.skipif(not PYGMENTS_AVAILABLE, reason='Pygments not available')
+def test_textdocument_highlight_matches_full_document_lexing():
+    """The incremental highlighting is the same as lexing the whole document."""
+    doc = _mk_python_document(_PY_CODE)
+    assert [line._colors for line in doc.dataLines()] == _pygments_colors(doc)
+    assert doc.toPlainText() == _PY_CODE
+
+
+@pytest.mark.skipif(not PYGMENTS_AVAILABLE, reason='Pygments not available')
+def test_textdocument_highlight_edit_converges():
+    """An edit which does not change the lexer state re-highlights only the lines up to its line."""
+    doc = _mk_python_document(_PY_CODE)
+    cursor = ttk.TTkTextCursor(document=doc)
+    cursor.setPosition(line=350, pos=4)
+    before = list(doc.dataLines())
+    cursor.insertText('x')
+
+    assert _refresh(doc) == 1
+    after = list(doc.dataLines())
+    # The lexing resumes some lines before the edit, a token may span up to the edited line
+    changed = [i for i, (a, b) in enumerate(zip(before, after)) if a is not b]
+    assert changed[-1] == 350
+    assert changed[0] >= 350 - HighlightedDocument._resumeLines - 8
+    assert [line._colors for line in after] == _pygments_colors(doc)
+
+
+@pytest.mark.skipif(not PYGMENTS_AVAILABLE, reason='Pygments not available')
+def test_textdocument_highlight_multiline_string_propagates():
+    """Opening/closing a multiline string re-highlights the following lines."""
+    doc = _mk_python_document(_PY_CODE)
+    cursor = ttk.TTkTextCursor(document=doc)
+    cursor.setPosition(line=8, pos=0)
+    cursor.insertText('"""')
+    _refresh(doc)
+    assert [line._colors for line in doc.dataLines()] == _pygments_colors(doc)
+
+    cursor.setPosition(line=8, pos=0)
+    cursor.setPosition(line=8, pos=3, moveMode=ttk.TTkTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    _refresh(doc)
+    assert doc.toPlainText() == _PY_CODE
+    assert [line._colors for line in doc.dataLines()] == _pygments_colors(doc)
+
+
+@pytest.mark.skipif(not PYGMENTS_AVAILABLE, reason='Pygments not available')
+def test_textdocument_highlight_edit_lookahead():
+    """Editing the end of a token matched with a lookahead (html script) re-highlights the token."""
+    text = '<html>\n<script>\nvar a = 1;\nvar b = 2;\n</script>\n<p>text</p>\n</html>'
+    doc = HighlightedDocument(text=text)
+    doc._timerRefresh.quit()
+    doc.setLexer('html')
+    _refresh(doc)
+    assert [line._colors for line in doc.dataLines()] == _pygments_colors(doc)
+
+    cursor = ttk.TTkTextCursor(document=doc)
+    cursor.setPosition(line=4, pos=2)
+    cursor.insertText('x')
+    _refresh(doc)
+    assert [line._colors for line in doc.dataLines()] == _pygments_colors(doc)
+
+    cursor.setPosition(line=4, pos=2)
+    cursor.setPosition(line=4, pos=3, moveMode=ttk.TTkTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    _refresh(doc)
+    assert doc.toPlainText() == text
+    assert [line._colors for line in doc.dataLines()] == _pygments_colors(doc)
+
+
+@pytest.mark.skipif(not PYGMENTS_AVAILABLE, reason='Pygments not available')
+def test_textdocument_highlight_edit_closes_a_multiline_token():
+    """Closing a comment opened some lines before re-highlights the whole comment."""
+    text = 'p {\n  color: red; /* c\n  d\n}\nq {}\n'
+    doc = HighlightedDocument(text=text)
+    doc._timerRefresh.quit()
+    doc.setLexer('css')
+    _refresh(doc)
+    cursor = ttk.TTkTextCursor(document=doc)
+    cursor.setPosition(line=4, pos=0)
+    cursor.insertText('*/')
+    _refresh(doc)
+    assert [line._colors for line in doc.dataLines()] == _pygments_colors(doc)
+
+
+@pytest.mark.skipif(not PYGMENTS_AVAILABLE, reason='Pygments not available')
+def test_textdocument_highlight_guess_lexer_on_a_sample():
+    """The lexer is guessed from the beginning of the document."""
+    text = '\n'.join([_PY_CODE] * 20)
+    doc = HighlightedDocument(text=text)
+    doc._timerRefresh.quit()
+    sample = doc._sampleText()
+    assert 0 < len(sample) <= HighlightedDocument._guessSample
+    assert text.startswith(sample)
@@ -1030,4 +1030,38 @@ def test_textedit_view_scroll_right_does_not_affect_vertical_offset():
     # Scroll RIGHT
     tev.scrollTo(ttk.TTkK.TextEditEdge.RIGHT)
     _, oy_after = tev.getViewOffsets()
-    assert oy_after == oy_before  # Vertical position unchanged
\ No newline at end of file
+    assert oy_after == oy_before  # Vertical position unchanged
+
+def test_textedit_view_paint_reuses_unchanged_rows():
+    '''Test that a repaint renders again only the rows affected by the cursor'''
+    tev = ttk.TTkTextEditView(size=(20, 5))
+    tev.setText('\n'.join(f'line {i}' for i in range(5)))
+    canvas = ttk.TTkCanvas(width=20, height=5)
+
+    tev.paintEvent(canvas)
+    before = {k:v[5] for k,v in tev._rowCache.items()}
+    assert len(before) == 5
+
+    tev.textCursor().setPosition(2, 0)
+    tev.textCursor().setPosition(2, 4, moveMode=ttk.TTkTextCursor.MoveMode.KeepAnchor)
+    tev.paintEvent(canvas)
+    after = {k:v[5] for k,v in tev._rowCache.items()}
+
+    assert before.keys() == after.keys()
+    for key in before:
+        if key[0] == 2:
+            assert after[key] is not before[key]
+            assert after[key] == 'line 2'
+            assert after[key].colorAt(0) != before[key].colorAt(0)
+        else:
+            assert after[key] is before[key]
+
+    # Editing a line invalidates only its rows
+    tev.textCursor().clearSelection()
+    tev.textCursor().setPosition(3, 0)
+    tev.textCursor().insertText('x')
+    tev.paintEvent(canvas)
+    edited = {k:v[5] for k,v in tev._rowCache.items()}
+    assert edited[(3,0)] == 'xline 3'
+    assert edited[(0,0)] is after[(0,0)]
+    assert edited[(4,0)] is after[(4,0)]
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Compare the list based TTkCanvas with the compact TTkCanvasArray
+# (TTkCfg.compactCanvas) on the most common canvas operations
+
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+W,H = 320,80
+
+out = []
+ttk.TTkTerm.push = lambda *args: out.append(args)
+
+text = ttk.TTkString("Hello World 世界 "*10, ttk.TTkColor.RED + ttk.TTkColor.BG_BLUE)
+color = ttk.TTkColor.fg('#00FFFF') + ttk.TTkColor.bg('#000044')
+
+def _canvases(cls):
+    root = cls(width=W, height=H)
+    root.updateSize()
+    root.enableDoubleBuffer()
+    child = cls(width=W-10, height=H-10)
+    child.updateSize()
+    child.fill(color=color)
+    for y in range(0,H-10,2):
+        child.drawText(pos=(y%7,y), text=text)
+    transparent = cls(width=W//2, height=H//2)
+    transparent.updateSize()
+    transparent.setTransparent(True)
+    transparent.drawBox(pos=(0,0), size=(W//2,H//2))
+    return root, child, transparent
+
+canvasList  = _canvases(ttk.TTkCanvas)
+canvasArray = _canvases(ttk.TTkCanvasArray)
+
+def _clean(c):     c[0].clean()
+def _fill(c):      c[0].fill(pos=(5,5), size=(W-10,H-10), char='x', color=color)
+def _drawText(c):
+    for y in range(H):
+        c[0].drawText(pos=(0,y), text=text)
+def _paint(c):
+    c[0].paintCanvas(c[1], (5,5,W-10,H-10), (0,0,W-10,H-10), (0,0,W,H))
+def _paintTr(c):
+    c[0].paintCanvas(c[2], (20,20,W//2,H//2), (0,0,W//2,H//2), (0,0,W,H))
+def _frame(c):
+    # A full frame, clean, compose and push, only a box is moving
+    c[0].clean()
+    _paint(c)
+    x = _frame.x[id(c)] = _frame.x.get(id(c),0)+1
+    c[0].paintCanvas(c[2], (x%20,20,W//2,H//2), (0,0,W//2,H//2), (0,0,W,H))
+    out.clear()
+    c[0].pushToTerminalBuffered(0,0,W,H)
+    return len(out)
+_frame.x = {}
+def _pushStill(c):
+    # Nothing changed since the last push
+    c[0].clean()
+    _paint(c)
+    out.clear()
+    c[0].pushToTerminalBuffered(0,0,W,H)
+    return len(out)
+
+def test_ti_01_A_clean_list():          return _clean(canvasList)
+def test_ti_01_B_clean_array():         return _clean(canvasArray)
+def test_ti_02_A_fill_list():           return _fill(canvasList)
+def test_ti_02_B_fill_array():          return _fill(canvasArray)
+def test_ti_03_A_drawText_list():       return _drawText(canvasList)
+def test_ti_03_B_drawText_array():      return _drawText(canvasArray)
+def test_ti_04_A_paintCanvas_list():    return _paint(canvasList)
+def test_ti_04_B_paintCanvas_array():   return _paint(canvasArray)
+def test_ti_05_A_paintTransp_list():    return _paintTr(canvasList)
+def test_ti_05_B_paintTransp_array():   return _paintTr(canvasArray)
+def test_ti_06_A_frame_list():          return _frame(canvasList)
+def test_ti_06_B_frame_array():         return _frame(canvasArray)
+def test_ti_07_A_pushStill_list():      return _pushStill(canvasList)
+def test_ti_07_B_pushStill_array():     return _pushStill(canvasArray)
+
+loop = 100
+
+a:dict = {}
+
+for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+    result = timeit.timeit(f'{testName}(*a)', globals=globals(), number=loop)
+    print(f"{testName:32} | {result / loop:.10f} sec. | {loop / result : 15.3f} Fps ╞╡-> {globals()[testName](*a)}")
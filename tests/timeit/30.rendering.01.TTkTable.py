@@ -30,7 +30,7 @@ import operator
 import json
 import timeit
 
-sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
 import TermTk as ttk
 
 imagesFile = os.path.join(os.path.dirname(os.path.abspath(__file__)),'../ansi.images.json')
@@ -78,8 +78,14 @@ data_lists = [
     [[fireMini       for y in range(100)] for x in range(1000)],
     [[python         for y in range(100)] for x in range(1000)]]
 
+class MyTableModel1M(ttk.TTkAbstractTableModel):
+    def rowCount(self):        return 1000000
+    def columnCount(self):     return 100
+    def data(self, row, col):  return txt1 if col%2 else 1234567
+
 table_models = [MyTableModel(dl) for dl in data_lists]
 tables = [ttk.TTkTableWidget(tableModel=tm) for tm in table_models]
+table1M = ttk.TTkTableWidget(tableModel=MyTableModel1M())
 
 def paint(table):
     canvas = table.getCanvas()
@@ -114,6 +120,12 @@ def test_ti_B_08():  return paint(tables[7])
 def test_ti_B_09():  return paint(tables[8])
 def test_ti_B_10():  return paint(tables[9])
 def test_ti_B_11():  return paint(tables[10])
+def test_ti_C_00_1M_rows():  return table1M.resize(200,50)
+def test_ti_C_01_top():      table1M.viewMoveTo(0,0);            return paint(table1M)
+def test_ti_C_02_middle():   table1M.viewMoveTo(0,1000000);      return paint(table1M)
+def test_ti_C_03_bottom():   table1M.viewMoveTo(0,2000000);      return paint(table1M)
+def test_ti_C_04_rowHeight(): return table1M.setRowHeight(10,3)
+def test_ti_C_05_findCell(): return table1M._findCell(100,25,False)
 
 
 for t in tables: t.resize(500,200)
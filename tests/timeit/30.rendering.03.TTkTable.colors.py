@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Count the TTkColor objects and the ansi sequences allocated during a
+# full screen TTkTable repaint (paint + push to the terminal)
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+from TermTk.TTkCore.color import TTkColor
+from TermTk.TTkCore.TTkTerm.colors import TTkTermColor
+
+W,H = 200,60
+ttk.TTkTerm.getTerminalSize = lambda : (W,H)
+ttk.TTkGlbl.term_w, ttk.TTkGlbl.term_h = W,H
+
+_out = []
+ttk.TTkTerm.push = _out.append
+
+class MyTableModel(ttk.TTkAbstractTableModel):
+    def __init__(self, mylist, *args):
+        super().__init__(*args)
+        self.mylist = mylist
+
+    def rowCount(self):        return len(self.mylist)
+    def columnCount(self):     return len(self.mylist[0])
+    def data(self, row, col):  return self.mylist[row][col]
+
+txt = ttk.TTkString('Text', TTkColor.RED + TTkColor.BG_BLUE + TTkColor.BOLD)
+
+data_lists = {
+    'Strings'   : [[f"{x}/{y}"       for y in range(100)] for x in range(1000)],
+    'TTkString' : [[txt              for y in range(100)] for x in range(1000)],
+    'Float'     : [[1234567.123456   for y in range(100)] for x in range(1000)]}
+
+root = ttk.TTk(layout=ttk.TTkGridLayout())
+tables = {}
+for name,dl in data_lists.items():
+    tables[name] = ttk.TTkTable(parent=root, tableModel=MyTableModel(dl), visible=False)
+root.show()
+
+# Count the allocations, wrapping the constructor and the ansi formatter
+_count = {'colors':0, 'ansi':0}
+_colorInit = TTkColor.__init__
+def _countInit(self, *args, **kwargs):
+    _count['colors'] += 1
+    _colorInit(self, *args, **kwargs)
+TTkColor.__init__ = _countInit
+_rgb2ansi = TTkTermColor.rgb2ansi
+def _countRgb2ansi(*args, **kwargs):
+    _count['ansi'] += 1
+    return _rgb2ansi(*args, **kwargs)
+TTkTermColor.rgb2ansi = staticmethod(_countRgb2ansi)
+
+def _frame(table, scroll):
+    # Scroll the table to force a full repaint
+    table.viewport().viewMoveTo(scroll%7, scroll)
+    root.setGeometry(0,0,W,H)
+    ttk.TTkHelper.paintAll()
+    _out.clear()
+
+def _show(name):
+    for n,t in tables.items():
+        t.setVisible(n==name)
+    tables[name].setGeometry(0,0,W,H)
+    _frame(tables[name], 0)
+
+loop = 20
+
+for name,table in tables.items():
+    _show(name)
+    _count['colors'] = _count['ansi'] = 0
+    steps = iter(range(1,loop+1))
+    result = timeit.timeit(lambda : _frame(table, next(steps)), number=loop)
+    print(f"{name:10} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps | "
+          f"{_count['colors']/loop:10.1f} TTkColor/frame | {_count['ansi']/loop:10.1f} ansi/frame")
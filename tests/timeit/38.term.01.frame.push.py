@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark the terminal output of the widget tree used in
+#     tests/stress/01.many.widgets.py
+# Count the write syscalls and the bytes sent to the terminal for each frame
+# pushing the output without ("push") and with ("frame") the frame buffer
+
+import os
+import sys
+import random
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+random.seed(1234)
+
+_stats = {'writes':0, 'bytes':0}
+
+class _CountingStdout():
+    '''Fake stdout writing to /dev/null and counting the syscalls'''
+    def __init__(self):
+        self._fd = os.open(os.devnull, os.O_WRONLY)
+        self._pending = ''
+        self.encoding = 'utf-8'
+    def fileno(self): return self._fd
+    def write(self, txt):
+        self._pending += txt
+        return len(txt)
+    def flush(self):
+        if self._pending:
+            os.write(self._fd, self._pending.encode())
+        self._pending = ''
+
+_osWrite = os.write
+def _countingWrite(fd, data):
+    if fd == sys.stdout.fileno():
+        _stats['writes'] += 1
+        _stats['bytes']  += len(data)
+    return _osWrite(fd, data)
+os.write = _countingWrite
+
+W,H = 200,60
+ttk.TTkTerm.getTerminalSize = lambda : (W,H)
+ttk.TTkGlbl.term_w, ttk.TTkGlbl.term_h = W,H
+
+root = ttk.TTk(layout=ttk.TTkGridLayout())
+root.layout().addWidget(btn:=ttk.TTkButton(text="Add Buttons",border=True,maxHeight=3),0,0)
+root.layout().addWidget(sa:=ttk.TTkScrollArea(),1,0,1,2)
+root.layout().addWidget(ttk.TTkLogViewer(maxHeight=10),2,0,1,2)
+
+sa.viewport().setLayout(ttk.TTkVBoxLayout())
+layouts = []
+for i in range(50):
+    layout = ttk.TTkHBoxLayout()
+    btns = []
+    for ii in range(50):
+        btns.append(btnx := ttk.TTkButton(text=f"btn:{i:03}-{ii:03}",border=True))
+        btnx.setMinimumWidth(random.randint(10,40))
+    layout.addWidgets(btns)
+    layouts.append(layout)
+sa.viewport().layout().addItems(layouts)
+root.show()
+
+sys.stdout, _stdout = _CountingStdout(), sys.stdout
+
+def _frame(scroll):
+    # Move the scroll area to force a full repaint of the viewport
+    sa.viewport().viewMoveTo(scroll, scroll)
+    root.setGeometry(0,0,W,H)
+    ttk.TTkHelper.paintAll()
+
+def _unbuffered(scroll):
+    _begin, _commit = ttk.TTkTerm.beginFrame, ttk.TTkTerm.commitFrame
+    ttk.TTkTerm.beginFrame = ttk.TTkTerm.commitFrame = lambda *args, **kwargs : None
+    try:
+        _frame(scroll)
+    finally:
+        ttk.TTkTerm.beginFrame, ttk.TTkTerm.commitFrame = _begin, _commit
+
+def _buffered(scroll):
+    _frame(scroll)
+
+_frame(0)
+loop = 50
+scrolls = [random.randint(0,100) for _ in range(loop)]
+results = []
+for name, fun in (('push ', _unbuffered), ('frame', _buffered)):
+    _frame(0)
+    _stats['writes'] = _stats['bytes'] = 0
+    steps = iter(scrolls)
+    result = timeit.timeit(lambda : fun(next(steps)), number=loop)
+    results.append(f"{name} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps | {_stats['writes']/loop:10.1f} writes/frame | {_stats['bytes']/loop:12.1f} bytes/frame")
+
+sys.stdout = _stdout
+print('\n'.join(results))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark the frame update of a clock label placed in a
+# deep window/splitter hierarchy with and without the damaged rows compositing
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+W,H = 200,60
+ttk.TTkTerm.getTerminalSize = lambda : (W,H)
+ttk.TTkGlbl.term_w, ttk.TTkGlbl.term_h = W,H
+
+_stats = {'bytes':0}
+def _push(txt):
+    _stats['bytes'] += len(txt)
+ttk.TTkTerm.push = _push
+
+root = ttk.TTk(layout=ttk.TTkGridLayout())
+parent = root
+for i in range(6):
+    # Each level include a text area and a splitter with the next level
+    spl = ttk.TTkSplitter(parent=parent, orientation=ttk.TTkK.VERTICAL if i%2 else ttk.TTkK.HORIZONTAL)
+    ttk.TTkTextEdit(parent=spl).setText('\n'.join([f"{i} - Lorem ipsum dolor sit amet"]*100))
+    win = ttk.TTkWindow(parent=spl, title=f"Window {i}", layout=ttk.TTkVBoxLayout())
+    spl.setSizes([8 if i%2 else 20, None])
+    parent = win
+clock = ttk.TTkLabel(parent=parent)
+ttk.TTkTextEdit(parent=parent).setText('\n'.join(["Lorem ipsum dolor sit amet"]*100))
+root.show()
+root.setGeometry(0,0,W,H)
+
+def _frame(tick):
+    clock.setText(f"Clock: {tick:08}")
+    ttk.TTkHelper.paintAll()
+
+loop = 200
+for damageCompose in (False, True):
+    ttk.TTkCfg.damageCompose = damageCompose
+    root.update()
+    _frame(0)
+    _stats['bytes'] = 0
+    ticks = iter(range(1,loop+1))
+    result = timeit.timeit(lambda : _frame(next(ticks)), number=loop)
+    print(f"damageCompose={damageCompose!s:5} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps | {_stats['bytes']/loop:10.1f} bytes/frame")
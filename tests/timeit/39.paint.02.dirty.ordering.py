@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark the ordering of the dirty widgets used in TTkHelper.paintAll,
+# the parents walk + sort by recursive depth against
+# the early stopped walk + bucketing by cached depth
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+from TermTk.TTkCore.helper import TTkHelper
+
+def _buildTree(parent, levels, children):
+    if not levels:
+        return [ttk.TTkLabel(parent=parent, text='x') for _ in range(children)]
+    ret = []
+    for _ in range(children):
+        c = ttk.TTkContainer(parent=parent, layout=ttk.TTkVBoxLayout())
+        ret += _buildTree(c, levels-1, children)
+    return ret
+
+root = ttk.TTkContainer(layout=ttk.TTkVBoxLayout())
+leaves = _buildTree(root, 5, 4)
+
+def _depthRecursive(widget):
+    if widget is None:
+        return 0
+    return 1 + _depthRecursive(widget.parentWidget())
+
+def _orderOld(dirty):
+    updateWidgets = set()
+    for widget in dirty:
+        updateWidgets.add(widget)
+        parent = widget.parentWidget()
+        while parent is not None:
+            updateWidgets.add(parent)
+            parent = parent.parentWidget()
+    return sorted(updateWidgets, key=lambda w: -_depthRecursive(w))
+
+def _orderNew(dirty):
+    updateWidgets = set()
+    for widget in dirty:
+        updateWidgets.add(widget)
+        parent = widget.parentWidget()
+        while parent is not None and parent not in updateWidgets:
+            updateWidgets.add(parent)
+            parent = parent.parentWidget()
+    depthBuckets = {}
+    for widget in updateWidgets:
+        depthBuckets.setdefault(TTkHelper.widgetDepth(widget),[]).append(widget)
+    return [w for d in sorted(depthBuckets, reverse=True) for w in depthBuckets[d]]
+
+loop = 20
+for num in (10, 100, len(leaves)):
+    dirty = leaves[::len(leaves)//num]
+    assert [_depthRecursive(w) for w in _orderOld(dirty)] == [_depthRecursive(w) for w in _orderNew(dirty)]
+    for name, fun in (('old', _orderOld), ('new', _orderNew)):
+        result = timeit.timeit(lambda : fun(dirty), number=loop)
+        print(f"{name} dirty={len(dirty):5} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
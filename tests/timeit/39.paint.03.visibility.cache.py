@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark isVisibleAndParent on a 10 levels deep tree with 5k leaves,
+# the parents walk against the cached visibility
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+ttk.TTkTerm.getTerminalSize = lambda : (200,60)
+ttk.TTkTerm.push = lambda *args : None
+
+root = ttk.TTk()
+parent = root
+for _ in range(10):
+    parent = ttk.TTkContainer(parent=parent)
+leaves = [ttk.TTkLabel(parent=parent, text='x') for _ in range(5000)]
+root.show()
+
+# The uncached isVisibleAndParent (TTk is the top of the chain)
+def _isVisibleAndParentWalk(widget):
+    if widget is root:
+        return widget._visible
+    return ( widget._visible and
+        ( widget._parent is not None ) and
+        _isVisibleAndParentWalk(widget._parent) )
+
+def test_ti_1_walk():
+    return sum(_isVisibleAndParentWalk(w) for w in leaves)
+
+def test_ti_2_cached():
+    return sum(w.isVisibleAndParent() for w in leaves)
+
+def test_ti_3_cached_invalidated():
+    # Invalidate the cache once every frame (i.e. a widget is shown/hidden)
+    ttk.TTkHelper.invalidateWidgetVisibility()
+    return sum(w.isVisibleAndParent() for w in leaves)
+
+loop = 100
+
+for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+    result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+    print(f"{testName} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps ({globals()[testName]()})")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark the hit-testing (TTkHelper.widgetAt and the mouse Move routing)
+# on a layout crowded with windows, with and without the spatial index
+
+import os
+import sys
+import random
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+W,H = 200,60
+ttk.TTkTerm.getTerminalSize = lambda : (W,H)
+ttk.TTkTerm.push = lambda *args : None
+
+random.seed(1234)
+root = ttk.TTk(layout=ttk.TTkLayout(), mouseTrack=True)
+for i in range(500):
+    win = ttk.TTkWindow(parent=root, title=f"Win {i}", layout=ttk.TTkGridLayout(),
+                        pos=(random.randint(0,W),random.randint(0,H)), size=(30,10))
+    ttk.TTkButton(parent=win, text=f"Button {i}")
+root.show()
+root.setGeometry(0,0,W,H)
+
+points = [(random.randint(0,W-1),random.randint(0,H-1)) for _ in range(1000)]
+moves = [ttk.TTkMouseEvent(x, y, ttk.TTkK.NoButton, ttk.TTkK.Move, ttk.TTkK.NoModifier, 0, '') for x,y in points]
+
+def test_ti_1_widgetAt():
+    return sum(1 for x,y in points if ttk.TTkHelper.widgetAt(x,y))
+
+def test_ti_2_mouseMove():
+    return sum(1 for evt in moves if root.mouseEvent(evt))
+
+loop = 10
+
+for spatialIndex in (False, True):
+    ttk.TTkCfg.spatialIndex = spatialIndex
+    for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+        result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+        print(f"spatialIndex={spatialIndex!s:5} {testName} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps ({globals()[testName]()})")
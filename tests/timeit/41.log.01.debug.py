@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark 100k TTkLog.debug calls without handlers, with a handler,
+# with a handler and the level gate and with the previous
+# inspect.getouterframes based caller context
+
+import os
+import sys
+import inspect
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+from TermTk.TTkCore.log import TTkLog
+
+_count = [0]
+def _handler(mode, context, message):
+    _count[0] += len(context.file)
+
+class _TTkContextInspect:
+    __slots__ = ['file', 'line', 'function']
+    def __init__(self, cf):
+        self.file = cf[1]
+        self.line = cf[2]
+        self.function = cf[3]
+
+def _process_msg_inspect(mode, msg):
+    for cb in TTkLog._messageHandler:
+        curframe = inspect.currentframe()
+        calframe = inspect.getouterframes(curframe,1)
+        if len(calframe) > 2:
+            ctx = _TTkContextInspect(calframe[2])
+            for txt in str(msg).split('\n'):
+                cb(mode, ctx, txt)
+
+def _debug_inspect(msg):
+    _process_msg_inspect(TTkLog.DebugMsg, msg)
+
+def test_ti_1_no_handlers():
+    for i in range(100000):
+        TTkLog.debug(f"Message {i}")
+
+def test_ti_2_handler():
+    for i in range(100000):
+        TTkLog.debug(f"Message {i}")
+
+def test_ti_3_handler_level_info():
+    for i in range(100000):
+        TTkLog.debug(f"Message {i}")
+
+def test_ti_4_handler_inspect():
+    # This is too slow, only 1k calls (x100)
+    for i in range(1000):
+        _debug_inspect(f"Message {i}")
+
+loop = 1
+
+for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+    if testName == 'test_ti_2_handler':
+        TTkLog.installMessageHandler(_handler)
+    if testName == 'test_ti_3_handler_level_info':
+        TTkLog.setLevel(TTkLog.InfoMsg)
+    if testName == 'test_ti_4_handler_inspect':
+        TTkLog.setLevel(TTkLog.DebugMsg)
+    result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+    if testName == 'test_ti_4_handler_inspect':
+        result *= 100
+    print(f"{testName:30} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark the read of a screen (50 rows x 4 columns) near the bottom
+# of a 1M rows TTkTableModelSQLite3, the "LIMIT 1 OFFSET row" query per cell
+# against the rows page cache
+
+import os
+import sys
+import sqlite3
+import tempfile
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+ROWS = 1000000
+
+dbFile = tempfile.NamedTemporaryFile(suffix='.db', delete=False).name
+conn = sqlite3.connect(dbFile)
+conn.execute('CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, age INTEGER, role TEXT, city TEXT)')
+conn.executemany('INSERT INTO users (name, age, role, city) VALUES (?, ?, ?, ?)',
+                 ((f'User {i}', i%97, f'Role {i%13}', f'City {i%101}') for i in range(ROWS)))
+conn.commit()
+conn.close()
+
+model = ttk.TTkTableModelSQLite3(fileName=dbFile, table='users')
+
+def _dataOffset(row, col):
+    res = model._cur.execute(
+        f"SELECT {model._columns[col]} FROM {model._table} "
+        f"{model._sort} "
+        f"LIMIT 1 OFFSET {row}")
+    return None if not (_fetch:=res.fetchone()) else _fetch[0]
+
+def _screen(fun, top):
+    return [fun(row, col) for row in range(top, top+50) for col in range(4)]
+
+top = ROWS-100
+assert _screen(_dataOffset, top) == _screen(model.data, top)
+
+def test_ti_1_offset():
+    return _screen(_dataOffset, top)
+
+def test_ti_2_page_cache_cold():
+    model._pages.clear()
+    return _screen(model.data, top)
+
+def test_ti_3_page_cache():
+    return _screen(model.data, top)
+
+for sort in (None, 1):
+    if sort is not None:
+        result = timeit.timeit(lambda : model.sort(sort, ttk.TTkK.SortOrder.DescendingOrder), number=1)
+        print(f"sort={sort!s:4} {'model.sort':26} | {result:.10f} sec.")
+    for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+        # The sorted OFFSET query sorts the whole table for each cell (~200 sec.)
+        if sort is not None and testName == 'test_ti_1_offset': continue
+        loop = 1 if testName == 'test_ti_1_offset' else 20
+        result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+        print(f"sort={sort!s:4} {testName:26} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
+
+os.unlink(dbFile)
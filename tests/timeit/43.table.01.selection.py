@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark the TTkTableWidget selection of a 1M rows x 20 columns table,
+# the List[List[bool]] selection against the row bands/column intervals one
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+from TermTk.TTkWidgets.TTkModelView.tablewidget import _SelectionProxy
+
+ROWS, COLS = 1000000, 20
+
+def flags(row, col):
+    return ttk.TTkK.ItemFlag.ItemIsSelectable
+cmp = ttk.TTkK.ItemFlag.ItemIsSelectable
+
+proxy = _SelectionProxy()
+proxy.updateModel(cols=COLS, rows=ROWS, flags=flags, uniformFlags=True)
+selected2d = [[False]*COLS for _ in range(ROWS)]
+
+def test_ti_1_list_selectAll():
+    global selected2d
+    selected2d = [[cmp==(cmp&flags(row=row,col=col)) for col in range(COLS)] for row in range(ROWS)]
+def test_ti_2_list_selectColumn():
+    for row,line in enumerate(selected2d):
+        line[5] = cmp==(cmp&flags(row=row,col=5))
+def test_ti_3_list_isRowSelected():
+    return all(_sel for i,_sel in enumerate(selected2d[500000]) if flags(500000,i)&cmp)
+def test_ti_4_list_iterateRow():
+    return [(row,col) for row,line in enumerate(selected2d) for col,value in enumerate(line) if value and row==500000]
+
+def test_ti_5_bands_selectAll():
+    proxy.selectAll()
+def test_ti_6_bands_selectColumn():
+    proxy.selectColumn(5)
+def test_ti_7_bands_isRowSelected():
+    return proxy.isRowSelected(500000)
+def test_ti_8_bands_iterateRow():
+    proxy.clear()
+    proxy.selectRow(500000)
+    return list(proxy.iterateSelected())
+
+for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+    loop = 1 if '_list_' in testName else 100
+    result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+    print(f"{testName:30} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark TTkTableWidget.resizeColumnsToContents on a 1M rows x 20 columns table,
+# the measure of the visible window on every call against the sampled cells width cache
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+class MyTableModel(ttk.TTkAbstractTableModel):
+    def __init__(self):
+        self._changed = {}
+        super().__init__()
+    def rowCount(self):        return 1000000
+    def columnCount(self):     return 20
+    def data(self, row, col):  return self._changed.get((row,col), f"Text {row}\nx{col}")
+    def setData(self, row, col, data):
+        self._changed[(row,col)] = data
+        self.dataChanged.emit((row,col),(1,1))
+        return True
+
+model = MyTableModel()
+table = ttk.TTkTableWidget(tableModel=model)
+table.resize(200,50)
+table.viewMoveTo(0,1000000)
+
+def _columnContentsSize(column):
+    # The previous implementation, measure the rows around the visible one
+    def _wid(_c):
+        txt = model.ttkStringData(_c, column)
+        return max(t.termWidth() for t in txt.split('\n'))
+    w,h = table.size()
+    row,_ = table._findCell(w//2, h//2, False)
+    rowa,rowb = max(0,row-100), min(row+100,model.rowCount())
+    return max(_wid(i) for i in range(rowa,rowb))+table._dataPadding
+
+def test_ti_1_window():
+    return [_columnContentsSize(c) for c in range(20)]
+def test_ti_2_cache_cold():
+    table._columnWidths.clear()
+    table.resizeColumnsToContents()
+def test_ti_3_cache():
+    table.resizeColumnsToContents()
+def test_ti_4_cache_setData():
+    model.setData(500000, 3, "Some longer text")
+    table.resizeColumnsToContents()
+
+for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+    loop = 10
+    result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+    print(f"{testName:26} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark the indexing of a 2M lines file in TTkFileBuffer,
+# the line offsets list built with "find" against the array('Q') built from the mmap,
+# and the read of a page of lines
+
+import os
+import sys
+import random
+import tempfile
+import threading
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+LINES = 2000000
+
+logFile = tempfile.NamedTemporaryFile(suffix='.log', delete=False).name
+with open(logFile, 'w') as f:
+    f.writelines(f"2026-01-01 12:00:{i%60:02} INFO line {i} {'x'*random.randint(0,80)}\n" for i in range(LINES))
+
+def _indexList():
+    indexes = [0]
+    offset = 0
+    with open(logFile,'rb') as infile:
+        while (chunk:=infile.read(0x1000000)):
+            start = 0
+            while (index:=chunk.find(0x0A,start))!=-1:
+                indexes.append(index+offset+1)
+                start = index+1
+            offset+=len(chunk)
+    width = max( (indexes[i+1]-indexes[i]) for i in range(len(indexes)-1) )
+    return indexes, width
+
+def _fileBuffer():
+    fb = ttk.TTkFileBuffer(logFile, 0x100, 0x10)
+    for thread in threading.enumerate():
+        if thread.name == 'TTkFileBuffer':
+            thread.join()
+    return fb
+
+indexes, width = _indexList()
+fb = _fileBuffer()
+assert list(fb._indexes) == indexes and fb.getWidth() == width
+print(f"Index size: list {sys.getsizeof(indexes)+sum(sys.getsizeof(i) for i in indexes)} bytes, array {sys.getsizeof(fb._indexes)} bytes")
+
+def test_ti_1_index_list():
+    return _indexList()
+
+def test_ti_2_index_array_mmap():
+    return _fileBuffer()
+
+def test_ti_3_read_pages():
+    fb._pages = [None]*len(fb._pages)
+    fb._buffer = [None]*fb._numW
+    return [fb.getLine(line) for line in range(0,LINES,LINES//0x20)]
+
+for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+    loop = 5
+    result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+    print(f"{testName:26} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
+
+os.unlink(logFile)
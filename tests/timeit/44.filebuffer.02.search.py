@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark the regex search in a 2M lines file,
+# the line by line search of the text file against TTkFileBuffer.searchRe
+# (chunks scanned by the search pool) and its cached result
+
+import os
+import re
+import sys
+import random
+import tempfile
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+LINES = 2000000
+
+logFile = tempfile.NamedTemporaryFile(suffix='.log', delete=False).name
+with open(logFile, 'w') as f:
+    f.writelines(f"2026-01-01 12:00:{i%60:02} {random.choice(['INFO','WARN','ERROR'])} line {i} {'x'*random.randint(0,80)}\n" for i in range(LINES))
+
+fb = ttk.TTkFileBuffer(logFile, 0x100, 0x10)
+fb._indexThread.join()
+
+def _searchLines(regex):
+    rr = re.compile(regex)
+    with open(logFile, 'r', errors='replace', newline='\n') as infile:
+        return [i for i,line in enumerate(infile) if rr.search(line)]
+
+for regex in ('line 12345', 'ERROR', r'x{70}', '^$'):
+    assert _searchLines(regex) == fb.searchRe(regex)
+
+    def test_ti_1_lines():
+        return _searchLines(regex)
+
+    def test_ti_2_searchRe():
+        fb._searchCache.clear()
+        return fb.searchRe(regex)
+
+    def test_ti_3_searchRe_cached():
+        return fb.searchRe(regex)
+
+    for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+        loop = 3
+        result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+        print(f"{regex:12} {testName:26} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
+
+os.unlink(logFile)
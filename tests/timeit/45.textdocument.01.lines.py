@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmark the lines storage of TTkTextDocument,
+# a plain list against the block based _TTkTextLines:
+# the snapshot copy, the line by line paste and the single splice paste
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+from TermTk.TTkGui.textdocument_lines import _TTkTextLines
+
+LINES = 200000
+
+dataList  = [ttk.TTkString(f"line {i} {'x'*(i%80)}") for i in range(LINES)]
+dataBlock = _TTkTextLines(dataList)
+pasted    = [ttk.TTkString(f"pasted {i}") for i in range(20000)]
+
+def test_ti_1_copy_list():
+    return dataList.copy()
+
+def test_ti_2_copy_blocks():
+    return dataBlock.copy()
+
+def test_ti_3_paste_list_insert():
+    lines = dataList.copy()
+    for nl in reversed(pasted):
+        lines.insert(LINES//2, nl)
+    return lines
+
+def test_ti_4_paste_blocks_splice():
+    lines = dataBlock.copy()
+    lines[LINES//2:LINES//2] = pasted
+    return lines
+
+def test_ti_5_read_list():
+    return [dataList[i] for i in range(0,LINES,7)]
+
+def test_ti_6_read_blocks():
+    return [dataBlock[i] for i in range(0,LINES,7)]
+
+for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+    loop = 5
+    result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+    print(f"{testName:26} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+
+# Benchmark the pygments highlighting of TextDocumentHighlight:
+# the line by line TTkString concatenation against the collected colors,
+# the lexer guessing on the whole text against a prefix sample
+# and the incremental refresh after a keystroke
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+from TermTk.TTkGui.textdocument_highlight_pygments import TextDocumentHighlight, _TTkFormatter, _highlightLines
+
+from pygments.lexers import guess_lexer, get_lexer_by_name
+
+with open(os.path.join(sys.path[0],'../../libs/pyTermTk/TermTk/TTkGui/textcursor.py')) as f:
+    text = f.read()*4
+
+lexer = get_lexer_by_name('python')
+formatter = _TTkFormatter(style='gruvbox-dark')
+lines = [ttk.TTkString(t) for t in text.split('\n')]
+
+doc = TextDocumentHighlight(text=text)
+doc._timerRefresh.quit()
+doc.setLexer('python')
+
+def _refresh():
+    while doc._refreshFrom is not None:
+        doc._refreshEvent()
+
+_refresh()
+
+def test_ti_1_lines_concat():
+    ret = [ttk.TTkString()]
+    for _, ttype, value in lexer.get_tokens_unprocessed(text):
+        values = value.split('\n')
+        ret[-1] += ttk.TTkString(values[0],formatter.color(ttype))
+        ret += [ttk.TTkString(t,formatter.color(ttype)) for t in values[1:]]
+    return ret
+
+def test_ti_2_lines_collected():
+    return list(_highlightLines(lexer, formatter, lines, 0, ('root',)))
+
+def test_ti_3_guess_full():
+    return guess_lexer(text)
+
+def test_ti_4_guess_sample():
+    return guess_lexer(doc._sampleText())
+
+def test_ti_5_keystroke():
+    cursor = ttk.TTkTextCursor(document=doc)
+    cursor.setPosition(line=doc.lineCount()//2, pos=4)
+    cursor.insertText('x')
+    _refresh()
+
+for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+    loop = 5
+    result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+    print(f"{testName:26} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2026 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+
+# Benchmark the TTkTextEditView paintEvent in a 200 rows editor:
+# the repaint with the rows cache in place against a cold cache
+# and the repaint after a multi cursor blink or a cursor movement
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../../libs/pyTermTk'))
+import TermTk as ttk
+
+with open(os.path.join(sys.path[0],'../../libs/pyTermTk/TermTk/TTkGui/textcursor.py')) as f:
+    text = f.read()
+
+tev = ttk.TTkTextEditView(size=(120, 200))
+tev.setText(text)
+canvas = ttk.TTkCanvas(width=120, height=200)
+
+cursor = tev.textCursor()
+cursor.setPosition(line=0, pos=0)
+for i in range(1,40):
+    cursor.addCursor(line=i*5, pos=0)
+
+tev.paintEvent(canvas)
+
+def test_ti_1_repaint_cold():
+    tev._rowCache = {}
+    tev.paintEvent(canvas)
+
+def test_ti_2_repaint_cached():
+    tev.paintEvent(canvas)
+
+def test_ti_3_cursor_move():
+    cursor.movePosition(operation=ttk.TTkTextCursor.MoveOperation.Right)
+    tev.paintEvent(canvas)
+
+for testName in sorted([tn for tn in globals() if tn.startswith('test_ti_')]):
+    loop = 50
+    result = timeit.timeit(f'{testName}()', globals=globals(), number=loop)
+    print(f"{testName:26} | {result / loop:.10f} sec. | {loop / result : 10.3f} Fps")
@@ -16,9 +16,10 @@ __check(){
             -e "signal.py:import asyncio" \
             -e "signal.py:import importlib.util" \
             -e "colors.py:from .colors_ansi_map" \
-            -e "TTkCore/log.py:import inspect" \
             -e "TTkCore/log.py:import logging" \
             -e "TTkCore/log.py:import sys" \
+            -e "TTkCore/log.py:import queue" \
+            -e "TTkCore/log.py:import atexit" \
             -e "TTkCore/log.py:import contextlib" \
             -e "TTkCore/log.py:from collections.abc import Callable, Set" \
             -e "term.py:import importlib.util" \
@@ -35,8 +36,21 @@ __check(){
             -e "ttk.py:import contextlib" \
             -e "clipboard.py:import importlib.util" \
             -e "filebuffer.py:import threading" \
+            -e "filebuffer.py:import mmap" \
+            -e "filebuffer.py:import weakref" \
+            -e "filebuffer.py:import operator" \
+            -e "filebuffer.py:from array import array" \
+            -e "filebuffer.py:from itertools import islice, compress, count, repeat" \
+            -e "filebuffer.py:import sys" \
+            -e "filebuffer.py:import time" \
+            -e "filebuffer.py:import multiprocessing" \
+            -e "filebuffer.py:from bisect import bisect_left" \
+            -e "filebuffer.py:from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor" \
             -e "text_edit.py:from math import log10, floor" \
+            -e "tablewidget.py:from concurrent.futures import ThreadPoolExecutor, Future" \
+            -e "tablewidget.py:from bisect import bisect_right" \
             -e "string.py:import unicodedata" \
+            -e "canvas_array.py:from array import array" \
             -e "string.py:from types import GeneratorType" \
             -e "progressbar.py:import math" \
             -e "uiloader.py:import json" \
@@ -78,6 +92,7 @@ __check(){
             -e "drivers/term_unix_serial.py:from ..TTkTerm.term_base import TTkTermBase" \
             -e "drivers/term_unix_serial.py:from .term_unix import *" \
             -e "drivers/term_unix_common.py:from threading import Thread, Lock" \
+            -e "drivers/term_unix_common.py:from select import select" \
             -e "drivers/term_unix_common.py:from ..TTkTerm.term_base import TTkTermBase" \
             -e "drivers/term_unix_darwin.py:import sys" \
             -e "drivers/term_unix_darwin.py:from ..TTkTerm.term_base import TTkTermBase" \
@@ -116,6 +131,10 @@ __check(){
             -e "TTkWidgets/widget.py:from __future__ import annotations" \
             -e "TTkModelView/__init__.py:from importlib.util import find_spec" \
             -e "TTkModelView/tablemodelcsv.py:import csv" \
+            -e "TTkModelView/tablemodelcsv.py:import io" \
+            -e "TTkModelView/tablemodelcsv.py:import os" \
+            -e "TTkModelView/tablemodelcsv.py:import threading" \
+            -e "TTkModelView/tablemodelcsv.py:from array import array" \
             -e "TTkModelView/tablemodelsqlite3.py:import sqlite3" \
             -e "TTkModelView/tablemodelsqlite3.py:import threading" |
         grep -v \
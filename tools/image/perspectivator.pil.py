@@ -526,10 +526,10 @@ class Perspectivator(ttk.TTkWidget):
         if not ((image:=self._state.highlightedMovable) and isinstance(image,_Image)):
             pass
         elif evt.evt == ttk.TTkK.WHEEL_Up:
-            image.setSize(min(image.size()+1,50))
+            image.setSize(min(image.size()+evt.delta,50))
             self.update()
         elif evt.evt == ttk.TTkK.WHEEL_Down:
-            image.setSize(max(image.size()-1,5))
+            image.setSize(max(image.size()-evt.delta,5))
             self.update()
         return True
 